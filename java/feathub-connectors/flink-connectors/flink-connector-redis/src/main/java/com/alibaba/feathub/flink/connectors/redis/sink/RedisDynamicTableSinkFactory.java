@@ -24,13 +24,19 @@ import org.apache.flink.table.factories.FactoryUtil;
 import java.util.HashSet;
 import java.util.Set;
 
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.BUFFER_SIZE;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.DB_NUM;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.FLUSH_INTERVAL_MS;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.HOST;
-import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.KEY_FIELD;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.KEY_FIELDS;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.MAX_IN_FLIGHT_REQUESTS;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.NAMESPACE;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.PASSWORD;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.PORT;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.STORAGE_LAYOUT;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.TIMESTAMP_FIELD;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.TIMESTAMP_FORMAT;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.TIMESTAMP_TIME_ZONE;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.USERNAME;
 
 /** {@link DynamicTableSinkFactory} for {@link RedisDynamicTableSink}. */
@@ -56,7 +62,7 @@ public class RedisDynamicTableSinkFactory implements DynamicTableSinkFactory {
         options.add(PORT);
         options.add(DB_NUM);
         options.add(NAMESPACE);
-        options.add(KEY_FIELD);
+        options.add(KEY_FIELDS);
         return options;
     }
 
@@ -66,6 +72,12 @@ public class RedisDynamicTableSinkFactory implements DynamicTableSinkFactory {
         options.add(USERNAME);
         options.add(PASSWORD);
         options.add(TIMESTAMP_FIELD);
+        options.add(TIMESTAMP_FORMAT);
+        options.add(TIMESTAMP_TIME_ZONE);
+        options.add(STORAGE_LAYOUT);
+        options.add(BUFFER_SIZE);
+        options.add(FLUSH_INTERVAL_MS);
+        options.add(MAX_IN_FLIGHT_REQUESTS);
         return options;
     }
 }
@@ -19,6 +19,8 @@ package com.alibaba.feathub.flink.connectors.redis.sink;
 import org.apache.flink.configuration.ConfigOption;
 import org.apache.flink.configuration.ConfigOptions;
 
+import java.util.List;
+
 /** Configurations used by Redis sink. */
 public class RedisSinkConfigs {
 
@@ -62,14 +64,16 @@ public class RedisSinkConfigs {
                                     + "records with the same key into Redis without "
                                     + "overwriting each other.");
 
-    static final ConfigOption<String> KEY_FIELD =
-            ConfigOptions.key("keyField")
+    static final ConfigOption<List<String>> KEY_FIELDS =
+            ConfigOptions.key("keyFields")
                     .stringType()
+                    .asList()
                     .noDefaultValue()
                     .withDescription(
-                            "The name of the key field in the input table. "
-                                    + "Values in this field would be concatenated with the "
-                                    + "namespace and used as keys in Redis storage");
+                            "The names of the key fields in the input table, separated by "
+                                    + "semicolons. The serialized values of these fields would "
+                                    + "be joined, concatenated with the namespace and used as "
+                                    + "keys in Redis storage.");
 
     static final ConfigOption<String> TIMESTAMP_FIELD =
             ConfigOptions.key("timestampField")
@@ -77,9 +81,68 @@ public class RedisSinkConfigs {
                     .noDefaultValue()
                     .withDescription(
                             "The name of the timestamp field in the input table. "
-                                    + "The values in this field must be Long values representing "
-                                    + "the milliseconds from epoch. If two records with the same "
+                                    + "The values in this field are converted to the "
+                                    + "milliseconds from epoch. If two records with the same "
                                     + "key and namespace but different timestamp are written out "
                                     + "through this sink, the record with larger timestamp value "
                                     + "will finally be persisted to Redis.");
+
+    static final ConfigOption<String> TIMESTAMP_FORMAT =
+            ConfigOptions.key("timestampFormat")
+                    .stringType()
+                    .defaultValue("epoch_millis")
+                    .withDescription(
+                            "The format of the timestamp field. It is 'epoch' or "
+                                    + "'epoch_millis' for seconds or milliseconds from epoch, or "
+                                    + "a pattern of java.text.SimpleDateFormat for string "
+                                    + "values.");
+
+    static final ConfigOption<String> TIMESTAMP_TIME_ZONE =
+            ConfigOptions.key("timestampTimeZone")
+                    .stringType()
+                    .defaultValue("UTC")
+                    .withDescription(
+                            "The time zone of the timestamp field, if its values are strings "
+                                    + "or timestamps without time zone.");
+
+    static final ConfigOption<String> STORAGE_LAYOUT =
+            ConfigOptions.key("storageLayout")
+                    .stringType()
+                    .defaultValue("hash")
+                    .withDescription(
+                            "The layout in which the fields of a record are stored in Redis. "
+                                    + "With 'hash', each field is stored as a field of a Redis "
+                                    + "hash whose name is the 4-byte index of the field. With "
+                                    + "'packed', all fields and the timestamp are stored in one "
+                                    + "Redis string as a packed row, which has a 1-byte version, "
+                                    + "the 8-byte timestamp, the 4-byte number of fields, the "
+                                    + "4-byte end offset of each field and the concatenated "
+                                    + "field values.");
+
+    static final ConfigOption<Integer> BUFFER_SIZE =
+            ConfigOptions.key("bufferSize")
+                    .intType()
+                    .defaultValue(1)
+                    .withDescription(
+                            "The maximum number of keys whose records are buffered before "
+                                    + "they are written to Redis in a pipeline. Only the latest "
+                                    + "record of each key in the buffer is written. The buffer "
+                                    + "is also flushed on checkpoints.");
+
+    static final ConfigOption<Long> FLUSH_INTERVAL_MS =
+            ConfigOptions.key("flushIntervalMs")
+                    .longType()
+                    .defaultValue(0L)
+                    .withDescription(
+                            "The interval in milliseconds to flush the buffered records to "
+                                    + "Redis. If it is 0, the buffer is only flushed when it is "
+                                    + "full, on checkpoints and when the sink is closed.");
+
+    static final ConfigOption<Integer> MAX_IN_FLIGHT_REQUESTS =
+            ConfigOptions.key("maxInFlightRequests")
+                    .intType()
+                    .defaultValue(1000)
+                    .withDescription(
+                            "The maximum number of requests sent in a pipeline before "
+                                    + "waiting for their responses from Redis.");
 }
@@ -18,43 +18,87 @@ package com.alibaba.feathub.flink.connectors.redis.sink;
 
 import org.apache.flink.configuration.Configuration;
 import org.apache.flink.configuration.ReadableConfig;
+import org.apache.flink.runtime.state.FunctionInitializationContext;
+import org.apache.flink.runtime.state.FunctionSnapshotContext;
+import org.apache.flink.streaming.api.checkpoint.CheckpointedFunction;
 import org.apache.flink.streaming.api.functions.sink.RichSinkFunction;
 import org.apache.flink.table.catalog.ResolvedSchema;
 import org.apache.flink.table.data.RowData;
+import org.apache.flink.table.types.DataType;
+import org.apache.flink.table.types.logical.LogicalType;
+import org.apache.flink.table.types.logical.LogicalTypeRoot;
+import org.apache.flink.table.types.logical.utils.LogicalTypeChecks;
 import org.apache.flink.util.Preconditions;
 import org.apache.flink.util.StringUtils;
+import org.apache.flink.util.concurrent.ExecutorThreadFactory;
 
 import redis.clients.jedis.Jedis;
+import redis.clients.jedis.Pipeline;
+import redis.clients.jedis.Response;
 
 import java.io.BufferedReader;
+import java.io.IOException;
 import java.io.InputStream;
 import java.io.InputStreamReader;
 import java.nio.ByteBuffer;
 import java.nio.ByteOrder;
 import java.nio.charset.StandardCharsets;
+import java.text.ParseException;
+import java.text.SimpleDateFormat;
+import java.time.ZoneId;
 import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.Collections;
 import java.util.HashMap;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.TimeZone;
+import java.util.concurrent.Executors;
+import java.util.concurrent.ScheduledExecutorService;
+import java.util.concurrent.TimeUnit;
 
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.BUFFER_SIZE;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.DB_NUM;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.FLUSH_INTERVAL_MS;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.HOST;
-import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.KEY_FIELD;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.KEY_FIELDS;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.MAX_IN_FLIGHT_REQUESTS;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.NAMESPACE;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.PASSWORD;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.PORT;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.STORAGE_LAYOUT;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.TIMESTAMP_FIELD;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.TIMESTAMP_FORMAT;
+import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.TIMESTAMP_TIME_ZONE;
 import static com.alibaba.feathub.flink.connectors.redis.sink.RedisSinkConfigs.USERNAME;
 
 /**
  * A {@link org.apache.flink.streaming.api.functions.sink.SinkFunction} that writes to a Redis
  * database.
  *
- * <p>The timestamp field, if specified, must contain Long values representing milliseconds from
- * epoch, and the other fields must contain byte arrays representing serialized key or data.
+ * <p>The values of the key fields and the other fields are serialized into the bytes of FeatHub's
+ * protobuf message Value, and the values of the key fields are joined into the Redis key, in the
+ * same way as {@code feathub.common.utils} in Python. The timestamp field, if specified, is
+ * converted to milliseconds from epoch according to the timestamp format.
+ *
+ * <p>Records are buffered and written to Redis through a pipeline when the buffer is full, when
+ * the flush interval has passed, on checkpoints and when the sink is closed, which provides
+ * at-least-once guarantees. Only the latest record of a key in the buffer is written, which is the
+ * one with the largest timestamp if the timestamp field is specified.
  */
-public class RedisSinkFunction extends RichSinkFunction<RowData> {
+public class RedisSinkFunction extends RichSinkFunction<RowData> implements CheckpointedFunction {
+
+    private static final String HASH_LAYOUT = "hash";
+    private static final String PACKED_LAYOUT = "packed";
+
+    private static final String EPOCH_FORMAT = "epoch";
+    private static final String EPOCH_MILLIS_FORMAT = "epoch_millis";
+
+    private static final byte PACKED_ROW_VERSION = 1;
+
+    // The version, the timestamp and the number of fields.
+    private static final int PACKED_ROW_HEADER_LENGTH = 1 + 8 + 4;
 
     private final String host;
     private final int port;
@@ -63,14 +107,32 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
     private final int dbNum;
 
     private final byte[] keyPrefix;
-    private final int keyFieldIndex;
+    private final int[] keyFieldIndices;
+    private final int[] valueFieldIndices;
     private final int timestampFieldIndex;
+    private final LogicalType[] fieldTypes;
+    private final String timestampFormat;
+    private final String timestampTimeZone;
+    private final String storageLayout;
+
+    private final int bufferSize;
+    private final long flushIntervalMs;
+    private final int maxInFlightRequests;
 
     private final byte[] evalScript;
     private byte[] evalScriptSHA;
 
-    private transient ByteBuffer indexBuffer;
-    private transient ByteBuffer timestampBuffer;
+    private transient RowData.FieldGetter[] fieldGetters;
+    private transient ValueEncoder[] fieldEncoders;
+    private transient SimpleDateFormat dateFormat;
+
+    private transient Map<ByteBuffer, BufferedRecord> buffer;
+
+    private transient ScheduledExecutorService flushScheduler;
+
+    private transient volatile Exception flushException;
+
+    private transient boolean closed;
 
     private transient Jedis jedis;
 
@@ -82,20 +144,50 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
         this.dbNum = config.get(DB_NUM);
 
         this.keyPrefix = getKeyPrefix(config.get(NAMESPACE));
-        this.keyFieldIndex = getKeyFieldIndex(config, schema);
+        this.keyFieldIndices = getKeyFieldIndices(config, schema);
         this.timestampFieldIndex = getTimestampFieldIndex(config, schema);
+        this.valueFieldIndices =
+                getValueFieldIndices(schema, keyFieldIndices, timestampFieldIndex);
+        this.fieldTypes =
+                schema.getColumnDataTypes().stream()
+                        .map(DataType::getLogicalType)
+                        .toArray(LogicalType[]::new);
+        this.timestampFormat = config.get(TIMESTAMP_FORMAT);
+        this.timestampTimeZone = config.get(TIMESTAMP_TIME_ZONE);
+        this.storageLayout = getStorageLayout(config);
+
+        this.bufferSize = config.get(BUFFER_SIZE);
+        this.flushIntervalMs = config.get(FLUSH_INTERVAL_MS);
+        this.maxInFlightRequests = config.get(MAX_IN_FLIGHT_REQUESTS);
 
         this.evalScript = getEvalScript(timestampFieldIndex);
 
-        validateConfigAndSchema(config, schema, keyFieldIndex, timestampFieldIndex);
+        validateConfigAndSchema(config, keyFieldIndices, valueFieldIndices, timestampFieldIndex);
+        Preconditions.checkArgument(bufferSize > 0, "Buffer size must be positive.");
+        Preconditions.checkArgument(flushIntervalMs >= 0, "Flush interval must not be negative.");
+        Preconditions.checkArgument(
+                maxInFlightRequests > 0, "Max in-flight requests must be positive.");
     }
 
     @Override
     public void open(Configuration parameters) throws Exception {
         super.open(parameters);
 
-        this.indexBuffer = ByteBuffer.allocate(4).order(ByteOrder.BIG_ENDIAN);
-        this.timestampBuffer = ByteBuffer.allocate(8).order(ByteOrder.BIG_ENDIAN);
+        this.fieldGetters = new RowData.FieldGetter[fieldTypes.length];
+        this.fieldEncoders = new ValueEncoder[fieldTypes.length];
+        for (int i = 0; i < fieldTypes.length; i++) {
+            if (i != timestampFieldIndex) {
+                fieldGetters[i] = RowData.createFieldGetter(fieldTypes[i], i);
+                fieldEncoders[i] = ValueEncoder.of(fieldTypes[i]);
+            }
+        }
+        if (timestampFieldIndex >= 0 && !isEpochFormat(timestampFormat)) {
+            this.dateFormat = new SimpleDateFormat(timestampFormat);
+            this.dateFormat.setTimeZone(TimeZone.getTimeZone(timestampTimeZone));
+        }
+
+        this.buffer = new LinkedHashMap<>();
+        this.closed = false;
 
         jedis = new Jedis(host, port);
         if (!StringUtils.isNullOrWhitespaceOnly(username)) {
@@ -107,54 +199,278 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
         if (timestampFieldIndex >= 0) {
             evalScriptSHA = jedis.scriptLoad(this.evalScript);
         }
+
+        if (flushIntervalMs > 0 && bufferSize > 1) {
+            flushScheduler =
+                    Executors.newScheduledThreadPool(
+                            1, new ExecutorThreadFactory("redis-sink-flusher"));
+            flushScheduler.scheduleWithFixedDelay(
+                    () -> {
+                        synchronized (RedisSinkFunction.this) {
+                            if (closed || flushException != null) {
+                                return;
+                            }
+                            try {
+                                flush();
+                            } catch (Exception e) {
+                                flushException = e;
+                            }
+                        }
+                    },
+                    flushIntervalMs,
+                    flushIntervalMs,
+                    TimeUnit.MILLISECONDS);
+        }
     }
 
     @Override
-    public void invoke(RowData data, Context context) {
-        byte[] originalKey = data.getBinary(keyFieldIndex);
+    public synchronized void invoke(RowData data, Context context) throws Exception {
+        checkFlushException();
+
+        List<byte[]> encodedKeys = new ArrayList<>();
+        for (int keyFieldIndex : keyFieldIndices) {
+            encodedKeys.add(encodeField(data, keyFieldIndex));
+        }
+        byte[] originalKey = ValueEncoder.joinKeys(encodedKeys);
         byte[] key = new byte[keyPrefix.length + originalKey.length];
         System.arraycopy(keyPrefix, 0, key, 0, keyPrefix.length);
         System.arraycopy(originalKey, 0, key, keyPrefix.length, originalKey.length);
 
-        Map<byte[], byte[]> value = new HashMap<>();
-        int arity = data.getArity();
-        for (int i = 0; i < arity; i++) {
-            if (timestampFieldIndex == i) {
-                // timestamp values have specific serialization strategy
-                continue;
+        long timestamp = timestampFieldIndex < 0 ? 0 : getTimestamp(data);
+        ByteBuffer bufferKey = ByteBuffer.wrap(key);
+        BufferedRecord bufferedRecord = buffer.get(bufferKey);
+        if (bufferedRecord != null
+                && timestampFieldIndex >= 0
+                && bufferedRecord.timestamp >= timestamp) {
+            // Redis would keep the buffered record, which has a larger or equal timestamp.
+            return;
+        }
+
+        byte[] packedRow = null;
+        Map<byte[], byte[]> fields = null;
+        if (PACKED_LAYOUT.equals(storageLayout)) {
+            packedRow = getPackedRow(data, timestamp);
+        } else {
+            fields = getHashFields(data);
+        }
+        buffer.put(bufferKey, new BufferedRecord(key, timestamp, fields, packedRow));
+
+        if (buffer.size() >= bufferSize) {
+            flush();
+        }
+    }
+
+    @Override
+    public synchronized void snapshotState(FunctionSnapshotContext context) throws Exception {
+        checkFlushException();
+        flush();
+    }
+
+    @Override
+    public void initializeState(FunctionInitializationContext context) {}
+
+    @Override
+    public void close() throws Exception {
+        synchronized (this) {
+            if (closed) {
+                return;
             }
+            closed = true;
+        }
+
+        if (flushScheduler != null) {
+            flushScheduler.shutdown();
+            flushScheduler.awaitTermination(flushIntervalMs, TimeUnit.MILLISECONDS);
+        }
 
-            if (keyFieldIndex == i) {
-                // don't store key values
-                continue;
+        try {
+            synchronized (this) {
+                if (buffer != null) {
+                    checkFlushException();
+                    flush();
+                }
             }
+        } finally {
+            // TODO: Remove the registered script from Redis when Redis supports removing a
+            //  certain script.
+            if (jedis != null) {
+                jedis.close();
+            }
+            super.close();
+        }
+    }
 
-            indexBuffer.putInt(0, i);
-            value.put(indexBuffer.array(), data.getBinary(i));
+    private void checkFlushException() throws IOException {
+        if (flushException != null) {
+            throw new IOException("Failed to write records to Redis.", flushException);
         }
+    }
 
-        if (timestampFieldIndex < 0) {
-            this.jedis.hset(key, value);
+    /**
+     * Writes the buffered records to Redis through a pipeline, waiting for the responses after
+     * every {@link #maxInFlightRequests} requests.
+     */
+    private void flush() throws IOException {
+        if (buffer.isEmpty()) {
+            return;
+        }
+
+        try (Pipeline pipeline = jedis.pipelined()) {
+            List<Response<?>> responses = new ArrayList<>();
+            for (BufferedRecord bufferedRecord : buffer.values()) {
+                responses.add(write(pipeline, bufferedRecord));
+                if (responses.size() >= maxInFlightRequests) {
+                    syncAndCheckResponses(pipeline, responses);
+                }
+            }
+            syncAndCheckResponses(pipeline, responses);
+        }
+        buffer.clear();
+    }
+
+    private static void syncAndCheckResponses(Pipeline pipeline, List<Response<?>> responses) {
+        pipeline.sync();
+        for (Response<?> response : responses) {
+            // Throws the error returned by Redis, if any.
+            response.get();
+        }
+        responses.clear();
+    }
+
+    private Response<?> write(Pipeline pipeline, BufferedRecord bufferedRecord) {
+        byte[] layout;
+        List<byte[]> values = new ArrayList<>();
+        if (bufferedRecord.packedRow != null) {
+            if (timestampFieldIndex < 0) {
+                return pipeline.set(bufferedRecord.key, bufferedRecord.packedRow);
+            }
+            layout = PACKED_LAYOUT.getBytes(StandardCharsets.UTF_8);
+            values.add(bufferedRecord.packedRow);
         } else {
-            timestampBuffer.putLong(0, data.getLong(timestampFieldIndex));
-
-            List<byte[]> arguments = new ArrayList<>();
-            arguments.add(key);
-            arguments.add(timestampBuffer.array());
-            for (Map.Entry<byte[], byte[]> entry : value.entrySet()) {
-                arguments.add(entry.getKey());
-                arguments.add(entry.getValue());
+            if (timestampFieldIndex < 0) {
+                return pipeline.hset(bufferedRecord.key, bufferedRecord.fields);
+            }
+            layout = HASH_LAYOUT.getBytes(StandardCharsets.UTF_8);
+            for (Map.Entry<byte[], byte[]> entry : bufferedRecord.fields.entrySet()) {
+                values.add(entry.getKey());
+                values.add(entry.getValue());
             }
+        }
+
+        byte[] timestamp =
+                ByteBuffer.allocate(8)
+                        .order(ByteOrder.BIG_ENDIAN)
+                        .putLong(0, bufferedRecord.timestamp)
+                        .array();
+        List<byte[]> arguments = new ArrayList<>();
+        arguments.add(bufferedRecord.key);
+        arguments.add(timestamp);
+        arguments.add(layout);
+        arguments.addAll(values);
+        return pipeline.evalsha(this.evalScriptSHA, Collections.emptyList(), arguments);
+    }
+
+    private byte[] encodeField(RowData data, int index) {
+        return fieldEncoders[index].encode(fieldGetters[index].getFieldOrNull(data));
+    }
 
-            this.jedis.evalsha(this.evalScriptSHA, Collections.emptyList(), arguments);
+    /**
+     * Returns the milliseconds from epoch of the timestamp field, which is parsed with the
+     * timestamp format if it is a string, or regarded as in the timestamp time zone if it is a
+     * timestamp without time zone.
+     */
+    private long getTimestamp(RowData data) throws ParseException {
+        LogicalType type = fieldTypes[timestampFieldIndex];
+        switch (type.getTypeRoot()) {
+            case CHAR:
+            case VARCHAR:
+                return dateFormat.parse(data.getString(timestampFieldIndex).toString()).getTime();
+            case INTEGER:
+            case BIGINT:
+                long value =
+                        type.getTypeRoot() == LogicalTypeRoot.INTEGER
+                                ? data.getInt(timestampFieldIndex)
+                                : data.getLong(timestampFieldIndex);
+                return EPOCH_FORMAT.equals(timestampFormat) ? value * 1000 : value;
+            case TIMESTAMP_WITHOUT_TIME_ZONE:
+                return data.getTimestamp(timestampFieldIndex, LogicalTypeChecks.getPrecision(type))
+                        .toLocalDateTime()
+                        .atZone(ZoneId.of(timestampTimeZone))
+                        .toInstant()
+                        .toEpochMilli();
+            case TIMESTAMP_WITH_LOCAL_TIME_ZONE:
+                return data.getTimestamp(timestampFieldIndex, LogicalTypeChecks.getPrecision(type))
+                        .getMillisecond();
+            default:
+                throw new UnsupportedOperationException(
+                        String.format("Unsupported timestamp field type %s.", type));
         }
     }
 
-    @Override
-    public void close() {
-        // TODO: Remove the registered script from Redis when Redis supports removing a certain
-        //  script.
-        jedis.close();
+    private static boolean isEpochFormat(String timestampFormat) {
+        return EPOCH_FORMAT.equals(timestampFormat) || EPOCH_MILLIS_FORMAT.equals(timestampFormat);
+    }
+
+    /**
+     * Returns the value fields of a record as the fields of a Redis hash, whose names are the
+     * 4-byte indices of the value fields.
+     */
+    private Map<byte[], byte[]> getHashFields(RowData data) {
+        Map<byte[], byte[]> fields = new HashMap<>();
+        for (int i = 0; i < valueFieldIndices.length; i++) {
+            // Each field needs its own index array, as byte arrays are hashed by identity.
+            byte[] index = ByteBuffer.allocate(4).order(ByteOrder.BIG_ENDIAN).putInt(i).array();
+            fields.put(index, encodeField(data, valueFieldIndices[i]));
+        }
+        return fields;
+    }
+
+    /**
+     * Packs the value fields of a record, in the order of the fields, into a packed row, which
+     * has the version of the format, the timestamp, the number of values, the end offset of each
+     * value in the value section, and the concatenated values. Numbers are saved in big-endian
+     * order.
+     */
+    private byte[] getPackedRow(RowData data, long timestamp) {
+        List<byte[]> values = new ArrayList<>();
+        int valuesLength = 0;
+        for (int valueFieldIndex : valueFieldIndices) {
+            byte[] value = encodeField(data, valueFieldIndex);
+            values.add(value);
+            valuesLength += value.length;
+        }
+
+        ByteBuffer buffer =
+                ByteBuffer.allocate(PACKED_ROW_HEADER_LENGTH + values.size() * 4 + valuesLength)
+                        .order(ByteOrder.BIG_ENDIAN);
+        buffer.put(PACKED_ROW_VERSION);
+        buffer.putLong(timestamp);
+        buffer.putInt(values.size());
+        int end = 0;
+        for (byte[] value : values) {
+            end += value.length;
+            buffer.putInt(end);
+        }
+        for (byte[] value : values) {
+            buffer.put(value);
+        }
+        return buffer.array();
+    }
+
+    /** A record to be written to Redis, with its fields in the storage layout. */
+    private static class BufferedRecord {
+        private final byte[] key;
+        private final long timestamp;
+        private final Map<byte[], byte[]> fields;
+        private final byte[] packedRow;
+
+        private BufferedRecord(
+                byte[] key, long timestamp, Map<byte[], byte[]> fields, byte[] packedRow) {
+            this.key = key;
+            this.timestamp = timestamp;
+            this.fields = fields;
+            this.packedRow = packedRow;
+        }
     }
 
     private static byte[] getKeyPrefix(String namespace) {
@@ -166,14 +482,33 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
         return (namespace + ":").getBytes(StandardCharsets.UTF_8);
     }
 
-    private static int getKeyFieldIndex(ReadableConfig config, ResolvedSchema schema) {
-        String keyFieldName = config.get(KEY_FIELD);
+    private static int[] getKeyFieldIndices(ReadableConfig config, ResolvedSchema schema) {
+        List<String> keyFieldNames = config.get(KEY_FIELDS);
+        Preconditions.checkArgument(!keyFieldNames.isEmpty(), "Key fields must not be empty.");
 
         List<String> fieldNames = schema.getColumnNames();
-        int index = fieldNames.indexOf(keyFieldName);
-        Preconditions.checkArgument(
-                index >= 0, "Input table does not contain key field %s.", keyFieldName);
-        return index;
+        int[] indices = new int[keyFieldNames.size()];
+        for (int i = 0; i < indices.length; i++) {
+            indices[i] = fieldNames.indexOf(keyFieldNames.get(i));
+            Preconditions.checkArgument(
+                    indices[i] >= 0,
+                    "Input table does not contain key field %s.",
+                    keyFieldNames.get(i));
+        }
+        return indices;
+    }
+
+    private static int[] getValueFieldIndices(
+            ResolvedSchema schema, int[] keyFieldIndices, int timestampFieldIndex) {
+        List<Integer> indices = new ArrayList<>();
+        for (int i = 0; i < schema.getColumnCount(); i++) {
+            indices.add(i);
+        }
+        indices.remove(Integer.valueOf(timestampFieldIndex));
+        for (int keyFieldIndex : keyFieldIndices) {
+            indices.remove(Integer.valueOf(keyFieldIndex));
+        }
+        return indices.stream().mapToInt(Integer::intValue).toArray();
     }
 
     private static int getTimestampFieldIndex(ReadableConfig config, ResolvedSchema schema) {
@@ -189,6 +524,15 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
         return index;
     }
 
+    private static String getStorageLayout(ReadableConfig config) {
+        String storageLayout = config.get(STORAGE_LAYOUT);
+        Preconditions.checkArgument(
+                HASH_LAYOUT.equals(storageLayout) || PACKED_LAYOUT.equals(storageLayout),
+                "Unsupported storage layout %s.",
+                storageLayout);
+        return storageLayout;
+    }
+
     private static byte[] getEvalScript(int timestampFieldIndex) {
         if (timestampFieldIndex < 0) {
             return new byte[0];
@@ -211,20 +555,16 @@ public class RedisSinkFunction extends RichSinkFunction<RowData> {
 
     private static void validateConfigAndSchema(
             ReadableConfig config,
-            ResolvedSchema schema,
-            int keyFieldIndex,
+            int[] keyFieldIndices,
+            int[] valueFieldIndices,
             int timestampFieldIndex) {
         Preconditions.checkArgument(
-                keyFieldIndex != timestampFieldIndex,
+                Arrays.stream(keyFieldIndices).noneMatch(x -> x == timestampFieldIndex),
                 "Timestamp field %s cannot be a key field.",
                 config.get(TIMESTAMP_FIELD));
 
-        int valueFieldNum = schema.getColumnNames().size() - 1;
-        if (timestampFieldIndex >= 0) {
-            valueFieldNum -= 1;
-        }
         Preconditions.checkArgument(
-                valueFieldNum > 0,
+                valueFieldIndices.length > 0,
                 "It is not allowed to treat all columns in the input table as key field or timestamp field.");
     }
 }
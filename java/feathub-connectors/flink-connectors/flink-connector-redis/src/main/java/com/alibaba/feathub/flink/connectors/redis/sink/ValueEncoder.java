@@ -0,0 +1,243 @@
+/*
+ * Copyright 2022 The FeatHub Authors
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     https://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package com.alibaba.feathub.flink.connectors.redis.sink;
+
+import org.apache.flink.table.data.ArrayData;
+import org.apache.flink.table.data.MapData;
+import org.apache.flink.table.data.StringData;
+import org.apache.flink.table.data.TimestampData;
+import org.apache.flink.table.types.logical.ArrayType;
+import org.apache.flink.table.types.logical.LogicalType;
+import org.apache.flink.table.types.logical.MapType;
+
+import java.io.ByteArrayOutputStream;
+import java.util.List;
+
+/**
+ * Encodes values of Flink internal data structures into the bytes of the protobuf message Value
+ * defined in FeatHub's value.proto. The bytes are the same as those serialized by {@code
+ * feathub.common.utils.serialize_object_with_protobuf} in Python, so that they can be read by
+ * FeatHub's Redis online store client.
+ */
+public class ValueEncoder {
+
+    // The tags of the fields of the message Value, each of which is the field number shifted
+    // left by 3 bits or-ed with the wire type.
+    private static final int NONE_TAG = 0x08;
+    private static final int BYTES_TAG = 0x12;
+    private static final int STRING_TAG = 0x1a;
+    private static final int INT_TAG = 0x20;
+    private static final int LONG_TAG = 0x28;
+    private static final int DOUBLE_TAG = 0x31;
+    private static final int FLOAT_TAG = 0x3d;
+    private static final int BOOLEAN_TAG = 0x40;
+    private static final int TIMESTAMP_TAG = 0x4a;
+    private static final int VECTOR_TAG = 0x52;
+    private static final int MAP_TAG = 0x5a;
+
+    // The tags of the fields of the messages VectorValue, MapValue and google.protobuf.Timestamp.
+    private static final int ELEMENT_TAG = 0x0a;
+    private static final int MAP_KEY_TAG = 0x0a;
+    private static final int MAP_VALUE_TAG = 0x12;
+    private static final int SECONDS_TAG = 0x08;
+    private static final int NANOS_TAG = 0x10;
+
+    private static final byte[] NONE_VALUE = new byte[] {NONE_TAG, 1};
+
+    private final Encoder encoder;
+
+    private ValueEncoder(Encoder encoder) {
+        this.encoder = encoder;
+    }
+
+    /** Creates an encoder of the values of the given type. */
+    public static ValueEncoder of(LogicalType type) {
+        return new ValueEncoder(createEncoder(type));
+    }
+
+    /** Encodes a value, which is encoded as a null value if it is null. */
+    public byte[] encode(Object value) {
+        if (value == null) {
+            return NONE_VALUE;
+        }
+        ByteArrayOutputStream out = new ByteArrayOutputStream();
+        encoder.encode(value, out);
+        return out.toByteArray();
+    }
+
+    /**
+     * Joins the encoded values of the key fields of a record. The result is the same as that of
+     * {@code feathub.common.utils.serialize_and_join_keys} in Python, which is the encoded value
+     * itself for a single key, or the encoded vector of the bytes of the encoded values otherwise.
+     */
+    public static byte[] joinKeys(List<byte[]> encodedKeys) {
+        if (encodedKeys.size() == 1) {
+            return encodedKeys.get(0);
+        }
+        ByteArrayOutputStream vector = new ByteArrayOutputStream();
+        for (byte[] encodedKey : encodedKeys) {
+            ByteArrayOutputStream element = new ByteArrayOutputStream();
+            writeLengthDelimited(element, BYTES_TAG, encodedKey);
+            writeLengthDelimited(vector, ELEMENT_TAG, element.toByteArray());
+        }
+        ByteArrayOutputStream out = new ByteArrayOutputStream();
+        writeLengthDelimited(out, VECTOR_TAG, vector.toByteArray());
+        return out.toByteArray();
+    }
+
+    /** Writes the message Value of a non-null value. */
+    private interface Encoder {
+        void encode(Object value, ByteArrayOutputStream out);
+    }
+
+    private static Encoder createEncoder(LogicalType type) {
+        switch (type.getTypeRoot()) {
+            case CHAR:
+            case VARCHAR:
+                return (value, out) ->
+                        writeLengthDelimited(out, STRING_TAG, ((StringData) value).toBytes());
+            case BINARY:
+            case VARBINARY:
+                return (value, out) -> writeLengthDelimited(out, BYTES_TAG, (byte[]) value);
+            case BOOLEAN:
+                return (value, out) -> {
+                    out.write(BOOLEAN_TAG);
+                    out.write((Boolean) value ? 1 : 0);
+                };
+            case TINYINT:
+            case SMALLINT:
+            case INTEGER:
+                return (value, out) -> {
+                    out.write(INT_TAG);
+                    // Negative int32 values are sign-extended to 10-byte varints.
+                    writeVarint(out, ((Number) value).intValue());
+                };
+            case BIGINT:
+                return (value, out) -> {
+                    out.write(LONG_TAG);
+                    writeVarint(out, (Long) value);
+                };
+            case FLOAT:
+                return (value, out) -> {
+                    out.write(FLOAT_TAG);
+                    writeFixed32(out, Float.floatToIntBits((Float) value));
+                };
+            case DOUBLE:
+                return (value, out) -> {
+                    out.write(DOUBLE_TAG);
+                    writeFixed64(out, Double.doubleToLongBits((Double) value));
+                };
+            case TIMESTAMP_WITHOUT_TIME_ZONE:
+            case TIMESTAMP_WITH_LOCAL_TIME_ZONE:
+                return (value, out) -> writeTimestamp(out, (TimestampData) value);
+            case ARRAY:
+                return createVectorEncoder((ArrayType) type);
+            case MAP:
+                return createMapEncoder((MapType) type);
+            default:
+                throw new UnsupportedOperationException(
+                        String.format("Unsupported type %s.", type));
+        }
+    }
+
+    private static Encoder createVectorEncoder(ArrayType type) {
+        ValueEncoder elementEncoder = ValueEncoder.of(type.getElementType());
+        ArrayData.ElementGetter elementGetter =
+                ArrayData.createElementGetter(type.getElementType());
+        return (value, out) -> {
+            ArrayData array = (ArrayData) value;
+            ByteArrayOutputStream vector = new ByteArrayOutputStream();
+            for (int i = 0; i < array.size(); i++) {
+                byte[] element = elementEncoder.encode(elementGetter.getElementOrNull(array, i));
+                writeLengthDelimited(vector, ELEMENT_TAG, element);
+            }
+            writeLengthDelimited(out, VECTOR_TAG, vector.toByteArray());
+        };
+    }
+
+    private static Encoder createMapEncoder(MapType type) {
+        ValueEncoder keyEncoder = ValueEncoder.of(type.getKeyType());
+        ValueEncoder valueEncoder = ValueEncoder.of(type.getValueType());
+        ArrayData.ElementGetter keyGetter = ArrayData.createElementGetter(type.getKeyType());
+        ArrayData.ElementGetter valueGetter = ArrayData.createElementGetter(type.getValueType());
+        return (value, out) -> {
+            MapData map = (MapData) value;
+            ArrayData keys = map.keyArray();
+            ArrayData values = map.valueArray();
+            // All keys are written before all values, in the order of the field numbers.
+            ByteArrayOutputStream mapValue = new ByteArrayOutputStream();
+            for (int i = 0; i < map.size(); i++) {
+                byte[] key = keyEncoder.encode(keyGetter.getElementOrNull(keys, i));
+                writeLengthDelimited(mapValue, MAP_KEY_TAG, key);
+            }
+            for (int i = 0; i < map.size(); i++) {
+                byte[] element = valueEncoder.encode(valueGetter.getElementOrNull(values, i));
+                writeLengthDelimited(mapValue, MAP_VALUE_TAG, element);
+            }
+            writeLengthDelimited(out, MAP_TAG, mapValue.toByteArray());
+        };
+    }
+
+    /**
+     * Writes a timestamp as a google.protobuf.Timestamp, whose fields with zero values are
+     * omitted. Timestamps without time zone are regarded as UTC, which is how Python's protobuf
+     * library converts naive datetime objects.
+     */
+    private static void writeTimestamp(ByteArrayOutputStream out, TimestampData timestamp) {
+        long millis = timestamp.getMillisecond();
+        long seconds = Math.floorDiv(millis, 1000);
+        int nanos =
+                (int) Math.floorMod(millis, 1000) * 1_000_000 + timestamp.getNanoOfMillisecond();
+
+        ByteArrayOutputStream message = new ByteArrayOutputStream();
+        if (seconds != 0) {
+            message.write(SECONDS_TAG);
+            writeVarint(message, seconds);
+        }
+        if (nanos != 0) {
+            message.write(NANOS_TAG);
+            writeVarint(message, nanos);
+        }
+        writeLengthDelimited(out, TIMESTAMP_TAG, message.toByteArray());
+    }
+
+    private static void writeLengthDelimited(ByteArrayOutputStream out, int tag, byte[] bytes) {
+        out.write(tag);
+        writeVarint(out, bytes.length);
+        out.write(bytes, 0, bytes.length);
+    }
+
+    private static void writeVarint(ByteArrayOutputStream out, long value) {
+        while ((value & ~0x7FL) != 0) {
+            out.write((int) ((value & 0x7F) | 0x80));
+            value >>>= 7;
+        }
+        out.write((int) value);
+    }
+
+    private static void writeFixed32(ByteArrayOutputStream out, int value) {
+        for (int i = 0; i < 4; i++) {
+            out.write(value >>> (8 * i));
+        }
+    }
+
+    private static void writeFixed64(ByteArrayOutputStream out, long value) {
+        for (int i = 0; i < 8; i++) {
+            out.write((int) (value >>> (8 * i)));
+        }
+    }
+}
@@ -22,6 +22,14 @@ in big-endian order. The long value represents the milliseconds that have passed
 since the epoch. If two features with the same key are written to the same Redis
 database, the one with a larger timestamp value would finally be persisted to
 Redis.
+
+The arguments are the key, the timestamp, the storage layout and the features.
+With the 'hash' layout, the features are pairs of field names and values of a
+Redis hash, and the timestamp is saved in the hash as well. With the 'packed'
+layout, the features are a single packed row to be saved as a Redis string,
+whose 8 bytes after the 1-byte version are the timestamp. A key that holds the
+other layout is compared with its saved timestamp and overwritten with the new
+layout, so that existing keys are migrated when the layout changes.
 --]]
 
 local function bytes_to_long_big_endian(string_bytes_array)
@@ -36,15 +44,39 @@ local function bytes_to_long_big_endian(string_bytes_array)
     return long_value
 end
 
-local key = ARGV[1]
 local timestamp_field_name = '__timestamp__'
-local current_timestamp_str = redis.call('HGET', key, timestamp_field_name)
-local current_timestamp = bytes_to_long_big_endian(current_timestamp_str)
+
+-- Reads the timestamp saved with the key in whichever layout the key currently
+-- holds, so that keys written with the other layout are compared and migrated
+-- instead of failing the command with a WRONGTYPE error.
+local function get_current_timestamp(key, key_type)
+  if key_type == 'string' then
+    return bytes_to_long_big_endian(redis.call('GETRANGE', key, 1, 8))
+  elseif key_type == 'hash' then
+    return bytes_to_long_big_endian(redis.call('HGET', key, timestamp_field_name))
+  end
+  return 0
+end
+
+local key = ARGV[1]
 local new_timestamp_str = ARGV[2]
 local new_timestamp = bytes_to_long_big_endian(new_timestamp_str)
+local storage_layout = ARGV[3]
+local key_type = redis.call('TYPE', key)['ok']
+local current_timestamp = get_current_timestamp(key, key_type)
 if new_timestamp > current_timestamp then
-  for i=3,table.getn(ARGV),2 do
-    redis.call('HSET', key, ARGV[i], ARGV[i + 1])
+  if storage_layout == 'packed' then
+    -- SET replaces a hash written with the 'hash' layout as a whole.
+    redis.call('SET', key, ARGV[4])
+  else
+    -- A string written with the 'packed' layout is removed before the hash
+    -- fields are set.
+    if key_type ~= 'hash' and key_type ~= 'none' then
+      redis.call('DEL', key)
+    end
+    for i=4,table.getn(ARGV),2 do
+      redis.call('HSET', key, ARGV[i], ARGV[i + 1])
+    end
+    redis.call('HSET', key, timestamp_field_name, new_timestamp_str)
   end
-  redis.call('HSET', key, timestamp_field_name, new_timestamp_str)
 end;
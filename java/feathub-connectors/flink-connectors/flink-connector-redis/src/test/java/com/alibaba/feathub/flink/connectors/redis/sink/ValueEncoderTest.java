@@ -0,0 +1,91 @@
+/*
+ * Copyright 2022 The FeatHub Authors
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     https://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package com.alibaba.feathub.flink.connectors.redis.sink;
+
+import org.apache.flink.table.data.GenericArrayData;
+import org.apache.flink.table.data.GenericMapData;
+import org.apache.flink.table.data.StringData;
+import org.apache.flink.table.data.TimestampData;
+import org.apache.flink.table.types.logical.ArrayType;
+import org.apache.flink.table.types.logical.BigIntType;
+import org.apache.flink.table.types.logical.BooleanType;
+import org.apache.flink.table.types.logical.DoubleType;
+import org.apache.flink.table.types.logical.FloatType;
+import org.apache.flink.table.types.logical.IntType;
+import org.apache.flink.table.types.logical.MapType;
+import org.apache.flink.table.types.logical.TimestampType;
+import org.apache.flink.table.types.logical.VarCharType;
+
+import org.junit.Test;
+
+import java.util.Arrays;
+import java.util.Collections;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Tests {@link ValueEncoder}. The expected bytes are those serialized by {@code
+ * feathub.common.utils.serialize_object_with_protobuf} in Python.
+ */
+public class ValueEncoderTest {
+
+    @Test
+    public void testEncodeScalars() {
+        assertThat(ValueEncoder.of(VarCharType.STRING_TYPE).encode(StringData.fromString("Apple")))
+                .containsExactly(26, 5, 65, 112, 112, 108, 101);
+        assertThat(ValueEncoder.of(new IntType()).encode(-1))
+                .containsExactly(32, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1);
+        assertThat(ValueEncoder.of(new BigIntType()).encode(300L)).containsExactly(40, -84, 2);
+        assertThat(ValueEncoder.of(new DoubleType()).encode(1.5))
+                .containsExactly(49, 0, 0, 0, 0, 0, 0, -8, 63);
+        assertThat(ValueEncoder.of(new FloatType()).encode(1.5f))
+                .containsExactly(61, 0, 0, -64, 63);
+        assertThat(ValueEncoder.of(new BooleanType()).encode(true)).containsExactly(64, 1);
+        assertThat(
+                        ValueEncoder.of(new TimestampType(3))
+                                .encode(TimestampData.fromEpochMillis(1500)))
+                .containsExactly(74, 8, 8, 1, 16, -128, -54, -75, -18, 1);
+        assertThat(ValueEncoder.of(new BigIntType()).encode(null)).containsExactly(8, 1);
+    }
+
+    @Test
+    public void testEncodeVectorAndMap() {
+        assertThat(
+                        ValueEncoder.of(new ArrayType(new BigIntType()))
+                                .encode(new GenericArrayData(new Object[] {1L, null})))
+                .containsExactly(82, 8, 10, 2, 40, 1, 10, 2, 8, 1);
+        assertThat(
+                        ValueEncoder.of(new MapType(VarCharType.STRING_TYPE, new BigIntType()))
+                                .encode(
+                                        new GenericMapData(
+                                                Collections.singletonMap(
+                                                        StringData.fromString("a"), 1L))))
+                .containsExactly(90, 9, 10, 3, 26, 1, 97, 18, 2, 40, 1);
+    }
+
+    @Test
+    public void testJoinKeys() {
+        byte[] stringKey =
+                ValueEncoder.of(VarCharType.STRING_TYPE).encode(StringData.fromString("a"));
+        byte[] longKey = ValueEncoder.of(new BigIntType()).encode(1L);
+
+        assertThat(ValueEncoder.joinKeys(Collections.singletonList(stringKey)))
+                .isEqualTo(stringKey);
+        assertThat(ValueEncoder.joinKeys(Arrays.asList(stringKey, longKey)))
+                .containsExactly(82, 13, 10, 5, 18, 3, 26, 1, 97, 10, 4, 18, 2, 40, 1);
+    }
+}
@@ -23,9 +23,11 @@ import org.apache.flink.streaming.api.environment.StreamExecutionEnvironment;
 import org.apache.flink.table.api.Table;
 import org.apache.flink.table.api.TableDescriptor;
 import org.apache.flink.table.api.bridge.java.StreamTableEnvironment;
+import org.apache.flink.table.types.logical.VarBinaryType;
 import org.apache.flink.test.util.AbstractTestBase;
 import org.apache.flink.types.Row;
 
+import com.alibaba.feathub.flink.connectors.redis.sink.ValueEncoder;
 import org.junit.AfterClass;
 import org.junit.Before;
 import org.junit.BeforeClass;
@@ -36,7 +38,7 @@ import redis.embedded.util.JedisUtil;
 
 import java.nio.ByteBuffer;
 import java.nio.charset.StandardCharsets;
-import java.util.HashMap;
+import java.util.Arrays;
 import java.util.List;
 import java.util.Map;
 import java.util.concurrent.TimeUnit;
@@ -101,7 +103,7 @@ public class RedisSentinelClusterITCase extends AbstractTestBase {
                         .option("port", port)
                         .option("dbNum", "0")
                         .option("namespace", "test_namespace")
-                        .option("keyField", "f0")
+                        .option("keyFields", "f0")
                         .build();
 
         tEnv.createTemporaryTable("redis_sink", descriptor);
@@ -110,18 +112,20 @@ public class RedisSentinelClusterITCase extends AbstractTestBase {
 
         assertThat(jedis.keys("*")).hasSize(NUM_ELEMENTS);
 
+        byte[] prefix = "test_namespace:".getBytes(StandardCharsets.UTF_8);
+        ValueEncoder encoder = ValueEncoder.of(new VarBinaryType(VarBinaryType.MAX_LENGTH));
         for (int i = 1; i <= NUM_ELEMENTS; i++) {
-            Map<byte[], byte[]> originalResult =
-                    jedis.hgetAll(("test_namespace:" + i).getBytes(StandardCharsets.UTF_8));
-            Map<String, String> convertedResult = new HashMap<>();
-            for (Map.Entry<byte[], byte[]> entry : originalResult.entrySet()) {
-                convertedResult.put(
-                        new String(entry.getKey(), StandardCharsets.UTF_8),
-                        new String(entry.getValue(), StandardCharsets.UTF_8));
-            }
-            assertThat(convertedResult)
-                    .containsOnlyKeys(new String(ByteBuffer.allocate(4).putInt(1).array()))
-                    .containsValue(String.valueOf(i));
+            // The key and the value of each record are the same.
+            byte[] encodedValue =
+                    encoder.encode(String.valueOf(i).getBytes(StandardCharsets.UTF_8));
+            byte[] redisKey = Arrays.copyOf(prefix, prefix.length + encodedValue.length);
+            System.arraycopy(encodedValue, 0, redisKey, prefix.length, encodedValue.length);
+
+            Map<byte[], byte[]> result = jedis.hgetAll(redisKey);
+            assertThat(result).hasSize(1);
+            Map.Entry<byte[], byte[]> entry = result.entrySet().iterator().next();
+            assertThat(entry.getKey()).isEqualTo(ByteBuffer.allocate(4).putInt(0).array());
+            assertThat(entry.getValue()).isEqualTo(encodedValue);
         }
 
         for (String key : jedis.keys("*")) {
@@ -24,14 +24,17 @@ import org.apache.flink.table.api.Schema;
 import org.apache.flink.table.api.Table;
 import org.apache.flink.table.api.TableDescriptor;
 import org.apache.flink.table.api.bridge.java.StreamTableEnvironment;
+import org.apache.flink.table.types.logical.VarBinaryType;
 import org.apache.flink.types.Row;
 
+import com.alibaba.feathub.flink.connectors.redis.sink.ValueEncoder;
 import org.junit.After;
 import org.junit.Before;
 import org.junit.Test;
 import redis.clients.jedis.Jedis;
 
 import java.nio.ByteBuffer;
+import java.util.Arrays;
 import java.util.HashMap;
 import java.util.Map;
 import java.util.concurrent.TimeUnit;
@@ -81,14 +84,11 @@ public class RedisSinkITCase extends RedisITCaseBase {
         assertThat(jedis.keys("*")).hasSize(NUM_ELEMENTS);
 
         for (int i = 1; i <= NUM_ELEMENTS; i++) {
-            Map<byte[], byte[]> originalResult = jedis.hgetAll(("test_namespace:" + i).getBytes());
-            Map<String, String> convertedResult = new HashMap<>();
-            for (Map.Entry<byte[], byte[]> entry : originalResult.entrySet()) {
-                convertedResult.put(new String(entry.getKey()), new String(entry.getValue()));
-            }
-            assertThat(convertedResult)
-                    .containsOnlyKeys(new String(getIndexBytes(1)))
-                    .containsValue(String.valueOf(i));
+            Map<byte[], byte[]> result = jedis.hgetAll(getRedisKey(i));
+            assertThat(result).hasSize(1);
+            Map.Entry<byte[], byte[]> entry = result.entrySet().iterator().next();
+            assertThat(entry.getKey()).isEqualTo(getIndexBytes(0));
+            assertThat(entry.getValue()).isEqualTo(encodeBytes(i));
         }
     }
 
@@ -96,24 +96,33 @@ public class RedisSinkITCase extends RedisITCaseBase {
         assertThat(jedis.keys("*")).hasSize(5);
 
         for (int i = 0; i < 5; i++) {
-            Map<byte[], byte[]> originalResult = jedis.hgetAll(("test_namespace:" + i).getBytes());
-            Map<String, String> convertedResult = new HashMap<>();
-            for (Map.Entry<byte[], byte[]> entry : originalResult.entrySet()) {
+            Map<byte[], byte[]> result = jedis.hgetAll(getRedisKey(i));
+            assertThat(result).hasSize(2);
+            for (Map.Entry<byte[], byte[]> entry : result.entrySet()) {
                 if (new String(entry.getKey()).equals("__timestamp__")) {
-                    // Timestamp field
-                    convertedResult.put(
-                            new String(entry.getKey()),
-                            String.valueOf(
-                                    ByteBuffer.allocate(8).put(entry.getValue()).getLong(0)));
+                    assertThat(ByteBuffer.wrap(entry.getValue()).getLong())
+                            .isEqualTo((NUM_ELEMENTS - i) * 1000L);
                 } else {
-                    convertedResult.put(new String(entry.getKey()), new String(entry.getValue()));
+                    assertThat(entry.getKey()).isEqualTo(getIndexBytes(0));
+                    assertThat(entry.getValue()).isEqualTo(encodeBytes(i));
                 }
             }
+        }
+    }
 
-            assertThat(convertedResult)
-                    .containsOnlyKeys("__timestamp__", new String(getIndexBytes(2)))
-                    .containsEntry("__timestamp__", String.valueOf((NUM_ELEMENTS - i) * 1000))
-                    .containsEntry(new String(getIndexBytes(2)), String.valueOf(i));
+    private void verifyPackedOutputResultWithTimestamp() {
+        assertThat(jedis.keys("*")).hasSize(5);
+
+        for (int i = 0; i < 5; i++) {
+            ByteBuffer packedRow = ByteBuffer.wrap(jedis.get(getRedisKey(i)));
+            assertThat(packedRow.get()).isEqualTo((byte) 1);
+            assertThat(packedRow.getLong()).isEqualTo((NUM_ELEMENTS - i) * 1000L);
+            assertThat(packedRow.getInt()).isEqualTo(1);
+
+            byte[] value = new byte[packedRow.getInt()];
+            packedRow.get(value);
+            assertThat(packedRow.hasRemaining()).isFalse();
+            assertThat(value).isEqualTo(encodeBytes(i));
         }
     }
 
@@ -121,6 +130,20 @@ public class RedisSinkITCase extends RedisITCaseBase {
         return ByteBuffer.allocate(4).putInt(value).array();
     }
 
+    /** Returns the protobuf-encoded bytes of the string representation of the value. */
+    private static byte[] encodeBytes(long value) {
+        return ValueEncoder.of(new VarBinaryType(VarBinaryType.MAX_LENGTH))
+                .encode(String.valueOf(value).getBytes());
+    }
+
+    private static byte[] getRedisKey(long key) {
+        byte[] prefix = "test_namespace:".getBytes();
+        byte[] encodedKey = encodeBytes(key);
+        byte[] redisKey = Arrays.copyOf(prefix, prefix.length + encodedKey.length);
+        System.arraycopy(encodedKey, 0, redisKey, prefix.length, encodedKey.length);
+        return redisKey;
+    }
+
     @Test
     public void testWriteToRedis() throws Exception {
         DataStream<Row> stream =
@@ -135,7 +158,7 @@ public class RedisSinkITCase extends RedisITCaseBase {
         configs.put("host", REDIS_HOST);
         configs.put("port", redisPort.getPort());
         configs.put("namespace", "test_namespace");
-        configs.put("keyField", "f0");
+        configs.put("keyFields", "f0");
         configs.put("dbNum", 0);
 
         buildAndExecute(stream, configs);
@@ -157,7 +180,7 @@ public class RedisSinkITCase extends RedisITCaseBase {
         configs.put("host", REDIS_HOST);
         configs.put("port", redisPort.getPort());
         configs.put("namespace", "test_namespace");
-        configs.put("keyField", "f0");
+        configs.put("keyFields", "f0");
         configs.put("dbNum", dbNum);
 
         buildAndExecute(stream, configs);
@@ -187,9 +210,106 @@ public class RedisSinkITCase extends RedisITCaseBase {
         configs.put("host", REDIS_HOST);
         configs.put("port", redisPort.getPort());
         configs.put("namespace", "test_namespace");
-        configs.put("keyField", "f0");
+        configs.put("keyFields", "f0");
+        configs.put("timestampField", "f1");
+        configs.put("dbNum", 0);
+
+        buildAndExecute(stream, configs);
+        verifyOutputResultWithTimestamp();
+    }
+
+    @Test
+    public void testPreservePackedRowsWithLargerTimestamp() throws Exception {
+        DataStream<Row> stream =
+                env.fromSequence(0, NUM_ELEMENTS - 1)
+                        .map(
+                                x ->
+                                        Row.of(
+                                                String.valueOf(x % 5).getBytes(),
+                                                (NUM_ELEMENTS - x) * 1000,
+                                                x.toString().getBytes()),
+                                new RowTypeInfo(
+                                        Types.PRIMITIVE_ARRAY(Types.BYTE),
+                                        Types.LONG,
+                                        Types.PRIMITIVE_ARRAY(Types.BYTE)))
+                        .setParallelism(1);
+
+        Map<String, Object> configs = new HashMap<>();
+        configs.put("host", REDIS_HOST);
+        configs.put("port", redisPort.getPort());
+        configs.put("namespace", "test_namespace");
+        configs.put("keyFields", "f0");
+        configs.put("timestampField", "f1");
+        configs.put("dbNum", 0);
+        configs.put("storageLayout", "packed");
+
+        buildAndExecute(stream, configs);
+        verifyPackedOutputResultWithTimestamp();
+    }
+
+    @Test
+    public void testMigrateHashRowsToPackedLayout() throws Exception {
+        for (int i = 0; i < 5; i++) {
+            jedis.hset(getRedisKey(i), getIndexBytes(0), encodeBytes(-1));
+            jedis.hset(
+                    getRedisKey(i),
+                    "__timestamp__".getBytes(),
+                    ByteBuffer.allocate(8).putLong(1L).array());
+        }
+
+        DataStream<Row> stream =
+                env.fromSequence(0, NUM_ELEMENTS - 1)
+                        .map(
+                                x ->
+                                        Row.of(
+                                                String.valueOf(x % 5).getBytes(),
+                                                (NUM_ELEMENTS - x) * 1000,
+                                                x.toString().getBytes()),
+                                new RowTypeInfo(
+                                        Types.PRIMITIVE_ARRAY(Types.BYTE),
+                                        Types.LONG,
+                                        Types.PRIMITIVE_ARRAY(Types.BYTE)))
+                        .setParallelism(1);
+
+        Map<String, Object> configs = new HashMap<>();
+        configs.put("host", REDIS_HOST);
+        configs.put("port", redisPort.getPort());
+        configs.put("namespace", "test_namespace");
+        configs.put("keyFields", "f0");
+        configs.put("timestampField", "f1");
+        configs.put("dbNum", 0);
+        configs.put("storageLayout", "packed");
+
+        buildAndExecute(stream, configs);
+        verifyPackedOutputResultWithTimestamp();
+    }
+
+    @Test
+    public void testBufferedWrites() throws Exception {
+        DataStream<Row> stream =
+                env.fromSequence(0, NUM_ELEMENTS - 1)
+                        .map(
+                                x ->
+                                        Row.of(
+                                                String.valueOf(x % 5).getBytes(),
+                                                (NUM_ELEMENTS - x) * 1000,
+                                                x.toString().getBytes()),
+                                new RowTypeInfo(
+                                        Types.PRIMITIVE_ARRAY(Types.BYTE),
+                                        Types.LONG,
+                                        Types.PRIMITIVE_ARRAY(Types.BYTE)))
+                        .setParallelism(1);
+
+        Map<String, Object> configs = new HashMap<>();
+        configs.put("host", REDIS_HOST);
+        configs.put("port", redisPort.getPort());
+        configs.put("namespace", "test_namespace");
+        configs.put("keyFields", "f0");
         configs.put("timestampField", "f1");
         configs.put("dbNum", 0);
+        configs.put("bufferSize", 7);
+        configs.put("flushIntervalMs", 100);
+        configs.put("maxInFlightRequests", 2);
 
         buildAndExecute(stream, configs);
         verifyOutputResultWithTimestamp();
@@ -203,7 +323,7 @@ public class RedisSinkITCase extends RedisITCaseBase {
         configs.put("host", REDIS_HOST);
         configs.put("port", redisPort.getPort());
         configs.put("namespace", "test_namespace");
-        configs.put("keyField", "f0");
+        configs.put("keyFields", "f0");
         configs.put("dbNum", 0);
 
         assertThatThrownBy(() -> buildAndExecute(stream, configs))
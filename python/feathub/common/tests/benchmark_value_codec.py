@@ -0,0 +1,85 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the time to encode and decode columns of feature values with ValueCodec
+and with protobuf messages, which is how the values were serialized before.
+
+Run it with `python -m feathub.common.tests.benchmark_value_codec`.
+"""
+import timeit
+from typing import Any, Callable, Dict, List
+
+from feathub.common import types
+from feathub.common.protobuf import value_pb2
+from feathub.common.value_codec import (
+    get_value_codec,
+    from_protobuf_value,
+    to_protobuf_value,
+)
+
+_NUM_VALUES = 100000
+
+
+def _encode_with_messages(values: List[Any], dtype: types.DType) -> List[bytes]:
+    return [to_protobuf_value(value, dtype).SerializeToString() for value in values]
+
+
+def _decode_with_messages(data_list: List[bytes]) -> List[Any]:
+    pb_value = value_pb2.Value()
+    results = []
+    for data in data_list:
+        pb_value.ParseFromString(data)
+        results.append(from_protobuf_value(pb_value))
+    return results
+
+
+def _best_time(function: Callable[[], Any]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=3))
+
+
+def main() -> None:
+    columns: Dict[str, Any] = {
+        "Int64": (types.Int64, list(range(_NUM_VALUES))),
+        "Float64": (types.Float64, [i * 0.5 for i in range(_NUM_VALUES)]),
+        "String": (types.String, [f"user_{i}" for i in range(_NUM_VALUES)]),
+        "Float64Vector": (
+            types.Float64Vector,
+            [[float(i)] * 8 for i in range(_NUM_VALUES)],
+        ),
+        "Map<String, Int64>": (
+            types.MapType(types.String, types.Int64),
+            [{"a": i, "b": -i} for i in range(_NUM_VALUES)],
+        ),
+    }
+
+    print(f"Seconds to encode and decode {_NUM_VALUES} values:")
+    headers = ["encode(pb)", "encode", "decode(pb)", "decode"]
+    print(f"{'type':<20}" + "".join(f"{header:>12}" for header in headers))
+    for name, (dtype, values) in columns.items():
+        codec = get_value_codec(dtype)
+        data_list = codec.encode_all(values)
+        assert data_list == _encode_with_messages(values, dtype)
+        assert codec.decode_all(data_list) == values
+
+        times = [
+            _best_time(lambda: _encode_with_messages(values, dtype)),
+            _best_time(lambda: codec.encode_all(values)),
+            _best_time(lambda: _decode_with_messages(data_list)),
+            _best_time(lambda: codec.decode_all(data_list)),
+        ]
+        print(f"{name:<20}" + "".join(f"{t:>12.3f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
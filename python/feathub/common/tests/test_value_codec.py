@@ -0,0 +1,112 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from datetime import datetime
+from typing import Any, Dict, List
+
+import numpy as np
+
+from feathub.common import types
+from feathub.common.utils import (
+    serialize_and_join_key_columns,
+    serialize_and_join_keys,
+)
+from feathub.common.value_codec import (
+    get_value_codec,
+    decode_value,
+    to_protobuf_value,
+)
+
+
+class ValueCodecTest(unittest.TestCase):
+    values: Dict[types.DType, List[Any]] = {
+        types.Bytes: [b"", b"Apple", bytes(range(256)) * 2],
+        types.String: ["", "Apple", "苹果", "a" * 300],
+        types.Bool: [True, False],
+        types.Int32: [0, 1, -1, 127, 128, 300, -(1 << 31), (1 << 31) - 1],
+        types.Int64: [0, 1, -1, 1 << 40, -(1 << 63), (1 << 63) - 1],
+        types.Float32: [0.0, 1.5, -2.25, float("inf")],
+        types.Float64: [0.0, 0.1, -1e300, float("-inf")],
+        types.Timestamp: [datetime(2022, 1, 1, 8), datetime(1970, 1, 1, 0, 0, 1)],
+        types.Float64Vector: [[], [1.0, 2.0], [None, 3.0]],
+        types.VectorType(types.VectorType(types.String)): [[[]], [["a"], ["b", None]]],
+        types.MapType(types.String, types.Int64): [{}, {"a": 1, "b": -2, "c": None}],
+        types.MapType(types.Int32, types.Float64Vector): [{1: [1.0], 2: []}],
+    }
+
+    def test_same_bytes_as_protobuf(self):
+        for dtype, values in self.values.items():
+            codec = get_value_codec(dtype)
+            for value in values + [None]:
+                self.assertEqual(
+                    to_protobuf_value(value, dtype).SerializeToString(),
+                    codec.encode(value),
+                    f"{value!r} of {dtype}",
+                )
+
+    def test_round_trip(self):
+        for dtype, values in self.values.items():
+            codec = get_value_codec(dtype)
+            column: List[Any] = values + [None]
+            encoded = codec.encode_all(column)
+            self.assertListEqual(column, codec.decode_all(encoded + [None])[:-1])
+            self.assertListEqual(column, [decode_value(data) for data in encoded])
+
+    def test_encode_numpy_array(self):
+        codec = get_value_codec(types.Int64)
+        self.assertListEqual(
+            codec.encode_all([1, 2, 3]),
+            codec.encode_all(np.array([1, 2, 3], dtype=np.int64)),
+        )
+        self.assertEqual(codec.encode(3), codec.encode(np.int64(3)))
+
+    def test_decode_other_type(self):
+        encoded = get_value_codec(types.String).encode("Apple")
+        self.assertEqual("Apple", get_value_codec(types.Int64).decode(encoded))
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            get_value_codec(types.Int32).encode(1 << 31)
+        with self.assertRaises(TypeError):
+            get_value_codec(types.Int64).encode(1.5)
+        with self.assertRaises(TypeError):
+            get_value_codec(types.String).encode(b"Apple")
+
+    def test_codec_is_cached(self):
+        self.assertIs(
+            get_value_codec(types.VectorType(types.Int64)),
+            get_value_codec(types.VectorType(types.Int64)),
+        )
+
+    def test_join_key_columns(self):
+        key_columns = [["Alex", "Emma"], np.array([1, 2], dtype=np.int64)]
+        key_types: List[types.DType] = [types.String, types.Int64]
+        self.assertListEqual(
+            [
+                serialize_and_join_keys(["Alex", 1], key_types),
+                serialize_and_join_keys(["Emma", 2], key_types),
+            ],
+            serialize_and_join_key_columns(key_columns, key_types),
+        )
+        self.assertEqual(
+            to_protobuf_value(
+                [
+                    to_protobuf_value("Alex", types.String).SerializeToString(),
+                    to_protobuf_value(1, types.Int64).SerializeToString(),
+                ],
+                types.VectorType(types.Bytes),
+            ).SerializeToString(),
+            serialize_and_join_keys(["Alex", 1], key_types),
+        )
@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numbers
 from datetime import datetime, timezone, tzinfo
 from string import Template
-from typing import Union, Any, Optional, cast
+from typing import Union, Any, Optional, List, Iterable
 
 from feathub.common import types
 from feathub.common.exceptions import FeathubException
-from feathub.common.protobuf import value_pb2
+from feathub.common.value_codec import get_value_codec, decode_value
 from feathub.table.schema import Schema
 from feathub.table.table_descriptor import TableDescriptor
 
@@ -54,6 +55,10 @@ def to_unix_timestamp(
     Uses the timezone specified in tz if it is not explicitly specified in the given
     date.
     """
+    if isinstance(time, numbers.Integral):
+        # Numpy integers are not instances of int.
+        time = int(time)
+
     if isinstance(time, str):
         time = datetime.strptime(time, format)
     elif isinstance(time, int):
@@ -80,103 +85,92 @@ def serialize_object_with_protobuf(
     :param feature_object: The feature value to be serialized.
     :param feature_type: The type of the feature value.
     """
-    return _serialize_object_with_protobuf(
-        feature_object, feature_type
-    ).SerializeToString()
+    return get_value_codec(feature_type).encode(feature_object)
 
 
-def _serialize_object_with_protobuf(
-    feature_object: Optional[Any], feature_type: types.DType
-) -> value_pb2.Value:
-    pb_value = value_pb2.Value()
-    if feature_object is None:
-        pb_value.none_value = True
-    elif feature_type == types.Bytes:
-        pb_value.bytes_value = feature_object
-    elif feature_type == types.String:
-        pb_value.string_value = feature_object
-    elif feature_type == types.Bool:
-        pb_value.boolean_value = feature_object
-    elif feature_type == types.Int32:
-        pb_value.int_value = feature_object
-    elif feature_type == types.Int64:
-        pb_value.long_value = feature_object
-    elif feature_type == types.Float32:
-        pb_value.float_value = feature_object
-    elif feature_type == types.Float64:
-        pb_value.double_value = feature_object
-    elif feature_type == types.Timestamp:
-        timestamp_value = cast(datetime, feature_object)
-        pb_value.timestamp_value.FromDatetime(timestamp_value)
-    elif isinstance(feature_type, types.MapType):
-        map_type: types.MapType = cast(types.MapType, feature_type)
-        map_object: dict = cast(dict, feature_object)
-        for key, value in map_object.items():
-            pb_value.map_value.keys.append(
-                _serialize_object_with_protobuf(key, map_type.key_dtype)
-            )
-            pb_value.map_value.values.append(
-                _serialize_object_with_protobuf(value, map_type.value_dtype)
-            )
-    elif isinstance(feature_type, types.VectorType):
-        vector_type: types.VectorType = cast(types.VectorType, feature_type)
-        vector_object: list = cast(list, feature_object)
-        for element in vector_object:
-            pb_value.vector_value.values.append(
-                _serialize_object_with_protobuf(element, vector_type.dtype)
-            )
+def serialize_objects_with_protobuf(
+    feature_objects: Iterable[Optional[Any]], feature_type: types.DType
+) -> List[bytes]:
+    """
+    Serializes the feature values of a column into byte arrays with protobuf.
+
+    :param feature_objects: The feature values to be serialized, which can be a list
+                            or a numpy array.
+    :param feature_type: The type of the feature values.
+    """
+    return get_value_codec(feature_type).encode_all(feature_objects)
+
+
+def serialize_and_join_keys(
+    key_objects: List[Any], key_types: List[types.DType]
+) -> bytes:
+    """
+    Serializes the key values of a row into a byte array with protobuf.
+
+    :param key_objects: The values of the key fields.
+    :param key_types: The types of the key fields.
+    """
+    return serialize_and_join_key_columns(
+        [[key_object] for key_object in key_objects], key_types
+    )[0]
+
+
+def serialize_and_join_key_columns(
+    key_columns: List[Iterable[Any]], key_types: List[types.DType]
+) -> List[bytes]:
+    """
+    Serializes the key values of rows into byte arrays with protobuf. The result is
+    the same as that of `serialize_and_join_keys` for each row.
+
+    :param key_columns: The values of each key field.
+    :param key_types: The types of the key fields.
+    """
+    results = [
+        serialize_objects_with_protobuf(key_column, key_type)
+        for key_column, key_type in zip(key_columns, key_types)
+    ]
+
+    if len(results) > 1:
+        return serialize_objects_with_protobuf(
+            [list(row) for row in zip(*results)], types.VectorType(types.Bytes)
+        )
     else:
-        raise TypeError(f"Unsupported data type {feature_type}")
-    return pb_value
+        return results[0]
 
 
-def deserialize_object_with_protobuf(pb_byte_array: bytes) -> Optional[Any]:
+def deserialize_object_with_protobuf(
+    pb_byte_array: bytes, feature_type: Optional[types.DType] = None
+) -> Optional[Any]:
     """
     Deserializes a feature value from byte array with protobuf.
 
     :param pb_byte_array: The protobuf byte array to be deserialized.
+    :param feature_type: Optional. The type of the feature value, with which the
+                         value is deserialized without the protobuf library.
     """
-    pb_value = value_pb2.Value()
-    pb_value.ParseFromString(pb_byte_array)
-    return _deserialize_object_with_protobuf(pb_value)
-
-
-def _deserialize_object_with_protobuf(pb_value: value_pb2.Value) -> Optional[Any]:
-    if pb_value.HasField("none_value"):
-        return None
-    elif pb_value.HasField("bytes_value"):
-        return pb_value.bytes_value
-    elif pb_value.HasField("string_value"):
-        return pb_value.string_value
-    elif pb_value.HasField("boolean_value"):
-        return pb_value.boolean_value
-    elif pb_value.HasField("int_value"):
-        return pb_value.int_value
-    elif pb_value.HasField("long_value"):
-        return pb_value.long_value
-    elif pb_value.HasField("float_value"):
-        return pb_value.float_value
-    elif pb_value.HasField("double_value"):
-        return pb_value.double_value
-    elif pb_value.HasField("timestamp_value"):
-        return pb_value.timestamp_value.ToDatetime()
-    elif pb_value.HasField("map_value"):
-        map_object = dict()
-        for raw_key, raw_value in zip(
-            pb_value.map_value.keys, pb_value.map_value.values
-        ):
-            key = _deserialize_object_with_protobuf(raw_key)
-            value = _deserialize_object_with_protobuf(raw_value)
-            map_object[key] = value
-        return map_object
-    elif pb_value.HasField("vector_value"):
-        vector_object = list()
-        for value in pb_value.vector_value.values:
-            element = _deserialize_object_with_protobuf(value)
-            vector_object.append(element)
-        return vector_object
-    else:
-        raise TypeError(f"Cannot deserialize protobuf object {pb_value}")
+    if feature_type is None:
+        return decode_value(pb_byte_array)
+    return get_value_codec(feature_type).decode(pb_byte_array)
+
+
+def deserialize_objects_with_protobuf(
+    pb_byte_arrays: Iterable[Optional[bytes]],
+    feature_type: Optional[types.DType] = None,
+) -> List[Optional[Any]]:
+    """
+    Deserializes feature values from byte arrays with protobuf.
+
+    :param pb_byte_arrays: The protobuf byte arrays to be deserialized. The result of
+                           a None byte array is None.
+    :param feature_type: Optional. The type of the feature values, with which the
+                         values are deserialized without the protobuf library.
+    """
+    if feature_type is None:
+        return [
+            None if pb_byte_array is None else decode_value(pb_byte_array)
+            for pb_byte_array in pb_byte_arrays
+        ]
+    return get_value_codec(feature_type).decode_all(pb_byte_arrays)
 
 
 def get_table_schema(table: TableDescriptor) -> Schema:
@@ -0,0 +1,463 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import operator
+import struct
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
+
+import numpy as np
+
+from feathub.common import types
+from feathub.common.protobuf import value_pb2
+
+# The tags of the fields of the protobuf message Value, each of which is the field
+# number shifted left by 3 bits or-ed with the wire type.
+_NONE_TAG = 0x08
+_BYTES_TAG = 0x12
+_STRING_TAG = 0x1A
+_INT_TAG = 0x20
+_LONG_TAG = 0x28
+_DOUBLE_TAG = 0x31
+_FLOAT_TAG = 0x3D
+_BOOLEAN_TAG = 0x40
+_VECTOR_TAG = 0x52
+_MAP_TAG = 0x5A
+
+# The tags of the repeated fields of the messages VectorValue and MapValue.
+_ELEMENT_TAG = b"\x0a"
+_MAP_KEY_TAG = b"\x0a"
+_MAP_VALUE_TAG = b"\x12"
+
+_ENCODED_NONE = bytes([_NONE_TAG, 1])
+
+_DOUBLE_STRUCT = struct.Struct("<d")
+_FLOAT_STRUCT = struct.Struct("<f")
+
+_INT32_MIN = -(1 << 31)
+_INT32_MAX = (1 << 31) - 1
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+_Encoder = Callable[[Any], bytes]
+# Decodes the Value message in the given range of the bytes.
+_Decoder = Callable[[bytes, int, int], Any]
+
+
+class ValueCodec:
+    """
+    Encodes values of a DType into the bytes of the protobuf message Value defined in
+    value.proto, and decodes them back. The bytes are the same as those serialized by
+    the protobuf library.
+
+    The encoder and the decoder are built once for the DType, so that values are
+    encoded and decoded without comparing DTypes or creating protobuf messages,
+    except for timestamps. Encoded values of other types, which are written with a
+    different DType, are decoded with the protobuf library.
+    """
+
+    def __init__(self, dtype: types.DType):
+        """
+        :param dtype: The type of the values to encode and decode.
+        """
+        self.dtype = dtype
+        self._encoder = _build_encoder(dtype)
+        self._decoder = _build_decoder(dtype)
+
+    def encode(self, value: Optional[Any]) -> bytes:
+        """
+        Encodes a value. None is encoded as a null value of any type.
+        """
+        return self._encoder(value)
+
+    def encode_all(self, values: Iterable[Optional[Any]]) -> List[bytes]:
+        """
+        Encodes the values of a column, which can be a list or a numpy array.
+        """
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        encoder = self._encoder
+        return [encoder(value) for value in values]
+
+    def decode(self, data: bytes) -> Optional[Any]:
+        """
+        Decodes a value from bytes.
+        """
+        return self._decoder(data, 0, len(data))
+
+    def decode_all(self, data_list: Iterable[Optional[bytes]]) -> List[Optional[Any]]:
+        """
+        Decodes the values of a column. The value of None bytes is None.
+        """
+        decoder = self._decoder
+        return [
+            None if data is None else decoder(data, 0, len(data)) for data in data_list
+        ]
+
+
+_CODECS: Dict[str, ValueCodec] = {}
+_CODECS_LOCK = threading.Lock()
+
+
+def get_value_codec(dtype: types.DType) -> ValueCodec:
+    """
+    Returns the ValueCodec of the DType, which is built the first time it is used.
+    """
+    codec_key = json.dumps(dtype.to_json(), sort_keys=True)
+    codec = _CODECS.get(codec_key)
+    if codec is None:
+        with _CODECS_LOCK:
+            codec = _CODECS.setdefault(codec_key, ValueCodec(dtype))
+    return codec
+
+
+def decode_value(data: bytes) -> Optional[Any]:
+    """
+    Decodes a value of any DType from bytes.
+    """
+    return _decode_generic(data, 0, len(data))
+
+
+def _build_encoder(dtype: types.DType) -> _Encoder:
+    if dtype == types.Bytes:
+        return _with_none(_encode_bytes)
+    elif dtype == types.String:
+        return _with_none(_encode_string)
+    elif dtype == types.Bool:
+        return _with_none(_encode_bool)
+    elif dtype == types.Int32:
+        return _with_none(_encode_int32)
+    elif dtype == types.Int64:
+        return _with_none(_encode_int64)
+    elif dtype == types.Float32:
+        return _with_none(_encode_float32)
+    elif dtype == types.Float64:
+        return _with_none(_encode_float64)
+    elif dtype == types.Timestamp:
+        return _with_none(_encode_timestamp)
+    elif isinstance(dtype, types.VectorType):
+        return _with_none(_build_vector_encoder(dtype))
+    elif isinstance(dtype, types.MapType):
+        return _with_none(_build_map_encoder(dtype))
+    raise TypeError(f"Unsupported data type {dtype}")
+
+
+def _build_decoder(dtype: types.DType) -> _Decoder:
+    if dtype == types.Bytes:
+        return _with_tag(_BYTES_TAG, _decode_bytes)
+    elif dtype == types.String:
+        return _with_tag(_STRING_TAG, _decode_string)
+    elif dtype == types.Bool:
+        return _with_tag(_BOOLEAN_TAG, _decode_bool)
+    elif dtype == types.Int32:
+        return _with_tag(_INT_TAG, _decode_int)
+    elif dtype == types.Int64:
+        return _with_tag(_LONG_TAG, _decode_int)
+    elif dtype == types.Float32:
+        return _with_tag(_FLOAT_TAG, _decode_float32)
+    elif dtype == types.Float64:
+        return _with_tag(_DOUBLE_TAG, _decode_float64)
+    elif isinstance(dtype, types.VectorType):
+        return _with_tag(_VECTOR_TAG, _build_vector_decoder(dtype))
+    elif isinstance(dtype, types.MapType):
+        return _with_tag(_MAP_TAG, _build_map_decoder(dtype))
+    return _decode_generic
+
+
+def _with_none(encoder: _Encoder) -> _Encoder:
+    def encode(value: Any) -> bytes:
+        if value is None:
+            return _ENCODED_NONE
+        return encoder(value)
+
+    return encode
+
+
+def _with_tag(tag: int, decoder: _Decoder) -> _Decoder:
+    """
+    Returns a decoder that decodes the Value messages with the given tag with the
+    given decoder, which starts from the field value after the tag, decodes the null
+    values as None and decodes the other messages with the protobuf library.
+    """
+
+    def decode(data: bytes, start: int, end: int) -> Any:
+        if end > start:
+            if data[start] == tag:
+                return decoder(data, start + 1, end)
+            if data[start] == _NONE_TAG:
+                return None
+        return _decode_generic(data, start, end)
+
+    return decode
+
+
+def _encode_varint(value: int) -> bytes:
+    if value < 0:
+        value += 1 << 64
+    if value < 0x80:
+        return bytes((value,))
+    result = bytearray()
+    while value >= 0x80:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+def _decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = data[pos]
+    if value < 0x80:
+        return value, pos + 1
+    value &= 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        pos += 1
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _encode_bytes(value: Any) -> bytes:
+    if not isinstance(value, bytes):
+        raise TypeError(f"{value!r} has type {type(value)}, but expected bytes.")
+    return bytes((_BYTES_TAG,)) + _encode_varint(len(value)) + value
+
+
+def _encode_string(value: Any) -> bytes:
+    if not isinstance(value, str):
+        raise TypeError(f"{value!r} has type {type(value)}, but expected str.")
+    encoded = value.encode("utf-8")
+    return bytes((_STRING_TAG,)) + _encode_varint(len(encoded)) + encoded
+
+
+def _encode_bool(value: Any) -> bytes:
+    return bytes((_BOOLEAN_TAG, 1 if operator.index(value) else 0))
+
+
+def _encode_int32(value: Any) -> bytes:
+    value = operator.index(value)
+    if not _INT32_MIN <= value <= _INT32_MAX:
+        raise ValueError(f"Value out of range: {value}")
+    return bytes((_INT_TAG,)) + _encode_varint(value)
+
+
+def _encode_int64(value: Any) -> bytes:
+    value = operator.index(value)
+    if not _INT64_MIN <= value <= _INT64_MAX:
+        raise ValueError(f"Value out of range: {value}")
+    return bytes((_LONG_TAG,)) + _encode_varint(value)
+
+
+def _encode_float32(value: Any) -> bytes:
+    return bytes((_FLOAT_TAG,)) + _FLOAT_STRUCT.pack(value)
+
+
+def _encode_float64(value: Any) -> bytes:
+    return bytes((_DOUBLE_TAG,)) + _DOUBLE_STRUCT.pack(value)
+
+
+def _encode_timestamp(value: Any) -> bytes:
+    pb_value = value_pb2.Value()
+    pb_value.timestamp_value.FromDatetime(cast(datetime, value))
+    return pb_value.SerializeToString()
+
+
+def _build_vector_encoder(dtype: types.VectorType) -> _Encoder:
+    element_encoder = _build_encoder(dtype.dtype)
+
+    def encode(value: Any) -> bytes:
+        fields = []
+        for element in value:
+            encoded_element = element_encoder(element)
+            fields.append(_ELEMENT_TAG)
+            fields.append(_encode_varint(len(encoded_element)))
+            fields.append(encoded_element)
+        vector_value = b"".join(fields)
+        return bytes((_VECTOR_TAG,)) + _encode_varint(len(vector_value)) + vector_value
+
+    return encode
+
+
+def _build_map_encoder(dtype: types.MapType) -> _Encoder:
+    key_encoder = _build_encoder(dtype.key_dtype)
+    value_encoder = _build_encoder(dtype.value_dtype)
+
+    def encode(value: Any) -> bytes:
+        # All keys are written before all values, in the order of the field numbers.
+        key_fields = []
+        value_fields = []
+        for map_key, map_value in value.items():
+            encoded_key = key_encoder(map_key)
+            key_fields.append(_MAP_KEY_TAG)
+            key_fields.append(_encode_varint(len(encoded_key)))
+            key_fields.append(encoded_key)
+            encoded_value = value_encoder(map_value)
+            value_fields.append(_MAP_VALUE_TAG)
+            value_fields.append(_encode_varint(len(encoded_value)))
+            value_fields.append(encoded_value)
+        map_value = b"".join(key_fields + value_fields)
+        return bytes((_MAP_TAG,)) + _encode_varint(len(map_value)) + map_value
+
+    return encode
+
+
+def _decode_bytes(data: bytes, start: int, end: int) -> bytes:
+    length, start = _decode_varint(data, start)
+    return data[start:end]
+
+
+def _decode_string(data: bytes, start: int, end: int) -> str:
+    length, start = _decode_varint(data, start)
+    return data[start:end].decode("utf-8")
+
+
+def _decode_bool(data: bytes, start: int, end: int) -> bool:
+    value, _ = _decode_varint(data, start)
+    return value != 0
+
+
+def _decode_int(data: bytes, start: int, end: int) -> int:
+    value, _ = _decode_varint(data, start)
+    if value > _INT64_MAX:
+        value -= 1 << 64
+    return value
+
+
+def _decode_float32(data: bytes, start: int, end: int) -> float:
+    return _FLOAT_STRUCT.unpack_from(data, start)[0]
+
+
+def _decode_float64(data: bytes, start: int, end: int) -> float:
+    return _DOUBLE_STRUCT.unpack_from(data, start)[0]
+
+
+def _decode_repeated(
+    data: bytes, start: int, end: int
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    Returns the ranges of the messages in the first and the second repeated fields
+    of the message in the given range.
+    """
+    first_ranges = []
+    second_ranges = []
+    pos = start
+    while pos < end:
+        tag = data[pos]
+        length, pos = _decode_varint(data, pos + 1)
+        if tag == _ELEMENT_TAG[0]:
+            first_ranges.append((pos, pos + length))
+        else:
+            second_ranges.append((pos, pos + length))
+        pos += length
+    return first_ranges, second_ranges
+
+
+def _build_vector_decoder(dtype: types.VectorType) -> _Decoder:
+    element_decoder = _build_decoder(dtype.dtype)
+
+    def decode(data: bytes, start: int, end: int) -> List:
+        length, start = _decode_varint(data, start)
+        element_ranges, _ = _decode_repeated(data, start, start + length)
+        return [
+            element_decoder(data, element_start, element_end)
+            for element_start, element_end in element_ranges
+        ]
+
+    return decode
+
+
+def _build_map_decoder(dtype: types.MapType) -> _Decoder:
+    key_decoder = _build_decoder(dtype.key_dtype)
+    value_decoder = _build_decoder(dtype.value_dtype)
+
+    def decode(data: bytes, start: int, end: int) -> Dict:
+        length, start = _decode_varint(data, start)
+        key_ranges, value_ranges = _decode_repeated(data, start, start + length)
+        return {
+            key_decoder(data, *key_range): value_decoder(data, *value_range)
+            for key_range, value_range in zip(key_ranges, value_ranges)
+        }
+
+    return decode
+
+
+def _decode_generic(data: bytes, start: int, end: int) -> Optional[Any]:
+    pb_value = value_pb2.Value()
+    pb_value.ParseFromString(data[start:end])
+    return from_protobuf_value(pb_value)
+
+
+def from_protobuf_value(pb_value: value_pb2.Value) -> Optional[Any]:
+    """
+    Returns the value of a protobuf message Value.
+    """
+    value_type = pb_value.WhichOneof("ValueOneOf")
+    if value_type is None:
+        raise TypeError(f"Cannot deserialize protobuf object {pb_value}")
+    elif value_type == "none_value":
+        return None
+    elif value_type == "timestamp_value":
+        return pb_value.timestamp_value.ToDatetime()
+    elif value_type == "map_value":
+        return {
+            from_protobuf_value(key): from_protobuf_value(value)
+            for key, value in zip(pb_value.map_value.keys, pb_value.map_value.values)
+        }
+    elif value_type == "vector_value":
+        return [from_protobuf_value(value) for value in pb_value.vector_value.values]
+    return getattr(pb_value, value_type)
+
+
+def to_protobuf_value(value: Optional[Any], dtype: types.DType) -> value_pb2.Value:
+    """
+    Returns the protobuf message Value of a value of the DType. It serializes to the
+    same bytes as `ValueCodec.encode`, while being much slower.
+    """
+    pb_value = value_pb2.Value()
+    if value is None:
+        pb_value.none_value = True
+    elif dtype == types.Bytes:
+        pb_value.bytes_value = value
+    elif dtype == types.String:
+        pb_value.string_value = value
+    elif dtype == types.Bool:
+        pb_value.boolean_value = value
+    elif dtype == types.Int32:
+        pb_value.int_value = value
+    elif dtype == types.Int64:
+        pb_value.long_value = value
+    elif dtype == types.Float32:
+        pb_value.float_value = value
+    elif dtype == types.Float64:
+        pb_value.double_value = value
+    elif dtype == types.Timestamp:
+        pb_value.timestamp_value.FromDatetime(cast(datetime, value))
+    elif isinstance(dtype, types.MapType):
+        pb_value.map_value.SetInParent()
+        for map_key, map_value in value.items():
+            pb_value.map_value.keys.append(to_protobuf_value(map_key, dtype.key_dtype))
+            pb_value.map_value.values.append(
+                to_protobuf_value(map_value, dtype.value_dtype)
+            )
+    elif isinstance(dtype, types.VectorType):
+        pb_value.vector_value.SetInParent()
+        for element in value:
+            pb_value.vector_value.values.append(to_protobuf_value(element, dtype.dtype))
+    else:
+        raise TypeError(f"Unsupported data type {dtype}")
+    return pb_value
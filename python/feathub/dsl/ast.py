@@ -13,7 +13,7 @@
 #  limitations under the License.
 import json
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Set
 
 from feathub.common.exceptions import FeathubException, FeathubExpressionException
 from feathub.common.types import (
@@ -68,6 +68,22 @@ class ExprAST(ABC):
     def eval_dtype(self, variable_types: Dict[str, DType]) -> DType:
         pass
 
+    def get_children(self) -> List["ExprAST"]:
+        """
+        Returns the child nodes of this node.
+        """
+        return []
+
+    def get_var_names(self) -> Set[str]:
+        """
+        Returns the names of the variables referred to by this node and its
+        descendants.
+        """
+        var_names: Set[str] = set()
+        for child in self.get_children():
+            var_names.update(child.get_var_names())
+        return var_names
+
     def __str__(self) -> str:
         return json.dumps(self.to_json(), indent=2, sort_keys=True)
 
@@ -77,6 +93,9 @@ class AbstractUnaryOp(ExprAST, ABC):
         super().__init__(node_type)
         self.child = child
 
+    def get_children(self) -> List[ExprAST]:
+        return [self.child]
+
 
 class AbstractBinaryOp(ExprAST, ABC):
     def __init__(self, node_type: str, left_child: ExprAST, right_child: ExprAST):
@@ -84,6 +103,9 @@ class AbstractBinaryOp(ExprAST, ABC):
         self.left_child = left_child
         self.right_child = right_child
 
+    def get_children(self) -> List[ExprAST]:
+        return [self.left_child, self.right_child]
+
 
 class BinaryOp(AbstractBinaryOp):
     def __init__(self, op_type: str, left_child: ExprAST, right_child: ExprAST) -> None:
@@ -204,6 +226,9 @@ class VariableNode(ExprAST):
             raise RuntimeError(f"Type of variable {self.var_name} is not given.")
         return variable_types.get(self.var_name)
 
+    def get_var_names(self) -> Set[str]:
+        return {self.var_name}
+
     def to_json(self) -> Dict:
         return {
             "node_type": "VariableNode",
@@ -219,6 +244,9 @@ class ArgListNode(ExprAST):
     def eval_dtype(self, variable_types: Dict[str, DType]) -> DType:
         raise NotImplementedError("This method should not be called.")
 
+    def get_children(self) -> List[ExprAST]:
+        return list(self.values)
+
     def to_json(self) -> Dict:
         return {
             "node_type": "ArgListNode",
@@ -241,6 +269,9 @@ class FuncCallOp(ExprAST):
             )
         return function_type_evaluator(arg_types)
 
+    def get_children(self) -> List[ExprAST]:
+        return [self.args]
+
     def to_json(self) -> Dict:
         return {
             "node_type": "FuncCallOp",
@@ -327,6 +358,9 @@ class CaseOp(ExprAST):
 
         return _get_higher_precision_type(*result_types)
 
+    def get_children(self) -> List[ExprAST]:
+        return [*self.conditions, *self.results, self.default]
+
     def to_json(self) -> Dict:
         return {
             "node_type": "CaseOp",
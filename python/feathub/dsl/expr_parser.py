@@ -12,8 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
 import logging
-from typing import Any
+import os
+import threading
+from typing import Any, Optional
 
 from ply import lex, yacc
 
@@ -37,12 +40,28 @@ from feathub.dsl.ast import (
 from feathub.dsl.expr_lexer_rules import ExprLexerRules
 
 
+_logger = logging.getLogger(__name__)
+
+# The module containing the precomputed LALR parse tables of the FeatHub expression
+# grammar. It should be regenerated with `python -m feathub.dsl.expr_parser` after
+# the grammar is changed.
+_PARSE_TABLE_MODULE = "feathub.dsl.expr_parsetab"
+
+_DEFAULT_PARSE_CACHE_SIZE = 4096
+
+
 class ExprParser:
     """
     Expr Parser parses the FeatHub expression and builds the Abstract Syntax Tree(AST).
     The AST will be further evaluated by the AST evaluator of each Processor.
+
+    The parse results are cached by expression string, so the returned AST is shared
+    by all callers parsing the same expression and should not be modified.
     """
 
+    INSTANCE: Optional["ExprParser"] = None
+    _INSTANCE_LOCK = threading.Lock()
+
     precedence = (
         ("left", "OR"),
         ("left", "AND"),
@@ -52,18 +71,37 @@ class ExprParser:
         ("right", "UMINUS"),
     )
 
-    def __init__(self, **kwargs: Any) -> None:
-        logging.basicConfig(
-            level=logging.DEBUG,
-            filename=".parser.out",
-            filemode="w",
-            format="%(filename)10s:%(lineno)4d:%(message)s",
-        )
-        log = logging.getLogger()
+    def __init__(self, cache_size: int = _DEFAULT_PARSE_CACHE_SIZE, **kwargs: Any):
+        """
+        :param cache_size: The maximum number of expressions whose parse results are
+                           cached.
+        """
         feathub_expr_lexer_rules = ExprLexerRules()
         self.lexer = lex.lex(module=feathub_expr_lexer_rules, **kwargs)
         self.tokens = feathub_expr_lexer_rules.tokens
-        self.yacc = yacc.yacc(module=self, write_tables=False, debuglog=log)
+        self.yacc = yacc.yacc(
+            module=self,
+            tabmodule=_PARSE_TABLE_MODULE,
+            write_tables=False,
+            debug=False,
+            errorlog=_logger,
+        )
+        # The lexer and the parser keep states while parsing an expression.
+        self._parse_lock = threading.Lock()
+        self._cached_parse = functools.lru_cache(maxsize=cache_size)(self._parse)
+
+    @staticmethod
+    def get_instance() -> "ExprParser":
+        """
+        Returns the ExprParser shared in the process, which is constructed when it is
+        first used.
+        """
+        if ExprParser.INSTANCE is None:
+            with ExprParser._INSTANCE_LOCK:
+                if ExprParser.INSTANCE is None:
+                    ExprParser.INSTANCE = ExprParser()
+
+        return ExprParser.INSTANCE
 
     def p_expression_binop(self, p: yacc.YaccProduction) -> None:
         """
@@ -195,4 +233,26 @@ class ExprParser:
             raise FeathubExpressionException("Syntax error at EOF")
 
     def parse(self, expr: str) -> ExprAST:
-        return self.yacc.parse(expr)
+        return self._cached_parse(expr)
+
+    def cache_info(self) -> Any:
+        """
+        Returns the statistics of the parse cache, including the number of cache
+        hits and misses, the maximum size and the current size of the cache.
+        """
+        return self._cached_parse.cache_info()
+
+    def _parse(self, expr: str) -> ExprAST:
+        with self._parse_lock:
+            return self.yacc.parse(expr, lexer=self.lexer)
+
+
+if __name__ == "__main__":
+    # Regenerates the precomputed parse tables.
+    yacc.yacc(
+        module=ExprParser(),
+        tabmodule=_PARSE_TABLE_MODULE,
+        outputdir=os.path.dirname(os.path.abspath(__file__)),
+        debug=False,
+        errorlog=yacc.NullLogger(),
+    )
@@ -0,0 +1,62 @@
+
+# expr_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "leftORleftANDleftLTLEGTGEEQNEISNOTleft+-left*/rightUMINUSAND AS CASE CAST COMMA DTYPE ELSE END EQ FALSE FLOAT GE GT ID INTEGER IS LE LPAREN LT NE NOT NULL OR RPAREN STRING THEN TRUE TRY_CAST WHEN\n        expression : expression '+' expression\n                   | expression '-' expression\n                   | expression '*' expression\n                   | expression '/' expression\n        expression : '-' expression %prec UMINUS\n        expression : expression LT expression\n                   | expression LE expression\n                   | expression GT expression\n                   | expression GE expression\n                   | expression EQ expression\n                   | expression NE expression\n        expression : LPAREN expression RPAREN\n        expression : FLOAT\n                   | INTEGER\n        \n        expression : STRING\n        \n        expression : TRUE\n                   | FALSE\n        expression : ID LPAREN arglist RPAREN\n        arglist : arglist COMMA expression\n                | expression\n        expression : ID\n        expression : CAST LPAREN expression AS DTYPE RPAREN\n                   | TRY_CAST LPAREN expression AS DTYPE RPAREN\n        \n        expression : expression OR expression\n                   | expression AND expression\n        expression : NULL\n        expression : expression IS expression\n                   | expression IS NOT expression\n        \n        expression : CASE caselist END\n                   | CASE caselist ELSE expression END\n        \n        caselist : caselist WHEN expression THEN expression\n                 | WHEN expression THEN expression\n        "
+    
+_lr_action_items = {'-':([0,1,2,3,4,5,6,7,8,9,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,62,63,64,65,68,69,70,71,72,73,],[2,15,2,2,-13,-14,-15,-16,-17,-21,-26,2,2,2,2,2,2,2,2,2,2,2,2,2,-5,15,2,2,2,2,-1,-2,-3,-4,15,15,15,15,15,15,15,15,15,2,-12,15,15,15,-29,2,2,15,15,-18,2,15,15,2,15,-30,2,15,-22,-23,15,]),'LPAREN':([0,2,3,9,10,11,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[3,3,3,29,30,31,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'FLOAT':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'INTEGER':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'STRING':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'TRUE':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'FALSE':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'ID':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'CAST':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'TRY_CAST':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'NULL':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'CASE':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'$end':([1,4,5,6,7,8,9,12,27,34,35,36,37,38,39,40,41,42,43,44,45,46,48,53,57,58,68,71,72,],[0,-13,-14,-15,-16,-17,-21,-26,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,-29,-28,-18,-30,-22,-23,]),'+':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[14,-13,-14,-15,-16,-17,-21,-26,-5,14,-1,-2,-3,-4,14,14,14,14,14,14,14,14,14,-12,14,14,14,-29,14,14,-18,14,14,14,-30,14,-22,-23,14,]),'*':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[16,-13,-14,-15,-16,-17,-21,-26,-5,16,16,16,-3,-4,16,16,16,16,16,16,16,16,16,-12,16,16,16,-29,16,16,-18,16,16,16,-30,16,-22,-23,16,]),'/':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[17,-13,-14,-15,-16,-17,-21,-26,-5,17,17,17,-3,-4,17,17,17,17,17,17,17,17,17,-12,17,17,17,-29,17,17,-18,17,17,17,-30,17,-22,-23,17,]),'LT':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[18,-13,-14,-15,-16,-17,-21,-26,-5,18,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,18,18,-27,-12,18,18,18,-29,18,-28,-18,18,18,18,-30,18,-22,-23,18,]),'LE':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[19,-13,-14,-15,-16,-17,-21,-26,-5,19,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,19,19,-27,-12,19,19,19,-29,19,-28,-18,19,19,19,-30,19,-22,-23,19,]),'GT':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[20,-13,-14,-15,-16,-17,-21,-26,-5,20,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,20,20,-27,-12,20,20,20,-29,20,-28,-18,20,20,20,-30,20,-22,-23,20,]),'GE':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[21,-13,-14,-15,-16,-17,-21,-26,-5,21,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,21,21,-27,-12,21,21,21,-29,21,-28,-18,21,21,21,-30,21,-22,-23,21,]),'EQ':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[22,-13,-14,-15,-16,-17,-21,-26,-5,22,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,22,22,-27,-12,22,22,22,-29,22,-28,-18,22,22,22,-30,22,-22,-23,22,]),'NE':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[23,-13,-14,-15,-16,-17,-21,-26,-5,23,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,23,23,-27,-12,23,23,23,-29,23,-28,-18,23,23,23,-30,23,-22,-23,23,]),'OR':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[24,-13,-14,-15,-16,-17,-21,-26,-5,24,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,24,24,24,-29,24,-28,-18,24,24,24,-30,24,-22,-23,24,]),'AND':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[25,-13,-14,-15,-16,-17,-21,-26,-5,25,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,25,-25,-27,-12,25,25,25,-29,25,-28,-18,25,25,25,-30,25,-22,-23,25,]),'IS':([1,4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,50,51,52,53,56,57,58,62,63,65,68,70,71,72,73,],[26,-13,-14,-15,-16,-17,-21,-26,-5,26,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,26,26,-27,-12,26,26,26,-29,26,-28,-18,26,26,26,-30,26,-22,-23,26,]),'RPAREN':([4,5,6,7,8,9,12,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,48,49,50,53,57,58,65,66,67,68,71,72,],[-13,-14,-15,-16,-17,-21,-26,-5,48,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,58,-20,-29,-28,-18,-19,71,72,-30,-22,-23,]),'COMMA':([4,5,6,7,8,9,12,27,34,35,36,37,38,39,40,41,42,43,44,45,46,48,49,50,53,57,58,65,68,71,72,],[-13,-14,-15,-16,-17,-21,-26,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,59,-20,-29,-28,-18,-19,-30,-22,-23,]),'AS':([4,5,6,7,8,9,12,27,34,35,36,37,38,39,40,41,42,43,44,45,46,48,51,52,53,57,58,68,71,72,],[-13,-14,-15,-16,-17,-21,-26,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,60,61,-29,-28,-18,-30,-22,-23,]),'THEN':([4,5,6,7,8,9,12,27,34,35,36,37,38,39,40,41,42,43,44,45,46,48,53,56,57,58,63,68,71,72,],[-13,-14,-15,-16,-17,-21,-26,-5,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,-29,64,-28,-18,69,-30,-22,-23,]),'END':([4,5,6,7,8,9,12,27,32,34,35,36,37,38,39,40,41,42,43,44,45,46,48,53,57,58,62,68,70,71,72,73,],[-13,-14,-15,-16,-17,-21,-26,-5,53,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,-29,-28,-18,68,-30,-32,-22,-23,-31,]),'ELSE':([4,5,6,7,8,9,12,27,32,34,35,36,37,38,39,40,41,42,43,44,45,46,48,53,57,58,68,70,71,72,73,],[-13,-14,-15,-16,-17,-21,-26,-5,54,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,-29,-28,-18,-30,-32,-22,-23,-31,]),'WHEN':([4,5,6,7,8,9,12,13,27,32,34,35,36,37,38,39,40,41,42,43,44,45,46,48,53,57,58,68,70,71,72,73,],[-13,-14,-15,-16,-17,-21,-26,33,-5,55,-1,-2,-3,-4,-6,-7,-8,-9,-10,-11,-24,-25,-27,-12,-29,-28,-18,-30,-32,-22,-23,-31,]),'NOT':([26,],[47,]),'DTYPE':([60,61,],[66,67,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression':([0,2,3,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,33,47,54,55,59,64,69,],[1,27,28,34,35,36,37,38,39,40,41,42,43,44,45,46,50,51,52,56,57,62,63,65,70,73,]),'caselist':([13,],[32,]),'arglist':([29,],[49,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expression","S'",1,None,None,None),
+  ('expression -> expression + expression','expression',3,'p_expression_binop','expr_parser.py',108),
+  ('expression -> expression - expression','expression',3,'p_expression_binop','expr_parser.py',109),
+  ('expression -> expression * expression','expression',3,'p_expression_binop','expr_parser.py',110),
+  ('expression -> expression / expression','expression',3,'p_expression_binop','expr_parser.py',111),
+  ('expression -> - expression','expression',2,'p_expression_uminus','expr_parser.py',116),
+  ('expression -> expression LT expression','expression',3,'p_expression_compare','expr_parser.py',121),
+  ('expression -> expression LE expression','expression',3,'p_expression_compare','expr_parser.py',122),
+  ('expression -> expression GT expression','expression',3,'p_expression_compare','expr_parser.py',123),
+  ('expression -> expression GE expression','expression',3,'p_expression_compare','expr_parser.py',124),
+  ('expression -> expression EQ expression','expression',3,'p_expression_compare','expr_parser.py',125),
+  ('expression -> expression NE expression','expression',3,'p_expression_compare','expr_parser.py',126),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','expr_parser.py',131),
+  ('expression -> FLOAT','expression',1,'p_expression_number','expr_parser.py',136),
+  ('expression -> INTEGER','expression',1,'p_expression_number','expr_parser.py',137),
+  ('expression -> STRING','expression',1,'p_expression_string','expr_parser.py',143),
+  ('expression -> TRUE','expression',1,'p_expression_boolean','expr_parser.py',149),
+  ('expression -> FALSE','expression',1,'p_expression_boolean','expr_parser.py',150),
+  ('expression -> ID LPAREN arglist RPAREN','expression',4,'p_expression_function_call','expr_parser.py',155),
+  ('arglist -> arglist COMMA expression','arglist',3,'p_expression_arglist','expr_parser.py',160),
+  ('arglist -> expression','arglist',1,'p_expression_arglist','expr_parser.py',161),
+  ('expression -> ID','expression',1,'p_expression_variable','expr_parser.py',170),
+  ('expression -> CAST LPAREN expression AS DTYPE RPAREN','expression',6,'p_expression_cast','expr_parser.py',175),
+  ('expression -> TRY_CAST LPAREN expression AS DTYPE RPAREN','expression',6,'p_expression_cast','expr_parser.py',176),
+  ('expression -> expression OR expression','expression',3,'p_expression_logical_op','expr_parser.py',190),
+  ('expression -> expression AND expression','expression',3,'p_expression_logical_op','expr_parser.py',191),
+  ('expression -> NULL','expression',1,'p_expression_null_node','expr_parser.py',196),
+  ('expression -> expression IS expression','expression',3,'p_expression_is_op','expr_parser.py',201),
+  ('expression -> expression IS NOT expression','expression',4,'p_expression_is_op','expr_parser.py',202),
+  ('expression -> CASE caselist END','expression',3,'p_expression_case_op_enclose','expr_parser.py',211),
+  ('expression -> CASE caselist ELSE expression END','expression',5,'p_expression_case_op_enclose','expr_parser.py',212),
+  ('caselist -> caselist WHEN expression THEN expression','caselist',5,'p_expression_case_op_condition','expr_parser.py',221),
+  ('caselist -> WHEN expression THEN expression','caselist',4,'p_expression_case_op_condition','expr_parser.py',222),
+]
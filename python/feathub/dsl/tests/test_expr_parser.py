@@ -13,6 +13,9 @@
 #  limitations under the License.
 import unittest
 
+from ply import yacc
+
+from feathub.dsl import expr_parsetab
 from feathub.dsl.ast import (
     FuncCallOp,
     ArgListNode,
@@ -98,3 +101,40 @@ class ExprParserTest(unittest.TestCase):
 
         for expr, node in expected_mappings.items():
             self.assertEqual(node.to_json(), self.parser.parse(expr).to_json())
+
+    def test_parse_cache(self):
+        parser = ExprParser(cache_size=2)
+        ast = parser.parse("a + 1")
+        self.assertIs(ast, parser.parse("a + 1"))
+        parser.parse("b + 1")
+        parser.parse("c + 1")
+        self.assertIsNot(ast, parser.parse("a + 1"))
+
+        cache_info = parser.cache_info()
+        self.assertEqual(1, cache_info.hits)
+        self.assertEqual(4, cache_info.misses)
+        self.assertEqual(2, cache_info.currsize)
+
+    def test_get_var_names(self):
+        self.assertEqual(
+            {"a", "b", "c", "d"},
+            self.parser.parse(
+                "CASE WHEN a > 1 THEN LOWER(b) ELSE CAST(c AS STRING) END <> -d"
+            ).get_var_names(),
+        )
+        self.assertEqual(set(), self.parser.parse("1 + 2").get_var_names())
+
+    def test_get_instance(self):
+        self.assertIs(ExprParser.get_instance(), ExprParser.get_instance())
+
+    def test_parse_tables_up_to_date(self):
+        parser_info = yacc.ParserReflect(
+            {name: getattr(self.parser, name) for name in dir(self.parser)}
+        )
+        parser_info.get_all()
+        self.assertEqual(
+            expr_parsetab._lr_signature,
+            parser_info.signature(),
+            "The parse tables are outdated. Please regenerate them with "
+            "`python -m feathub.dsl.expr_parser`.",
+        )
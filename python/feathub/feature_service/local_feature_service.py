@@ -11,17 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Union, Callable, Sequence
 
 import pandas as pd
-from typing import Optional, List, Dict, Union
 
 from feathub.common.exceptions import FeathubException
 from feathub.feature_service.feature_service import FeatureService
+from feathub.feature_service.local_feature_service_config import (
+    LocalFeatureServiceConfig,
+    MAX_CONCURRENT_LOOKUPS_CONFIG,
+)
 from feathub.feature_tables.feature_table import FeatureTable
 from feathub.feature_tables.sources.mysql_source import MySQLSource
 from feathub.feature_tables.sources.redis_source import RedisSource
 from feathub.online_stores.online_store_client import OnlineStoreClient
-from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.local_ast_compiler import LocalAstCompiler
 from feathub.registries.registry import Registry
 from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
 from feathub.feature_views.transforms.join_transform import JoinTransform
@@ -43,10 +48,20 @@ class LocalFeatureService(FeatureService):
         super().__init__()
         self.props = props
         self.registry = registry
-        self.parser = ExprParser()
-        self.ast_evaluator = LocalAstEvaluator()
+        self.parser = ExprParser.get_instance()
+        self.ast_compiler = LocalAstCompiler()
         self.online_store_clients: Dict[str, OnlineStoreClient] = {}
 
+        config = LocalFeatureServiceConfig(props)
+        self.max_concurrent_lookups = config.get(MAX_CONCURRENT_LOOKUPS_CONFIG)
+        # The threads of the pool are only started when lookups are submitted.
+        self._lookup_executor: Optional[ThreadPoolExecutor] = None
+        if self.max_concurrent_lookups > 1:
+            self._lookup_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_lookups,
+                thread_name_prefix="feathub-lookup",
+            )
+
     def get_online_features(
         self,
         request_df: pd.DataFrame,
@@ -74,15 +89,38 @@ class LocalFeatureService(FeatureService):
             )
 
         input_fields = request_df.columns.tolist()
-        for feature in feature_view.get_resolved_features():
-            if isinstance(feature.transform, JoinTransform):
-                request_df = self._evaluate_join_transform(request_df, feature)
-            elif isinstance(feature.transform, ExpressionTransform):
-                request_df = self._evaluate_expression_transform(request_df, feature)
+        request_df = request_df.copy()
+        features = feature_view.get_resolved_features()
+        idx = 0
+        while idx < len(features):
+            # Consecutive features of the same transform type are evaluated together,
+            # unless a join depends on the result of a former join.
+            if isinstance(features[idx].transform, JoinTransform):
+                end = idx + 1
+                while (
+                    end < len(features)
+                    and isinstance(features[end].transform, JoinTransform)
+                    and set(features[end].keys or []) <= set(request_df.columns)
+                ):
+                    end += 1
+                request_df = self._evaluate_join_transforms(
+                    request_df, features[idx:end]
+                )
+            elif isinstance(features[idx].transform, ExpressionTransform):
+                end = idx + 1
+                while end < len(features) and isinstance(
+                    features[end].transform, ExpressionTransform
+                ):
+                    end += 1
+                request_df = self._evaluate_expression_transforms(
+                    request_df, features[idx:end]
+                )
             else:
                 raise RuntimeError(
-                    f"Unsupported transformation type for feature {feature.to_json()}."
+                    f"Unsupported transformation type for feature "
+                    f"{features[idx].to_json()}."
                 )
+            idx = end
 
         if feature_names is not None:
             output_fields = feature_names
@@ -91,6 +129,18 @@ class LocalFeatureService(FeatureService):
 
         return request_df[output_fields]
 
+    def close(self) -> None:
+        """
+        Releases the threads used to look up online tables concurrently.
+        """
+        if self._lookup_executor is not None:
+            self._lookup_executor.shutdown()
+
+    def __del__(self) -> None:
+        # The attribute is missing if the constructor failed.
+        if getattr(self, "_lookup_executor", None) is not None:
+            self.close()
+
     def _get_on_demand_feature_view_from_registry(
         self, feature_view_name: str
     ) -> OnDemandFeatureView:
@@ -102,37 +152,104 @@ class LocalFeatureService(FeatureService):
             )
         return feature_view
 
-    def _evaluate_expression_transform(
-        self, df: pd.DataFrame, feature: Feature
+    def _evaluate_expression_transforms(
+        self, df: pd.DataFrame, features: Sequence[Feature]
     ) -> pd.DataFrame:
-        expression_transform = feature.transform
-        if not isinstance(expression_transform, ExpressionTransform):
-            raise FeathubException(f"Feature {feature} should use ExpressionTransform.")
-        expr_node = self.parser.parse(expression_transform.expr)
-        df[feature.name] = df.apply(
-            lambda row: self.ast_evaluator.eval(expr_node, row), axis=1
-        ).tolist()
+        # Online requests usually contain only a few rows, so the expressions are
+        # evaluated in one pass over the rows with the cached compiled functions.
+        # Each expression can refer to the results of the former ones.
+        field_names = df.columns.tolist()
+        funcs = []
+        for feature in features:
+            expression_transform = feature.transform
+            if not isinstance(expression_transform, ExpressionTransform):
+                raise FeathubException(
+                    f"Feature {feature} should use ExpressionTransform."
+                )
+            funcs.append(
+                self.ast_compiler.compile_expr(expression_transform.expr, field_names)
+            )
+            field_names = field_names + [feature.name]
+
+        rows = [list(row) for row in df.itertuples(index=False, name=None)]
+        for row in rows:
+            for func in funcs:
+                row.append(func(row))
+
+        num_input_fields = df.shape[1]
+        for idx, feature in enumerate(features):
+            df[feature.name] = [row[num_input_fields + idx] for row in rows]
         return df
 
-    def _evaluate_join_transform(
-        self, input_df: pd.DataFrame, feature: Feature
+    def _evaluate_join_transforms(
+        self, input_df: pd.DataFrame, features: Sequence[Feature]
     ) -> pd.DataFrame:
-        join_transform = feature.transform
-        if not isinstance(join_transform, JoinTransform):
-            raise RuntimeError(f"Feature '{feature.name}' should use JoinTransform.")
+        # Features from the same table are looked up at once. The map is from table
+        # name to the map from feature name to the name of the joined field.
+        table_features: Dict[str, Dict[str, str]] = {}
+        for feature in features:
+            join_transform = feature.transform
+            if not isinstance(join_transform, JoinTransform):
+                raise RuntimeError(
+                    f"Feature '{feature.name}' should use JoinTransform."
+                )
+            table_features.setdefault(join_transform.table_name, {})[
+                feature.name
+            ] = join_transform.feature_name
+
+        lookups = {
+            table_name: self._get_lookup_function(
+                table_name, input_df, list(dict.fromkeys(field_names.values()))
+            )
+            for table_name, field_names in table_features.items()
+        }
 
-        source = self.registry.get_features(join_transform.table_name)
+        # Remote tables are looked up concurrently, while the in-memory tables are
+        # looked up in the current thread.
+        remote_table_names = [
+            table_name
+            for table_name in table_features
+            if not isinstance(self.registry.get_features(table_name), MemoryStoreSource)
+        ]
+        results: Dict[str, pd.DataFrame] = {}
+        if self._lookup_executor is not None and len(remote_table_names) > 1:
+            futures = {
+                table_name: self._lookup_executor.submit(lookups[table_name])
+                for table_name in remote_table_names
+            }
+            for table_name, future in futures.items():
+                results[table_name] = future.result()
+        for table_name, lookup in lookups.items():
+            if table_name not in results:
+                results[table_name] = lookup()
+
+        # The lookup results have the same rows as the input DataFrame.
+        for table_name, field_names in table_features.items():
+            for feature_name, field_name in field_names.items():
+                input_df[feature_name] = results[table_name][field_name].to_numpy()
+        return input_df
+
+    def _get_lookup_function(
+        self, table_name: str, input_df: pd.DataFrame, field_names: List[str]
+    ) -> Callable[[], pd.DataFrame]:
+        """
+        Returns a function that looks up the given fields from the table with the
+        keys in the input DataFrame.
+        """
+        source = self.registry.get_features(table_name)
+        keys_df = input_df[source.keys]
 
         if isinstance(source, MemoryStoreSource):
-            return MemoryOnlineStore.get_instance().get(
-                table_name=source.table_name, input_data=input_df
+            memory_table_name = source.table_name
+            return lambda: MemoryOnlineStore.get_instance().get(
+                table_name=memory_table_name,
+                input_data=keys_df,
+                feature_names=field_names,
             )
 
         if isinstance(source, RedisSource) or isinstance(source, MySQLSource):
             client = self._get_online_store_client(source)
-            return client.get(
-                input_data=input_df, feature_names=[join_transform.feature_name]
-            )
+            return lambda: client.get(input_data=keys_df, feature_names=field_names)
 
         raise RuntimeError(f"Unsupported source {source.to_json()}.")
 
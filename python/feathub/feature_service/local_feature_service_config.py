@@ -0,0 +1,43 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict, Any, List
+
+from feathub.common.config import ConfigDef
+from feathub.feature_service.feature_service_config import (
+    FeatureServiceConfig,
+    FEATURE_SERVICE_PREFIX,
+)
+
+LOCAL_FEATURE_SERVICE_PREFIX = FEATURE_SERVICE_PREFIX + "local."
+
+MAX_CONCURRENT_LOOKUPS_CONFIG = LOCAL_FEATURE_SERVICE_PREFIX + "max_concurrent_lookups"
+MAX_CONCURRENT_LOOKUPS_DOC = (
+    "The maximum number of online tables that are looked up concurrently when "
+    "getting online features."
+)
+
+local_feature_service_config_defs: List[ConfigDef] = [
+    ConfigDef(
+        name=MAX_CONCURRENT_LOOKUPS_CONFIG,
+        value_type=int,
+        description=MAX_CONCURRENT_LOOKUPS_DOC,
+        default_value=8,
+    ),
+]
+
+
+class LocalFeatureServiceConfig(FeatureServiceConfig):
+    def __init__(self, props: Dict[str, Any]) -> None:
+        super().__init__(props)
+        self.update_config_values(local_feature_service_config_defs)
@@ -13,8 +13,10 @@
 # limitations under the License.
 import shutil
 import tempfile
+import threading
 import unittest
 from typing import List, Optional
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -23,17 +25,43 @@ from feathub.common.config import flatten_dict
 from feathub.common.types import from_numpy_dtype
 from feathub.feature_service.feature_service import FeatureService
 from feathub.feature_service.local_feature_service import LocalFeatureService
+from feathub.feature_service.local_feature_service_config import (
+    MAX_CONCURRENT_LOOKUPS_CONFIG,
+)
 from feathub.feature_tables.sinks.memory_store_sink import MemoryStoreSink
 from feathub.feature_tables.sources.file_system_source import FileSystemSource
 from feathub.feature_tables.sources.memory_store_source import MemoryStoreSource
+from feathub.feature_tables.sources.redis_source import RedisSource
 from feathub.feature_views.feature import Feature
 from feathub.feature_views.on_demand_feature_view import OnDemandFeatureView
+from feathub.feature_views.transforms.join_transform import JoinTransform
 from feathub.online_stores.memory_online_store import MemoryOnlineStore
+from feathub.online_stores.online_store_client import OnlineStoreClient
 from feathub.processors.local.local_processor import LocalProcessor
 from feathub.registries.local_registry import LocalRegistry
 from feathub.table.schema import Schema
 
 
+class _FakeOnlineStoreClient(OnlineStoreClient):
+    def __init__(self, feature_values: dict):
+        super().__init__()
+        self.feature_values = feature_values
+        self.feature_names: List[List[str]] = []
+        self.thread_names: List[str] = []
+
+    def get(
+        self, input_data: pd.DataFrame, feature_names: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        self.feature_names.append(feature_names)
+        self.thread_names.append(threading.current_thread().name)
+        features = input_data.copy()
+        for feature_name in feature_names:
+            features[feature_name] = [
+                self.feature_values[feature_name][name] for name in input_data["name"]
+            ]
+        return features
+
+
 class FeatureServiceTest(unittest.TestCase):
     def setUp(self):
         self.registry = LocalRegistry(props={})
@@ -248,3 +276,109 @@ class FeatureServiceTest(unittest.TestCase):
             columns=["name", "extra_field", "cost"],
         )
         self.assertTrue(expected_online_features.equals(online_features))
+
+    def test_join_transforms_grouped_by_table(self):
+        request_df = pd.DataFrame([["Alex"], ["Emma"]], columns=["name"])
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[
+                f"{self.online_source_1.name}.cost",
+                f"{self.online_source_2.name}.distance",
+                Feature(
+                    name="cost_copy",
+                    dtype=types.Int64,
+                    transform=JoinTransform(self.online_source_1.name, "cost"),
+                    keys=["name"],
+                ),
+                Feature(name="avg_cost", transform="cost / distance"),
+                Feature(name="double_avg_cost", transform="avg_cost * 2"),
+            ],
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.registry.build_features([on_demand_fv])
+
+        memory_store = MemoryOnlineStore.get_instance()
+        with patch.object(memory_store, "get", wraps=memory_store.get) as get:
+            online_features = self.feature_service.get_online_features(
+                request_df=request_df, feature_view=on_demand_fv
+            )
+        self.assertEqual(2, get.call_count)
+
+        expected_online_features = pd.DataFrame(
+            [["Alex", 600, 800, 600, 0.75, 1.5], ["Emma", 200, 250, 200, 0.8, 1.6]],
+            columns=[
+                "name",
+                "cost",
+                "distance",
+                "cost_copy",
+                "avg_cost",
+                "double_avg_cost",
+            ],
+        )
+        self.assertTrue(expected_online_features.equals(online_features))
+        self.assertListEqual(["name"], request_df.columns.tolist())
+
+    def test_concurrent_remote_lookups(self):
+        schema = (
+            Schema.new_builder()
+            .column("name", types.String)
+            .column("age", types.Int64)
+            .column("city", types.String)
+            .build()
+        )
+        redis_source_1 = RedisSource(
+            name="redis_source_1", schema=schema, keys=["name"], host="127.0.0.1"
+        )
+        redis_source_2 = RedisSource(
+            name="redis_source_2", schema=schema, keys=["name"], host="127.0.0.1"
+        )
+        self.registry.build_features([redis_source_1, redis_source_2])
+        client_1 = _FakeOnlineStoreClient(
+            {"age": {"Alex": 20, "Emma": 30}, "city": {"Alex": "A", "Emma": "B"}}
+        )
+        client_2 = _FakeOnlineStoreClient({"age": {"Alex": 21, "Emma": 31}})
+        self.feature_service.online_store_clients["redis_source_1"] = client_1
+        self.feature_service.online_store_clients["redis_source_2"] = client_2
+
+        on_demand_fv = OnDemandFeatureView(
+            name="on_demand_fv",
+            features=[
+                "redis_source_1.age",
+                "redis_source_1.city",
+                Feature(
+                    name="next_age",
+                    dtype=types.Int64,
+                    transform=JoinTransform("redis_source_2", "age"),
+                    keys=["name"],
+                ),
+                f"{self.online_source_1.name}.cost",
+            ],
+            request_schema=Schema.new_builder().column("name", types.String).build(),
+        )
+        self.registry.build_features([on_demand_fv])
+        online_features = self.feature_service.get_online_features(
+            request_df=pd.DataFrame([["Emma"], ["Alex"]], columns=["name"]),
+            feature_view=on_demand_fv,
+        )
+
+        expected_online_features = pd.DataFrame(
+            [["Emma", 30, "B", 31, 200], ["Alex", 20, "A", 21, 600]],
+            columns=["name", "age", "city", "next_age", "cost"],
+        )
+        self.assertTrue(expected_online_features.equals(online_features))
+        self.assertListEqual([["age", "city"]], client_1.feature_names)
+        self.assertListEqual([["age"]], client_2.feature_names)
+        for thread_name in client_1.thread_names + client_2.thread_names:
+            self.assertTrue(thread_name.startswith("feathub-lookup"))
+
+        lookup_threads = list(self.feature_service._lookup_executor._threads)
+        self.assertTrue(len(lookup_threads) > 0)
+        self.feature_service.close()
+        self.assertFalse(any(thread.is_alive() for thread in lookup_threads))
+
+    def test_sequential_lookups(self):
+        feature_service = LocalFeatureService(
+            props={MAX_CONCURRENT_LOOKUPS_CONFIG: 1}, registry=self.registry
+        )
+        self.assertIsNone(feature_service._lookup_executor)
+        feature_service.close()
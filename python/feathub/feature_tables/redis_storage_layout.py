@@ -0,0 +1,100 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import struct
+from enum import Enum
+from typing import List, Optional, Sequence
+
+from feathub.common.exceptions import FeathubException
+
+
+class RedisStorageLayout(Enum):
+    """
+    The layouts in which the features of a key are stored in Redis.
+
+    HASH: The features are stored in a Redis hash, where each feature is a field
+          whose name is the 4-byte big-endian index of the feature, and the
+          timestamp, if any, is the field `__timestamp__`.
+    PACKED: The features and the timestamp are stored in a Redis string as a packed
+            row, so that they are read with one GET. See `pack_row` for the format.
+    """
+
+    HASH = "hash"
+    PACKED = "packed"
+
+
+PACKED_ROW_VERSION = 1
+
+# The version, the timestamp and the number of fields.
+_PACKED_ROW_HEADER = struct.Struct(">bqi")
+_OFFSET = struct.Struct(">i")
+
+
+def pack_row(values: Sequence[bytes], timestamp: Optional[int] = None) -> bytes:
+    """
+    Packs the serialized feature values of a key into a packed row, which has
+
+    - the version of the format, as 1 byte.
+    - the timestamp in epoch millis, as an 8-byte big-endian long, which is 0 if the
+      features have no timestamp.
+    - the number of values, as a 4-byte big-endian int.
+    - the end offset of each value in the value section, as a 4-byte big-endian int.
+    - the value section, which is the concatenated values.
+
+    :param values: The serialized feature values, in the order of the features.
+    :param timestamp: Optional. The epoch millis when the features are generated.
+    """
+    offsets = []
+    end = 0
+    for value in values:
+        end += len(value)
+        offsets.append(_OFFSET.pack(end))
+    header = _PACKED_ROW_HEADER.pack(
+        PACKED_ROW_VERSION, 0 if timestamp is None else timestamp, len(values)
+    )
+    return b"".join([header] + offsets + list(values))
+
+
+def unpack_values(row: bytes, indices: Sequence[int]) -> List[bytes]:
+    """
+    Returns the serialized feature values at the given indices of a packed row,
+    without reading the other values.
+
+    :param row: The packed row.
+    :param indices: The indices of the values to return.
+    """
+    version, _, num_values = _PACKED_ROW_HEADER.unpack_from(row)
+    if version != PACKED_ROW_VERSION:
+        raise FeathubException(f"Unsupported packed row version {version}.")
+    offsets_start = _PACKED_ROW_HEADER.size
+    values_start = offsets_start + num_values * _OFFSET.size
+    results = []
+    for index in indices:
+        if index >= num_values:
+            raise FeathubException(
+                f"Packed row has {num_values} values, which does not contain index "
+                f"{index}."
+            )
+        start = values_start
+        if index > 0:
+            start += _OFFSET.unpack_from(row, offsets_start + (index - 1) * 4)[0]
+        end = values_start + _OFFSET.unpack_from(row, offsets_start + index * 4)[0]
+        results.append(row[start:end])
+    return results
+
+
+def get_packed_row_timestamp(row: bytes) -> int:
+    """
+    Returns the timestamp in epoch millis of a packed row.
+    """
+    return _PACKED_ROW_HEADER.unpack_from(row)[1]
@@ -11,8 +11,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Dict
+from datetime import timedelta
+from typing import Dict, Union, Optional
 
+from feathub.feature_tables.redis_storage_layout import RedisStorageLayout
 from feathub.feature_tables.sinks.sink import Sink
 
 
@@ -25,6 +27,10 @@ class RedisSink(Sink):
         password: str = None,
         db_num: int = 0,
         namespace: str = "default",
+        storage_layout: Union[str, RedisStorageLayout] = RedisStorageLayout.HASH,
+        buffer_size: int = 1,
+        flush_interval: Optional[timedelta] = None,
+        max_in_flight_requests: int = 1000,
     ):
         """
         :param host: The host of the Redis instance to connect.
@@ -36,7 +42,22 @@ class RedisSink(Sink):
                           sinking to Redis sinks with different namespaces can save
                           records with the same key into Redis without overwriting
                           each other.
+        :param storage_layout: The layout or the name of the layout in which the
+                               features of a key are stored in Redis. The sources
+                               reading the features must use the same layout.
+        :param buffer_size: The maximum number of keys whose features are buffered
+                            before they are written to Redis in a pipeline. Only the
+                            latest features of each key in the buffer are written. The
+                            buffer is also flushed on checkpoints, so that features are
+                            written at least once.
+        :param flush_interval: Optional. If it is not None, the buffered features are
+                               written to Redis at this interval. Otherwise, they are
+                               written only when the buffer is full, on checkpoints and
+                               when the job finishes.
+        :param max_in_flight_requests: The maximum number of requests sent to Redis in
+                                       a pipeline before waiting for their responses.
         """
+        storage_layout = RedisStorageLayout(storage_layout)
         super().__init__(
             name="",
             system_name="redis",
@@ -47,6 +68,12 @@ class RedisSink(Sink):
                 "username": username,
                 "password": password,
                 "db_num": db_num,
+                "storage_layout": storage_layout.value,
+                "buffer_size": buffer_size,
+                "flush_interval_ms": None
+                if flush_interval is None
+                else flush_interval / timedelta(milliseconds=1),
+                "max_in_flight_requests": max_in_flight_requests,
             },
         )
         self.namespace = namespace
@@ -55,6 +82,10 @@ class RedisSink(Sink):
         self.username = username
         self.password = password
         self.db_num = db_num
+        self.storage_layout = storage_layout
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_in_flight_requests = max_in_flight_requests
 
     def to_json(self) -> Dict:
         return {
@@ -65,4 +96,10 @@ class RedisSink(Sink):
             "username": self.username,
             "password": self.password,
             "db_num": self.db_num,
+            "storage_layout": self.storage_layout.value,
+            "buffer_size": self.buffer_size,
+            "flush_interval_ms": None
+            if self.flush_interval is None
+            else self.flush_interval / timedelta(milliseconds=1),
+            "max_in_flight_requests": self.max_in_flight_requests,
         }
@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from datetime import timedelta
 from typing import Dict, List, Optional
 
 from feathub.feature_tables.feature_table import FeatureTable
@@ -38,6 +39,12 @@ class MySQLSource(FeatureTable):
         timestamp_field: Optional[str] = None,
         timestamp_format: str = "epoch",
         extra_config: Optional[Dict[str, str]] = None,
+        batch_size: int = 100,
+        pool_size: int = 5,
+        pool_idle_timeout: timedelta = timedelta(minutes=5),
+        cache_ttl: Optional[timedelta] = None,
+        cache_max_size: int = 10000,
+        cache_missing_keys: bool = True,
     ):
         """
         :param name: The name that uniquely identifies this source in a registry.
@@ -58,6 +65,19 @@ class MySQLSource(FeatureTable):
         :param extra_config: Extra configurations to be passthrough to the processor.
                              The available configurations are different for different
                              processors.
+        :param batch_size: The maximum number of keys whose features are looked up in
+                           one query to MySQL.
+        :param pool_size: The maximum number of connections in the connection pool
+                          shared by the clients connecting to the same MySQL database.
+        :param pool_idle_timeout: The connections in the connection pool that have
+                                  been idle for longer than this timeout are closed
+                                  instead of being reused.
+        :param cache_ttl: Optional. If it is not None, the features looked up from
+                          this source are cached in memory by the online store client
+                          for this duration. Otherwise, the features are not cached.
+        :param cache_max_size: The maximum number of keys whose features are cached.
+        :param cache_missing_keys: Whether to cache the keys whose features are not
+                                   found in this source.
         """
         super().__init__(
             name=name,
@@ -67,6 +87,14 @@ class MySQLSource(FeatureTable):
                 "port": port,
                 "database": database,
                 "table": table,
+                "batch_size": batch_size,
+                "pool_size": pool_size,
+                "pool_idle_timeout_ms": pool_idle_timeout / timedelta(milliseconds=1),
+                "cache_ttl_ms": None
+                if cache_ttl is None
+                else cache_ttl / timedelta(milliseconds=1),
+                "cache_max_size": cache_max_size,
+                "cache_missing_keys": cache_missing_keys,
             },
             keys=keys,
             timestamp_field=timestamp_field,
@@ -81,6 +109,12 @@ class MySQLSource(FeatureTable):
         self.username = username
         self.password = password
         self.extra_config = extra_config
+        self.batch_size = batch_size
+        self.pool_size = pool_size
+        self.pool_idle_timeout = pool_idle_timeout
+        self.cache_ttl = cache_ttl
+        self.cache_max_size = cache_max_size
+        self.cache_missing_keys = cache_missing_keys
 
     def to_json(self) -> Dict:
         return {
@@ -97,4 +131,12 @@ class MySQLSource(FeatureTable):
             "timestamp_field": self.timestamp_field,
             "timestamp_format": self.timestamp_format,
             "extra_config": self.extra_config,
+            "batch_size": self.batch_size,
+            "pool_size": self.pool_size,
+            "pool_idle_timeout_ms": self.pool_idle_timeout / timedelta(milliseconds=1),
+            "cache_ttl_ms": None
+            if self.cache_ttl is None
+            else self.cache_ttl / timedelta(milliseconds=1),
+            "cache_max_size": self.cache_max_size,
+            "cache_missing_keys": self.cache_missing_keys,
         }
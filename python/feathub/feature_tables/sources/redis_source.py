@@ -11,9 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Optional, Dict
+from datetime import timedelta
+from typing import List, Optional, Dict, Union
 
 from feathub.feature_tables.feature_table import FeatureTable
+from feathub.feature_tables.redis_storage_layout import RedisStorageLayout
 from feathub.table.schema import Schema
 
 
@@ -35,6 +37,12 @@ class RedisSource(FeatureTable):
         db_num: int = 0,
         namespace: str = "default",
         timestamp_field: Optional[str] = None,
+        batch_size: int = 100,
+        max_connections: Optional[int] = None,
+        cache_ttl: Optional[timedelta] = None,
+        cache_max_size: int = 10000,
+        cache_missing_keys: bool = True,
+        storage_layout: Union[str, RedisStorageLayout] = RedisStorageLayout.HASH,
     ):
         """
         :param name: The name that uniquely identifies this source in a registry.
@@ -52,7 +60,23 @@ class RedisSource(FeatureTable):
         :param timestamp_field: Optional. If it is not None, it is the name of the field
                                 whose values show the time when the corresponding row
                                 is generated.
+        :param batch_size: The maximum number of keys whose features are looked up in
+                           one round-trip to Redis.
+        :param max_connections: Optional. The maximum number of connections in the
+                                connection pool shared by the clients connecting to the
+                                same Redis database. If it is None, the number of
+                                connections is not limited.
+        :param cache_ttl: Optional. If it is not None, the features looked up from
+                          this source are cached in memory by the online store client
+                          for this duration. Otherwise, the features are not cached.
+        :param cache_max_size: The maximum number of keys whose features are cached.
+        :param cache_missing_keys: Whether to cache the keys whose features are not
+                                   found in this source.
+        :param storage_layout: The layout or the name of the layout in which the
+                               features of a key are stored in Redis. It must be equal
+                               to the layout of the corresponding RedisSink.
         """
+        storage_layout = RedisStorageLayout(storage_layout)
         super().__init__(
             name=name,
             system_name="redis",
@@ -63,6 +87,14 @@ class RedisSource(FeatureTable):
                 "password": password,
                 "db_num": db_num,
                 "namespace": namespace,
+                "batch_size": batch_size,
+                "max_connections": max_connections,
+                "cache_ttl_ms": None
+                if cache_ttl is None
+                else cache_ttl / timedelta(milliseconds=1),
+                "cache_max_size": cache_max_size,
+                "cache_missing_keys": cache_missing_keys,
+                "storage_layout": storage_layout.value,
             },
             keys=keys,
             schema=schema,
@@ -75,6 +107,12 @@ class RedisSource(FeatureTable):
         self.password = password
         self.db_num = db_num
         self.namespace = namespace
+        self.batch_size = batch_size
+        self.max_connections = max_connections
+        self.cache_ttl = cache_ttl
+        self.cache_max_size = cache_max_size
+        self.cache_missing_keys = cache_missing_keys
+        self.storage_layout = storage_layout
 
     def to_json(self) -> Dict:
         return {
@@ -89,4 +127,12 @@ class RedisSource(FeatureTable):
             "db_num": self.db_num,
             "namespace": self.namespace,
             "timestamp_field": self.timestamp_field,
+            "batch_size": self.batch_size,
+            "max_connections": self.max_connections,
+            "cache_ttl_ms": None
+            if self.cache_ttl is None
+            else self.cache_ttl / timedelta(milliseconds=1),
+            "cache_max_size": self.cache_max_size,
+            "cache_missing_keys": self.cache_missing_keys,
+            "storage_layout": self.storage_layout.value,
         }
@@ -23,6 +23,11 @@ from feathub.common.utils import (
     serialize_object_with_protobuf,
     to_unix_timestamp,
 )
+from feathub.feature_tables.redis_storage_layout import (
+    RedisStorageLayout,
+    unpack_values,
+    get_packed_row_timestamp,
+)
 from feathub.feature_tables.sinks.redis_sink import RedisSink
 from feathub.table.schema import Schema
 from feathub.tests.feathub_it_test_base import FeathubITTestBase
@@ -102,11 +107,76 @@ class RedisSourceSinkITTest(ABC, FeathubITTestBase):
                             datetime(2022, 1, 1, 0, 0, i),
                             format="%Y-%m-%d %H:%M:%S",
                         )
+                        * 1000
                     ).to_bytes(8, byteorder="big"),
                 },
                 redis_client.hgetall(key.decode("utf-8")),
             )
 
+    def test_redis_sink_packed_layout(self):
+        input_data = pd.DataFrame(
+            [
+                [1, 1, 10, "2022-01-01 00:00:00"],
+                [2, 2, 20, "2022-01-01 00:00:01"],
+            ],
+            columns=["id", "val", "val_2", "ts"],
+        )
+
+        schema = (
+            Schema.new_builder()
+            .column("id", types.Int64)
+            .column("val", types.Int64)
+            .column("val_2", types.Int64)
+            .column("ts", types.String)
+            .build()
+        )
+
+        source = self.create_file_source(
+            input_data,
+            keys=["id"],
+            schema=schema,
+            timestamp_field="ts",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+
+        host, port, redis_client = self._get_redis_host_port_and_client()
+
+        sink = RedisSink(
+            namespace="test_packed_namespace",
+            host=host,
+            port=port,
+            storage_layout=RedisStorageLayout.PACKED,
+        )
+
+        self.client.materialize_features(
+            features=source,
+            sink=sink,
+            allow_overwrite=True,
+        ).wait(30000)
+
+        for i in range(input_data.shape[0]):
+            key = b"test_packed_namespace:" + serialize_object_with_protobuf(
+                input_data["id"][i], Int64
+            )
+            packed_row = redis_client.get(key)
+
+            self.assertEqual(
+                int(
+                    to_unix_timestamp(
+                        datetime(2022, 1, 1, 0, 0, i), format="%Y-%m-%d %H:%M:%S"
+                    )
+                    * 1000
+                ),
+                get_packed_row_timestamp(packed_row),
+            )
+            self.assertListEqual(
+                [
+                    serialize_object_with_protobuf(i + 1, Int64),
+                    serialize_object_with_protobuf((i + 1) * 10, Int64),
+                ],
+                unpack_values(packed_row, [0, 1]),
+            )
+
     @classmethod
     def _get_redis_host_port_and_client(cls):
         host = cls.redis_container.get_container_host_ip()
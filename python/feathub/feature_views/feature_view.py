@@ -29,8 +29,6 @@ from feathub.feature_views.transforms.sliding_window_transform import (
 )
 from feathub.table.table_descriptor import TableDescriptor
 
-feathub_expr_parser = ExprParser()
-
 
 class FeatureView(TableDescriptor, ABC):
     """
@@ -228,14 +226,13 @@ class FeatureView(TableDescriptor, ABC):
         self, feature: Feature, variable_types: Dict[str, DType]
     ) -> Optional[DType]:
         transform = feature.transform
+        parser = ExprParser.get_instance()
         if isinstance(transform, ExpressionTransform):
-            dtype = feathub_expr_parser.parse(transform.expr).eval_dtype(variable_types)
+            dtype = parser.parse(transform.expr).eval_dtype(variable_types)
         elif isinstance(transform, OverWindowTransform) or isinstance(
             transform, SlidingWindowTransform
         ):
-            expr_result_type = feathub_expr_parser.parse(transform.expr).eval_dtype(
-                variable_types
-            )
+            expr_result_type = parser.parse(transform.expr).eval_dtype(variable_types)
             dtype = transform.agg_func.get_result_type(expr_result_type)
         elif isinstance(transform, JoinTransform):
             raise FeathubException("JoinTransform feature should have dtype set.")
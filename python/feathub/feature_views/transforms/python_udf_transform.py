@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Any, Dict
+from typing import Callable, Any, Dict, Optional, Sequence, Union
 import pandas as pd
 
 from feathub.feature_views.transforms.transformation import Transformation
@@ -21,17 +21,42 @@ from feathub.feature_views.transforms.transformation import Transformation
 class PythonUdfTransform(Transformation):
     """
     Derives feature values by applying a Python UDF on one row of the parent table at a
-    time.
+    time, or on a batch of rows at a time if the transform is vectorized.
     """
 
-    def __init__(self, udf: Callable[[pd.Series], Any]) -> None:
+    def __init__(
+        self,
+        udf: Union[Callable[[pd.Series], Any], Callable[[pd.DataFrame], pd.Series]],
+        pure: bool = False,
+        vectorized: bool = False,
+        input_fields: Optional[Sequence[str]] = None,
+    ) -> None:
         """
         :param udf: The udf that will be invoked for each row. The input
                           of the udf is a Pandas Series object that represent the
-                          row.
+                          row. If the transform is vectorized, the udf is invoked for
+                          each batch of rows instead, whose input is a Pandas
+                          DataFrame object that represents the rows and whose output
+                          is a Pandas Series object with a value for each row.
+        :param pure: Whether the result of the udf only depends on the input row and
+                     the udf has no side effect. Processors might invoke a pure udf
+                     in parallel in other processes.
+        :param vectorized: Whether the udf is invoked on a batch of rows at a time,
+                           which saves the overhead of invoking it for each row.
+        :param input_fields: Optional. The names of the fields in the parent table
+                             that are used by the udf, which are the only fields
+                             passed to the udf. If it is None, all fields in the
+                             parent table are passed to the udf.
         """
         super().__init__()
         self.udf = udf
+        self.pure = pure
+        self.vectorized = vectorized
+        self.input_fields = None if input_fields is None else list(input_fields)
 
     def to_json(self) -> Dict:
-        return {"type": "PythonTransform"}
+        return {
+            "type": "PythonTransform",
+            "vectorized": self.vectorized,
+            "input_fields": self.input_fields,
+        }
@@ -15,7 +15,7 @@ from abc import ABC
 
 import pandas as pd
 
-from feathub.common.types import String
+from feathub.common.types import Int64, String
 from feathub.feature_views.derived_feature_view import DerivedFeatureView
 from feathub.feature_views.feature import Feature
 from feathub.feature_views.transforms.python_udf_transform import PythonUdfTransform
@@ -58,3 +58,53 @@ class PythonUDFTransformITTest(ABC, FeathubITTestBase):
         )
 
         self.assertTrue(expected_result_df.equals(result_df))
+
+    def test_vectorized_python_udf_transform(self):
+        df_1 = self.input_data.copy()
+        source = self.create_file_source(df_1)
+
+        def name_to_lower(df: pd.DataFrame) -> pd.Series:
+            return df["name"].str.lower()
+
+        def cost_with_distance(row: pd.Series) -> int:
+            return row["cost"] + row["distance"]
+
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=source,
+            features=[
+                Feature(
+                    name="lower_name",
+                    dtype=String,
+                    transform=PythonUdfTransform(
+                        name_to_lower, vectorized=True, input_fields=["name"]
+                    ),
+                    keys=["name"],
+                ),
+                Feature(
+                    name="cost_with_distance",
+                    dtype=Int64,
+                    transform=PythonUdfTransform(
+                        cost_with_distance, input_fields=["cost", "distance"]
+                    ),
+                    keys=["name"],
+                ),
+            ],
+        )
+
+        expected_result_df = df_1
+        expected_result_df["lower_name"] = expected_result_df["name"].str.lower()
+        expected_result_df["cost_with_distance"] = (
+            expected_result_df["cost"] + expected_result_df["distance"]
+        )
+        expected_result_df.drop(["cost", "distance"], axis=1, inplace=True)
+        expected_result_df = expected_result_df.sort_values(
+            by=["name", "time"]
+        ).reset_index(drop=True)
+
+        table = self.client.get_features(features=feature_view)
+        result_df = (
+            table.to_pandas().sort_values(by=["name", "time"]).reset_index(drop=True)
+        )
+
+        self.assertTrue(expected_result_df.equals(result_df))
@@ -0,0 +1,189 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, List, Dict, Tuple, Any, NamedTuple
+
+import pandas as pd
+
+from feathub.online_stores.online_store_client import OnlineStoreClient
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a CachedOnlineStoreClient.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class CachedOnlineStoreClient(OnlineStoreClient):
+    """
+    An online store client that caches the feature values read through another
+    OnlineStoreClient in memory, so that the features of hot keys are only read from
+    the online store once per TTL.
+
+    The cache keeps the features of at most `max_size` keys and evicts the least
+    recently used keys first. Keys whose requested features are all missing, e.g.
+    keys not found in the online store, are also cached if `cache_missing_keys` is
+    true. The cache can be accessed by multiple threads concurrently.
+    """
+
+    def __init__(
+        self,
+        client: OnlineStoreClient,
+        keys: List[str],
+        all_feature_names: List[str],
+        ttl: timedelta,
+        max_size: int = 10000,
+        cache_missing_keys: bool = True,
+    ):
+        """
+        :param client: The client to read the features not found in the cache.
+        :param keys: The names of the key fields of the table.
+        :param all_feature_names: The names of the feature fields of the table.
+        :param ttl: The duration for which the features of a key are cached.
+        :param max_size: The maximum number of keys whose features are cached.
+        :param cache_missing_keys: Whether to cache the keys whose requested
+                                   features are all missing.
+        """
+        super().__init__()
+        self.client = client
+        self.keys = keys
+        self.all_feature_names = all_feature_names
+        self.ttl_sec = ttl.total_seconds()
+        self.max_size = max_size
+        self.cache_missing_keys = cache_missing_keys
+
+        # The map from key tuple to the expiration time and the cached feature
+        # values of the key, in the order from the least to the most recently used.
+        self._entries: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self, input_data: pd.DataFrame, feature_names: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        if not set(self.keys) <= set(input_data.columns.values):
+            raise RuntimeError(
+                f"Input dataframe's column names {input_data.columns.values} "
+                f"should contain all of source key field names {self.keys}."
+            )
+
+        if feature_names is None:
+            feature_names = self.all_feature_names
+
+        keys = list(zip(*[input_data[key].tolist() for key in self.keys]))
+        values = self._get_cached_values(keys, feature_names)
+
+        missed_keys = list(dict.fromkeys(key for key in keys if key not in values))
+        if missed_keys:
+            values.update(self._load_values(missed_keys, feature_names))
+
+        features = pd.DataFrame(
+            {
+                feature_name: [values[key][feature_name] for key in keys]
+                for feature_name in feature_names
+            },
+            index=input_data.index,
+            columns=feature_names,
+        )
+        return input_data.join(features)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the number of cache hits, misses, evictions and the number of keys
+        currently cached.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._evictions, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """
+        Removes all the cached features.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _get_cached_values(
+        self, keys: List[Tuple], feature_names: List[str]
+    ) -> Dict[Tuple, Dict[str, Any]]:
+        now = time.monotonic()
+        values = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] <= now:
+                    del self._entries[key]
+                    entry = None
+                if entry is None or not all(
+                    feature_name in entry[1] for feature_name in feature_names
+                ):
+                    self._misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                values[key] = entry[1]
+                self._hits += 1
+        return values
+
+    def _load_values(
+        self, keys: List[Tuple], feature_names: List[str]
+    ) -> Dict[Tuple, Dict[str, Any]]:
+        keys_df = pd.DataFrame(keys, columns=self.keys)
+        features = self.client.get(input_data=keys_df, feature_names=feature_names)
+
+        values = {
+            key: dict(zip(feature_names, row))
+            for key, row in zip(
+                keys,
+                features[feature_names].itertuples(index=False, name=None),
+            )
+        }
+
+        now = time.monotonic()
+        with self._lock:
+            for key, key_values in values.items():
+                if not self.cache_missing_keys and all(
+                    _is_missing(value) for value in key_values.values()
+                ):
+                    continue
+                # The loaded features are merged into a live entry of the key, so
+                # that callers requesting different features of a key do not evict
+                # each other's features. The merged entry keeps the expiration time
+                # of the features cached earliest.
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries[key] = (entry[0], {**entry[1], **key_values})
+                else:
+                    self._entries[key] = (now + self.ttl_sec, key_values)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return values
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
@@ -12,9 +12,9 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Any, Sequence
 
+import numpy as np
 import pandas as pd
 
 import feathub.common.utils as utils
@@ -24,17 +24,52 @@ from feathub.table.schema import Schema
 
 
 class _TableInfo:
+    """
+    The feature values of a table, which are stored in columns. The i-th row of the
+    table consists of the i-th value of each column, and the index maps the key of
+    each row to its position.
+    """
+
     def __init__(
         self,
-        table: Dict,
         schema: Schema,
         timestamp_field: Optional[str],
         key_fields: List[str],
     ):
-        self.table = table
         self.schema = schema
         self.timestamp_field = timestamp_field
         self.key_fields = key_fields
+        self.index: Dict[Tuple, int] = {}
+        self.columns: Dict[str, np.ndarray] = {}
+        # The epoch millis of the timestamp field of each row.
+        self.times = np.zeros(0, dtype=np.int64)
+        # A pandas Index of the keys used to look up the rows of many keys at once,
+        # which is built lazily and invalidated when new keys are inserted.
+        self._lookup_index: Optional[pd.Index] = None
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.index)
+
+    def invalidate_lookup_index(self) -> None:
+        self._lookup_index = None
+
+    def lookup(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Returns the positions of the rows whose keys match the keys of each row in
+        the given DataFrame.
+        """
+        if self._lookup_index is None:
+            self._lookup_index = _to_index(
+                [self.columns[key] for key in self.key_fields]
+            )
+        slots = self._lookup_index.get_indexer(
+            _to_index([df[key].to_numpy() for key in self.key_fields])
+        )
+        if (slots < 0).any():
+            key = _get_keys(df, self.key_fields)[np.argmax(slots < 0)]
+            raise KeyError(key)
+        return slots
 
 
 class MemoryOnlineStore:
@@ -77,7 +112,6 @@ class MemoryOnlineStore:
 
         if table_name not in self.table_infos:
             self.table_infos[table_name] = _TableInfo(
-                table={},
                 schema=schema,
                 key_fields=key_fields,
                 timestamp_field=timestamp_field,
@@ -98,29 +132,74 @@ class MemoryOnlineStore:
                 f"Features' columns {features.columns} do not have all "
                 f"the keys {table_info.key_fields}."
             )
+        if features.shape[0] == 0:
+            return
 
-        table = table_info.table
-        for index, row in features.iterrows():
-            key = tuple(row.loc[key_fields].to_dict(OrderedDict).items())
-
-            # overwrite if timestamp_field is None
-            if timestamp_field is None:
-                table[key] = row
-                continue
-
+        times = None
+        if timestamp_field is not None:
             if timestamp_format is None:
                 raise FeathubException(
                     "timestamp_format must not be None if timestamp_field is given."
                 )
-            time = utils.to_unix_timestamp(row[timestamp_field], timestamp_format)
-            existing_row = table.get(key, None)
-            if existing_row is not None:
-                existing_time = utils.to_unix_timestamp(
-                    existing_row[timestamp_field], timestamp_format
-                )
-                if existing_time >= time:
-                    continue
-            table[key] = row
+            times = _to_epoch_millis(features[timestamp_field], timestamp_format)
+
+        # Only keeps the row that should be written for each distinct key, which is
+        # the first row with the latest timestamp, or the last row if there is no
+        # timestamp field.
+        keys = _get_keys(features, table_info.key_fields)
+        key_codes, unique_keys = pd.factorize(keys)
+        positions = np.arange(features.shape[0])
+        if times is None:
+            order = np.lexsort((-positions, key_codes))
+        else:
+            order = np.lexsort((positions, -times, key_codes))
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = key_codes[order][1:] != key_codes[order][:-1]
+        rows = order[is_first]
+
+        slots = np.fromiter(
+            (table_info.index.get(key, -1) for key in unique_keys),
+            dtype=np.int64,
+            count=len(unique_keys),
+        )
+        is_existing = slots >= 0
+        is_updated = is_existing.copy()
+        if times is not None:
+            is_updated[is_existing] = (
+                times[rows[is_existing]] > table_info.times[slots[is_existing]]
+            )
+
+        updated_rows = rows[is_updated]
+        updated_slots = slots[is_updated]
+        inserted_rows = rows[~is_existing]
+        inserted_slots = np.arange(
+            table_info.num_rows, table_info.num_rows + len(inserted_rows)
+        )
+
+        for name in features.columns:
+            values = features[name].to_numpy()
+            if name in table_info.columns:
+                column = _promote_dtype(table_info.columns[name], values.dtype)
+            elif table_info.num_rows == 0:
+                column = np.empty(0, dtype=values.dtype)
+            else:
+                column = np.full(table_info.num_rows, None, dtype=object)
+            # The key values of updated rows are unchanged. They are not written
+            # again since the lookup index refers to the objects in the key columns.
+            if name not in table_info.key_fields:
+                column[updated_slots] = values[updated_rows]
+            table_info.columns[name] = np.concatenate(
+                [column, values[inserted_rows].astype(column.dtype)]
+            )
+        if times is not None:
+            table_info.times[updated_slots] = times[updated_rows]
+            table_info.times = np.concatenate([table_info.times, times[inserted_rows]])
+
+        if len(inserted_slots) > 0:
+            table_info.index.update(
+                zip(unique_keys[~is_existing].tolist(), inserted_slots.tolist())
+            )
+            table_info.invalidate_lookup_index()
 
     def get(
         self,
@@ -145,7 +224,6 @@ class MemoryOnlineStore:
         """
 
         table_info = self.table_infos[table_name]
-        table = table_info.table
         key_fields = table_info.key_fields
         if not set(key_fields).issubset(list(input_data.columns)):
             raise RuntimeError(f"Input data does not have all the keys {key_fields}.")
@@ -153,33 +231,30 @@ class MemoryOnlineStore:
         if include_timestamp_field:
             field_to_drop = None
 
-        rows = []
-        for index, row in input_data.iterrows():
-            key = tuple(row.loc[key_fields].to_dict(OrderedDict).items())
-            row = table[key]
-            rows.append(row)
+        slots = table_info.lookup(input_data)
 
         # TODO: move this logic to FeatureService.
 
-        schema = self.table_infos[table_name].schema
-        features = (
-            pd.concat(rows, axis=1)
-            .transpose()
-            .reset_index(drop=True)
-            .astype(
-                {
-                    field_name: to_numpy_dtype(schema.get_field_type(field_name))
-                    for field_name in schema.field_names
-                }
-            )
+        schema = table_info.schema
+        features = pd.DataFrame(
+            {
+                name: column.take(slots)
+                for name, column in table_info.columns.items()
+                if name not in key_fields
+            }
+        ).astype(
+            {
+                field_name: to_numpy_dtype(schema.get_field_type(field_name))
+                for field_name in schema.field_names
+                if field_name not in key_fields
+            }
         )
-        features = features.drop(columns=key_fields)
         input_data = input_data.drop(columns=features.columns.tolist(), errors="ignore")
         features = input_data.join(features)
 
         if feature_names is not None:
             if table_info.timestamp_field is not None:
-                feature_names.append(table_info.timestamp_field)
+                feature_names = feature_names + [table_info.timestamp_field]
             features = features[input_data.columns.values.tolist() + feature_names]
         if table_info.timestamp_field is not None and not include_timestamp_field:
             features = features.drop(columns=[field_to_drop])
@@ -194,3 +269,41 @@ class MemoryOnlineStore:
             MemoryOnlineStore.INSTANCE = MemoryOnlineStore()
 
         return MemoryOnlineStore.INSTANCE
+
+
+def _get_keys(df: pd.DataFrame, key_fields: Sequence[str]) -> np.ndarray:
+    """
+    Returns an object array containing the tuple of key values of each row.
+    """
+    keys = np.empty(df.shape[0], dtype=object)
+    keys[:] = list(zip(*[df[key].tolist() for key in key_fields]))
+    return keys
+
+
+def _to_index(arrays: List[np.ndarray]) -> pd.Index:
+    if len(arrays) == 1:
+        return pd.Index(arrays[0])
+    return pd.MultiIndex.from_arrays(arrays)
+
+
+def _to_epoch_millis(series: pd.Series, timestamp_format: str) -> np.ndarray:
+    # Each distinct timestamp is only converted once.
+    codes, uniques = pd.factorize(series)
+    unique_millis = np.array(
+        [
+            round(utils.to_unix_timestamp(value, timestamp_format) * 1000)
+            for value in uniques.tolist()
+        ],
+        dtype=np.int64,
+    )
+    return unique_millis[codes]
+
+
+def _promote_dtype(column: np.ndarray, dtype: Any) -> np.ndarray:
+    try:
+        result_dtype = np.result_type(column.dtype, dtype)
+    except TypeError:
+        result_dtype = np.dtype(object)
+    if result_dtype == column.dtype:
+        return column
+    return column.astype(result_dtype)
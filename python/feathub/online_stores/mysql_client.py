@@ -11,7 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Optional, List, Any
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Optional, List, Any, Dict, Tuple, Iterator
 
 import mysql.connector
 import pandas as pd
@@ -20,7 +24,131 @@ from feathub.online_stores.online_store_client import OnlineStoreClient
 from feathub.table.schema import Schema
 
 
+class _PooledConnection:
+    """
+    A MySQL connection in the connection pool, together with the prepared cursors
+    created on it so that each statement is only prepared once per connection.
+    """
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.cursors: Dict[str, Tuple[str, Any]] = {}
+        self.last_used_time = time.monotonic()
+
+    def execute(self, sql: str, params: List[Any]) -> List[Any]:
+        """
+        Executes the statement with a server-side prepared statement and returns the
+        result rows.
+        """
+        if sql not in self.cursors:
+            self.cursors[sql] = (sql, self.connection.cursor(prepared=True))
+        # The cursor only reuses its prepared statement if it is executed with the
+        # same string object.
+        prepared_sql, cursor = self.cursors[sql]
+        cursor.execute(prepared_sql, params)
+        return cursor.fetchall()
+
+    def close(self) -> None:
+        try:
+            for _, cursor in self.cursors.values():
+                cursor.close()
+            self.connection.close()
+        except mysql.connector.Error:
+            pass
+
+
+class _ConnectionPool:
+    """
+    A pool of at most `pool_size` connections to a MySQL database. Connections are
+    created lazily, reused in last-in-first-out order and closed once they have been
+    idle for the idle timeout. Acquiring a connection blocks while all
+    the connections are in use.
+    """
+
+    def __init__(
+        self, pool_size: int, idle_timeout: timedelta, **connection_config: Any
+    ):
+        self.idle_timeout_sec = idle_timeout.total_seconds()
+        self.connection_config = connection_config
+        self._semaphore = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self._idle_connections: List[_PooledConnection] = []
+
+    @contextmanager
+    def get_connection(self) -> Iterator[_PooledConnection]:
+        with self._semaphore:
+            connection = self._take_idle_connection()
+            if connection is None:
+                connection = _PooledConnection(
+                    mysql.connector.connect(**self.connection_config)
+                )
+            try:
+                yield connection
+            except mysql.connector.Error:
+                connection.close()
+                raise
+            except Exception:
+                self._release(connection)
+                raise
+            self._release(connection)
+
+    def _take_idle_connection(self) -> Optional[_PooledConnection]:
+        expired_time = time.monotonic() - self.idle_timeout_sec
+        with self._lock:
+            expired_connections = [
+                x for x in self._idle_connections if x.last_used_time <= expired_time
+            ]
+            self._idle_connections = [
+                x for x in self._idle_connections if x.last_used_time > expired_time
+            ]
+            connection = (
+                self._idle_connections.pop() if self._idle_connections else None
+            )
+        for expired_connection in expired_connections:
+            expired_connection.close()
+        return connection
+
+    def _release(self, connection: _PooledConnection) -> None:
+        connection.last_used_time = time.monotonic()
+        with self._lock:
+            self._idle_connections.append(connection)
+
+
+# The connection pools shared by the MySQLClients connecting to the same database
+# with the same pool settings.
+_CONNECTION_POOLS: Dict[Tuple, _ConnectionPool] = {}
+_CONNECTION_POOLS_LOCK = threading.Lock()
+
+
+def _get_connection_pool(
+    host: str,
+    port: int,
+    username: str,
+    password: str,
+    database: str,
+    pool_size: int,
+    idle_timeout: timedelta,
+) -> _ConnectionPool:
+    pool_key = (host, port, username, password, database, pool_size, idle_timeout)
+    with _CONNECTION_POOLS_LOCK:
+        if pool_key not in _CONNECTION_POOLS:
+            _CONNECTION_POOLS[pool_key] = _ConnectionPool(
+                pool_size=pool_size,
+                idle_timeout=idle_timeout,
+                host=host,
+                port=port,
+                user=username,
+                password=password,
+                database=database,
+            )
+        return _CONNECTION_POOLS[pool_key]
+
+
 class MySQLClient(OnlineStoreClient):
+    """
+    An online store client that reads feature values from MySQL.
+    """
+
     def __init__(
         self,
         database: str,
@@ -32,6 +160,9 @@ class MySQLClient(OnlineStoreClient):
         password: str,
         keys: Optional[List[str]] = None,
         timestamp_field: Optional[str] = None,
+        batch_size: int = 100,
+        pool_size: int = 5,
+        pool_idle_timeout: timedelta = timedelta(minutes=5),
     ):
         super().__init__()
         self.table = table
@@ -42,11 +173,22 @@ class MySQLClient(OnlineStoreClient):
         self.username = username
         self.password = password
         self.database = database
+        self.batch_size = batch_size
 
         self.all_feature_names = [
             x for x in schema.field_names if x not in self.keys and x != timestamp_field
         ]
 
+        self.connection_pool = _get_connection_pool(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            database=database,
+            pool_size=pool_size,
+            idle_timeout=pool_idle_timeout,
+        )
+
     def get(
         self, input_data: pd.DataFrame, feature_names: Optional[List[str]] = None
     ) -> pd.DataFrame:
@@ -61,10 +203,10 @@ class MySQLClient(OnlineStoreClient):
 
         selected_field_names = [*self.keys, *feature_names]
 
-        key_values = []
-        for _, row in input_data.iterrows():
-            row_dict = row.to_dict()
-            key_values.append([row_dict[key] for key in self.keys])
+        # Each distinct key is only queried once.
+        key_values = list(
+            dict.fromkeys(zip(*[input_data[key].tolist() for key in self.keys]))
+        )
 
         features = pd.DataFrame(
             data=self._query_rows_with_primary_key(selected_field_names, key_values),
@@ -74,40 +216,39 @@ class MySQLClient(OnlineStoreClient):
         return features
 
     def _query_rows_with_primary_key(
-        self, select_fields: List[str], key_values: List[List[Any]]
+        self, select_fields: List[str], key_values: List[Tuple]
     ) -> List[Any]:
-        conn = None
-        cursor = None
-        primary_keys_predicate = " AND ".join([f"`{key}`=%s" for key in self.keys])
+        if not key_values:
+            return []
+
+        # Every query has the same number of keys so that the statement is only
+        # prepared once. The last batch is padded by repeating its last key, which
+        # does not change the result of the IN predicate.
+        batch_size = min(self.batch_size, len(key_values))
+        sql = self._get_query_sql(select_fields, batch_size)
+
+        results: List[Any] = []
+        with self.connection_pool.get_connection() as connection:
+            for start in range(0, len(key_values), batch_size):
+                end = start + batch_size
+                batch = key_values[start:end]
+                batch += [batch[-1]] * (batch_size - len(batch))
+                results.extend(
+                    connection.execute(sql, [value for key in batch for value in key])
+                )
+
+        return results
+
+    def _get_query_sql(self, select_fields: List[str], batch_size: int) -> str:
         select_field_str = ",".join([f"`{f}`" for f in select_fields])
-        sql = (
+        if len(self.keys) == 1:
+            keys_str = f"`{self.keys[0]}`"
+            key_placeholder = "%s"
+        else:
+            keys_str = "(" + ",".join([f"`{key}`" for key in self.keys]) + ")"
+            key_placeholder = "(" + ",".join(["%s"] * len(self.keys)) + ")"
+        placeholders = ",".join([key_placeholder] * batch_size)
+        return (
             f"SELECT {select_field_str} FROM {self.table} "
-            f"WHERE {primary_keys_predicate}"
+            f"WHERE {keys_str} IN ({placeholders})"
         )
-
-        try:
-            conn = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.username,
-                password=self.password,
-                database=self.database,
-            )
-            cursor = conn.cursor()
-
-            results = []
-            for key_value in key_values:
-                cursor.execute(sql, key_value)
-
-                result = cursor.fetchone()
-
-                if result:
-                    results.append(result)
-
-            return results
-        finally:
-            if cursor is not None:
-                cursor.close()
-
-            if conn is not None:
-                conn.close()
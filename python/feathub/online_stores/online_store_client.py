@@ -54,9 +54,33 @@ class OnlineStoreClient(ABC):
     @staticmethod
     def instantiate(source: FeatureTable) -> OnlineStoreClient:
         """
-        Instantiates an OnlineStoreClient from the provided source.
+        Instantiates an OnlineStoreClient from the provided source. If the source
+        specifies a cache TTL, the client caches the features it reads in memory.
         """
+        client = OnlineStoreClient._instantiate(source)
 
+        if isinstance(source, (RedisSource, MySQLSource)) and source.cache_ttl:
+            from feathub.online_stores.cached_online_store_client import (
+                CachedOnlineStoreClient,
+            )
+
+            return CachedOnlineStoreClient(
+                client=client,
+                keys=source.keys,
+                all_feature_names=[
+                    x
+                    for x in source.schema.field_names
+                    if x not in source.keys and x != source.timestamp_field
+                ],
+                ttl=source.cache_ttl,
+                max_size=source.cache_max_size,
+                cache_missing_keys=source.cache_missing_keys,
+            )
+
+        return client
+
+    @staticmethod
+    def _instantiate(source: FeatureTable) -> OnlineStoreClient:
         if isinstance(source, RedisSource):
             from feathub.online_stores.redis_client import RedisClient
 
@@ -70,6 +94,9 @@ class OnlineStoreClient(ABC):
                 namespace=source.namespace,
                 keys=source.keys,
                 timestamp_field=source.timestamp_field,
+                batch_size=source.batch_size,
+                max_connections=source.max_connections,
+                storage_layout=source.storage_layout,
             )
 
         if isinstance(source, MySQLSource):
@@ -85,6 +112,9 @@ class OnlineStoreClient(ABC):
                 password=source.password,
                 keys=source.keys,
                 timestamp_field=source.timestamp_field,
+                batch_size=source.batch_size,
+                pool_size=source.pool_size,
+                pool_idle_timeout=source.pool_idle_timeout,
             )
 
         raise RuntimeError(
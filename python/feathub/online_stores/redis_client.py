@@ -11,18 +11,52 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional, List
+import threading
+from typing import Optional, List, Dict, Tuple, Any, Sequence
 
+import numpy as np
 import pandas as pd
 import redis
 
+from feathub.common.types import to_numpy_dtype, DType, VectorType, MapType, Unknown
 from feathub.common.utils import (
-    deserialize_object_with_protobuf,
+    deserialize_objects_with_protobuf,
+    serialize_and_join_key_columns,
+)
+from feathub.feature_tables.redis_storage_layout import (
+    RedisStorageLayout,
+    unpack_values,
 )
 from feathub.online_stores.online_store_client import OnlineStoreClient
-from feathub.processors.flink.table_builder.redis_utils import serialize_and_join_keys
 from feathub.table.schema import Schema
 
+# The connection pools shared by the RedisClients connecting to the same database
+# with the same pool settings.
+_CONNECTION_POOLS: Dict[Tuple, redis.ConnectionPool] = {}
+_CONNECTION_POOLS_LOCK = threading.Lock()
+
+
+def _get_connection_pool(
+    host: str,
+    port: int,
+    username: Optional[str],
+    password: Optional[str],
+    db_num: int,
+    max_connections: Optional[int],
+) -> redis.ConnectionPool:
+    pool_key = (host, port, username, password, db_num, max_connections)
+    with _CONNECTION_POOLS_LOCK:
+        if pool_key not in _CONNECTION_POOLS:
+            _CONNECTION_POOLS[pool_key] = redis.ConnectionPool(
+                host=host,
+                port=port,
+                username=username,
+                password=password,
+                db=db_num,
+                max_connections=max_connections,
+            )
+        return _CONNECTION_POOLS[pool_key]
+
 
 class RedisClient(OnlineStoreClient):
     """
@@ -40,9 +74,15 @@ class RedisClient(OnlineStoreClient):
         namespace: str = "default",
         keys: Optional[List[str]] = None,
         timestamp_field: Optional[str] = None,
+        batch_size: int = 100,
+        max_connections: Optional[int] = None,
+        storage_layout: RedisStorageLayout = RedisStorageLayout.HASH,
     ):
         super().__init__()
         self.namespace = namespace
+        self.storage_layout = storage_layout
+        self.schema = schema
+        self.batch_size = batch_size
 
         self.key_names = keys
         self.key_types = [schema.get_field_type(x) for x in self.key_names]
@@ -52,20 +92,24 @@ class RedisClient(OnlineStoreClient):
             for x in schema.field_names
             if x not in self.key_names and x != timestamp_field
         ]
+        self.feature_indices = {}
         self.encoded_feature_indices = {}
         for i in range(len(self.all_feature_names)):
+            self.feature_indices[self.all_feature_names[i]] = i
             self.encoded_feature_indices[self.all_feature_names[i]] = i.to_bytes(
                 4, byteorder="big"
             )
 
         self.redis_client = redis.Redis(
-            host=host,
-            port=port,
-            username=username,
-            password=password,
-            decode_responses=False,
+            connection_pool=_get_connection_pool(
+                host=host,
+                port=port,
+                username=username,
+                password=password,
+                db_num=db_num,
+                max_connections=max_connections,
+            )
         )
-        self.redis_client.select(db_num)
 
     def get(
         self, input_data: pd.DataFrame, feature_names: Optional[List[str]] = None
@@ -79,27 +123,90 @@ class RedisClient(OnlineStoreClient):
         if feature_names is None:
             feature_names = self.all_feature_names
 
-        selected_feature_indices = [
-            self.encoded_feature_indices[field] for field in feature_names
+        key_prefix = (self.namespace + ":").encode("utf-8")
+        redis_keys = [
+            key_prefix + joined_keys
+            for joined_keys in serialize_and_join_key_columns(
+                [input_data[key].to_numpy() for key in self.key_names], self.key_types
+            )
         ]
 
-        results_list = []
-        for _, row in input_data.iterrows():
-            row_dict = row.to_dict()
-            key_value = serialize_and_join_keys(
-                [row_dict[x] for x in self.key_names], self.key_types
-            )
-            key_value = (self.namespace + ":").encode("utf-8") + key_value
+        if self.storage_layout == RedisStorageLayout.PACKED:
+            raw_rows = self._get_packed_rows(redis_keys, feature_names)
+        else:
+            raw_rows = self._get_hash_rows(redis_keys, feature_names)
 
-            result = []
-            raw_values = self.redis_client.hmget(key_value, selected_feature_indices)
-            for raw_value in raw_values:
-                result.append(deserialize_object_with_protobuf(bytes(raw_value)))
-            results_list.append(result)
+        columns = {}
+        for i, feature_name in enumerate(feature_names):
+            columns[feature_name] = _to_series(
+                deserialize_objects_with_protobuf(
+                    (raw_row[i] for raw_row in raw_rows),
+                    self.schema.get_field_type(feature_name),
+                ),
+                self.schema.get_field_type(feature_name),
+                input_data.index,
+            )
 
-        features = pd.DataFrame(results_list, columns=feature_names)
+        features = pd.DataFrame(columns, index=input_data.index)
         features = input_data.join(features)
         return features
 
+    def _get_hash_rows(
+        self, redis_keys: List[bytes], feature_names: List[str]
+    ) -> List[Sequence[Optional[bytes]]]:
+        selected_feature_indices = [
+            self.encoded_feature_indices[field] for field in feature_names
+        ]
+
+        # Looks up the keys in batches, each of which is sent to Redis in one
+        # round-trip with a non-transactional pipeline.
+        raw_rows: List[Sequence[Optional[bytes]]] = []
+        for start in range(0, len(redis_keys), self.batch_size):
+            end = start + self.batch_size
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for redis_key in redis_keys[start:end]:
+                pipeline.hmget(redis_key, selected_feature_indices)
+            raw_rows.extend(pipeline.execute())
+        return raw_rows
+
+    def _get_packed_rows(
+        self, redis_keys: List[bytes], feature_names: List[str]
+    ) -> List[Sequence[Optional[bytes]]]:
+        selected_feature_indices = [self.feature_indices[x] for x in feature_names]
+
+        packed_rows: List[Optional[bytes]] = []
+        for start in range(0, len(redis_keys), self.batch_size):
+            end = start + self.batch_size
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for redis_key in redis_keys[start:end]:
+                pipeline.get(redis_key)
+            packed_rows.extend(pipeline.execute())
+
+        # Only the values of the selected features are sliced out of the packed rows.
+        missing_row: List[Optional[bytes]] = [None] * len(feature_names)
+        raw_rows: List[Sequence[Optional[bytes]]] = []
+        for packed_row in packed_rows:
+            if packed_row is None:
+                raw_rows.append(missing_row)
+            else:
+                raw_rows.append(unpack_values(packed_row, selected_feature_indices))
+        return raw_rows
+
     def __del__(self) -> None:
         self.redis_client.close()
+
+
+def _to_series(values: List[Any], dtype: DType, index: pd.Index) -> pd.Series:
+    """
+    Converts the values to a Series of the numpy type of the given dtype, unless
+    there are missing values or the dtype is not a primitive numeric type.
+    """
+    if isinstance(dtype, (VectorType, MapType)) or dtype == Unknown:
+        return pd.Series(values, index=index, dtype=object)
+    try:
+        numpy_dtype = np.dtype(to_numpy_dtype(dtype))
+    except Exception:
+        return pd.Series(values, index=index, dtype=object)
+    if numpy_dtype.kind not in "biuf" or any(value is None for value in values):
+        return pd.Series(values, index=index, dtype=object)
+    return pd.Series(values, index=index, dtype=numpy_dtype)
@@ -0,0 +1,159 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from datetime import timedelta
+from typing import List, Optional
+from unittest.mock import patch
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.feature_tables.sources.redis_source import RedisSource
+from feathub.online_stores.cached_online_store_client import (
+    CachedOnlineStoreClient,
+    CacheInfo,
+)
+from feathub.online_stores.online_store_client import OnlineStoreClient
+from feathub.table.schema import Schema
+
+
+class _FakeOnlineStoreClient(OnlineStoreClient):
+    def __init__(self):
+        super().__init__()
+        self.rows = {"Alex": (20, "A"), "Emma": (30, "B"), "Jack": (40, "C")}
+        self.requested_keys: List[List[str]] = []
+
+    def get(
+        self, input_data: pd.DataFrame, feature_names: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        names = input_data["name"].tolist()
+        self.requested_keys.append(names)
+        features = pd.DataFrame(
+            [self.rows.get(name, (None, None)) for name in names],
+            columns=["age", "city"],
+            index=input_data.index,
+        )
+        return input_data.join(features[feature_names])
+
+
+class CachedOnlineStoreClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = _FakeOnlineStoreClient()
+        self.now = 0.0
+        patcher = patch(
+            "feathub.online_stores.cached_online_store_client.time.monotonic",
+            side_effect=lambda: self.now,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _new_cached_client(self, **kwargs) -> CachedOnlineStoreClient:
+        return CachedOnlineStoreClient(
+            client=self.client,
+            keys=["name"],
+            all_feature_names=["age", "city"],
+            ttl=timedelta(seconds=10),
+            **kwargs,
+        )
+
+    def _get(self, cached_client, names, feature_names=None) -> pd.DataFrame:
+        return cached_client.get(
+            pd.DataFrame({"name": names}), feature_names=feature_names
+        )
+
+    def test_get(self):
+        cached_client = self._new_cached_client()
+
+        result = self._get(cached_client, ["Alex", "Emma", "Alex"])
+        expected = pd.DataFrame(
+            [["Alex", 20, "A"], ["Emma", 30, "B"], ["Alex", 20, "A"]],
+            columns=["name", "age", "city"],
+        )
+        self.assertTrue(expected.equals(result))
+        self.assertListEqual([["Alex", "Emma"]], self.client.requested_keys)
+
+        result = self._get(cached_client, ["Emma", "Jack"], ["age"])
+        expected = pd.DataFrame([["Emma", 30], ["Jack", 40]], columns=["name", "age"])
+        self.assertTrue(expected.equals(result))
+        self.assertListEqual(["Jack"], self.client.requested_keys[-1])
+        self.assertEqual(CacheInfo(1, 4, 0, 3), cached_client.cache_info())
+
+    def test_ttl(self):
+        cached_client = self._new_cached_client()
+        self._get(cached_client, ["Alex"])
+        self.now = 9.0
+        self._get(cached_client, ["Alex"])
+        self.assertEqual(1, len(self.client.requested_keys))
+
+        self.now = 10.0
+        self._get(cached_client, ["Alex"])
+        self.assertEqual(2, len(self.client.requested_keys))
+
+    def test_lru_eviction(self):
+        cached_client = self._new_cached_client(max_size=2)
+        self._get(cached_client, ["Alex", "Emma"])
+        self._get(cached_client, ["Alex"])
+        self._get(cached_client, ["Jack"])
+
+        self._get(cached_client, ["Alex", "Jack"])
+        self.assertEqual(2, len(self.client.requested_keys))
+        self._get(cached_client, ["Emma"])
+        self.assertListEqual(["Emma"], self.client.requested_keys[-1])
+        self.assertEqual(2, cached_client.cache_info().evictions)
+
+    def test_merge_features_of_key(self):
+        cached_client = self._new_cached_client()
+        self._get(cached_client, ["Alex"], ["age"])
+        result = self._get(cached_client, ["Alex"], ["city"])
+        self.assertListEqual(["A"], result["city"].tolist())
+        result = self._get(cached_client, ["Alex"], ["age"])
+        self.assertListEqual([20], result["age"].tolist())
+
+        self.assertEqual(2, len(self.client.requested_keys))
+        self.assertEqual(CacheInfo(1, 2, 0, 1), cached_client.cache_info())
+
+        # Merged features expire with the features cached earliest.
+        self.now = 10.0
+        self._get(cached_client, ["Alex"], ["city"])
+        self.assertEqual(3, len(self.client.requested_keys))
+
+    def test_missing_keys(self):
+        cached_client = self._new_cached_client()
+        result = self._get(cached_client, ["Mike"])
+        self.assertListEqual([None], result["age"].tolist())
+        self._get(cached_client, ["Mike"])
+        self.assertEqual(1, len(self.client.requested_keys))
+
+        cached_client = self._new_cached_client(cache_missing_keys=False)
+        self._get(cached_client, ["Mike"])
+        self._get(cached_client, ["Mike"])
+        self.assertEqual(3, len(self.client.requested_keys))
+
+    def test_instantiate(self):
+        schema = (
+            Schema.new_builder()
+            .column("name", types.String)
+            .column("age", types.Int64)
+            .build()
+        )
+        source = RedisSource(
+            name="source",
+            schema=schema,
+            keys=["name"],
+            host="127.0.0.1",
+            cache_ttl=timedelta(seconds=1),
+        )
+        client = OnlineStoreClient.instantiate(source)
+        assert isinstance(client, CachedOnlineStoreClient)
+        self.assertListEqual(["age"], client.all_feature_names)
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gc
 import unittest
 import pandas as pd
 
@@ -73,3 +74,112 @@ class MemoryOnlineStoreTest(unittest.TestCase):
             columns=["name", "cost", "time"],
         )
         self.assertTrue(expected_result_df.equals(result_df))
+
+    def test_put_updates_newer_rows(self):
+        store = MemoryOnlineStore.get_instance()
+        store.put(
+            table_name="table_1",
+            features=self.features,
+            schema=self.schema,
+            key_fields=["name"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+        store.put(
+            table_name="table_1",
+            features=pd.DataFrame(
+                [
+                    ["Alex", 700, 700, "2022-01-02 08:03:00"],
+                    ["Emma", 800, 800, "2022-01-03 08:04:00"],
+                    ["Emma", 900, 900, "2022-01-03 08:04:00"],
+                    ["Jack", 1000, 1000, "2022-01-01 08:05:00"],
+                    ["Mike", 1100, 1100, "2022-01-01 08:05:00"],
+                ],
+                columns=["name", "cost", "distance", "time"],
+            ),
+            schema=self.schema,
+            key_fields=["name"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+
+        keys = pd.DataFrame([["Mike"], ["Jack"], ["Emma"], ["Alex"]], columns=["name"])
+        result_df = store.get(table_name="table_1", input_data=keys)
+
+        expected_result_df = pd.DataFrame(
+            [
+                ["Mike", 1100, 1100],
+                ["Jack", 500, 500],
+                ["Emma", 800, 800],
+                ["Alex", 300, 200],
+            ],
+            columns=["name", "cost", "distance"],
+        )
+        self.assertTrue(expected_result_df.equals(result_df))
+
+        with self.assertRaises(KeyError):
+            store.get(
+                table_name="table_1",
+                input_data=pd.DataFrame([["Alex"], ["Bob"]], columns=["name"]),
+            )
+
+    def test_put_without_timestamp_field(self):
+        store = MemoryOnlineStore.get_instance()
+        store.put(
+            table_name="table_1",
+            features=self.features,
+            schema=self.schema,
+            key_fields=["name", "distance"],
+            timestamp_field=None,
+            timestamp_format=None,
+        )
+
+        keys = pd.DataFrame(
+            [["Emma", 250], ["Alex", 100]], columns=["name", "distance"]
+        )
+        result_df = store.get(
+            table_name="table_1", input_data=keys, feature_names=["cost"]
+        )
+
+        expected_result_df = pd.DataFrame(
+            [["Emma", 250, 200], ["Alex", 100, 100]],
+            columns=["name", "distance", "cost"],
+        )
+        self.assertTrue(expected_result_df.equals(result_df))
+
+    def test_repeated_updates_after_lookup(self):
+        store = MemoryOnlineStore.get_instance()
+        schema = (
+            Schema.new_builder().column("name", String).column("cost", Int64).build()
+        )
+
+        def new_names():
+            # Creates new key objects so that they are not shared with the store.
+            return [f"name_{i}" for i in range(1000)]
+
+        def put(keys, cost):
+            store.put(
+                table_name="table_1",
+                features=pd.DataFrame({"name": keys, "cost": cost}),
+                schema=schema,
+                key_fields=["name"],
+                timestamp_field=None,
+                timestamp_format=None,
+            )
+
+        def get_costs():
+            keys = pd.DataFrame({"name": new_names()})
+            return store.get(table_name="table_1", input_data=keys)["cost"].tolist()
+
+        # The lookup index is built after the key columns have been updated and a key
+        # has been inserted, and is used after the key columns are updated again.
+        put(new_names(), 1)
+        put(new_names(), 2)
+        put(["name_new"], 3)
+        self.assertEqual([2] * 1000, get_costs())
+        put(new_names(), 4)
+        gc.collect()
+        # Allocates objects which might reuse the memory of freed key objects.
+        garbage = [f"cost_{i}" for i in range(1000)]
+        self.assertEqual([4] * 1000, get_costs())
+        del garbage
@@ -0,0 +1,180 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from datetime import timedelta
+from typing import Dict, List, Tuple
+from unittest.mock import patch
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.online_stores import mysql_client
+from feathub.online_stores.mysql_client import MySQLClient
+from feathub.table.schema import Schema
+
+
+class _FakeCursor:
+    def __init__(self, connection: "_FakeConnection"):
+        self.connection = connection
+        self.executed = None
+        self.rows: List = []
+
+    def execute(self, sql, params):
+        if sql is not self.executed:
+            self.connection.num_prepares += 1
+            self.executed = sql
+        self.connection.num_executions += 1
+
+        key_size = len(self.connection.key_names)
+        keys = set(zip(*[params[i::key_size] for i in range(key_size)]))
+        self.rows = [
+            (*key, *values)
+            for key, values in self.connection.rows.items()
+            if key in keys
+        ]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    """
+    An in-memory stand-in of a MySQL connection that serves the IN-list queries
+    issued by MySQLClient.
+    """
+
+    def __init__(self, key_names: List[str], rows: Dict[Tuple, Tuple]):
+        self.key_names = key_names
+        self.rows = rows
+        self.num_prepares = 0
+        self.num_executions = 0
+        self.closed = False
+
+    def cursor(self, prepared=False):
+        return _FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class MySQLClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = (
+            Schema.new_builder()
+            .column("id", types.Int64)
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .column("ts", types.String)
+            .build()
+        )
+        self.rows: Dict[Tuple, Tuple] = {
+            (1, "Alex"): (100,),
+            (2, "Emma"): (200,),
+            (3, "Jack"): (300,),
+        }
+        self.connections: List[_FakeConnection] = []
+
+        connect_patcher = patch(
+            "feathub.online_stores.mysql_client.mysql.connector.connect",
+            side_effect=self._connect,
+        )
+        connect_patcher.start()
+        self.addCleanup(connect_patcher.stop)
+        self.addCleanup(mysql_client._CONNECTION_POOLS.clear)
+
+    def _connect(self, **kwargs):
+        connection = _FakeConnection(["id", "name"], self.rows)
+        self.connections.append(connection)
+        return connection
+
+    def _new_client(self, **kwargs) -> MySQLClient:
+        return MySQLClient(
+            database="db",
+            table="features",
+            schema=self.schema,
+            host="127.0.0.1",
+            port=3306,
+            username="root",
+            password="",
+            keys=["id", "name"],
+            timestamp_field="ts",
+            **kwargs,
+        )
+
+    def test_get(self):
+        client = self._new_client(batch_size=2)
+        input_data = pd.DataFrame(
+            [[3, "Jack"], [1, "Alex"], [4, "Mike"], [3, "Jack"], [2, "Emma"]],
+            columns=["id", "name"],
+        )
+
+        result = client.get(input_data)
+
+        self.assertListEqual(
+            [300, 100, None, 300, 200],
+            [None if pd.isna(x) else x for x in result["cost"]],
+        )
+        self.assertListEqual(["id", "name", "cost"], list(result.columns))
+        self.assertListEqual(list(input_data.index), list(result.index))
+
+        # 4 distinct keys are queried in 2 batches with a single prepared statement.
+        self.assertEqual(1, len(self.connections))
+        self.assertEqual(1, self.connections[0].num_prepares)
+        self.assertEqual(2, self.connections[0].num_executions)
+
+        client.get(input_data)
+        self.assertEqual(1, len(self.connections))
+        self.assertEqual(1, self.connections[0].num_prepares)
+
+    def test_get_query_sql(self):
+        client = self._new_client()
+        self.assertEqual(
+            "SELECT `id`,`name`,`cost` FROM features "
+            "WHERE (`id`,`name`) IN ((%s,%s),(%s,%s))",
+            client._get_query_sql(["id", "name", "cost"], 2),
+        )
+
+    def test_share_connection_pool(self):
+        client = self._new_client()
+        another_client = self._new_client()
+        self.assertIs(client.connection_pool, another_client.connection_pool)
+
+        input_data = pd.DataFrame([[1, "Alex"]], columns=["id", "name"])
+        client.get(input_data)
+        another_client.get(input_data)
+        self.assertEqual(1, len(self.connections))
+
+    def test_separate_pools_for_different_settings(self):
+        client = self._new_client()
+        self.assertIsNot(
+            client.connection_pool, self._new_client(pool_size=10).connection_pool
+        )
+        self.assertIsNot(
+            client.connection_pool,
+            self._new_client(pool_idle_timeout=timedelta(0)).connection_pool,
+        )
+
+    def test_pool_idle_timeout(self):
+        client = self._new_client(pool_idle_timeout=timedelta(0))
+        input_data = pd.DataFrame([[1, "Alex"]], columns=["id", "name"])
+
+        client.get(input_data)
+        client.get(input_data)
+
+        self.assertEqual(2, len(self.connections))
+        self.assertTrue(self.connections[0].closed)
+        self.assertFalse(self.connections[1].closed)
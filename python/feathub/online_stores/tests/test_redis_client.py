@@ -0,0 +1,192 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from typing import Dict, List
+from unittest.mock import patch
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.common.utils import (
+    serialize_and_join_keys,
+    serialize_object_with_protobuf,
+)
+from feathub.feature_tables.redis_storage_layout import (
+    RedisStorageLayout,
+    pack_row,
+    unpack_values,
+    get_packed_row_timestamp,
+)
+from feathub.online_stores.redis_client import RedisClient
+from feathub.table.schema import Schema
+
+
+class _FakePipeline:
+    def __init__(self, redis_client: "_FakeRedis"):
+        self.redis_client = redis_client
+        self.commands: List = []
+
+    def hmget(self, name, keys):
+        self.commands.append((name, keys))
+
+    def get(self, name):
+        self.commands.append((name, None))
+
+    def execute(self):
+        self.redis_client.num_round_trips += 1
+        return [
+            self.redis_client.strings.get(name)
+            if keys is None
+            else [self.redis_client.hashes.get(name, {}).get(key) for key in keys]
+            for name, keys in self.commands
+        ]
+
+
+class _FakeRedis:
+    """
+    An in-memory stand-in of redis.Redis supporting the commands used by
+    RedisClient.
+    """
+
+    def __init__(self, **kwargs):
+        self.hashes: Dict[bytes, Dict[bytes, bytes]] = {}
+        self.strings: Dict[bytes, bytes] = {}
+        self.num_round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def close(self):
+        pass
+
+
+class RedisClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = (
+            Schema.new_builder()
+            .column("id", types.Int64)
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .column("tags", types.VectorType(types.String))
+            .column("ts", types.String)
+            .build()
+        )
+        self.fake_redis = _FakeRedis()
+        with patch(
+            "feathub.online_stores.redis_client.redis.Redis",
+            return_value=self.fake_redis,
+        ):
+            self.client = RedisClient(
+                schema=self.schema,
+                host="127.0.0.1",
+                keys=["id", "name"],
+                timestamp_field="ts",
+                batch_size=2,
+            )
+
+        for key_id, name, cost, tags in [
+            (1, "Alex", 100, ["a"]),
+            (2, "Emma", 200, ["d"]),
+            (3, "Jack", 300, ["b", "c"]),
+        ]:
+            redis_key = b"default:" + serialize_and_join_keys(
+                [key_id, name], [types.Int64, types.String]
+            )
+            self.fake_redis.hashes[redis_key] = {
+                (0).to_bytes(4, byteorder="big"): serialize_object_with_protobuf(
+                    cost, types.Int64
+                ),
+                (1).to_bytes(4, byteorder="big"): serialize_object_with_protobuf(
+                    tags, types.VectorType(types.String)
+                ),
+            }
+
+    def test_get(self):
+        input_data = pd.DataFrame(
+            [[3, "Jack", "x"], [1, "Alex", "y"], [2, "Emma", "z"]],
+            columns=["id", "name", "extra"],
+        )
+        result = self.client.get(input_data)
+
+        expected = pd.DataFrame(
+            [
+                [3, "Jack", "x", 300, ["b", "c"]],
+                [1, "Alex", "y", 100, ["a"]],
+                [2, "Emma", "z", 200, ["d"]],
+            ],
+            columns=["id", "name", "extra", "cost", "tags"],
+        )
+        self.assertTrue(expected.equals(result))
+        self.assertEqual(2, self.fake_redis.num_round_trips)
+
+    def test_get_missing_keys(self):
+        input_data = pd.DataFrame([[1, "Alex"], [4, "Mike"]], columns=["id", "name"])
+        result = self.client.get(input_data, feature_names=["cost"])
+
+        self.assertListEqual([100, None], result["cost"].tolist())
+        self.assertEqual(1, self.fake_redis.num_round_trips)
+
+    def test_get_packed_rows(self):
+        with patch(
+            "feathub.online_stores.redis_client.redis.Redis",
+            return_value=self.fake_redis,
+        ):
+            client = RedisClient(
+                schema=self.schema,
+                host="127.0.0.1",
+                keys=["id", "name"],
+                timestamp_field="ts",
+                batch_size=2,
+                storage_layout=RedisStorageLayout.PACKED,
+            )
+        for redis_key, features in self.fake_redis.hashes.items():
+            self.fake_redis.strings[redis_key] = pack_row(
+                [features[(i).to_bytes(4, byteorder="big")] for i in range(2)], 1000
+            )
+
+        input_data = pd.DataFrame([[3, "Jack"], [4, "Mike"]], columns=["id", "name"])
+        result = client.get(input_data, feature_names=["tags"])
+
+        self.assertListEqual([["b", "c"], None], result["tags"].tolist())
+        self.assertEqual(1, self.fake_redis.num_round_trips)
+
+    def test_pack_row(self):
+        packed_row = pack_row([b"a", b"", b"bcd"], 1234)
+        self.assertEqual(1234, get_packed_row_timestamp(packed_row))
+        self.assertListEqual([b"bcd", b"a"], unpack_values(packed_row, [2, 0]))
+        self.assertListEqual([b""], unpack_values(packed_row, [1]))
+
+    def test_share_connection_pool(self):
+        with patch("feathub.online_stores.redis_client.redis.Redis") as redis_cls:
+            RedisClient(schema=self.schema, host="127.0.0.1", keys=["id"])
+            RedisClient(schema=self.schema, host="127.0.0.1", keys=["name"])
+            RedisClient(schema=self.schema, host="127.0.0.2", keys=["id"])
+
+        pools = [call.kwargs["connection_pool"] for call in redis_cls.call_args_list]
+        self.assertIs(pools[0], pools[1])
+        self.assertIsNot(pools[0], pools[2])
+
+    def test_separate_pools_for_different_max_connections(self):
+        with patch("feathub.online_stores.redis_client.redis.Redis") as redis_cls:
+            RedisClient(
+                schema=self.schema, host="127.0.0.1", keys=["id"], max_connections=2
+            )
+            RedisClient(
+                schema=self.schema, host="127.0.0.1", keys=["id"], max_connections=100
+            )
+
+        pools = [call.kwargs["connection_pool"] for call in redis_cls.call_args_list]
+        self.assertIsNot(pools[0], pools[1])
+        self.assertEqual(2, pools[0].max_connections)
+        self.assertEqual(100, pools[1].max_connections)
@@ -14,7 +14,7 @@
 import logging
 import os
 from datetime import timedelta, datetime
-from typing import Optional, Union, Dict
+from typing import Optional, Union, Dict, Sequence, Tuple
 
 import pandas as pd
 from pyflink.datastream import StreamExecutionEnvironment
@@ -197,6 +197,49 @@ class FlinkProcessor(Processor):
             allow_overwrite=allow_overwrite,
         )
 
+    def materialize_features_in_batch(
+        self,
+        materializations: Sequence[Tuple[Union[str, TableDescriptor], FeatureTable]],
+        ttl: Optional[timedelta] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        allow_overwrite: bool = False,
+    ) -> ProcessorJob:
+        """
+        Starts one Flink job to write each of the given tables of features into the
+        corresponding sink. Unlike calling `materialize_features` for each of them,
+        the sources and intermediate tables shared by the tables are read and computed
+        once, e.g. when a feature view is written to both an online and an offline
+        sink.
+
+        :param materializations: The pairs of the table of features to be inserted in
+                                 the sink and the sink. If a table is a string, it
+                                 refers to the name of a table descriptor in the entity
+                                 registry.
+        :param ttl: Optional. If it is not None, the features data should be purged from
+                    the sinks after the specified period of time.
+        :param start_datetime: Optional. If it is not None, the tables should have a
+                               timestamp field. And only writes into sinks those
+                               features whose timestamp >= floor(start_datetime).
+        :param end_datetime: Optional. If it is not None, the tables should have a
+                             timestamp field. And only writes into sinks those
+                             features whose timestamp <= ceil(start_datetime).
+        :param allow_overwrite: If it is false, throw error if the features collide with
+                                existing data in the given sinks.
+        :return: A processor job corresponding to all the materialization operations.
+        """
+        if ttl is not None or not allow_overwrite:
+            raise RuntimeError("Unsupported operation.")
+
+        return self.flink_job_submitter.submit_in_batch(
+            materializations=[
+                (self._resolve_table_descriptor(features), sink)
+                for features, sink in materializations
+            ],
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+        )
+
     def _get_table_env(
         self,
         jobmanager_rpc_address: Optional[str] = None,
@@ -14,13 +14,34 @@
 import typing
 from collections import defaultdict
 from datetime import timedelta, datetime
-from typing import Optional, Union, Any, Dict, List
+from typing import Optional, Union, Any, Dict, List, Iterator
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyflink.java_gateway import get_gateway
 from pyflink.table import (
     Table as NativeFlinkTable,
     DataTypes,
+    TableSchema,
+)
+from pyflink.table.serializers import ArrowSerializer
+from pyflink.table.types import (
+    DataType,
+    ArrayType,
+    TinyIntType,
+    SmallIntType,
+    IntType,
+    BigIntType,
+    FloatType,
+    DoubleType,
+    BooleanType,
+    VarCharType,
+    CharType,
+    VarBinaryType,
+    BinaryType,
+    TimestampType,
+    create_arrow_schema,
 )
 
 from feathub.common.exceptions import FeathubException
@@ -49,34 +70,160 @@ FLINK_DATA_TYPE_TO_NUMPY_TYPE: Dict = {
 }
 
 
+# The number of rows in an Arrow batch collected by `flink_table_to_pandas`.
+_ARROW_BATCH_SIZE = 10000
+
+# The Flink DataTypes that can be collected in Arrow format. PyFlink doesn't support
+# collecting Map type in Arrow format, and local zoned timestamps collected in Arrow
+# format are converted to a different time zone than the collected rows.
+_ARROW_SUPPORTED_TYPES = (
+    TinyIntType,
+    SmallIntType,
+    IntType,
+    BigIntType,
+    FloatType,
+    DoubleType,
+    BooleanType,
+    VarCharType,
+    CharType,
+    VarBinaryType,
+    BinaryType,
+    TimestampType,
+)
+
+
+def flink_table_to_pandas(table: NativeFlinkTable) -> pd.DataFrame:
+    """
+    Converting the given flink table to pandas dataframe.
+    """
+    if not _is_arrow_supported(table.get_schema()):
+        batches = list(_collect_rows_in_batches(table, None))
+        return batches[0] if batches else _rows_to_pandas([], table.get_schema())
+
+    record_batches = list(_collect_arrow_record_batches(table, _ARROW_BATCH_SIZE))
+    return _arrow_table_to_pandas(
+        pa.Table.from_batches(record_batches, _get_arrow_schema(table)),
+        table.get_schema(),
+    )
+
+
+def flink_table_to_pandas_batches(
+    table: NativeFlinkTable, batch_size: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Converting the given flink table to pandas dataframes, each of which contains at
+    most `batch_size` rows. The rows are collected lazily as the dataframes are
+    consumed.
+    """
+    if not _is_arrow_supported(table.get_schema()):
+        yield from _collect_rows_in_batches(table, batch_size)
+        return
+
+    for record_batch in _collect_arrow_record_batches(table, batch_size):
+        yield _arrow_table_to_pandas(
+            pa.Table.from_batches([record_batch]), table.get_schema()
+        )
+
+
+def _is_arrow_supported(schema: TableSchema) -> bool:
+    """
+    Returns whether the table with the given schema can be collected in Arrow format,
+    and converted to the same pandas dataframe as the collected rows.
+    """
+    return all(
+        _is_arrow_supported_type(schema.get_field_data_type(name))
+        for name in schema.get_field_names()
+    )
+
+
+def _is_arrow_supported_type(data_type: DataType) -> bool:
+    if isinstance(data_type, ArrayType):
+        return _is_arrow_supported_type(data_type.element_type)
+    return isinstance(data_type, _ARROW_SUPPORTED_TYPES)
+
+
+def _get_arrow_schema(table: NativeFlinkTable) -> pa.Schema:
+    schema = table.get_schema()
+    return create_arrow_schema(schema.get_field_names(), schema.get_field_data_types())
+
+
+def _collect_arrow_record_batches(
+    table: NativeFlinkTable, batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    """
+    Executes the table and collects its rows as Arrow record batches, each of which
+    contains at most `batch_size` rows. This is how PyFlink Table#to_pandas collects
+    rows, without converting all rows into one pandas dataframe.
+    """
+    # Registers the Python dependencies of the job, e.g. Python UDFs.
+    table._t_env._before_execute()
+    batches_iterator = (
+        get_gateway().jvm.org.apache.flink.table.runtime.arrow.ArrowUtils
+    ).collectAsPandasDataFrame(table._j_table, batch_size)
+    serializer = ArrowSerializer(
+        _get_arrow_schema(table), table.get_schema().to_row_data_type(), None
+    )
+    yield from serializer.load_from_iterator(batches_iterator)
+
+
+def _arrow_table_to_pandas(arrow_table: pa.Table, schema: TableSchema) -> pd.DataFrame:
+    """
+    Converts the Arrow table to a pandas dataframe with the same values as those
+    converted from the collected rows, where timestamps and arrays are Python
+    datetime and list objects.
+    """
+    data = {}
+    for name, column in zip(arrow_table.column_names, arrow_table.columns):
+        if isinstance(schema.get_field_data_type(name), (TimestampType, ArrayType)):
+            data[name] = pd.Series(column.to_pylist(), dtype=object)
+        else:
+            data[name] = column.to_pandas()
+    return pd.DataFrame(data, columns=arrow_table.column_names)
+
+
 # PyFlink Table#to_pandas currently doesn't support Map type. We have to collect the
 # result and construct the pandas DataFrame.
 # TODO: Use PyFlink Table#to_pandas after
 #  https://issues.apache.org/jira/projects/FLINK/issues/FLINK-30607 is resolved.
-def flink_table_to_pandas(table: NativeFlinkTable) -> pd.DataFrame:
+def _collect_rows_in_batches(
+    table: NativeFlinkTable, batch_size: Optional[int]
+) -> Iterator[pd.DataFrame]:
     """
-    Converting the given flink table to pandas dataframe.
+    Collects the rows of the table into pandas dataframes, each of which contains at
+    most `batch_size` rows, or all rows if `batch_size` is None.
     """
     schema = table.get_schema()
-    field_names = schema.get_field_names()
-    field_types = {
-        name: FLINK_DATA_TYPE_TO_NUMPY_TYPE.get(
-            type(schema.get_field_data_type(name)), None
-        )
-        for name in field_names
-    }
     with table.execute().collect() as results:
-        data: Dict[str, List[Any]] = defaultdict(list)
+        rows = []
         for row in results:
-            for name, value in zip(field_names, row):
-                data[name].append(value)
-
-        return pd.DataFrame(
-            {
-                name: pd.Series(values, dtype=field_types[name])
-                for name, values in data.items()
-            }
+            rows.append(row)
+            if batch_size is not None and len(rows) == batch_size:
+                yield _rows_to_pandas(rows, schema)
+                rows = []
+        if rows:
+            yield _rows_to_pandas(rows, schema)
+
+
+def _rows_to_pandas(rows: List[Any], schema: TableSchema) -> pd.DataFrame:
+    """
+    Converts the collected rows to a pandas dataframe with a column for each field of
+    the schema, even if there is no row.
+    """
+    field_names = schema.get_field_names()
+    data: Dict[str, List[Any]] = defaultdict(list)
+    for row in rows:
+        for name, value in zip(field_names, row):
+            data[name].append(value)
+
+    columns = {}
+    for name in field_names:
+        dtype = FLINK_DATA_TYPE_TO_NUMPY_TYPE.get(
+            type(schema.get_field_data_type(name)), None
         )
+        if dtype is None and len(rows) == 0:
+            dtype = object
+        columns[name] = pd.Series(data[name], dtype=dtype)
+    return pd.DataFrame(columns, columns=field_names)
 
 
 class FlinkTable(Table):
@@ -129,24 +276,24 @@ class FlinkTable(Table):
         return to_feathub_schema(schema)
 
     def to_pandas(self, force_bounded: bool = False) -> pd.DataFrame:
-        if self.flink_processor.deployment_mode not in (
-            DeploymentMode.CLI,
-            DeploymentMode.SESSION,
-        ):
-            raise FeathubException(
-                "Table.to_pandas is only supported in cli mode and session mode."
-            )
+        feature = self._get_bounded_feature("to_pandas", force_bounded)
+        return flink_table_to_pandas(self._get_flink_table(feature))
 
-        feature = self.feature
-        if not feature.is_bounded():
-            if not force_bounded:
-                raise FeathubException(
-                    "Unbounded table cannot be converted to Pandas DataFrame. You can "
-                    "set force_bounded to True to convert the Table to DataFrame."
-                )
-            feature = feature.get_bounded_view()
+    def to_pandas_batches(
+        self, batch_size: int, force_bounded: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Returns the rows of this table in batches. Unlike `to_pandas`, the rows are
+        collected batch by batch as the batches are consumed, so that the whole table
+        does not need to fit in the memory of the client.
 
-        return flink_table_to_pandas(self._get_flink_table(feature))
+        :param batch_size: The maximum number of rows in a batch.
+        :param force_bounded: Whether to force the table to be bounded.
+        """
+        if batch_size <= 0:
+            raise FeathubException("Batch size must be positive.")
+        feature = self._get_bounded_feature("to_pandas_batches", force_bounded)
+        return flink_table_to_pandas_batches(self._get_flink_table(feature), batch_size)
 
     def execute_insert(
         self,
@@ -163,6 +310,27 @@ class FlinkTable(Table):
             allow_overwrite=allow_overwrite,
         )
 
+    def _get_bounded_feature(
+        self, method_name: str, force_bounded: bool
+    ) -> TableDescriptor:
+        if self.flink_processor.deployment_mode not in (
+            DeploymentMode.CLI,
+            DeploymentMode.SESSION,
+        ):
+            raise FeathubException(
+                f"Table.{method_name} is only supported in cli mode and session mode."
+            )
+
+        feature = self.feature
+        if not feature.is_bounded():
+            if not force_bounded:
+                raise FeathubException(
+                    "Unbounded table cannot be converted to Pandas DataFrame. You can "
+                    "set force_bounded to True to convert the Table to DataFrame."
+                )
+            feature = feature.get_bounded_view()
+        return feature
+
     def _get_flink_table(self, feature: TableDescriptor) -> NativeFlinkTable:
         return self.flink_processor.flink_table_builder.build(
             features=feature,
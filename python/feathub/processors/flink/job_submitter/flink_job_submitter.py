@@ -13,10 +13,11 @@
 #  limitations under the License.
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Union, Sequence, Tuple
 
 import pandas as pd
 
+from feathub.common.exceptions import FeathubException
 from feathub.feature_tables.feature_table import FeatureTable
 from feathub.processors.processor_job import ProcessorJob
 from feathub.table.table_descriptor import TableDescriptor
@@ -66,3 +67,29 @@ class FlinkJobSubmitter(ABC):
         :return:ProcessorJob A processor job representing the submitted Flink job.
         """
         pass
+
+    def submit_in_batch(
+        self,
+        materializations: Sequence[Tuple[TableDescriptor, FeatureTable]],
+        start_datetime: Optional[datetime],
+        end_datetime: Optional[datetime],
+    ) -> ProcessorJob:
+        """
+        Submit one Flink job that computes the features in each of the given tables
+        and writes them to the corresponding sink. The sources and intermediate tables
+        shared by the tables are read and computed once.
+
+        :param materializations: The pairs of the table descriptor that contains the
+                                 features to compute and the sink to write to.
+        :param start_datetime: Optional. If it is not None, the tables should have a
+                               timestamp field. And only features whose
+                               timestamp >= start_datetime are written.
+        :param end_datetime: Optional. If it is not None, the tables should have a
+                             timestamp field. And only features whose
+                             timestamp < end_datetime are written.
+        :return:ProcessorJob A processor job representing the submitted Flink job.
+        """
+        raise FeathubException(
+            f"{type(self).__name__} does not support submitting materializations in "
+            f"batch."
+        )
@@ -16,7 +16,7 @@ from __future__ import annotations
 import typing
 from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Union, Sequence, Tuple
 
 import pandas as pd
 from py4j.protocol import Py4JJavaError
@@ -95,6 +95,50 @@ class FlinkSessionClusterJobSubmitter(FlinkJobSubmitter):
         )
         return FlinkSessionClusterJob(table_result, self._executor)
 
+    def submit_in_batch(
+        self,
+        materializations: Sequence[Tuple[TableDescriptor, FeatureTable]],
+        start_datetime: Optional[datetime],
+        end_datetime: Optional[datetime],
+    ) -> ProcessorJob:
+        # Features are written to the memory store by the client, which cannot be done
+        # in the Flink job.
+        flink_materializations = []
+        for features, sink in materializations:
+            if isinstance(sink, MemoryStoreSink):
+                self.submit(
+                    features=features,
+                    keys=None,
+                    start_datetime=start_datetime,
+                    end_datetime=end_datetime,
+                    sink=sink,
+                    local_registry_tables={},
+                    allow_overwrite=True,
+                )
+            else:
+                flink_materializations.append((features, sink))
+
+        if not flink_materializations:
+            return FlinkSessionClusterJob(None, self._executor)
+
+        table_builder = self.flink_processor.flink_table_builder
+        statement_set = table_builder.t_env.create_statement_set()
+        with table_builder.share_built_tables():
+            for features, sink in flink_materializations:
+                native_flink_table = table_builder.build(
+                    features=features,
+                    start_datetime=start_datetime,
+                    end_datetime=end_datetime,
+                )
+                insert_into_sink(
+                    table_builder.t_env,
+                    native_flink_table,
+                    features,
+                    sink,
+                    statement_set,
+                )
+        return FlinkSessionClusterJob(statement_set.execute(), self._executor)
+
 
 class FlinkSessionClusterJob(ProcessorJob):
     """Represent a Flink job that runs in Flink session cluster."""
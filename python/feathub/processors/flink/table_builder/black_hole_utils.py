@@ -11,14 +11,25 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Optional
+
 from pyflink.table import (
     TableResult,
     Table as NativeFlinkTable,
     TableDescriptor as NativeFlinkTableDescriptor,
+    StatementSet,
+)
+
+from feathub.processors.flink.table_builder.source_sink_utils_common import (
+    insert_into_table,
 )
 
 
-def insert_into_black_hole_sink(table: NativeFlinkTable) -> TableResult:
-    return table.execute_insert(
-        NativeFlinkTableDescriptor.for_connector("blackhole").build()
+def insert_into_black_hole_sink(
+    table: NativeFlinkTable, statement_set: Optional[StatementSet] = None
+) -> Optional[TableResult]:
+    return insert_into_table(
+        table,
+        NativeFlinkTableDescriptor.for_connector("blackhole").build(),
+        statement_set,
     )
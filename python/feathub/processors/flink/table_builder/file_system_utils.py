@@ -11,12 +11,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Optional
 
 from pyflink.table import (
     StreamTableEnvironment,
     Table as NativeFlinkTable,
     TableDescriptor as NativeFlinkTableDescriptor,
     TableResult,
+    StatementSet,
 )
 
 from feathub.common.exceptions import FeathubException
@@ -27,6 +29,7 @@ from feathub.processors.flink.table_builder.source_sink_utils_common import (
     generate_random_table_name,
     get_schema_from_table,
     define_watermark,
+    insert_into_table,
 )
 
 
@@ -69,8 +72,11 @@ def get_table_from_file_source(
 
 
 def insert_into_file_sink(
-    t_env: StreamTableEnvironment, table: NativeFlinkTable, sink: FileSystemSink
-) -> TableResult:
+    t_env: StreamTableEnvironment,
+    table: NativeFlinkTable,
+    sink: FileSystemSink,
+    statement_set: Optional[StatementSet] = None,
+) -> Optional[TableResult]:
     path = sink.path
 
     # TODO: Remove this check after FLINK-28513 is resolved.
@@ -92,4 +98,4 @@ def insert_into_file_sink(
         .option("path", path)
         .build(),
     )
-    return table.execute_insert(random_sink_name)
+    return insert_into_table(table, random_sink_name, statement_set)
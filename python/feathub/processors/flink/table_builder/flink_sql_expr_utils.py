@@ -16,7 +16,6 @@ import logging
 from feathub.dsl.expr_parser import ExprParser
 from feathub.processors.flink.ast_evaluator.flink_ast_evaluator import FlinkAstEvaluator
 
-_parser = ExprParser()
 _ast_evaluator = FlinkAstEvaluator()
 
 logger = logging.getLogger(__file__)
@@ -24,7 +23,7 @@ logger = logging.getLogger(__file__)
 
 def to_flink_sql_expr(feathub_expr: str) -> str:
     logger.debug(f"Parsing FeatHub expr: {feathub_expr}")
-    ast = _parser.parse(feathub_expr)
+    ast = ExprParser.get_instance().parse(feathub_expr)
     flink_sql_expr = _ast_evaluator.eval(ast, {})
     logger.debug(f"Result Flink Sql expr: {flink_sql_expr}")
     return flink_sql_expr
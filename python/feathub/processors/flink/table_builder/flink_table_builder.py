@@ -11,8 +11,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Union, Optional, List, Any, Dict, Sequence, Tuple, Set, cast
+from typing import (
+    Union,
+    Optional,
+    List,
+    Any,
+    Dict,
+    Sequence,
+    Tuple,
+    Set,
+    cast,
+    Iterator,
+)
 
 import pandas as pd
 from pyflink.table import (
@@ -109,6 +121,10 @@ class FlinkTableBuilder:
         # reference.
         self._tables_being_built: Set[str] = set()
 
+        # Whether the built tables are kept across calls of `build`. See
+        # `share_built_tables`.
+        self._sharing_built_tables = False
+
         register_all_feathub_udf(self.t_env)
 
     def build(
@@ -161,10 +177,27 @@ class FlinkTableBuilder:
         if EVENT_TIME_ATTRIBUTE_NAME in table.get_schema().get_field_names():
             table = table.drop_columns(EVENT_TIME_ATTRIBUTE_NAME)
 
-        self._built_tables.clear()
+        if not self._sharing_built_tables:
+            self._built_tables.clear()
 
         return table
 
+    @contextmanager
+    def share_built_tables(self) -> Iterator[None]:
+        """
+        Returns a context in which the native Flink tables built from the same
+        TableDescriptor are reused by all calls of `build`, instead of being built
+        again for each call. The tables built in the context should be executed in the
+        same job, e.g. with a StatementSet, so that the sources and intermediate tables
+        they share are read and computed once.
+        """
+        self._sharing_built_tables = True
+        try:
+            yield
+        finally:
+            self._sharing_built_tables = False
+            self._built_tables.clear()
+
     def _filter_table_by_keys(
         self,
         table: NativeFlinkTable,
@@ -14,7 +14,7 @@
 import glob
 import os
 from datetime import timedelta
-from typing import Sequence
+from typing import Sequence, Optional
 
 from pyflink.table import (
     StreamTableEnvironment,
@@ -23,6 +23,7 @@ from pyflink.table import (
     TableResult,
     Schema,
     DataTypes,
+    StatementSet,
 )
 
 from feathub.common import types
@@ -37,6 +38,7 @@ from feathub.processors.flink.table_builder.source_sink_utils_common import (
     define_watermark,
     generate_random_table_name,
     get_schema_from_table,
+    insert_into_table,
 )
 from feathub.processors.flink.table_builder.time_utils import (
     timedelta_to_flink_sql_interval,
@@ -176,7 +178,8 @@ def insert_into_kafka_sink(
     table: NativeFlinkTable,
     sink: KafkaSink,
     keys: Sequence[str],
-) -> TableResult:
+    statement_set: Optional[StatementSet] = None,
+) -> Optional[TableResult]:
     add_jar_to_t_env(
         t_env, _get_kafka_connector_jar(), _get_bounded_kafka_connector_jar()
     )
@@ -206,7 +209,7 @@ def insert_into_kafka_sink(
     t_env.create_temporary_table(
         random_sink_name, kafka_sink_descriptor_builder.build()
     )
-    return table.execute_insert(random_sink_name)
+    return insert_into_table(table, random_sink_name, statement_set)
 
 
 def _get_kafka_connector_jar() -> str:
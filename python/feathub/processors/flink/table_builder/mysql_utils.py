@@ -13,7 +13,7 @@
 #  limitations under the License.
 import glob
 import os
-from typing import List
+from typing import List, Optional
 
 from pyflink.table import (
     Table as NativeFlinkTable,
@@ -21,11 +21,15 @@ from pyflink.table import (
     TableDescriptor as NativeFlinkTableDescriptor,
     TableResult,
     Schema as NativeFlinkSchema,
+    StatementSet,
 )
 
 from feathub.common.exceptions import FeathubException
 from feathub.feature_tables.sinks.mysql_sink import MySQLSink
 from feathub.processors.flink.flink_jar_utils import add_jar_to_t_env, find_jar_lib
+from feathub.processors.flink.table_builder.source_sink_utils_common import (
+    insert_into_table,
+)
 
 
 def insert_into_mysql_sink(
@@ -33,7 +37,8 @@ def insert_into_mysql_sink(
     feature_table: NativeFlinkTable,
     sink: MySQLSink,
     keys: List[str],
-) -> TableResult:
+    statement_set: Optional[StatementSet] = None,
+) -> Optional[TableResult]:
     add_jar_to_t_env(t_env, _get_jdbc_connector_jar(), _get_mysql_driver_jar())
 
     table_descriptor_builder = (
@@ -57,7 +62,9 @@ def insert_into_mysql_sink(
     schema_builder.primary_key(*keys)
     table_descriptor_builder.schema(schema_builder.build())
 
-    return feature_table.execute_insert(table_descriptor_builder.build())
+    return insert_into_table(
+        feature_table, table_descriptor_builder.build(), statement_set
+    )
 
 
 def _get_mysql_url(host: str, port: int, database: str) -> str:
@@ -11,8 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Optional
+
 from pyflink.table import (
     TableResult,
+    StatementSet,
     StreamTableEnvironment,
     Table as NativeFlinkTable,
     TableDescriptor as NativeFlinkTableDescriptor,
@@ -21,12 +24,15 @@ from pyflink.table import (
 from feathub.processors.flink.table_builder.source_sink_utils_common import (
     generate_random_table_name,
     get_schema_from_table,
+    insert_into_table,
 )
 
 
 def insert_into_print_sink(
-    t_env: StreamTableEnvironment, table: NativeFlinkTable
-) -> TableResult:
+    t_env: StreamTableEnvironment,
+    table: NativeFlinkTable,
+    statement_set: Optional[StatementSet] = None,
+) -> Optional[TableResult]:
 
     # TODO: Alibaba Cloud Realtime Compute has bug that assumes all the tables should
     # have a name in VVR-6.0.2, which should be fixed in next version VVR-6.0.3. As a
@@ -39,4 +45,4 @@ def insert_into_print_sink(
         .schema(get_schema_from_table(table))
         .build(),
     )
-    return table.execute_insert(random_sink_name)
+    return insert_into_table(table, random_sink_name, statement_set)
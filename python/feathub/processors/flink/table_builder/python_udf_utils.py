@@ -43,15 +43,27 @@ def evaluate_python_udf_transform(
     :param result_field_name: The name of the result field.
     :param result_type: The data type of the result field.
     """
-    field_names = [
-        field_name
-        for field_name in flink_table.get_schema().get_field_names()
-        if field_name != EVENT_TIME_ATTRIBUTE_NAME
-    ]
-    python_udf = udf(
-        _PythonUdfWrapper(field_names, transform.udf),
-        result_type=to_flink_type(result_type),
-    )
+    if transform.input_fields is not None:
+        field_names = list(transform.input_fields)
+    else:
+        field_names = [
+            field_name
+            for field_name in flink_table.get_schema().get_field_names()
+            if field_name != EVENT_TIME_ATTRIBUTE_NAME
+        ]
+
+    if transform.vectorized:
+        # Pandas UDFs are invoked with batches of rows transferred in Arrow format.
+        python_udf = udf(
+            _VectorizedPythonUdfWrapper(field_names, transform.udf),
+            result_type=to_flink_type(result_type),
+            func_type="pandas",
+        )
+    else:
+        python_udf = udf(
+            _PythonUdfWrapper(field_names, transform.udf),
+            result_type=to_flink_type(result_type),
+        )
     input_cols = [native_flink_expr.col(field) for field in field_names]
     return flink_table.add_or_replace_columns(
         native_flink_expr.call(python_udf, *input_cols).alias(result_field_name)
@@ -81,3 +93,36 @@ class _PythonUdfWrapper(ScalarFunction):
         data = {field_name: value for field_name, value in zip(self.field_names, args)}
         df = pd.Series(data)
         return self.callable(df)
+
+
+class _VectorizedPythonUdfWrapper(ScalarFunction):
+    """
+    The wrapper that implement the Flink ScalarFunction for the pandas UDF of a
+    vectorized PythonUdfTransform.
+
+    The wrapper packages the input columns of a batch of rows as Pandas DataFrame and
+    passes to the udf of the PythonUdfTransform.
+    """
+
+    def __init__(
+        self,
+        field_names: Sequence[str],
+        callable_: Callable[[pd.DataFrame], pd.Series],
+    ):
+        self.field_names = field_names
+        self.callable = callable_
+
+    def eval(self, *args: pd.Series) -> pd.Series:
+        if len(args) != len(self.field_names):
+            raise FeathubException(
+                "Number of arguments are not the same as the fields in the input table."
+            )
+
+        df = pd.concat(args, axis=1, keys=self.field_names)
+        result = self.callable(df)
+        if len(result) != df.shape[0]:
+            raise FeathubException(
+                f"Vectorized Python UDF returns {len(result)} values for "
+                f"{df.shape[0]} rows."
+            )
+        return pd.Series(result).reset_index(drop=True)
@@ -11,11 +11,13 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Optional
 
 from pyflink.table import (
     StreamTableEnvironment,
     Table as NativeFlinkTable,
     TableResult,
+    StatementSet,
 )
 
 from feathub.common.exceptions import FeathubException
@@ -77,21 +79,31 @@ def insert_into_sink(
     features_table: NativeFlinkTable,
     features_desc: TableDescriptor,
     sink: FeatureTable,
-) -> TableResult:
+    statement_set: Optional[StatementSet] = None,
+) -> Optional[TableResult]:
     """
     Insert the flink table to the given sink.
+
+    If the statement set is not None, the insertion is added to the statement set
+    instead of being executed, and None is returned.
     """
     if isinstance(sink, FileSystemSink):
-        return insert_into_file_sink(t_env, features_table, sink)
+        return insert_into_file_sink(t_env, features_table, sink, statement_set)
     elif isinstance(sink, KafkaSink):
-        return insert_into_kafka_sink(t_env, features_table, sink, features_desc.keys)
+        return insert_into_kafka_sink(
+            t_env, features_table, sink, features_desc.keys, statement_set
+        )
     elif isinstance(sink, PrintSink):
-        return insert_into_print_sink(t_env, features_table)
+        return insert_into_print_sink(t_env, features_table, statement_set)
     elif isinstance(sink, RedisSink):
-        return insert_into_redis_sink(t_env, features_table, features_desc, sink)
+        return insert_into_redis_sink(
+            t_env, features_table, features_desc, sink, statement_set
+        )
     elif isinstance(sink, MySQLSink):
-        return insert_into_mysql_sink(t_env, features_table, sink, features_desc.keys)
+        return insert_into_mysql_sink(
+            t_env, features_table, sink, features_desc.keys, statement_set
+        )
     elif isinstance(sink, BlackHoleSink):
-        return insert_into_black_hole_sink(features_table)
+        return insert_into_black_hole_sink(features_table, statement_set)
     else:
         raise FeathubException(f"Unsupported sink type {type(sink)}.")
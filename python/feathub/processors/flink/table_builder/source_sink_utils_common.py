@@ -13,11 +13,15 @@
 #  limitations under the License.
 import uuid
 from datetime import timedelta
+from typing import Optional, Union
 
 from pyflink.table import (
     Table as NativeFlinkTable,
     Schema as NativeFlinkSchema,
     StreamTableEnvironment,
+    StatementSet,
+    TableResult,
+    TableDescriptor as NativeFlinkTableDescriptor,
 )
 
 from feathub.common import types
@@ -35,6 +39,28 @@ def generate_random_table_name(original_table_name: str) -> str:
     return random_sink_name
 
 
+def insert_into_table(
+    table: NativeFlinkTable,
+    target: Union[str, NativeFlinkTableDescriptor],
+    statement_set: Optional[StatementSet],
+) -> Optional[TableResult]:
+    """
+    Inserts the table into the target table, which is either the path of a registered
+    table or a table descriptor.
+
+    :param table: The table to insert.
+    :param target: The path or the descriptor of the target table.
+    :param statement_set: Optional. If it is not None, the insertion is added to the
+                          statement set to be executed together with the others in
+                          the same job, and None is returned. Otherwise, the insertion
+                          is executed and its result is returned.
+    """
+    if statement_set is None:
+        return table.execute_insert(target)
+    statement_set.add_insert(target, table)
+    return None
+
+
 def get_schema_from_table(table: NativeFlinkTable) -> NativeFlinkSchema:
     schema_builder = NativeFlinkSchema.new_builder()
     for field_name in table.get_schema().get_field_names():
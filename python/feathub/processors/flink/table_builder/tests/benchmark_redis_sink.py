@@ -0,0 +1,107 @@
+# Copyright 2022 The FeatHub Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the rows per second at which the Flink processor materializes features
+into Redis on a local mini-cluster. Run it on two commits to compare the throughput
+of their Redis materialization paths.
+
+Run it with `python -m feathub.processors.flink.table_builder.tests.
+benchmark_redis_sink [--host HOST] [--port PORT] [--rows ROWS]`, which writes to
+the Redis server at HOST:PORT.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.feathub_client import FeathubClient
+from feathub.feature_tables.sinks.redis_sink import RedisSink
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.table.schema import Schema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    client = FeathubClient(
+        {
+            "processor": {"type": "flink", "flink": {"deployment_mode": "cli"}},
+            "online_store": {"types": ["memory"], "memory": {}},
+            "registry": {"type": "local", "local": {"namespace": "default"}},
+            "feature_service": {"type": "local", "local": {}},
+        }
+    )
+
+    start_time = datetime(2022, 1, 1)
+    df = pd.DataFrame(
+        {
+            "id": range(args.rows),
+            "name": [f"user_{i % 1000}" for i in range(args.rows)],
+            "cost": [i * 0.5 for i in range(args.rows)],
+            "time": [
+                (start_time + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S")
+                for i in range(args.rows)
+            ],
+        }
+    )
+    schema = (
+        Schema.new_builder()
+        .column("id", types.Int64)
+        .column("name", types.String)
+        .column("cost", types.Float64)
+        .column("time", types.String)
+        .build()
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "input.csv")
+        df.to_csv(path, index=False, header=False)
+        source = FileSystemSource(
+            name="benchmark_source",
+            path=path,
+            data_format="csv",
+            schema=schema,
+            keys=["id"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+        sink = RedisSink(
+            namespace="benchmark",
+            host=args.host,
+            port=args.port,
+            buffer_size=1000,
+        )
+
+        begin = time.time()
+        client.materialize_features(
+            features=source, sink=sink, allow_overwrite=True
+        ).wait()
+        seconds = time.time() - begin
+
+    print(
+        f"Wrote {args.rows} rows to Redis in {seconds:.3f} seconds, "
+        f"{args.rows / seconds:.0f} rows/sec."
+    )
+
+
+if __name__ == "__main__":
+    main()
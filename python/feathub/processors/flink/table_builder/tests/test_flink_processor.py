@@ -198,6 +198,52 @@ class FlinkProcessorTest(unittest.TestCase):
         self.assertEqual(source, mock_table_builder.build.call_args[1]["features"])
         mock_table.execute_insert.assert_called_once()
 
+    def test_materialize_in_batch_with_session_mode(self):
+        processor = FlinkProcessor(
+            props={
+                "processor.flink.rest.address": "127.0.0.1",
+                "processor.flink.rest.port": 1234,
+            },
+            registry=self.registry,
+        )
+        mock_table = Mock(spec=Table)
+        mock_schema = Mock(spec=TableSchema)
+        mock_schema.get_field_names.return_value = []
+        mock_table.get_schema.return_value = mock_schema
+
+        mock_table_builder = Mock(spec=FlinkTableBuilder)
+        mock_table_builder.build.return_value = mock_table
+        mock_table_builder.share_built_tables.return_value = MagicMock()
+        mock_table_builder.t_env = Mock()
+        processor.flink_table_builder = mock_table_builder
+        source = FileSystemSource("source", "/path", "csv", Schema([], []))
+        sink_1 = FileSystemSink("/path_1", "csv")
+        sink_2 = FileSystemSink("/path_2", "csv")
+
+        processor.materialize_features_in_batch(
+            [(source, sink_1), (source, sink_2)], allow_overwrite=True
+        )
+        mock_table_builder.share_built_tables.assert_called_once()
+        self.assertEqual(2, mock_table_builder.build.call_count)
+        statement_set = mock_table_builder.t_env.create_statement_set.return_value
+        self.assertEqual(2, statement_set.add_insert.call_count)
+        statement_set.execute.assert_called_once()
+        mock_table.execute_insert.assert_not_called()
+
+    def test_materialize_in_batch_with_kubernetes_application_mode(self):
+        processor = FlinkProcessor(
+            props={
+                "flink_home": "/flink/home",
+                "processor.flink.deployment_mode": "kubernetes-application",
+            },
+            registry=self.registry,
+        )
+        source = FileSystemSource("source", "/path", "csv", Schema([], []))
+        with self.assertRaises(FeathubException):
+            processor.materialize_features_in_batch(
+                [(source, FileSystemSink("/path", "csv"))], allow_overwrite=True
+            )
+
     def test_to_pandas_with_kubernetes_application_mode(self):
         processor = FlinkProcessor(
             props={
@@ -12,7 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
+
+from pyflink.table import DataTypes, TableSchema
 
 from feathub.common.exceptions import FeathubException
 from feathub.common.types import String
@@ -78,3 +80,46 @@ class FlinkTableTest(unittest.TestCase):
                 build_method.call_args[1]["features"], TableDescriptor
             )
             self.assertTrue(build_method.call_args[1]["features"].is_bounded())
+
+    def test_to_pandas_batches(self):
+        source = DataGenSource(
+            "source",
+            Schema.new_builder().column("x", String).build(),
+            number_of_rows=10,
+        )
+        table = FlinkTable(
+            flink_processor=self.processor,
+            feature=self.registry.build_features([source])[0],
+            keys=None,
+            start_datetime=None,
+            end_datetime=None,
+        )
+
+        with self.assertRaises(FeathubException) as cm:
+            table.to_pandas_batches(batch_size=0)
+        self.assertIn("Batch size must be positive.", cm.exception.args[0])
+
+        with patch.object(
+            self.processor.flink_table_builder, "build"
+        ) as build_method, patch.object(
+            flink_table, "flink_table_to_pandas_batches"
+        ) as to_pandas_batches_method:
+            table.to_pandas_batches(batch_size=3)
+            self.assertEqual(
+                (build_method.return_value, 3), to_pandas_batches_method.call_args[0]
+            )
+
+    def test_empty_table_to_pandas(self):
+        # Tables with Map fields are collected as rows.
+        native_table = MagicMock()
+        native_table.get_schema.return_value = TableSchema(
+            ["x", "m"],
+            [DataTypes.BIGINT(), DataTypes.MAP(DataTypes.STRING(), DataTypes.STRING())],
+        )
+        results = native_table.execute.return_value.collect.return_value
+        results.__enter__.return_value = []
+
+        df = flink_table.flink_table_to_pandas(native_table)
+        self.assertListEqual(["x", "m"], df.columns.tolist())
+        self.assertEqual("int64", df["x"].dtype)
+        self.assertEqual(0, df.shape[0])
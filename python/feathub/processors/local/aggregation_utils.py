@@ -11,11 +11,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Sequence, Any
+from abc import ABC, abstractmethod
+from collections import deque, Counter
+from typing import Sequence, Any, Deque, Tuple, Dict, List
 
 import numpy as np
 import pandas as pd
 
+from feathub.common.exceptions import FeathubException
 from feathub.feature_views.transforms.agg_func import AggFunc
 
 
@@ -36,3 +39,222 @@ AGG_FUNCTIONS = {
     AggFunc.COUNT: lambda l: len(l),
     AggFunc.VALUE_COUNTS: _value_counts,
 }
+
+
+class WindowAccumulator(ABC):
+    """
+    An accumulator that incrementally maintains the aggregation result of the values
+    in a window, when values enter the window from its end and leave the window from
+    its start in the same order.
+    """
+
+    @abstractmethod
+    def add(self, value: Any) -> None:
+        """
+        Adds a value to the end of the window.
+        """
+        pass
+
+    @abstractmethod
+    def retract(self, value: Any) -> None:
+        """
+        Removes the value at the start of the window.
+        """
+        pass
+
+    @abstractmethod
+    def get_result(self) -> Any:
+        """
+        Returns the aggregation result of the values in the window.
+        """
+        pass
+
+
+class _SumAccumulator(WindowAccumulator):
+    def __init__(self) -> None:
+        self.sum: Any = 0
+        self.count = 0
+        self.null_count = 0
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+        if pd.isna(value):
+            self.null_count += 1
+        else:
+            self.sum += value
+
+    def retract(self, value: Any) -> None:
+        self.count -= 1
+        if pd.isna(value):
+            self.null_count -= 1
+        else:
+            self.sum -= value
+        if self.count == 0:
+            # Resets the sum to avoid accumulating floating point errors.
+            self.sum = 0
+
+    def get_result(self) -> Any:
+        if self.null_count > 0:
+            return np.nan
+        return self.sum
+
+
+class _AvgAccumulator(_SumAccumulator):
+    def get_result(self) -> Any:
+        if self.count == 0:
+            return np.nan
+        return super().get_result() / self.count
+
+
+class _CountAccumulator(WindowAccumulator):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+
+    def retract(self, value: Any) -> None:
+        self.count -= 1
+
+    def get_result(self) -> Any:
+        return self.count
+
+
+class _MinMaxAccumulator(WindowAccumulator):
+    """
+    Maintains the minimum or maximum value with a monotonic deque, whose values are
+    the candidates of the result in their order in the window.
+    """
+
+    def __init__(self, is_max: bool) -> None:
+        self.is_max = is_max
+        self.candidates: Deque[Tuple[int, Any]] = deque()
+        self.start_idx = 0
+        self.end_idx = 0
+        self.null_count = 0
+
+    def _dominates(self, value: Any, other: Any) -> bool:
+        return value >= other if self.is_max else value <= other
+
+    def add(self, value: Any) -> None:
+        if pd.isna(value):
+            self.null_count += 1
+        else:
+            while self.candidates and self._dominates(value, self.candidates[-1][1]):
+                self.candidates.pop()
+            self.candidates.append((self.end_idx, value))
+        self.end_idx += 1
+
+    def retract(self, value: Any) -> None:
+        if pd.isna(value):
+            self.null_count -= 1
+        elif self.candidates and self.candidates[0][0] == self.start_idx:
+            self.candidates.popleft()
+        self.start_idx += 1
+
+    def get_result(self) -> Any:
+        if self.null_count > 0:
+            return np.nan
+        if not self.candidates:
+            return None
+        return self.candidates[0][1]
+
+
+class _FirstLastValueAccumulator(WindowAccumulator):
+    def __init__(self, is_last: bool) -> None:
+        self.is_last = is_last
+        self.values: Deque[Any] = deque()
+
+    def add(self, value: Any) -> None:
+        self.values.append(value)
+
+    def retract(self, value: Any) -> None:
+        self.values.popleft()
+
+    def get_result(self) -> Any:
+        if not self.values:
+            return None
+        return self.values[-1] if self.is_last else self.values[0]
+
+
+class _ValueCountsAccumulator(WindowAccumulator):
+    def __init__(self) -> None:
+        self.counter: Counter = Counter()
+
+    def add(self, value: Any) -> None:
+        self.counter[value] += 1
+
+    def retract(self, value: Any) -> None:
+        self.counter[value] -= 1
+        if self.counter[value] == 0:
+            del self.counter[value]
+
+    def get_result(self) -> Any:
+        if not self.counter:
+            return None
+        return dict(self.counter)
+
+
+def create_window_accumulator(agg_func: AggFunc) -> WindowAccumulator:
+    """
+    Creates a WindowAccumulator that computes the given aggregation function.
+    """
+    if agg_func == AggFunc.SUM:
+        return _SumAccumulator()
+    elif agg_func == AggFunc.AVG:
+        return _AvgAccumulator()
+    elif agg_func == AggFunc.COUNT or agg_func == AggFunc.ROW_NUMBER:
+        return _CountAccumulator()
+    elif agg_func == AggFunc.MAX:
+        return _MinMaxAccumulator(is_max=True)
+    elif agg_func == AggFunc.MIN:
+        return _MinMaxAccumulator(is_max=False)
+    elif agg_func == AggFunc.FIRST_VALUE:
+        return _FirstLastValueAccumulator(is_last=False)
+    elif agg_func == AggFunc.LAST_VALUE:
+        return _FirstLastValueAccumulator(is_last=True)
+    elif agg_func == AggFunc.VALUE_COUNTS:
+        return _ValueCountsAccumulator()
+
+    raise FeathubException(f"Unsupported agg function {agg_func}.")
+
+
+def aggregate_windows(
+    values: np.ndarray,
+    window_starts: np.ndarray,
+    window_ends: np.ndarray,
+    agg_func: AggFunc,
+) -> List:
+    """
+    Aggregates the values in each window. The window starts and ends should be
+    non-decreasing, so that every value is added to and retracted from a
+    WindowAccumulator at most once.
+
+    :param values: The values to aggregate.
+    :param window_starts: The inclusive start index of each window in values.
+    :param window_ends: The exclusive end index of each window in values.
+    :param agg_func: The aggregation function.
+    :return: A list containing the aggregation result of each window.
+    """
+    accumulator = create_window_accumulator(agg_func)
+    results = []
+    result_by_window: Dict[Tuple[int, int], Any] = {}
+    start = 0
+    end = 0
+    for window_start, window_end in zip(window_starts, window_ends):
+        window = (window_start, window_end)
+        if window not in result_by_window:
+            while end < window_end:
+                accumulator.add(values[end])
+                end += 1
+            while start < window_start:
+                accumulator.retract(values[start])
+                start += 1
+            result_by_window.clear()
+            result_by_window[window] = (
+                AGG_FUNCTIONS[agg_func]([])
+                if start == end
+                else accumulator.get_result()
+            )
+        results.append(result_by_window[window])
+    return results
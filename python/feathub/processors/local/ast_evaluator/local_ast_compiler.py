@@ -0,0 +1,305 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import operator
+from datetime import timezone, tzinfo
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, List
+
+from feathub.common.exceptions import FeathubExpressionException
+from feathub.dsl.ast import (
+    ExprAST,
+    ArgListNode,
+    VariableNode,
+    FuncCallOp,
+    ValueNode,
+    CompareOp,
+    UminusOp,
+    BinaryOp,
+    LogicalOp,
+    CastOp,
+    GroupNode,
+    IsOp,
+    NullNode,
+    CaseOp,
+)
+from feathub.dsl.expr_parser import ExprParser
+from feathub.processors.local.ast_evaluator.local_ast_evaluator import (
+    get_cast_function,
+)
+from feathub.processors.local.ast_evaluator.local_func_evaluator import (
+    LocalFuncEvaluator,
+)
+
+# A function that takes a row and returns the result of an expression on the row.
+CompiledExpression = Callable[[Any], Any]
+
+BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+COMPARE_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+    "<>": operator.ne,
+}
+
+
+class LocalAstCompiler:
+    """
+    LocalAstCompiler compiles an AST into a Python closure that evaluates the
+    expression on a row, which gives the same result as LocalAstEvaluator but
+    resolves the node types, operators, functions and variable positions only once
+    at compile time instead of once per row. Subtrees that do not refer to any
+    variable are evaluated at compile time.
+    """
+
+    def __init__(self, tz: tzinfo = timezone.utc):
+        """
+        :param tz: The timezone used to evaluate the expressions.
+        """
+        self.func_evaluator = LocalFuncEvaluator(tz)
+        self._cache: Dict[Tuple[str, Optional[Tuple]], CompiledExpression] = {}
+
+    def compile_expr(
+        self, expr: str, field_names: Optional[Sequence[str]] = None
+    ) -> CompiledExpression:
+        """
+        Compiles the expression, or returns the cached result if the expression has
+        been compiled with the same field names.
+
+        :param expr: The FeatHub expression.
+        :param field_names: Optional. If it is not None, the compiled function takes
+                            a sequence of the values of these fields, e.g. a tuple
+                            from `DataFrame.itertuples`. Otherwise, it takes a map
+                            from field name to value.
+        """
+        key = (expr, None if field_names is None else tuple(field_names))
+        if key not in self._cache:
+            ast = ExprParser.get_instance().parse(expr)
+            self._cache[key] = self.compile(ast, field_names)
+        return self._cache[key]
+
+    def compile(
+        self, ast: ExprAST, field_names: Optional[Sequence[str]] = None
+    ) -> CompiledExpression:
+        """
+        Compiles the AST into a function that evaluates the AST on a row.
+
+        :param ast: The root of the AST.
+        :param field_names: Optional. If it is not None, the compiled function takes
+                            a sequence of the values of these fields. Otherwise, it
+                            takes a map from field name to value.
+        """
+        positions = (
+            None
+            if field_names is None
+            else {name: idx for idx, name in enumerate(field_names)}
+        )
+        func, _ = self._compile(ast, positions)
+        return func
+
+    def _compile(
+        self, ast: ExprAST, positions: Optional[Dict[str, int]]
+    ) -> Tuple[CompiledExpression, bool]:
+        """
+        Returns the compiled function of the AST and whether the AST refers to any
+        variable.
+        """
+        if isinstance(ast, VariableNode):
+            return self._compile_variable_node(ast, positions), True
+        if isinstance(ast, ValueNode):
+            value = ast.value
+            return lambda row: value, False
+
+        children, is_variable = self._compile_children(ast, positions)
+        func = self._compile_node(ast, children)
+        if is_variable:
+            return func, True
+
+        # Folds the constant subtree unless it fails, in which case the error is
+        # raised when the compiled function is called, as LocalAstEvaluator does.
+        try:
+            value = func(None)
+        except Exception:
+            return func, False
+        return lambda row: value, False
+
+    def _compile_children(
+        self, ast: ExprAST, positions: Optional[Dict[str, int]]
+    ) -> Tuple[List[CompiledExpression], bool]:
+        if isinstance(ast, (BinaryOp, CompareOp, LogicalOp)):
+            child_asts = [ast.left_child, ast.right_child]
+        elif isinstance(ast, (UminusOp, CastOp, GroupNode)):
+            child_asts = [ast.child]
+        elif isinstance(ast, FuncCallOp):
+            child_asts = ast.args.values
+        elif isinstance(ast, ArgListNode):
+            child_asts = ast.values
+        elif isinstance(ast, (IsOp, NullNode, CaseOp)):
+            child_asts = []
+        else:
+            raise FeathubExpressionException(f"Unknown AST node {type(ast)}.")
+
+        children = []
+        is_variable = False
+        for child_ast in child_asts:
+            child, is_child_variable = self._compile(child_ast, positions)
+            children.append(child)
+            is_variable = is_variable or is_child_variable
+        return children, is_variable
+
+    def _compile_node(
+        self, ast: ExprAST, children: List[CompiledExpression]
+    ) -> CompiledExpression:
+        if isinstance(ast, BinaryOp):
+            return _compile_binary_op(ast, *children)
+        if isinstance(ast, UminusOp):
+            child = children[0]
+            return lambda row: -child(row)
+        if isinstance(ast, CompareOp):
+            return _compile_compare_op(ast, *children)
+        if isinstance(ast, FuncCallOp):
+            return self._compile_func_call_op(ast, children)
+        if isinstance(ast, ArgListNode):
+            return lambda row: [child(row) for child in children]
+        if isinstance(ast, CastOp):
+            return _compile_cast_op(ast, children[0])
+        if isinstance(ast, LogicalOp):
+            return _compile_logical_op(ast, *children)
+        if isinstance(ast, GroupNode):
+            return children[0]
+        if isinstance(ast, IsOp):
+            return _compile_unsupported_op("IS/IS NOT operation is not supported.")
+        if isinstance(ast, NullNode):
+            return _compile_unsupported_op("NULL operation is not supported.")
+        if isinstance(ast, CaseOp):
+            return _compile_unsupported_op("CASE operation is not supported.")
+
+        raise FeathubExpressionException(f"Unknown AST node {type(ast)}.")
+
+    @staticmethod
+    def _compile_variable_node(
+        ast: VariableNode, positions: Optional[Dict[str, int]]
+    ) -> CompiledExpression:
+        var_name = ast.var_name
+        if positions is None:
+
+            def get_variable(row: Any) -> Any:
+                if var_name not in row:
+                    raise RuntimeError(f"Variable '{var_name}' is not found in {row}.")
+                return row[var_name]
+
+            return get_variable
+
+        if var_name not in positions:
+            return _compile_unsupported_op(
+                f"Variable '{var_name}' is not found in {list(positions)}."
+            )
+        position = positions[var_name]
+        return lambda row: row[position]
+
+    def _compile_func_call_op(
+        self, ast: FuncCallOp, children: List[CompiledExpression]
+    ) -> CompiledExpression:
+        func_name = ast.func_name
+        if func_name not in self.func_evaluator.functions:
+            return _compile_unsupported_op(f"Unsupported function: {func_name}.")
+        function = self.func_evaluator.get_function(func_name)
+        return lambda row: function([child(row) for child in children])
+
+
+def _compile_binary_op(
+    ast: BinaryOp, left: CompiledExpression, right: CompiledExpression
+) -> CompiledExpression:
+    if ast.op_type not in BINARY_OPERATORS:
+        return _compile_unsupported_op(f"Unsupported op type: {ast.op_type}.")
+    op = BINARY_OPERATORS[ast.op_type]
+
+    def binary_op(row: Any) -> Any:
+        left_value = left(row)
+        right_value = right(row)
+        if left_value is None or right_value is None:
+            return None
+        return op(left_value, right_value)
+
+    return binary_op
+
+
+def _compile_compare_op(
+    ast: CompareOp, left: CompiledExpression, right: CompiledExpression
+) -> CompiledExpression:
+    if ast.op_type not in COMPARE_OPERATORS:
+        return _compile_unsupported_op(f"Unsupported op type: {ast.op_type}.")
+    op = COMPARE_OPERATORS[ast.op_type]
+    return lambda row: op(left(row), right(row))
+
+
+def _compile_cast_op(ast: CastOp, child: CompiledExpression) -> CompiledExpression:
+    try:
+        cast_function = get_cast_function(ast.type_name)
+    except FeathubExpressionException as e:
+        error = e
+
+        def cast_function(val: Any) -> Any:
+            raise error
+
+    def cast(row: Any) -> Any:
+        return cast_function(child(row))
+
+    if ast.exception_on_failure:
+        return cast
+
+    def try_cast(row: Any) -> Any:
+        try:
+            return cast(row)
+        except Exception:
+            return None
+
+    return try_cast
+
+
+def _compile_logical_op(
+    ast: LogicalOp, left: CompiledExpression, right: CompiledExpression
+) -> CompiledExpression:
+    # Both operands are evaluated before the operation, as LocalAstEvaluator does.
+    if ast.op_type == "AND":
+
+        def logical_and(row: Any) -> Any:
+            left_value = left(row)
+            right_value = right(row)
+            return left_value and right_value
+
+        return logical_and
+    elif ast.op_type == "OR":
+
+        def logical_or(row: Any) -> Any:
+            left_value = left(row)
+            right_value = right(row)
+            return left_value or right_value
+
+        return logical_or
+
+    return lambda row: None
+
+
+def _compile_unsupported_op(message: str) -> CompiledExpression:
+    def unsupported_op(row: Any) -> Any:
+        raise RuntimeError(message)
+
+    return unsupported_op
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from datetime import datetime, timezone, tzinfo
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Callable
 
 from feathub.common.exceptions import FeathubException, FeathubExpressionException
 from feathub.dsl.abstract_ast_evaluator import AbstractAstEvaluator
@@ -39,6 +39,49 @@ _TRUE_STRINGS = ("t", "true", "y", "yes", "1")
 _FALSE_STRINGS = ("f", "false", "n", "no", "0")
 
 
+def _cast_to_bytes(val: Any) -> bytes:
+    if isinstance(val, str):
+        return bytes(val, "utf-8")
+    raise FeathubException(f"Cannot cast '{val}' to bytes")
+
+
+def _cast_to_boolean(val: Any) -> bool:
+    if isinstance(val, str):
+        if val.lower() in _TRUE_STRINGS:
+            return True
+        if val.lower() in _FALSE_STRINGS:
+            return False
+        raise FeathubException(f"Cannot parser '{val}' as BOOLEAN")
+    return bool(val)
+
+
+def _cast_to_timestamp(val: Any) -> datetime:
+    return datetime.strptime(val, "%Y-%m-%d %H:%M:%S.%f")
+
+
+_CAST_FUNCTIONS: Dict[str, Callable[[Any], Any]] = {
+    "BYTES": _cast_to_bytes,
+    "STRING": str,
+    "INTEGER": int,
+    "BIGINT": int,
+    "FLOAT": float,
+    "DOUBLE": float,
+    "BOOLEAN": _cast_to_boolean,
+    "TIMESTAMP": _cast_to_timestamp,
+}
+
+
+def get_cast_function(type_name: str) -> Callable[[Any], Any]:
+    """
+    Returns the function that casts a value to the given FeatHub data type.
+
+    :param type_name: The name of the data type in FeatHub expression, e.g. INTEGER.
+    """
+    if type_name not in _CAST_FUNCTIONS:
+        raise FeathubExpressionException(f"Unknown datatype: {type_name}.")
+    return _CAST_FUNCTIONS[type_name]
+
+
 class LocalAstEvaluator(AbstractAstEvaluator):
     """
     AST Evaluator for local processor.
@@ -116,28 +159,7 @@ class LocalAstEvaluator(AbstractAstEvaluator):
 
     def _eval_cast_node(self, ast: CastOp, variables: Optional[Dict]) -> Any:
         val = self.eval(ast.child, variables)
-        if ast.type_name == "BYTES":
-            if isinstance(val, str):
-                return bytes(val, "utf-8")
-            raise FeathubException(f"Cannot cast '{val}' to bytes")
-        if ast.type_name == "STRING":
-            return str(val)
-        if ast.type_name == "INTEGER" or ast.type_name == "BIGINT":
-            return int(val)
-        if ast.type_name == "FLOAT" or ast.type_name == "DOUBLE":
-            return float(val)
-        if ast.type_name == "BOOLEAN":
-            if isinstance(val, str):
-                if val.lower() in _TRUE_STRINGS:
-                    return True
-                if val.lower() in _FALSE_STRINGS:
-                    return False
-                raise FeathubException(f"Cannot parser '{val}' as BOOLEAN")
-            return bool(val)
-        if ast.type_name == "TIMESTAMP":
-            return datetime.strptime(val, "%Y-%m-%d %H:%M:%S.%f")
-
-        raise FeathubExpressionException(f"Unknown datatype: {ast.type_name}.")
+        return get_cast_function(ast.type_name)(val)
 
     def eval_logical_op(self, ast: LogicalOp, variables: Optional[Dict]) -> Any:
         left_value = self.eval(ast.left_child, variables)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import tzinfo, timezone
-from typing import Any
+from typing import Any, Callable, Dict, List
 
 from feathub.common.utils import to_unix_timestamp
 
@@ -20,15 +20,31 @@ from feathub.common.utils import to_unix_timestamp
 class LocalFuncEvaluator:
     def __init__(self, tz: tzinfo = timezone.utc):
         self.tz = tz
+        self.functions: Dict[str, Callable[[List], Any]] = {
+            "LOWER": self._lower,
+            "UNIX_TIMESTAMP": self._unix_timestamp,
+        }
 
     def eval(self, func_name: str, values: Any) -> Any:
-        if func_name == "LOWER":
-            return values[0].lower()
-        elif func_name == "UNIX_TIMESTAMP":
-            if values[0] is None:
-                return None
-            if len(values) == 1:
-                return int(to_unix_timestamp(values[0], tz=self.tz))
-            else:
-                return int(to_unix_timestamp(values[0], values[1], self.tz))
-        raise RuntimeError(f"Unsupported function: {func_name}.")
+        return self.get_function(func_name)(values)
+
+    def get_function(self, func_name: str) -> Callable[[List], Any]:
+        """
+        Returns the function that takes the list of argument values and returns the
+        result of the FeatHub built-in function with the given name.
+        """
+        if func_name not in self.functions:
+            raise RuntimeError(f"Unsupported function: {func_name}.")
+        return self.functions[func_name]
+
+    @staticmethod
+    def _lower(values: List) -> Any:
+        return values[0].lower()
+
+    def _unix_timestamp(self, values: List) -> Any:
+        if values[0] is None:
+            return None
+        if len(values) == 1:
+            return int(to_unix_timestamp(values[0], tz=self.tz))
+        else:
+            return int(to_unix_timestamp(values[0], values[1], self.tz))
@@ -0,0 +1,322 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import operator
+from datetime import timezone, tzinfo
+from typing import Any, Dict, Optional, Callable
+
+import numpy as np
+import pandas as pd
+
+from feathub.common.utils import to_unix_timestamp
+from feathub.dsl.abstract_ast_evaluator import AbstractAstEvaluator
+from feathub.dsl.ast import (
+    ExprAST,
+    ArgListNode,
+    VariableNode,
+    FuncCallOp,
+    ValueNode,
+    CompareOp,
+    UminusOp,
+    BinaryOp,
+    LogicalOp,
+    CastOp,
+    GroupNode,
+    IsOp,
+    NullNode,
+    CaseOp,
+)
+from feathub.processors.local.ast_evaluator.local_ast_compiler import (
+    LocalAstCompiler,
+    BINARY_OPERATORS,
+    COMPARE_OPERATORS,
+)
+
+
+class _NotVectorizableException(Exception):
+    """
+    Raised when an AST node cannot be evaluated on whole columns, so that the node
+    is evaluated row by row instead.
+    """
+
+    pass
+
+
+class LocalVectorizedAstEvaluator(AbstractAstEvaluator):
+    """
+    AST Evaluator for local processor that evaluates an expression on whole columns
+    of a DataFrame at once. The variables should be a DataFrame, and the result of
+    each node is either a Series aligned with the DataFrame or a scalar if the node
+    does not depend on any variable.
+
+    Nodes that cannot be vectorized, e.g. a cast that fails on some rows or an
+    operation whose inputs have unsupported types, are evaluated row by row with
+    LocalAstCompiler, so that the results are the same as those of
+    LocalAstEvaluator.
+    """
+
+    def __init__(self, tz: tzinfo = timezone.utc):
+        self.tz = tz
+        self.ast_compiler = LocalAstCompiler(tz)
+
+    def eval_column(self, ast: ExprAST, df: pd.DataFrame) -> pd.Series:
+        """
+        Evaluate the AST on each row of the given DataFrame.
+
+        :param ast: The root of the AST.
+        :param df: The DataFrame containing the variables as columns.
+        :return: A Series containing the result of each row, with the same index as
+                 the DataFrame.
+        """
+        result = self.eval(ast, df)
+        if isinstance(result, pd.Series):
+            return result
+        return pd.Series([result] * df.shape[0], index=df.index, dtype=object)
+
+    def eval_filter(self, ast: ExprAST, df: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate the filter AST on each row of the given DataFrame.
+
+        :param ast: The root of the AST.
+        :param df: The DataFrame containing the variables as columns.
+        :return: A boolean array indicating which rows match the filter, i.e. whose
+                 result is neither None nor false.
+        """
+        results = self.eval_column(ast, df)
+        if results.dtype == bool:
+            return results.to_numpy()
+        return np.array(
+            [result is not None and bool(result) for result in results], dtype=bool
+        )
+
+    def eval(self, ast: ExprAST, variables: Optional[Dict]) -> Any:
+        try:
+            return super().eval(ast, variables)
+        except _NotVectorizableException:
+            return self._eval_by_row(ast, variables)
+
+    def _eval_by_row(self, ast: ExprAST, df: Any) -> pd.Series:
+        func = self.ast_compiler.compile(ast, list(df.columns))
+        return pd.Series(
+            [func(row) for row in df.itertuples(index=False, name=None)],
+            index=df.index,
+            dtype=object,
+        )
+
+    def eval_binary_op(self, ast: BinaryOp, variables: Optional[Dict]) -> Any:
+        left_value = self.eval(ast.left_child, variables)
+        right_value = self.eval(ast.right_child, variables)
+
+        if ast.op_type not in BINARY_OPERATORS:
+            raise RuntimeError(f"Unsupported op type: {ast.op_type}.")
+        op = BINARY_OPERATORS[ast.op_type]
+
+        if left_value is None or right_value is None:
+            return None
+
+        # Null values are propagated with a mask and the operation is only applied
+        # on the other rows.
+        null_mask = _get_null_mask(left_value) | _get_null_mask(right_value)
+        if not null_mask.any():
+            return _apply_arithmetic_operator(op, left_value, right_value)
+
+        index = (left_value if isinstance(left_value, pd.Series) else right_value).index
+        results = np.full(len(index), None, dtype=object)
+        results[~null_mask] = _apply_arithmetic_operator(
+            op, _filter(left_value, ~null_mask), _filter(right_value, ~null_mask)
+        ).to_numpy(dtype=object)
+        return pd.Series(results, index=index, dtype=object)
+
+    def eval_uminus_op(self, ast: UminusOp, variables: Optional[Dict]) -> Any:
+        child_value = self.eval(ast.child, variables)
+        if isinstance(child_value, pd.Series) and child_value.dtype.kind not in "iuf":
+            raise _NotVectorizableException()
+        return _apply_arithmetic_operator(operator.neg, child_value)
+
+    def eval_compare_op(self, ast: CompareOp, variables: Optional[Dict]) -> Any:
+        left_value = self.eval(ast.left_child, variables)
+        right_value = self.eval(ast.right_child, variables)
+
+        if ast.op_type not in COMPARE_OPERATORS:
+            raise RuntimeError(f"Unsupported op type: {ast.op_type}.")
+
+        # Pandas implicitly parses strings compared with datetime columns, which
+        # LocalAstEvaluator does not.
+        if _is_datetime(left_value) != _is_datetime(right_value):
+            raise _NotVectorizableException()
+
+        return _apply_operator(COMPARE_OPERATORS[ast.op_type], left_value, right_value)
+
+    def eval_value_node(self, ast: ValueNode, variables: Optional[Dict]) -> Any:
+        return ast.value
+
+    def eval_func_call_op(self, ast: FuncCallOp, variables: Optional[Dict]) -> Any:
+        values = self.eval(ast.args, variables)
+        if not isinstance(values[0], pd.Series):
+            return self.ast_compiler.func_evaluator.eval(ast.func_name, values)
+
+        if ast.func_name == "LOWER":
+            if pd.api.types.infer_dtype(values[0], skipna=False) != "string":
+                raise _NotVectorizableException()
+            return values[0].str.lower()
+        elif ast.func_name == "UNIX_TIMESTAMP":
+            if len(values) > 1 and isinstance(values[1], pd.Series):
+                raise _NotVectorizableException()
+            return self._eval_unix_timestamp(*values)
+
+        raise _NotVectorizableException()
+
+    def _eval_unix_timestamp(
+        self, series: pd.Series, timestamp_format: str = "%Y-%m-%d %H:%M:%S"
+    ) -> pd.Series:
+        # Timestamps are usually shared by many rows, so each distinct value is only
+        # converted once.
+        codes, uniques = pd.factorize(series)
+        unique_results = np.array(
+            [
+                int(to_unix_timestamp(value, timestamp_format, self.tz))
+                for value in uniques.tolist()
+            ]
+            + [None],
+            dtype=object,
+        )
+        results = pd.Series(unique_results[codes], index=series.index)
+        if (codes >= 0).all():
+            return results.astype(np.int64)
+        return results
+
+    def eval_variable_node(self, ast: VariableNode, variables: Optional[Dict]) -> Any:
+        if ast.var_name not in variables:
+            raise RuntimeError(
+                f"Variable '{ast.var_name}' is not found in {list(variables)}."
+            )
+
+        return variables[ast.var_name]
+
+    def eval_arglist_node(self, ast: ArgListNode, variables: Optional[Dict]) -> Any:
+        return [self.eval(value, variables) for value in ast.values]
+
+    def eval_cast_node(self, ast: CastOp, variables: Optional[Dict]) -> Any:
+        val = self.eval(ast.child, variables)
+        if not isinstance(val, pd.Series):
+            raise _NotVectorizableException()
+
+        # Only casts between numeric and boolean values and casts to string are
+        # vectorized. Casts that may fail, e.g. parsing strings, are evaluated row
+        # by row so that TRY_CAST returns None on the failed rows only.
+        kind = val.dtype.kind
+        try:
+            if ast.type_name == "STRING" and kind in "iubO":
+                return val.astype(str)
+            if ast.type_name in ("INTEGER", "BIGINT") and kind in "iub":
+                return val.astype(np.int64)
+            if ast.type_name in ("INTEGER", "BIGINT") and kind == "f":
+                if val.isna().any():
+                    raise _NotVectorizableException()
+                return val.astype(np.int64)
+            if ast.type_name in ("FLOAT", "DOUBLE") and kind in "iubf":
+                return val.astype(np.float64)
+            if ast.type_name == "BOOLEAN" and kind in "iubf":
+                return val != 0
+        except (TypeError, ValueError) as e:
+            raise _NotVectorizableException() from e
+
+        raise _NotVectorizableException()
+
+    def eval_logical_op(self, ast: LogicalOp, variables: Optional[Dict]) -> Any:
+        left_value = self.eval(ast.left_child, variables)
+        right_value = self.eval(ast.right_child, variables)
+
+        # Python's `and` and `or` return one of the operands, which is only the same
+        # as the element-wise logical operation if both operands are booleans.
+        if not _is_boolean(left_value) or not _is_boolean(right_value):
+            raise _NotVectorizableException()
+
+        if ast.op_type == "AND":
+            return left_value & right_value
+        elif ast.op_type == "OR":
+            return left_value | right_value
+
+    def eval_group_node(self, ast: GroupNode, variables: Optional[Dict]) -> Any:
+        return self.eval(ast.child, variables)
+
+    def eval_is_op(self, ast: IsOp, variables: Optional[Dict]) -> Any:
+        raise _NotVectorizableException()
+
+    def eval_null_node(self, ast: NullNode, variables: Optional[Dict]) -> Any:
+        raise _NotVectorizableException()
+
+    def eval_case_op(self, ast: CaseOp, variables: Optional[Dict]) -> Any:
+        raise _NotVectorizableException()
+
+
+def _apply_operator(op: Callable, *values: Any) -> Any:
+    try:
+        return op(*values)
+    except Exception as e:
+        raise _NotVectorizableException() from e
+
+
+def _apply_arithmetic_operator(op: Callable, *values: Any) -> Any:
+    """
+    Applies the arithmetic operator on the values, where Python raises errors on
+    division by zero and integers never overflow.
+    """
+    for value in values:
+        # Numpy adds and multiplies booleans as logical operations.
+        if isinstance(value, pd.Series) and value.dtype == bool:
+            raise _NotVectorizableException()
+    if op is operator.truediv:
+        divisor = values[1]
+        if (divisor == 0).any() if isinstance(divisor, pd.Series) else divisor == 0:
+            raise _NotVectorizableException()
+
+    result = _apply_operator(op, *values)
+    if isinstance(result, pd.Series) and result.dtype.kind in "iu":
+        # Float results are inexact, so results near the bounds of the integer type
+        # are also regarded as overflowed.
+        float_result = op(*[_to_float(value) for value in values])
+        info = np.iinfo(result.dtype)
+        if ((float_result < info.min / 2) | (float_result > info.max / 2)).any():
+            raise _NotVectorizableException()
+    return result
+
+
+def _to_float(value: Any) -> Any:
+    if isinstance(value, pd.Series):
+        return value.astype(np.float64)
+    return float(value)
+
+
+def _get_null_mask(value: Any) -> np.ndarray:
+    if isinstance(value, pd.Series) and value.dtype == object:
+        return np.equal(value.to_numpy(), None)
+    return np.zeros(1, dtype=bool)
+
+
+def _filter(value: Any, mask: np.ndarray) -> Any:
+    if isinstance(value, pd.Series):
+        return value[mask]
+    return value
+
+
+def _is_datetime(value: Any) -> bool:
+    if isinstance(value, pd.Series):
+        return value.dtype.kind == "M"
+    return isinstance(value, (pd.Timestamp, np.datetime64))
+
+
+def _is_boolean(value: Any) -> bool:
+    if isinstance(value, pd.Series):
+        return value.dtype == bool
+    return isinstance(value, (bool, np.bool_))
@@ -0,0 +1,91 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from unittest.mock import patch
+
+from feathub.common.exceptions import FeathubException
+from feathub.dsl.expr_parser import ExprParser
+from feathub.processors.local.ast_evaluator.local_ast_compiler import LocalAstCompiler
+from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+
+
+class LocalAstCompilerTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.parser = ExprParser()
+        self.ast_compiler = LocalAstCompiler()
+        self.ast_evaluator = LocalAstEvaluator()
+
+    def _assert_same_as_evaluator(self, expr, variables=None):
+        ast = self.parser.parse(expr)
+        expected = self.ast_evaluator.eval(ast, variables)
+        self.assertEqual(expected, self.ast_compiler.compile(ast)(variables))
+        if variables is not None:
+            func = self.ast_compiler.compile(ast, list(variables.keys()))
+            self.assertEqual(expected, func(tuple(variables.values())))
+
+    def test_compile(self):
+        variables = {"a": 6, "b": 2.5, "c": True, "s": "Alex", "n": None}
+        for expr in [
+            "1 + 2 * 3 - 6",
+            "2 * 3 / 5",
+            "-a + 9",
+            "(a + b) <> 3",
+            "a * n",
+            "a > 1 AND c",
+            "a < 1 OR c",
+            "LOWER(s)",
+            "UNIX_TIMESTAMP('2020-01-01 00:24:39')",
+            "CAST(a AS STRING)",
+            "CAST(b AS INTEGER)",
+            "CAST(s AS BYTES)",
+            "TRY_CAST(s AS DOUBLE)",
+            "TRY_CAST(s AS BOOLEAN)",
+        ]:
+            self._assert_same_as_evaluator(expr, variables)
+
+    def test_errors(self):
+        func = self.ast_compiler.compile_expr("CAST(a AS BOOLEAN)")
+        with self.assertRaises(FeathubException):
+            func({"a": "abc"})
+
+        func = self.ast_compiler.compile_expr("a + 1")
+        with self.assertRaises(RuntimeError):
+            func({"b": 1})
+
+        func = self.ast_compiler.compile_expr("a + 1", ["b"])
+        with self.assertRaises(RuntimeError):
+            func((1,))
+
+        # Constant subtrees that fail to evaluate only raise when they are called.
+        func = self.ast_compiler.compile_expr("CAST('abc' AS INTEGER)")
+        with self.assertRaises(ValueError):
+            func({})
+
+    def test_constant_folding(self):
+        func = self.ast_compiler.compile_expr(
+            "UNIX_TIMESTAMP('2020-01-01 00:24:39') + a"
+        )
+        with patch(
+            "feathub.processors.local.ast_evaluator.local_func_evaluator."
+            "to_unix_timestamp"
+        ) as to_unix_timestamp:
+            self.assertEqual(1577838280, func({"a": 1}))
+            to_unix_timestamp.assert_not_called()
+
+    def test_compile_expr_cache(self):
+        func = self.ast_compiler.compile_expr("a + 1", ["a"])
+        self.assertIs(func, self.ast_compiler.compile_expr("a + 1", ["a"]))
+        self.assertIsNot(func, self.ast_compiler.compile_expr("a + 1", ["b", "a"]))
+        self.assertEqual(3, self.ast_compiler.compile_expr("a + 1", ["b", "a"])((1, 2)))
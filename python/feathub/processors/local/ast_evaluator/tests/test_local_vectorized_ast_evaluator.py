@@ -0,0 +1,164 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+import pandas as pd
+
+from feathub.common.exceptions import FeathubException
+from feathub.dsl.expr_parser import ExprParser
+from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.local_vectorized_ast_evaluator import (
+    LocalVectorizedAstEvaluator,
+)
+
+
+class LocalVectorizedAstEvaluatorTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.parser = ExprParser()
+        self.ast_evaluator = LocalVectorizedAstEvaluator()
+        self.row_ast_evaluator = LocalAstEvaluator()
+        self.df = pd.DataFrame(
+            {
+                "a": [1, 2, 3, 4],
+                "b": [0.5, 1.5, -2.0, 4.0],
+                "c": [True, False, True, False],
+                "name": ["Alex", "EMMA", "jack", "Alex"],
+                "number": ["1", "2", "x", "4"],
+                "nullable": pd.Series([1, None, 3, None], dtype=object),
+                "time": [
+                    "2022-01-01 00:00:00",
+                    "2022-01-01 00:00:01",
+                    "2022-01-01 00:00:00",
+                    "2022-01-02 00:00:00",
+                ],
+            }
+        )
+
+    def _eval(self, expr):
+        return self.ast_evaluator.eval_column(self.parser.parse(expr), self.df)
+
+    def _eval_by_row(self, expr):
+        ast = self.parser.parse(expr)
+        return [self.row_ast_evaluator.eval(ast, row) for _, row in self.df.iterrows()]
+
+    def _assert_same_as_row_evaluator(self, expr):
+        result = self._eval(expr)
+        self.assertListEqual(list(self.df.index), list(result.index))
+        self.assertListEqual(self._eval_by_row(expr), result.tolist())
+
+    def test_binary_op(self):
+        self._assert_same_as_row_evaluator("a + b * 2 - 1")
+        self._assert_same_as_row_evaluator("(a + 1) / 2")
+        self._assert_same_as_row_evaluator("-a + b")
+        self._assert_same_as_row_evaluator("1 + 2 * 3")
+        self._assert_same_as_row_evaluator("name + name")
+
+    def test_division_by_zero(self):
+        for expr in ["a / (a - 1)", "b / (a - 1)", "a / 0"]:
+            with self.assertRaises(ZeroDivisionError):
+                self._eval(expr)
+        self.assertListEqual(
+            [-1.0, None, 3.0, None], self._eval("nullable / (a - 2)").tolist()
+        )
+
+    def test_integer_overflow(self):
+        df = pd.DataFrame({"big": [1, 2**62]})
+        self.assertListEqual(
+            [4, 2**64],
+            self.ast_evaluator.eval_column(self.parser.parse("big * 4"), df).tolist(),
+        )
+        self.assertListEqual(
+            [2, 2**63],
+            self.ast_evaluator.eval_column(self.parser.parse("big + big"), df).tolist(),
+        )
+        self.assertListEqual(
+            [-1, -(2**62)],
+            self.ast_evaluator.eval_column(self.parser.parse("-big"), df).tolist(),
+        )
+
+    def test_boolean_arithmetic(self):
+        self._assert_same_as_row_evaluator("c + c")
+
+    def test_null_propagation(self):
+        self.assertListEqual([3, None, 5, None], self._eval("nullable + 2").tolist())
+        self.assertListEqual([1, None, 9, None], self._eval("nullable * a").tolist())
+
+    def test_compare_op(self):
+        for op in ["<", "<=", ">", ">=", "=", "<>"]:
+            self._assert_same_as_row_evaluator(f"a {op} b")
+            self._assert_same_as_row_evaluator(f"name {op} 'Alex'")
+
+    def test_logical_op(self):
+        self._assert_same_as_row_evaluator("a > 1 AND c")
+        self._assert_same_as_row_evaluator("a > 3 OR c")
+        self._assert_same_as_row_evaluator("a OR c")
+
+    def test_cast(self):
+        self._assert_same_as_row_evaluator("CAST(a AS STRING)")
+        self._assert_same_as_row_evaluator("CAST(b AS INTEGER)")
+        self._assert_same_as_row_evaluator("CAST(a AS DOUBLE)")
+        self._assert_same_as_row_evaluator("CAST(a AS BOOLEAN)")
+        self._assert_same_as_row_evaluator("CAST(name AS BYTES)")
+        self._assert_same_as_row_evaluator("TRY_CAST(number AS INTEGER)")
+        self._assert_same_as_row_evaluator("TRY_CAST(time AS TIMESTAMP)")
+        self.assertListEqual(
+            [1, 2, None, 4], self._eval("TRY_CAST(number AS BIGINT)").tolist()
+        )
+
+        with self.assertRaises(ValueError):
+            self._eval("CAST(number AS INTEGER)")
+
+        with self.assertRaises(FeathubException):
+            self._eval("CAST(a AS BYTES)")
+
+    def test_func_call(self):
+        self._assert_same_as_row_evaluator("LOWER(name)")
+        self._assert_same_as_row_evaluator("UNIX_TIMESTAMP(time)")
+        self._assert_same_as_row_evaluator(
+            "UNIX_TIMESTAMP(time, '%Y-%m-%d %H:%M:%S') - UNIX_TIMESTAMP(time)"
+        )
+        self.assertListEqual(
+            [1640995200] * 4,
+            self._eval("UNIX_TIMESTAMP('2022-01-01 00:00:00')").tolist(),
+        )
+
+        with self.assertRaises(AttributeError):
+            self._eval("LOWER(a)")
+
+    def test_timestamp_compare(self):
+        self.df["ts"] = pd.to_datetime(self.df["time"])
+        self._assert_same_as_row_evaluator("ts >= ts")
+
+        # Strings are not implicitly parsed as timestamps.
+        with self.assertRaises(TypeError):
+            self._eval("ts > '2022-01-01 00:00:00'")
+
+    def test_eval_filter(self):
+        self.assertListEqual(
+            [False, True, True, True],
+            self.ast_evaluator.eval_filter(
+                self.parser.parse("a > 1"), self.df
+            ).tolist(),
+        )
+        self.assertListEqual(
+            [True, False, True, False],
+            self.ast_evaluator.eval_filter(
+                self.parser.parse("nullable"), self.df
+            ).tolist(),
+        )
+
+    def test_empty_dataframe(self):
+        self.df = self.df.iloc[:0]
+        self.assertListEqual([], self._eval("a + 1").tolist())
+        self.assertListEqual([], self._eval("CAST(name AS BYTES)").tolist())
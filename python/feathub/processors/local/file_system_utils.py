@@ -0,0 +1,221 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import glob
+import os
+from typing import List, Sequence, Optional, Any, Iterator
+
+import pandas as pd
+
+from feathub.common.exceptions import FeathubException
+from feathub.common.types import to_numpy_dtype
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.processors.local.local_plan import TimeRange
+
+# Maps the data formats of FileSystemSource to the formats of pyarrow datasets.
+_COLUMNAR_FILE_FORMATS = {
+    "parquet": "parquet",
+    "orc": "orc",
+    "arrow": "ipc",
+    "feather": "ipc",
+}
+
+SUPPORTED_FILE_FORMATS = ["csv"] + list(_COLUMNAR_FILE_FORMATS.keys())
+
+
+def get_file_paths(path: str) -> List[str]:
+    """
+    Returns the paths of the files matched by the path of a FileSystemSource, which
+    can be a file, a directory or a glob pattern.
+    """
+    if glob.has_magic(path):
+        paths = glob.glob(path, recursive=True)
+    else:
+        paths = [path]
+
+    file_paths: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, _, file_names in os.walk(path):
+                file_paths.extend(
+                    os.path.join(dir_path, file_name)
+                    for file_name in file_names
+                    if not file_name.startswith((".", "_"))
+                )
+        elif os.path.exists(path):
+            file_paths.append(path)
+    return sorted(file_paths)
+
+
+def read_file_system_source(
+    source: FileSystemSource, fields: Sequence[str], time_range: TimeRange
+) -> pd.DataFrame:
+    """
+    Reads the given fields of the files of the source.
+
+    Columnar formats only read the columns of the given fields. If the timestamp
+    field is in epoch format, the rows are filtered by the time range while they are
+    read, so that the row groups and files whose timestamp statistics are out of the
+    range are skipped. The rows read are not guaranteed to be in the time range
+    otherwise.
+
+    :param source: The source to read.
+    :param fields: The names of the fields to read.
+    :param time_range: The range of the source's timestamp field of the rows to read.
+    """
+    if source.data_format == "csv":
+        return _read_csv(source, fields, chunksize=None)
+
+    if source.data_format not in _COLUMNAR_FILE_FORMATS:
+        raise FeathubException(f"Unsupported file format: {source.data_format}.")
+
+    table = _get_dataset(source).to_table(
+        columns=list(fields), filter=_get_time_range_filter(source, time_range)
+    )
+    return _to_pandas(table, source, fields)
+
+
+def iter_file_system_source(
+    source: FileSystemSource,
+    fields: Sequence[str],
+    time_range: TimeRange,
+    batch_size: int,
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads the given fields of the files of the source in batches of at most
+    `batch_size` rows, in the order of the rows in the files. Columnar formats are
+    read and decoded by multiple threads, and the rows are filtered in the same way
+    as `read_file_system_source`.
+
+    :param source: The source to read.
+    :param fields: The names of the fields to read.
+    :param time_range: The range of the source's timestamp field of the rows to read.
+    :param batch_size: The maximum number of rows in a batch.
+    """
+    if source.data_format == "csv":
+        yield from _read_csv(source, fields, chunksize=batch_size)
+        return
+
+    if source.data_format not in _COLUMNAR_FILE_FORMATS:
+        raise FeathubException(f"Unsupported file format: {source.data_format}.")
+
+    for batch in _get_dataset(source).to_batches(
+        columns=list(fields),
+        filter=_get_time_range_filter(source, time_range),
+        batch_size=batch_size,
+    ):
+        yield _to_pandas(batch, source, fields)
+
+
+def _read_csv(
+    source: FileSystemSource, fields: Sequence[str], chunksize: Optional[int]
+) -> Any:
+    return pd.read_csv(
+        source.path,
+        names=source.schema.field_names,
+        usecols=list(fields) if len(fields) > 0 else None,
+        dtype={
+            name: to_numpy_dtype(source.schema.get_field_type(name))
+            for name in source.schema.field_names
+        },
+        chunksize=chunksize,
+    )
+
+
+def _to_pandas(
+    table: Any, source: FileSystemSource, fields: Sequence[str]
+) -> pd.DataFrame:
+    df = table.to_pandas()
+
+    # Numeric types may be stored with different widths, and partition values are
+    # inferred from directory names.
+    dtypes = {}
+    for name in fields:
+        dtype = to_numpy_dtype(source.schema.get_field_type(name))
+        if dtype not in (str, object) and df[name].dtype != dtype:
+            dtypes[name] = dtype
+    return df.astype(dtypes)
+
+
+def _import_pyarrow_dataset() -> Any:
+    # pyarrow is an optional dependency which is only needed by columnar formats.
+    try:
+        import pyarrow.dataset
+    except ImportError as e:
+        raise FeathubException(
+            "pyarrow is required to read parquet, orc and arrow files. Please "
+            "install it with `pip install feathub[pyarrow]`."
+        ) from e
+    return pyarrow.dataset
+
+
+def _get_dataset(source: FileSystemSource) -> Any:
+    ds = _import_pyarrow_dataset()
+    import pyarrow.fs as fs
+
+    file_format = _COLUMNAR_FILE_FORMATS[source.data_format]
+    filesystem = None
+    if "://" not in source.path:
+        # Memory-maps local Arrow IPC files so that they are loaded without copying.
+        filesystem = fs.LocalFileSystem(use_mmap=(file_format == "ipc"))
+
+    if not glob.has_magic(source.path):
+        return ds.dataset(
+            source.path,
+            format=file_format,
+            partitioning="hive",
+            filesystem=filesystem,
+        )
+
+    file_paths = get_file_paths(source.path)
+    if len(file_paths) == 0:
+        raise FeathubException(f"No file matches path {source.path}.")
+    # Partition values are parsed from the directories below the deepest directory
+    # that is neither a glob pattern nor a partition.
+    base_dir = os.path.dirname(source.path)
+    while glob.has_magic(base_dir) or "=" in os.path.basename(base_dir):
+        base_dir = os.path.dirname(base_dir)
+    return ds.dataset(
+        file_paths,
+        format=file_format,
+        partitioning="hive",
+        partition_base_dir=base_dir,
+        filesystem=filesystem,
+    )
+
+
+def _get_time_range_filter(
+    source: FileSystemSource, time_range: TimeRange
+) -> Optional[Any]:
+    if source.timestamp_field is None or source.timestamp_format not in (
+        "epoch",
+        "epoch_millis",
+    ):
+        return None
+
+    # Converts the bounds in millis to the bounds of the timestamp values.
+    unit_millis = 1000 if source.timestamp_format == "epoch" else 1
+    field = _import_pyarrow_dataset().field(source.timestamp_field)
+    expression = None
+    if time_range.start_millis is not None:
+        expression = field >= _ceil_div(time_range.start_millis, unit_millis)
+    if time_range.end_millis is not None:
+        end_expression = field < _ceil_div(time_range.end_millis, unit_millis)
+        expression = (
+            end_expression if expression is None else expression & end_expression
+        )
+    return expression
+
+
+def _ceil_div(value: int, divisor: int) -> int:
+    return -(-value // divisor)
@@ -0,0 +1,227 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Sequence, Dict, List, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from feathub.common.exceptions import FeathubException
+from feathub.processors.local.parallel_utils import ParallelExecutor
+
+
+def get_key_codes(
+    left_key_df: pd.DataFrame, right_key_df: pd.DataFrame, match_nulls: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes the key columns of the two DataFrames into int64 group codes, so that
+    rows from either side have the same code if and only if all their key values are
+    equal. Rows with any null key value have code -1 and never match another row,
+    unless `match_nulls` is true.
+
+    :param left_key_df: A DataFrame containing only the key columns of the left side.
+    :param right_key_df: A DataFrame containing only the key columns of the right
+                         side, in the same order as those of the left side.
+    :param match_nulls: Whether null key values are treated as equal to each other.
+    :return: A tuple of the codes of the left rows and the codes of the right rows.
+    """
+    if len(left_key_df.columns) != len(right_key_df.columns):
+        raise FeathubException(
+            f"The number of left keys {list(left_key_df.columns)} does not match "
+            f"the number of right keys {list(right_key_df.columns)}."
+        )
+
+    num_left_rows = left_key_df.shape[0]
+    num_rows = num_left_rows + right_key_df.shape[0]
+    codes = np.zeros(num_rows, dtype=np.int64)
+    for left_key, right_key in zip(left_key_df.columns, right_key_df.columns):
+        values = pd.concat(
+            [left_key_df[left_key], right_key_df[right_key]], ignore_index=True
+        )
+        key_codes, key_uniques = pd.factorize(
+            values, na_sentinel=None if match_nulls else -1
+        )
+        codes = np.where(
+            (codes < 0) | (key_codes < 0), -1, codes * len(key_uniques) + key_codes
+        )
+        # Re-factorize the combined codes to keep them bounded by the number of rows.
+        valid = codes >= 0
+        codes[valid] = pd.factorize(codes[valid])[0]
+
+    return codes[:num_left_rows], codes[num_left_rows:]
+
+
+def filter_by_keys(df: pd.DataFrame, key_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns the rows of the DataFrame whose values of the key columns are equal to
+    those of any row in the key DataFrame, in their original order. It is a hash
+    semi-join with linear cost in the number of rows of both DataFrames. Null key
+    values are equal to each other, and numeric keys are compared by value
+    regardless of their dtypes.
+
+    :param df: The DataFrame to filter.
+    :param key_df: A DataFrame whose columns are the key columns of `df`.
+    """
+    key_fields = list(key_df.columns)
+    missing_key_fields = [x for x in key_fields if x not in df.columns]
+    if missing_key_fields:
+        raise FeathubException(
+            f"Keys {missing_key_fields} are not in the fields {list(df.columns)}."
+        )
+
+    codes, key_codes = get_key_codes(df[key_fields], key_df, match_nulls=True)
+    is_key_code = np.zeros(df.shape[0] + key_df.shape[0], dtype=bool)
+    is_key_code[key_codes] = True
+    return df[is_key_code[codes]]
+
+
+def evaluate_point_in_time_join(
+    left_df: pd.DataFrame,
+    left_keys: Sequence[str],
+    left_times: np.ndarray,
+    right_df: pd.DataFrame,
+    right_keys: Sequence[str],
+    right_times: np.ndarray,
+    value_fields: Sequence[str],
+    executor: Optional[ParallelExecutor] = None,
+) -> Dict[str, List]:
+    """
+    Joins the value fields of the right DataFrame onto the left DataFrame. For each
+    row in the left DataFrame, the joined row is the right row with the same key
+    values and the latest timestamp that is not larger than the timestamp of the left
+    row. If there are multiple such right rows, the first one in the right DataFrame
+    is used. The joined values are None if there is no such right row.
+
+    Instead of comparing every pair of rows, the rows from both sides are sorted
+    once by (key, timestamp) and each left row picks the last right row before it
+    in the sorted order, so the join takes O((m + n) log(m + n)) time.
+
+    :param left_df: The DataFrame to join values onto.
+    :param left_keys: The names of the key fields in the left DataFrame.
+    :param left_times: The epoch millis of each row in the left DataFrame.
+    :param right_df: The DataFrame to join values from.
+    :param right_keys: The names of the key fields in the right DataFrame, in the
+                       same order as the left keys.
+    :param right_times: The epoch millis of each row in the right DataFrame.
+    :param value_fields: The names of the fields in the right DataFrame to join.
+    :param executor: Optional. If it is not None, the rows are hash-partitioned by
+                     their keys and matched in parallel by the executor.
+    :return: A map from value field name to the list of joined values, which are
+             aligned with the rows of the left DataFrame.
+    """
+    num_left_rows = left_df.shape[0]
+    left_codes, right_codes = get_key_codes(
+        left_df[list(left_keys)], right_df[list(right_keys)]
+    )
+    left_times = np.asarray(left_times, dtype=np.int64)
+    right_times = np.asarray(right_times, dtype=np.int64)
+
+    num_partitions = 1
+    if executor is not None:
+        num_partitions = executor.get_num_partitions(num_left_rows + right_df.shape[0])
+    if num_partitions > 1:
+        assert executor is not None
+        # Rows with null keys never match, so they are not in any partition.
+        left_partitions = [
+            np.flatnonzero((left_codes >= 0) & (left_codes % num_partitions == i))
+            for i in range(num_partitions)
+        ]
+        right_partitions = [
+            np.flatnonzero((right_codes >= 0) & (right_codes % num_partitions == i))
+            for i in range(num_partitions)
+        ]
+        partition_results = executor.map(
+            match_point_in_time_rows,
+            [
+                (
+                    left_codes[left_rows],
+                    left_times[left_rows],
+                    right_codes[right_rows],
+                    right_times[right_rows],
+                )
+                for left_rows, right_rows in zip(left_partitions, right_partitions)
+            ],
+        )
+        matched_left_positions = np.concatenate(
+            [
+                left_rows[matched_left]
+                for left_rows, (matched_left, _) in zip(
+                    left_partitions, partition_results
+                )
+            ]
+        )
+        matched_right_positions = np.concatenate(
+            [
+                right_rows[matched_right]
+                for right_rows, (_, matched_right) in zip(
+                    right_partitions, partition_results
+                )
+            ]
+        )
+    else:
+        matched_left_positions, matched_right_positions = match_point_in_time_rows(
+            left_codes, left_times, right_codes, right_times
+        )
+
+    results = {}
+    for field in value_fields:
+        right_values = right_df[field].to_numpy(dtype=object)
+        values = np.full(num_left_rows, None, dtype=object)
+        values[matched_left_positions] = right_values[matched_right_positions]
+        results[field] = values.tolist()
+
+    return results
+
+
+def match_point_in_time_rows(
+    left_codes: np.ndarray,
+    left_times: np.ndarray,
+    right_codes: np.ndarray,
+    right_times: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Matches each left row with the right row with the same key code and the latest
+    timestamp that is not larger than that of the left row.
+
+    :return: The positions of the matched left rows and the positions of the right
+             rows they are matched with.
+    """
+    num_left_rows = len(left_codes)
+    num_right_rows = len(right_codes)
+
+    # Right rows are sorted before the left rows with the same key and timestamp,
+    # and the right rows with the same key and timestamp are sorted in the reverse
+    # order of their positions, so that the first of them is the last one before
+    # a left row in the sorted order.
+    codes = np.concatenate([left_codes, right_codes])
+    times = np.concatenate([left_times, right_times])
+    is_right = np.concatenate(
+        [np.zeros(num_left_rows, dtype=bool), np.ones(num_right_rows, dtype=bool)]
+    )
+    positions = np.concatenate([np.arange(num_left_rows), np.arange(num_right_rows)])
+    tie_breakers = np.where(is_right, -positions, 0)
+    order = np.lexsort((tie_breakers, ~is_right, times, codes))
+
+    sorted_codes = codes[order]
+    sorted_is_right = is_right[order]
+    last_right_idx = np.maximum.accumulate(
+        np.where(sorted_is_right, np.arange(len(order)), -1)
+    )
+    matched = (
+        ~sorted_is_right
+        & (sorted_codes >= 0)
+        & (last_right_idx >= 0)
+        & (sorted_codes[np.maximum(last_right_idx, 0)] == sorted_codes)
+    )
+
+    return positions[order][matched], positions[order][last_right_idx[matched]]
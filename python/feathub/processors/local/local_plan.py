@@ -0,0 +1,389 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from abc import ABC, abstractmethod
+from datetime import timedelta, datetime
+from typing import (
+    Optional,
+    Sequence,
+    List,
+    Dict,
+    Tuple,
+    Hashable,
+    NamedTuple,
+    Union,
+    Set,
+    Collection,
+)
+
+import pandas as pd
+
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.sliding_feature_view import SlidingFeatureView
+from feathub.processors.local.sliding_window_utils import (
+    SlidingWindowDescriptor,
+    AggregationFieldDescriptor,
+)
+from feathub.table.table_descriptor import TableDescriptor
+
+
+class TimeRange(NamedTuple):
+    """
+    A range of epoch millis [start_millis, end_millis). A None bound means the range
+    is unbounded on that side.
+    """
+
+    start_millis: Optional[int] = None
+    end_millis: Optional[int] = None
+
+    def is_unbounded(self) -> bool:
+        return self.start_millis is None and self.end_millis is None
+
+    def extend_start(self, duration: Optional[timedelta]) -> "TimeRange":
+        """
+        Returns a range that starts the given duration earlier, or has no start if
+        the duration is None.
+        """
+        if self.start_millis is None or duration is None:
+            return TimeRange(None, self.end_millis)
+        return TimeRange(
+            self.start_millis - int(duration / timedelta(milliseconds=1)),
+            self.end_millis,
+        )
+
+    def __str__(self) -> str:
+        start = "-inf" if self.start_millis is None else str(self.start_millis)
+        end = "+inf" if self.end_millis is None else str(self.end_millis)
+        return f"[{start}, {end})"
+
+
+class PlanNode(ABC):
+    """
+    A node of the logical plan executed by LocalProcessor. The plan is a DAG whose
+    leaves are scans, and nodes with the same identity are shared by their parents
+    so that they are only executed once.
+    """
+
+    def __init__(self, children: Sequence["PlanNode"]):
+        self.children = list(children)
+
+    @abstractmethod
+    def describe(self) -> str:
+        """
+        Returns a one-line description of this node without its children.
+        """
+        pass
+
+    def get_identity(self) -> Hashable:
+        """
+        Returns a hashable value that is equal for nodes producing the same result.
+        """
+        return (
+            type(self).__name__,
+            self.describe(),
+            tuple(id(child) for child in self.children),
+        )
+
+    def explain(self) -> str:
+        """
+        Returns the plan rooted at this node as an indented tree. Nodes shared by
+        multiple parents are numbered and only expanded at their first occurrence.
+        """
+        num_parents = get_num_parents(self)
+        shared_ids: Dict[int, int] = {}
+        lines: List[str] = []
+        _explain(self, 0, num_parents, shared_ids, lines)
+        return "\n".join(lines)
+
+
+def get_num_parents(plan: PlanNode) -> Dict[int, int]:
+    """
+    Returns a map from the id of each node in the plan to the number of its parents.
+    A parent is counted multiple times if the node is its child multiple times.
+    """
+    num_parents: Dict[int, int] = {}
+    visited: Set[int] = set()
+    nodes = [plan]
+    while len(nodes) > 0:
+        node = nodes.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        for child in node.children:
+            num_parents[id(child)] = num_parents.get(id(child), 0) + 1
+            nodes.append(child)
+    return num_parents
+
+
+def _explain(
+    node: PlanNode,
+    depth: int,
+    num_parents: Dict[int, int],
+    shared_ids: Dict[int, int],
+    lines: List[str],
+) -> None:
+    indent = "  " * depth
+    if id(node) in shared_ids:
+        lines.append(f"{indent}#{shared_ids[id(node)]} (reused)")
+        return
+    prefix = ""
+    if num_parents.get(id(node), 0) > 1:
+        shared_ids[id(node)] = len(shared_ids) + 1
+        prefix = f"#{shared_ids[id(node)]} "
+    lines.append(f"{indent}{prefix}{node.describe()}")
+    for child in node.children:
+        _explain(child, depth + 1, num_parents, shared_ids, lines)
+
+
+def _format_fields(fields: Optional[Sequence[str]]) -> str:
+    return "*" if fields is None else ", ".join(fields)
+
+
+class ScanNode(PlanNode):
+    """
+    Reads the given fields of a source, keeping only the rows in the time range.
+    """
+
+    def __init__(
+        self,
+        source: Union[FileSystemSource, pd.DataFrame],
+        fields: Optional[Sequence[str]],
+        time_range: TimeRange,
+    ):
+        """
+        :param source: The source to read, or a DataFrame.
+        :param fields: Optional. The names of the fields to read. If it is None, all
+                       fields are read.
+        :param time_range: The range of the source's timestamp field of the rows to
+                           read. The rows of a DataFrame are not filtered.
+        """
+        super().__init__([])
+        self.source = source
+        self.fields = None if fields is None else list(fields)
+        self.time_range = time_range
+
+    def describe(self) -> str:
+        if isinstance(self.source, pd.DataFrame):
+            return (
+                f"Scan(DataFrame@{id(self.source):x}, "
+                f"fields=[{', '.join(self.source.columns)}])"
+            )
+        description = (
+            f"Scan({type(self.source).__name__} '{self.source.name}', "
+            f"path={self.source.path}, fields=[{_format_fields(self.fields)}]"
+        )
+        if not self.time_range.is_unbounded():
+            description += f", {self.source.timestamp_field} in {self.time_range}"
+        return description + ")"
+
+
+class CacheNode(PlanNode):
+    """
+    Reads the result of its child from the result cache of LocalProcessor if it is
+    cached, and caches the result of its child otherwise.
+    """
+
+    def __init__(
+        self,
+        child: PlanNode,
+        key: str,
+        dependencies: Collection[str],
+        persistent: bool,
+    ):
+        """
+        :param child: The node whose result is cached.
+        :param key: The key of the result in the cache.
+        :param dependencies: The names of the tables the result is computed from.
+        :param persistent: Whether the key is valid across processes.
+        """
+        super().__init__([child])
+        self.key = key
+        self.dependencies = set(dependencies)
+        self.persistent = persistent
+
+    def describe(self) -> str:
+        return f"Cache(key={self.key[:16]})"
+
+
+class ProjectNode(PlanNode):
+    """
+    Selects the given fields in the given order.
+    """
+
+    def __init__(self, child: PlanNode, fields: Sequence[str]):
+        super().__init__([child])
+        self.fields = list(fields)
+
+    def describe(self) -> str:
+        return f"Project([{_format_fields(self.fields)}])"
+
+
+class TimeFilterNode(PlanNode):
+    """
+    Keeps the rows whose timestamps are in [start_datetime, end_datetime) and sorts
+    them by time.
+    """
+
+    def __init__(
+        self,
+        child: PlanNode,
+        timestamp_field: str,
+        timestamp_format: str,
+        start_datetime: Optional[datetime],
+        end_datetime: Optional[datetime],
+    ):
+        super().__init__([child])
+        self.timestamp_field = timestamp_field
+        self.timestamp_format = timestamp_format
+        self.start_datetime = start_datetime
+        self.end_datetime = end_datetime
+
+    def describe(self) -> str:
+        start = "-inf" if self.start_datetime is None else str(self.start_datetime)
+        end = "+inf" if self.end_datetime is None else str(self.end_datetime)
+        return f"TimeFilter({self.timestamp_field} in [{start}, {end}))"
+
+
+class KeyFilterNode(PlanNode):
+    """
+    Keeps the rows of the first child whose key values appear in the second child.
+    """
+
+    def __init__(self, child: PlanNode, keys: PlanNode):
+        super().__init__([child, keys])
+
+    def describe(self) -> str:
+        return "KeyFilter()"
+
+
+class ExpressionNode(PlanNode):
+    """
+    Evaluates features with per-row transforms, i.e. ExpressionTransform and
+    PythonUdfTransform, in order.
+    """
+
+    def __init__(self, child: PlanNode, features: Sequence[Feature]):
+        super().__init__([child])
+        self.features = list(features)
+
+    def describe(self) -> str:
+        return f"Expression([{_describe_features(self.features)}])"
+
+    def get_identity(self) -> Hashable:
+        return super().get_identity(), _get_features_identity(self.features)
+
+
+class OverWindowNode(PlanNode):
+    """
+    Evaluates features with OverWindowTransform in order.
+    """
+
+    def __init__(
+        self,
+        child: PlanNode,
+        features: Sequence[Feature],
+        timestamp_field: str,
+        timestamp_format: str,
+    ):
+        super().__init__([child])
+        self.features = list(features)
+        self.timestamp_field = timestamp_field
+        self.timestamp_format = timestamp_format
+
+    def describe(self) -> str:
+        return f"OverWindow([{_describe_features(self.features)}])"
+
+    def get_identity(self) -> Hashable:
+        return (
+            super().get_identity(),
+            _get_features_identity(self.features),
+            self.timestamp_field,
+            self.timestamp_format,
+        )
+
+
+class JoinNode(PlanNode):
+    """
+    Evaluates features with JoinTransform from the same table with a point-in-time
+    join of the first child with the second child.
+    """
+
+    def __init__(
+        self,
+        child: PlanNode,
+        join_table: PlanNode,
+        features: Sequence[Feature],
+        timestamp_field: str,
+        timestamp_format: str,
+        join_descriptor: TableDescriptor,
+    ):
+        super().__init__([child, join_table])
+        self.features = list(features)
+        self.timestamp_field = timestamp_field
+        self.timestamp_format = timestamp_format
+        self.join_descriptor = join_descriptor
+
+    def describe(self) -> str:
+        return (
+            f"Join('{self.join_descriptor.name}', "
+            f"[{_describe_features(self.features)}])"
+        )
+
+    def get_identity(self) -> Hashable:
+        return (
+            super().get_identity(),
+            _get_features_identity(self.features),
+            self.timestamp_field,
+            self.timestamp_format,
+        )
+
+
+class SlidingWindowNode(PlanNode):
+    """
+    Evaluates the SlidingWindowTransforms of a SlidingFeatureView.
+    """
+
+    def __init__(
+        self,
+        child: PlanNode,
+        feature_view: SlidingFeatureView,
+        window_descriptor: SlidingWindowDescriptor,
+        agg_descriptors: Sequence[AggregationFieldDescriptor],
+    ):
+        super().__init__([child])
+        self.feature_view = feature_view
+        self.window_descriptor = window_descriptor
+        self.agg_descriptors = list(agg_descriptors)
+
+    def describe(self) -> str:
+        agg_fields = ", ".join(d.field_name for d in self.agg_descriptors)
+        return (
+            f"SlidingWindow('{self.feature_view.name}', "
+            f"step={self.window_descriptor.step_size}, "
+            f"keys=[{', '.join(self.window_descriptor.group_by_keys)}], "
+            f"[{agg_fields}])"
+        )
+
+    def get_identity(self) -> Hashable:
+        return super().get_identity(), str(self.feature_view)
+
+
+def _describe_features(features: Sequence[Feature]) -> str:
+    return ", ".join(feature.name for feature in features)
+
+
+def _get_features_identity(features: Sequence[Feature]) -> Tuple:
+    # PythonUdfTransforms with different functions have the same json, so features
+    # are also identified by their transform objects.
+    return tuple((str(feature), id(feature.transform)) for feature in features)
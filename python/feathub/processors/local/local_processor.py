@@ -11,16 +11,31 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
+import itertools
+import json
+import math
+import os
+import weakref
 from datetime import datetime, timedelta
 from typing import (
     Dict,
     Optional,
     Union,
     List,
-    Any,
     Sequence,
+    Collection,
+    Hashable,
+    Set,
+    Tuple,
+    Any,
+    Callable,
+    Iterator,
+    Iterable,
+    cast,
 )
 
+import numpy as np
 import pandas as pd
 from dateutil.tz import tz
 
@@ -52,10 +67,50 @@ from feathub.feature_views.transforms.sliding_window_transform import (
 from feathub.online_stores.memory_online_store import MemoryOnlineStore
 from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
 from feathub.processors.local.aggregation_utils import AGG_FUNCTIONS
-from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
+from feathub.processors.local.ast_evaluator.local_vectorized_ast_evaluator import (
+    LocalVectorizedAstEvaluator,
+)
+from feathub.processors.local.file_system_utils import (
+    SUPPORTED_FILE_FORMATS,
+    get_file_paths,
+    read_file_system_source,
+    iter_file_system_source,
+)
+from feathub.processors.local.join_utils import (
+    evaluate_point_in_time_join,
+    filter_by_keys,
+)
 from feathub.processors.local.local_job import LocalJob
-from feathub.processors.local.local_processor_config import LocalProcessorConfig
-from feathub.processors.local.local_table import LocalTable
+from feathub.processors.local.local_plan import (
+    PlanNode,
+    TimeRange,
+    CacheNode,
+    ScanNode,
+    ProjectNode,
+    TimeFilterNode,
+    KeyFilterNode,
+    ExpressionNode,
+    OverWindowNode,
+    JoinNode,
+    SlidingWindowNode,
+    get_num_parents,
+)
+from feathub.processors.local.local_processor_config import (
+    LocalProcessorConfig,
+    RESULT_CACHE_ENABLED_CONFIG,
+    RESULT_CACHE_MAX_BYTES_CONFIG,
+    RESULT_CACHE_DIR_CONFIG,
+    PARALLELISM_CONFIG,
+    MIN_ROWS_PER_PARTITION_CONFIG,
+    BATCH_SIZE_CONFIG,
+)
+from feathub.processors.local.local_result_cache import (
+    LocalResultCache,
+    ResultCacheStats,
+)
+from feathub.processors.local.local_table import LocalTable, split_into_batches
+from feathub.processors.local.over_window_utils import evaluate_over_window
+from feathub.processors.local.parallel_utils import ParallelExecutor, is_picklable
 from feathub.processors.local.sliding_window_utils import (
     SlidingWindowDescriptor,
     AggregationFieldDescriptor,
@@ -63,7 +118,7 @@ from feathub.processors.local.sliding_window_utils import (
 )
 from feathub.processors.local.time_utils import (
     append_and_sort_unix_time_column,
-    append_unix_time_column,
+    get_unix_time_millis,
 )
 from feathub.processors.local.type_utils import cast_series_dtype
 from feathub.processors.processor import Processor
@@ -90,8 +145,40 @@ class LocalProcessor(Processor):
         config = LocalProcessorConfig(props)
         self.timezone = tz.gettz(config.get(TIMEZONE_CONFIG))
 
-        self.parser = ExprParser()
-        self.ast_evaluator = LocalAstEvaluator(tz=self.timezone)
+        self.parser = ExprParser.get_instance()
+        self.ast_evaluator = LocalVectorizedAstEvaluator(tz=self.timezone)
+
+        self.parallel_executor: Optional[ParallelExecutor] = None
+        if config.get(PARALLELISM_CONFIG) > 1:
+            self.parallel_executor = ParallelExecutor(
+                num_workers=config.get(PARALLELISM_CONFIG),
+                min_rows_per_partition=config.get(MIN_ROWS_PER_PARTITION_CONFIG),
+            )
+
+        self.batch_size: Optional[int] = config.get(BATCH_SIZE_CONFIG)
+
+        self.result_cache: Optional[LocalResultCache] = None
+        if config.get(RESULT_CACHE_ENABLED_CONFIG):
+            self.result_cache = LocalResultCache(
+                max_bytes=config.get(RESULT_CACHE_MAX_BYTES_CONFIG),
+                cache_dir=config.get(RESULT_CACHE_DIR_CONFIG),
+            )
+        # Maps the ids of the Python UDFs in result cache keys to references of the
+        # UDFs and the tokens identifying them.
+        self._udf_tokens: Dict[int, Tuple[Callable[[], Any], int]] = {}
+        self._udf_token_counter = itertools.count()
+
+    def close(self) -> None:
+        """
+        Releases the worker processes used to compute features in parallel.
+        """
+        if self.parallel_executor is not None:
+            self.parallel_executor.close()
+
+    def __del__(self) -> None:
+        # The attribute is missing if the constructor failed.
+        if getattr(self, "parallel_executor", None) is not None:
+            self.close()
 
     def get_table(
         self,
@@ -101,41 +188,83 @@ class LocalProcessor(Processor):
         end_datetime: Optional[datetime] = None,
     ) -> LocalTable:
         features = self._resolve_table_descriptor(features)
-        df = self._get_table(features).df
-        if keys is not None:
-            keys = self._get_table(keys).df
-            keys = keys.drop_duplicates()
-            idx = df[list(keys.columns)].apply(
-                lambda row: any([row.equals(key) for _, key in keys.iterrows()]),
-                axis=1,
-            )
-            df = df[idx]
 
+        time_range = TimeRange()
         if start_datetime is not None or end_datetime is not None:
             if features.timestamp_field is None:
                 raise FeathubException("Features do not have timestamp column.")
             if features.timestamp_format is None:
                 raise FeathubException("Features do not have timestamp format.")
-            append_and_sort_unix_time_column(
-                df, features.timestamp_field, features.timestamp_format, self.timezone
+            # The range pushed down to the scans is a superset of the requested
+            # range in epoch millis. The exact range is applied by the TimeFilterNode.
+            time_range = TimeRange(
+                None
+                if start_datetime is None
+                else math.floor(
+                    utils.to_unix_timestamp(start_datetime, tz=self.timezone) * 1000
+                ),
+                None
+                if end_datetime is None
+                else math.ceil(
+                    utils.to_unix_timestamp(end_datetime, tz=self.timezone) * 1000
+                )
+                + 1,
             )
-        if start_datetime is not None:
-            unix_start_datetime = utils.to_unix_timestamp(
-                start_datetime, tz=self.timezone
+
+        plan_nodes: Dict[Hashable, PlanNode] = {}
+        plan = self._build_plan(features, None, time_range, plan_nodes)
+        if keys is not None:
+            plan = self._intern_plan_node(
+                KeyFilterNode(
+                    plan, self._build_plan(keys, None, TimeRange(), plan_nodes)
+                ),
+                plan_nodes,
+            )
+        if not time_range.is_unbounded():
+            plan = self._intern_plan_node(
+                TimeFilterNode(
+                    plan,
+                    cast(str, features.timestamp_field),
+                    features.timestamp_format,
+                    start_datetime,
+                    end_datetime,
+                ),
+                plan_nodes,
             )
-            df = df[df[EVENT_TIME_ATTRIBUTE_NAME] >= unix_start_datetime]
-        if end_datetime is not None:
-            unix_end_datetime = utils.to_unix_timestamp(end_datetime, tz=self.timezone)
-            df = df[df[EVENT_TIME_ATTRIBUTE_NAME] < unix_end_datetime]
-        if EVENT_TIME_ATTRIBUTE_NAME in df:
-            df = df.drop(columns=[EVENT_TIME_ATTRIBUTE_NAME])
 
         return LocalTable(
-            df=df.reset_index(drop=True),
+            df=None,
             timestamp_field=features.timestamp_field,
             timestamp_format=features.timestamp_format,
+            plan=plan,
+            execute_plan=self._execute_plan,
+            execute_plan_in_batches=self._execute_plan_in_batches,
         )
 
+    def get_result_cache_stats(self) -> Optional[ResultCacheStats]:
+        """
+        Returns the statistics of the result cache, or None if the result cache is
+        not enabled.
+        """
+        if self.result_cache is None:
+            return None
+        return self.result_cache.get_stats()
+
+    def invalidate_result_cache(
+        self, features: Union[str, TableDescriptor, None] = None
+    ) -> None:
+        """
+        Removes the cached tables computed from the given table, or all the cached
+        tables if the given table is None.
+
+        :param features: Optional. The table or the name of the table to invalidate.
+        """
+        if self.result_cache is None:
+            return
+        if isinstance(features, TableDescriptor):
+            features = features.name
+        self.result_cache.invalidate(features)
+
     # TODO: figure out whether and how to support long running feature materialization.
     def materialize_features(
         self,
@@ -153,342 +282,324 @@ class LocalProcessor(Processor):
         if features.keys is None:
             raise FeathubException(f"Features keys must not be None {features}.")
 
-        features_df = self.get_table(
+        table = self.get_table(
             features=features,
             keys=None,
             start_datetime=start_datetime,
             end_datetime=end_datetime,
-        ).to_pandas()
+        )
+        if self.batch_size is None:
+            batches: Iterable[pd.DataFrame] = [table.to_pandas()]
+        else:
+            batches = table.to_pandas_batches(self.batch_size)
 
         # TODO: handle allow_overwrite.
         # TODO: Support FileSystemSink, KafkaSink, PrintSink.
         if isinstance(sink, MemoryStoreSink):
-            return self._write_features_to_online_store(
-                features=features_df,
-                schema=utils.get_table_schema(features),
-                sink=sink,
-                key_fields=features.keys,
-                timestamp_field=features.timestamp_field,
-                timestamp_format=features.timestamp_format,
-            )
+            for features_df in batches:
+                self._write_features_to_online_store(
+                    features=features_df,
+                    schema=utils.get_table_schema(features),
+                    sink=sink,
+                    key_fields=features.keys,
+                    timestamp_field=features.timestamp_field,
+                    timestamp_format=features.timestamp_format,
+                )
+            return LocalJob()
 
         raise RuntimeError(f"Unsupported sink: {sink}.")
 
-    def _get_table(self, features: Union[pd.DataFrame, TableDescriptor]) -> LocalTable:
+    def _build_plan(
+        self,
+        features: Union[pd.DataFrame, TableDescriptor],
+        required_fields: Optional[Collection[str]],
+        time_range: TimeRange,
+        plan_nodes: Dict[Hashable, PlanNode],
+    ) -> PlanNode:
+        """
+        Builds the plan that computes the given table.
+
+        :param features: The table to compute.
+        :param required_fields: Optional. The names of the fields needed from the
+                                table. If it is None, all fields are needed.
+        :param time_range: The time range of the rows needed from the table. The plan
+                           might output rows out of the range.
+        :param plan_nodes: The nodes built so far by their identities. Nodes with the
+                           same identity are shared instead of being built again.
+        """
         if isinstance(features, pd.DataFrame):
-            return LocalTable(
-                df=features,
-                timestamp_field=None,
-                timestamp_format="unknown",
+            return self._intern_plan_node(
+                ScanNode(features, None, TimeRange()), plan_nodes
             )
 
-        # TODO: Support SlidingFeatureView, KafkaSource, DataGenSource.
+        # TODO: Support KafkaSource, DataGenSource.
         if isinstance(features, FileSystemSource):
-            return self._get_table_from_file_source(features)
+            node = self._build_file_source_plan(
+                features, required_fields, time_range, plan_nodes
+            )
         elif isinstance(features, DerivedFeatureView):
-            return self._get_table_from_derived_feature_view(features)
+            node = self._build_derived_feature_view_plan(
+                features, required_fields, time_range, plan_nodes
+            )
         elif isinstance(features, SlidingFeatureView):
-            return self._get_table_from_sliding_feature_view(features)
+            node = self._build_sliding_feature_view_plan(
+                features, required_fields, time_range, plan_nodes
+            )
+        else:
+            raise RuntimeError(
+                f"Unsupported type '{type(features).__name__}' for '{features}'."
+            )
 
-        raise RuntimeError(
-            f"Unsupported type '{type(features).__name__}' for '{features}'."
-        )
+        if self.result_cache is None:
+            return node
 
-    def _write_features_to_online_store(
-        self,
-        features: pd.DataFrame,
-        schema: Schema,
-        sink: MemoryStoreSink,
-        key_fields: List[str],
-        timestamp_field: Optional[str],
-        timestamp_format: Optional[str],
-    ) -> LocalJob:
-        MemoryOnlineStore.get_instance().put(
-            table_name=sink.table_name,
-            features=features,
-            schema=schema,
-            key_fields=key_fields,
-            timestamp_field=timestamp_field,
-            timestamp_format=timestamp_format,
+        fingerprint, dependencies, persistent = self._get_table_fingerprint(features)
+        key = hashlib.sha256(
+            json.dumps(
+                {
+                    "table": fingerprint,
+                    "fields": None
+                    if required_fields is None
+                    else sorted(required_fields),
+                    "time_range": list(time_range),
+                    "timezone": str(self.timezone),
+                },
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        return self._intern_plan_node(
+            CacheNode(node, key, dependencies, persistent), plan_nodes
         )
 
-        return LocalJob()
+    def _get_table_fingerprint(
+        self, table: TableDescriptor
+    ) -> Tuple[Dict, Set[str], bool]:
+        """
+        Returns a fingerprint of the rows of the table, the names of the tables the
+        rows are computed from, and whether the fingerprint is valid across processes.
+        The fingerprint covers the definitions of the table and the tables it is
+        computed from, and the identity of the files read.
+        """
+        fingerprint: Dict[str, Any] = {"table": table.to_json()}
+        dependencies = {table.name}
+        persistent = True
 
-    def _get_table_from_file_source(self, source: FileSystemSource) -> LocalTable:
-        if source.data_format == "csv":
-            df = pd.read_csv(
-                source.path,
-                names=source.schema.field_names,
-                dtype={
-                    name: to_numpy_dtype(dtype)
-                    for name, dtype in zip(
-                        source.schema.field_names, source.schema.field_types
+        if isinstance(table, FileSystemSource):
+            files = []
+            for path in get_file_paths(table.path):
+                try:
+                    stat = os.stat(path)
+                    files.append([path, stat.st_mtime_ns, stat.st_size])
+                except OSError:
+                    files.append([path, None, None])
+            fingerprint["files"] = files
+        elif isinstance(table, FeatureView):
+            upstream_tables = [table.get_resolved_source()]
+            udf_tokens = []
+            for feature in self._get_dependent_features(table):
+                if isinstance(feature.transform, JoinTransform):
+                    upstream_tables.append(
+                        self.registry.get_features(name=feature.transform.table_name)
                     )
-                },
-            )
-            return LocalTable(
-                df=df,
-                timestamp_field=source.timestamp_field,
-                timestamp_format=source.timestamp_format,
-            )
+                elif isinstance(feature.transform, PythonUdfTransform):
+                    # Python functions can only be identified in the current process.
+                    udf_tokens.append(self._get_udf_token(feature.transform.udf))
+                    persistent = False
+            fingerprint["udfs"] = udf_tokens
 
-        raise RuntimeError(f"Unsupported file format: {source.data_format}.")
+            fingerprint["upstream_tables"] = []
+            for upstream_table in upstream_tables:
+                (
+                    upstream_fingerprint,
+                    upstream_dependencies,
+                    upstream_persistent,
+                ) = self._get_table_fingerprint(upstream_table)
+                fingerprint["upstream_tables"].append(upstream_fingerprint)
+                dependencies.update(upstream_dependencies)
+                persistent = persistent and upstream_persistent
 
-    def _evaluate_expression_transform(
-        self, df: pd.DataFrame, transform: ExpressionTransform
-    ) -> List:
-        expr_node = self.parser.parse(transform.expr)
-        return df.apply(
-            lambda row: self.ast_evaluator.eval(expr_node, row), axis=1
-        ).tolist()
+        return fingerprint, dependencies, persistent
 
-    def _get_table_from_derived_feature_view(
-        self, feature_view: DerivedFeatureView
-    ) -> LocalTable:
+    def _get_udf_token(self, udf: Callable) -> int:
+        """
+        Returns a number identifying the Python UDF in the current process. Unlike
+        id(), the number is not reused by another UDF after the UDF is garbage
+        collected.
+        """
+        entry = self._udf_tokens.get(id(udf))
+        if entry is not None and entry[0]() is udf:
+            return entry[1]
+
+        reference: Callable[[], Any]
+        try:
+            reference = weakref.ref(udf)
+        except TypeError:
+            # Keeps the UDF alive so that its id is not reused.
+            def reference() -> Any:
+                return udf
+
+        token = next(self._udf_token_counter)
+        self._udf_tokens[id(udf)] = (reference, token)
+        return token
+
+    @staticmethod
+    def _intern_plan_node(
+        node: PlanNode, plan_nodes: Dict[Hashable, PlanNode]
+    ) -> PlanNode:
+        return plan_nodes.setdefault(node.get_identity(), node)
+
+    def _build_file_source_plan(
+        self,
+        source: FileSystemSource,
+        required_fields: Optional[Collection[str]],
+        time_range: TimeRange,
+        plan_nodes: Dict[Hashable, PlanNode],
+    ) -> PlanNode:
+        if source.data_format not in SUPPORTED_FILE_FORMATS:
+            raise RuntimeError(f"Unsupported file format: {source.data_format}.")
+
+        if source.timestamp_field is None:
+            time_range = TimeRange()
+        fields = None
+        if required_fields is not None:
+            fields = _select_fields(source.schema.field_names, required_fields)
+        return self._intern_plan_node(ScanNode(source, fields, time_range), plan_nodes)
+
+    def _build_derived_feature_view_plan(
+        self,
+        feature_view: DerivedFeatureView,
+        required_fields: Optional[Collection[str]],
+        time_range: TimeRange,
+        plan_nodes: Dict[Hashable, PlanNode],
+    ) -> PlanNode:
         # TODO: Support filtering DerivedFeatureView in LocalProcessor.
         if feature_view.filter_expr is not None:
             raise FeathubException(
                 "LocalProcessor does not support filtering DerivedFeatureView."
             )
 
-        source_table = self._get_table(feature_view.source)
-        source_df = source_table.df
-        source_fields = list(source_table.get_schema().field_names)
-        dependent_features = self._get_dependent_features(feature_view)
-
-        table_names = set(
-            [
-                feature.transform.table_name
-                for feature in feature_view.get_resolved_features()
-                if isinstance(feature.transform, JoinTransform)
-            ]
+        source = feature_view.get_resolved_source()
+        source_fields = _get_field_names(source)
+        output_fields = _select_fields(
+            feature_view.get_output_fields(source_fields), required_fields
         )
-        table_by_names = {}
-        descriptors_by_names = {}
-        for name in table_names:
-            descriptor = self.registry.get_features(name=name)
-            descriptors_by_names[name] = descriptor
-            table_by_names[name] = self._get_table(features=descriptor)
-
-        for feature in dependent_features:
-            if isinstance(feature.transform, ExpressionTransform):
-                source_df[feature.name] = self._evaluate_expression_transform(
-                    source_df, feature.transform
-                )
-            elif isinstance(feature.transform, PythonUdfTransform):
-                source_df[feature.name] = self._evaluate_python_udf_transform(
-                    source_df, feature.transform
-                )
-            elif isinstance(feature.transform, OverWindowTransform):
+        features, used_fields = self._prune_features(
+            self._get_dependent_features(feature_view),
+            output_fields,
+            feature_view.timestamp_field,
+        )
+
+        join_descriptors: Dict[str, TableDescriptor] = {}
+        join_required_fields: Dict[str, List[str]] = {}
+        for feature in features:
+            if isinstance(feature.transform, OverWindowTransform) or isinstance(
+                feature.transform, JoinTransform
+            ):
                 if (
                     feature_view.timestamp_field is None
                     or feature_view.timestamp_format is None
                 ):
                     raise FeathubException(
                         "FeatureView must have timestamp field and timestamp format "
-                        "specified for OverWindowTransform."
+                        f"specified for {type(feature.transform).__name__}."
                     )
-                source_df[feature.name] = self._evaluate_over_window_transform(
-                    source_df,
-                    feature.transform,
-                    feature_view.timestamp_field,
-                    feature_view.timestamp_format,
-                )
-            elif isinstance(feature.transform, JoinTransform):
-                source_df[feature.name] = self._evaluate_join_transform(
-                    source_df,
-                    feature,
-                    feature_view.timestamp_field,
-                    feature_view.timestamp_format,
-                    table_by_names,
-                    descriptors_by_names,
-                )
-            else:
-                raise RuntimeError(
-                    f"Unsupported transformation type "
-                    f"{type(feature.transform).__name__} for feature {feature.name}."
+            if not isinstance(feature.transform, JoinTransform):
+                continue
+            table_name = feature.transform.table_name
+            if table_name not in join_descriptors:
+                join_descriptors[table_name] = self.registry.get_features(
+                    name=table_name
                 )
-            source_df[feature.name] = cast_series_dtype(
-                source_df[feature.name], to_numpy_dtype(feature.dtype)
-            )
-
-        output_fields = feature_view.get_output_fields(source_fields)
-
-        return LocalTable(
-            df=source_df[output_fields],
-            timestamp_field=feature_view.timestamp_field,
-            timestamp_format=feature_view.timestamp_format,
-        )
-
-    def _resolve_table_descriptor(
-        self, features: Union[str, TableDescriptor]
-    ) -> TableDescriptor:
-        if isinstance(features, str):
-            features = self.registry.get_features(name=features)
-        elif isinstance(features, FeatureView) and features.is_unresolved():
-            features = self.registry.get_features(name=features.name)
-
-        return features
-
-    def _evaluate_join_transform(
-        self,
-        source_df: pd.DataFrame,
-        feature: Feature,
-        source_timestamp_field: str,
-        source_timestamp_format: str,
-        table_by_names: Dict[str, LocalTable],
-        descriptors_by_names: Dict[str, TableDescriptor],
-    ) -> List:
-        if feature.keys is None:
-            raise FeathubException(
-                f"Feature {feature} with JoinTransform must have keys."
+                join_required_fields[table_name] = []
+            join_descriptor = join_descriptors[table_name]
+            _, join_keys, join_feature_names = self._resolve_join_features(
+                [feature], join_descriptor
             )
-        join_transform = feature.transform
-        if not isinstance(join_transform, JoinTransform):
-            raise RuntimeError(f"Feature '{feature.name}' should use JoinTransform.")
-
-        join_descriptor = descriptors_by_names[join_transform.table_name]
-        if (
-            join_descriptor.timestamp_field is None
-            or join_descriptor.timestamp_format is None
-        ):
-            raise FeathubException(
-                "Join table must have timestamp field and timestamp format specified."
-            )
-        join_timestamp_field = join_descriptor.timestamp_field
-        join_timestamp_format = join_descriptor.timestamp_format
-        join_df = table_by_names[join_transform.table_name].df
-        join_feature = join_descriptor.get_feature(join_transform.feature_name)
-        if join_feature.keys is None:
-            raise FeathubException(
-                f"The Feature {join_feature} to join must have keys."
+            join_required_fields[table_name].extend(
+                [*join_keys, *join_feature_names, join_descriptor.timestamp_field]
             )
 
-        result = []
-        # TODO: optimize the performance for the following code.
-        for source_idx, source_row in source_df.iterrows():
-            source_timestamp = utils.to_unix_timestamp(
-                source_row[source_timestamp_field],
-                source_timestamp_format,
-                self.timezone,
+        # A point-in-time join only looks up rows earlier than the rows to join, so the
+        # join tables only need rows before the end of the time range. Each join table
+        # is computed once for all the features joined from it.
+        join_plans = {
+            table_name: self._build_plan(
+                descriptor,
+                join_required_fields[table_name],
+                TimeRange(None, time_range.end_millis),
+                plan_nodes,
             )
-            joined_value = None
-            joined_timestamp = None
-            for join_idx, join_row in join_df.iterrows():
-                join_timestamp = utils.to_unix_timestamp(
-                    join_row[join_timestamp_field], join_timestamp_format, self.timezone
-                )
-                if join_timestamp > source_timestamp:
-                    continue
-                if joined_timestamp is not None and joined_timestamp >= join_timestamp:
-                    continue
+            for table_name, descriptor in join_descriptors.items()
+        }
 
-                keys_match = True
-                for i in range(len(feature.keys)):
-                    if source_row[feature.keys[i]] != join_row[join_feature.keys[i]]:
-                        keys_match = False
-                        break
-                if not keys_match:
+        node = self._build_plan(
+            source,
+            used_fields,
+            self._get_source_time_range(feature_view, features, time_range),
+            plan_nodes,
+        )
+        batch: List[Feature] = []
+        joined_feature_names: Set[str] = set()
+        for feature in features:
+            transform = feature.transform
+            if isinstance(transform, JoinTransform):
+                node = self._append_feature_node(node, batch, feature_view, plan_nodes)
+                batch = []
+                if feature.name in joined_feature_names:
                     continue
-                joined_value = join_row[join_transform.feature_name]
-                joined_timestamp = join_timestamp
-            result.append(joined_value)
-
-        return result
-
-    def _evaluate_over_window_transform(
-        self,
-        df: pd.DataFrame,
-        transform: OverWindowTransform,
-        timestamp_field: str,
-        timestamp_format: str,
-    ) -> List:
-        agg_func = AGG_FUNCTIONS.get(transform.agg_func, None)
-        if agg_func is None:
-            raise RuntimeError(f"Unsupported agg function {transform.agg_func}.")
-        temp_column = "_temp"
-        if temp_column in df:
-            raise RuntimeError("The dataframe has column with name _temp.")
-
-        for key in transform.group_by_keys:
-            if key not in df:
-                raise RuntimeError(
-                    f"Group-by key '{key}' is not found in {df.columns}."
+                # Joins all the features from the same table with the same keys on
+                # both sides in one pass.
+                join_descriptor = join_descriptors[transform.table_name]
+                join_keys = join_descriptor.get_feature(transform.feature_name).keys
+                join_features = [
+                    f
+                    for f in features
+                    if isinstance(f.transform, JoinTransform)
+                    and f.transform.table_name == transform.table_name
+                    and f.keys == feature.keys
+                    and join_descriptor.get_feature(f.transform.feature_name).keys
+                    == join_keys
+                ]
+                joined_feature_names.update(f.name for f in join_features)
+                node = self._intern_plan_node(
+                    JoinNode(
+                        node,
+                        join_plans[transform.table_name],
+                        join_features,
+                        cast(str, feature_view.timestamp_field),
+                        feature_view.timestamp_format,
+                        join_descriptor,
+                    ),
+                    plan_nodes,
                 )
-
-        expr_node = self.parser.parse(transform.expr)
-        df_copy = df.copy()
-        df_copy[temp_column] = df_copy.apply(
-            lambda row: self.ast_evaluator.eval(expr_node, row), axis=1
-        )
-
-        # Append an internal unix time column.
-        append_unix_time_column(
-            df_copy, timestamp_field, timestamp_format, self.timezone
-        )
-
-        group_by_idx = {}
-        if len(transform.group_by_keys) > 0:
-            for group in df_copy.groupby(transform.group_by_keys).indices.values():
-                for idx in group:
-                    group_by_idx[idx] = group
-
-        filter_expr_node = None
-        if transform.filter_expr is not None:
-            filter_expr_node = self.parser.parse(transform.filter_expr)
-        result: List[Any] = []
-        # TODO: optimize the performance for the following code.
-        # Computes the feature's value for each row in the group.
-        for idx, row in df_copy.iterrows():
-            if filter_expr_node is not None and not self.ast_evaluator.eval(
-                filter_expr_node, dict(row)
+            elif isinstance(
+                transform,
+                (ExpressionTransform, PythonUdfTransform, OverWindowTransform),
             ):
-                result.append(None)
-                continue
-            max_timestamp = row[EVENT_TIME_ATTRIBUTE_NAME]
-            window_size = transform.window_size
-            min_timestamp = (
-                0
-                if window_size is None
-                else max_timestamp - window_size.total_seconds()
-            )
-
-            rows_in_group = (
-                # If group_by_idx is empty all rows in the same group.
-                df_copy.iloc[group_by_idx[idx]]
-                if len(group_by_idx) > 0
-                else df_copy
-            )
-            predicate = rows_in_group[EVENT_TIME_ATTRIBUTE_NAME].transform(
-                lambda timestamp: min_timestamp <= timestamp <= max_timestamp
-            )
-            if filter_expr_node is not None:
-                predicate = predicate & rows_in_group.apply(
-                    lambda r: self.ast_evaluator.eval(filter_expr_node, r.to_dict()),
-                    axis=1,
-                )
-            rows_in_group_and_window = rows_in_group[predicate]
-            limit = transform.limit
-            if limit is not None:
-                rows_in_group_and_window.sort_values(
-                    by=[EVENT_TIME_ATTRIBUTE_NAME],
-                    ascending=True,
-                    inplace=True,
-                    ignore_index=True,
+                if len(batch) > 0 and isinstance(
+                    batch[0].transform, OverWindowTransform
+                ) != isinstance(transform, OverWindowTransform):
+                    node = self._append_feature_node(
+                        node, batch, feature_view, plan_nodes
+                    )
+                    batch = []
+                batch.append(feature)
+            else:
+                raise RuntimeError(
+                    f"Unsupported transformation type "
+                    f"{type(transform).__name__} for feature {feature.name}."
                 )
-                rows_in_group_and_window = rows_in_group_and_window.iloc[-limit:]
-            result.append(agg_func(rows_in_group_and_window[temp_column].tolist()))
+        node = self._append_feature_node(node, batch, feature_view, plan_nodes)
 
-        return result
+        return self._intern_plan_node(ProjectNode(node, output_fields), plan_nodes)
 
-    def _evaluate_python_udf_transform(
-        self, df: pd.DataFrame, transform: PythonUdfTransform
-    ) -> List:
-        return df.apply(lambda row: transform.udf(row), axis=1).tolist()
-
-    def _get_table_from_sliding_feature_view(
-        self, feature_view: SlidingFeatureView
-    ) -> LocalTable:
+    def _build_sliding_feature_view_plan(
+        self,
+        feature_view: SlidingFeatureView,
+        required_fields: Optional[Collection[str]],
+        time_range: TimeRange,
+        plan_nodes: Dict[Hashable, PlanNode],
+    ) -> PlanNode:
         if (
             feature_view.config.get(ENABLE_EMPTY_WINDOW_OUTPUT_CONFIG) is not True
             and feature_view.config.get(SKIP_SAME_WINDOW_OUTPUT_CONFIG) is not True
@@ -498,42 +609,35 @@ class LocalProcessor(Processor):
                 "ENABLE_EMPTY_WINDOW_OUTPUT_CONFIG = True and "
                 "SKIP_SAME_WINDOW_OUTPUT_CONFIG = True."
             )
-        source_table = self._get_table(feature_view.source)
-        source_df = source_table.df
-        source_fields = list(source_table.get_schema().field_names)
-        dependent_features = self._get_dependent_features(feature_view)
+
+        source = feature_view.get_resolved_source()
+        source_fields = _get_field_names(source)
+        output_fields = _select_fields(
+            feature_view.get_output_fields(source_fields), required_fields
+        )
 
         sliding_window_descriptor: Optional[SlidingWindowDescriptor] = None
         agg_field_descriptors: List[AggregationFieldDescriptor] = []
+        agg_used_fields = {source.timestamp_field}
 
-        # This list contains all per-row transform features listed after the first
-        # SlidingWindowTransform feature in the dependent_features.
-        per_row_transform_features_following_first_sliding_feature = []
-
-        for feature in dependent_features:
+        # The per-row transform features listed before the first SlidingWindowTransform
+        # feature are evaluated on the source table, and the others are evaluated on
+        # the aggregated table.
+        per_row_features_before_first_sliding_feature = []
+        per_row_features_following_first_sliding_feature = []
 
+        for feature in self._get_dependent_features(feature_view):
             # The timestamp field is computed as part of the sliding window.
             if feature.name == feature_view.timestamp_field:
                 continue
 
-            if isinstance(feature.transform, ExpressionTransform):
-                if sliding_window_descriptor is not None:
-                    per_row_transform_features_following_first_sliding_feature.append(
-                        feature
-                    )
-                else:
-                    source_df[feature.name] = self._evaluate_expression_transform(
-                        source_df, feature.transform
-                    )
-            elif isinstance(feature.transform, PythonUdfTransform):
+            if isinstance(feature.transform, ExpressionTransform) or isinstance(
+                feature.transform, PythonUdfTransform
+            ):
                 if sliding_window_descriptor is not None:
-                    per_row_transform_features_following_first_sliding_feature.append(
-                        feature
-                    )
+                    per_row_features_following_first_sliding_feature.append(feature)
                 else:
-                    source_df[feature.name] = self._evaluate_python_udf_transform(
-                        source_df, feature.transform
-                    )
+                    per_row_features_before_first_sliding_feature.append(feature)
             elif isinstance(feature.transform, SlidingWindowTransform):
                 if feature_view.timestamp_field is None:
                     raise FeathubException(
@@ -559,43 +663,758 @@ class LocalProcessor(Processor):
                 agg_field_descriptors.append(
                     AggregationFieldDescriptor.from_feature(feature)
                 )
+                agg_used_fields.update(self._get_used_fields(feature, None) or [])
             else:
                 raise FeathubTransformationException(
                     f"Unsupported transformation type "
                     f"{type(feature.transform).__name__} for feature {feature.name}."
                 )
 
-        agg_df = evaluate_sliding_window(
-            input_df=source_df,
-            feature_view=feature_view,
-            window_descriptor=sliding_window_descriptor,
-            agg_descriptors=agg_field_descriptors,
-            tz=self.timezone,
-            parser=self.parser,
-            ast_evaluator=self.ast_evaluator,
+        if sliding_window_descriptor is None:
+            raise FeathubException(
+                "SlidingFeatureView must have at least one feature with "
+                "SlidingWindowTransform."
+            )
+
+        # All the aggregations are kept even if they are not required, since they
+        # decide whether a window is skipped as the same as the previous window.
+        following_features, _ = self._prune_features(
+            per_row_features_following_first_sliding_feature, output_fields, None
+        )
+        preceding_features, used_fields = self._prune_features(
+            per_row_features_before_first_sliding_feature, agg_used_fields, None
+        )
+
+        # A window only depends on the rows before its end, so only the end of the
+        # time range can be pushed down. It is only pushed down if the timestamps of
+        # windows are epoch times, as the other formats are not in the configured
+        # time zone.
+        source_time_range = TimeRange()
+        if feature_view.timestamp_format in ("epoch", "epoch_millis"):
+            source_time_range = TimeRange(None, time_range.end_millis)
+
+        node = self._build_plan(source, used_fields, source_time_range, plan_nodes)
+        node = self._append_feature_node(
+            node, preceding_features, feature_view, plan_nodes
+        )
+        node = self._intern_plan_node(
+            SlidingWindowNode(
+                node, feature_view, sliding_window_descriptor, agg_field_descriptors
+            ),
+            plan_nodes,
+        )
+        node = self._append_feature_node(
+            node, following_features, feature_view, plan_nodes
         )
 
-        for feature in per_row_transform_features_following_first_sliding_feature:
-            if isinstance(feature.transform, ExpressionTransform):
-                agg_df[feature.name] = self._evaluate_expression_transform(
-                    agg_df, feature.transform
+        return self._intern_plan_node(ProjectNode(node, output_fields), plan_nodes)
+
+    def _append_feature_node(
+        self,
+        node: PlanNode,
+        features: Sequence[Feature],
+        feature_view: FeatureView,
+        plan_nodes: Dict[Hashable, PlanNode],
+    ) -> PlanNode:
+        """
+        Appends a node evaluating the given per-row transform features or the given
+        OverWindowTransform features to the given node.
+        """
+        if len(features) == 0:
+            return node
+        if isinstance(features[0].transform, OverWindowTransform):
+            return self._intern_plan_node(
+                OverWindowNode(
+                    node,
+                    features,
+                    cast(str, feature_view.timestamp_field),
+                    feature_view.timestamp_format,
+                ),
+                plan_nodes,
+            )
+        return self._intern_plan_node(ExpressionNode(node, features), plan_nodes)
+
+    def _prune_features(
+        self,
+        features: Sequence[Feature],
+        required_fields: Collection[str],
+        timestamp_field: Optional[str],
+    ) -> Tuple[List[Feature], Optional[Set[str]]]:
+        """
+        Removes the features that are neither required nor used by the other features.
+
+        :param features: The features in the order of evaluation.
+        :param required_fields: The names of the fields required after evaluating the
+                                features.
+        :param timestamp_field: The timestamp field used by the features.
+        :return: The remaining features, and the names of the fields needed before
+                 evaluating the features, or None if all fields are needed.
+        """
+        used_fields: Optional[Set[str]] = set(required_fields)
+        remaining_features = []
+        for feature in reversed(features):
+            if used_fields is None:
+                remaining_features.append(feature)
+                continue
+            if feature.name not in used_fields:
+                continue
+            remaining_features.append(feature)
+            used_fields.discard(feature.name)
+            feature_used_fields = self._get_used_fields(feature, timestamp_field)
+            if feature_used_fields is None:
+                used_fields = None
+            else:
+                used_fields.update(feature_used_fields)
+        remaining_features.reverse()
+        return remaining_features, used_fields
+
+    def _get_used_fields(
+        self, feature: Feature, timestamp_field: Optional[str]
+    ) -> Optional[Set[str]]:
+        """
+        Returns the names of the fields used to evaluate the feature, or None if the
+        feature might use all fields.
+        """
+        transform = feature.transform
+        used_fields: Set[str] = set()
+        if isinstance(transform, ExpressionTransform):
+            return self.parser.parse(transform.expr).get_var_names()
+        elif isinstance(transform, PythonUdfTransform):
+            if transform.input_fields is None:
+                return None
+            used_fields.update(transform.input_fields)
+        elif isinstance(transform, OverWindowTransform) or isinstance(
+            transform, SlidingWindowTransform
+        ):
+            used_fields.update(self.parser.parse(transform.expr).get_var_names())
+            if transform.filter_expr is not None:
+                used_fields.update(
+                    self.parser.parse(transform.filter_expr).get_var_names()
                 )
-            elif isinstance(feature.transform, PythonUdfTransform):
-                agg_df[feature.name] = self._evaluate_python_udf_transform(
-                    agg_df, feature.transform
+            used_fields.update(transform.group_by_keys)
+        elif isinstance(transform, JoinTransform):
+            used_fields.update(feature.keys or [])
+
+        if timestamp_field is not None:
+            used_fields.add(timestamp_field)
+        return used_fields
+
+    @staticmethod
+    def _get_source_time_range(
+        feature_view: FeatureView, features: Sequence[Feature], time_range: TimeRange
+    ) -> TimeRange:
+        """
+        Returns the time range of the rows needed from the source of the feature view
+        to compute the rows of the feature view in the given time range.
+        """
+        source = feature_view.get_resolved_source()
+        if (
+            time_range.is_unbounded()
+            or feature_view.timestamp_field != source.timestamp_field
+            or feature_view.timestamp_format != source.timestamp_format
+        ):
+            return TimeRange()
+
+        max_window_size = timedelta(0)
+        for feature in features:
+            transform = feature.transform
+            if feature.name == feature_view.timestamp_field and not (
+                isinstance(transform, ExpressionTransform)
+                and transform.expr.strip() == feature.name
+            ):
+                return TimeRange()
+            if isinstance(transform, OverWindowTransform):
+                if transform.window_size is None:
+                    return TimeRange(None, time_range.end_millis)
+                max_window_size = max(max_window_size, transform.window_size)
+
+        # Over windows of the rows in the time range need rows before its start.
+        return time_range.extend_start(max_window_size)
+
+    def _execute_plan(self, plan: PlanNode) -> pd.DataFrame:
+        df = self._execute_plan_node(plan, get_num_parents(plan), {})
+        return df.reset_index(drop=True)
+
+    def _execute_plan_node(
+        self,
+        node: PlanNode,
+        num_remaining_parents: Dict[int, int],
+        results: Dict[int, pd.DataFrame],
+    ) -> pd.DataFrame:
+        if isinstance(node, CacheNode):
+            assert self.result_cache is not None
+            cached_df = self.result_cache.get(node.key)
+            if cached_df is not None:
+                return cached_df
+
+        inputs = []
+        for child in node.children:
+            if id(child) not in results:
+                results[id(child)] = self._execute_plan_node(
+                    child, num_remaining_parents, results
                 )
+            # Nodes might update their inputs in place, so the result of a shared
+            # node is copied for all but its last parent.
+            num_remaining_parents[id(child)] -= 1
+            if num_remaining_parents[id(child)] == 0:
+                inputs.append(results.pop(id(child)))
             else:
-                raise FeathubTransformationException(
-                    f"Unsupported transformation type: {type(feature.transform)}."
+                inputs.append(results[id(child)].copy())
+
+        if isinstance(node, ScanNode):
+            return self._scan(node)
+        elif isinstance(node, CacheNode):
+            assert self.result_cache is not None
+            self.result_cache.put(
+                node.key, inputs[0], node.dependencies, node.persistent
+            )
+            return inputs[0]
+        return self._evaluate_plan_node(node, inputs)
+
+    def _evaluate_plan_node(
+        self, node: PlanNode, inputs: List[pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Computes the rows of a node other than ScanNode and CacheNode from the rows of
+        its children.
+        """
+        if isinstance(node, ProjectNode):
+            return inputs[0][node.fields]
+        elif isinstance(node, TimeFilterNode):
+            return self._filter_by_time(inputs[0], node)
+        elif isinstance(node, KeyFilterNode):
+            return filter_by_keys(inputs[0], inputs[1])
+        elif isinstance(node, ExpressionNode):
+            df = inputs[0]
+            for feature in node.features:
+                if isinstance(feature.transform, ExpressionTransform):
+                    df[feature.name] = self._evaluate_expression_transform(
+                        df, feature.transform
+                    )
+                elif isinstance(feature.transform, PythonUdfTransform):
+                    df[feature.name] = self._evaluate_python_udf_transform(
+                        df, feature.transform
+                    )
+                df[feature.name] = cast_series_dtype(
+                    df[feature.name], to_numpy_dtype(feature.dtype)
                 )
+            return df
+        elif isinstance(node, OverWindowNode):
+            df = inputs[0]
+            for feature in node.features:
+                df[feature.name] = cast_series_dtype(
+                    pd.Series(
+                        self._evaluate_over_window_transform(
+                            df,
+                            cast(OverWindowTransform, feature.transform),
+                            node.timestamp_field,
+                            node.timestamp_format,
+                        ),
+                        index=df.index,
+                    ),
+                    to_numpy_dtype(feature.dtype),
+                )
+            return df
+        elif isinstance(node, JoinNode):
+            df = inputs[0]
+            joined_values = self._evaluate_join_transforms(
+                df,
+                node.features,
+                node.timestamp_field,
+                node.timestamp_format,
+                inputs[1],
+                node.join_descriptor,
+            )
+            for feature in node.features:
+                df[feature.name] = cast_series_dtype(
+                    pd.Series(joined_values[feature.name], index=df.index),
+                    to_numpy_dtype(feature.dtype),
+                )
+            return df
+        elif isinstance(node, SlidingWindowNode):
+            return evaluate_sliding_window(
+                input_df=inputs[0],
+                feature_view=node.feature_view,
+                window_descriptor=node.window_descriptor,
+                agg_descriptors=node.agg_descriptors,
+                tz=self.timezone,
+                parser=self.parser,
+                ast_evaluator=self.ast_evaluator,
+                executor=self.parallel_executor,
+            )
 
-        output_fields = feature_view.get_output_fields(source_fields)
+        raise RuntimeError(f"Unsupported plan node {node.describe()}.")
 
-        return LocalTable(
-            df=agg_df[output_fields],
-            timestamp_field=feature_view.timestamp_field,
-            timestamp_format=feature_view.timestamp_format,
+    def _execute_plan_in_batches(
+        self, plan: PlanNode, batch_size: int
+    ) -> Iterator[pd.DataFrame]:
+        for df in self._execute_plan_node_in_batches(plan, batch_size):
+            if df.shape[0] > 0:
+                yield df.reset_index(drop=True)
+
+    def _execute_plan_node_in_batches(
+        self, node: PlanNode, batch_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Computes the rows of the node in batches. Scans read their sources in batches,
+        and the nodes evaluated row by row process the batches of their first child
+        while their other children are computed as a whole. Over windows on input
+        ordered by time keep the rows of previous batches that the windows of later
+        rows might contain. The other nodes are computed as a whole and split into
+        batches.
+        """
+        if isinstance(node, ScanNode) and isinstance(node.source, FileSystemSource):
+            for df in iter_file_system_source(
+                node.source, self._get_read_fields(node), node.time_range, batch_size
+            ):
+                yield self._filter_scanned_rows(df, node)
+        elif isinstance(node, CacheNode):
+            assert self.result_cache is not None
+            cached_df = self.result_cache.get(node.key)
+            if cached_df is None:
+                yield from self._execute_plan_node_in_batches(
+                    node.children[0], batch_size
+                )
+            else:
+                yield from split_into_batches(cached_df, batch_size)
+        elif isinstance(
+            node,
+            (ProjectNode, TimeFilterNode, KeyFilterNode, ExpressionNode, JoinNode),
+        ):
+            other_inputs = [self._execute_plan(child) for child in node.children[1:]]
+            for df in self._execute_plan_node_in_batches(node.children[0], batch_size):
+                if df.shape[0] > 0:
+                    yield self._evaluate_plan_node(node, [df] + other_inputs)
+        elif isinstance(node, OverWindowNode) and self._is_over_window_bounded(node):
+            yield from self._evaluate_over_window_node_in_batches(
+                node, self._execute_plan_node_in_batches(node.children[0], batch_size)
+            )
+        else:
+            yield from split_into_batches(self._execute_plan(node), batch_size)
+
+    def _is_over_window_bounded(self, node: OverWindowNode) -> bool:
+        """
+        Returns whether the windows of the node only contain a bounded number of rows
+        before each row, and its input is read in the order of time.
+        """
+        for feature in node.features:
+            transform = cast(OverWindowTransform, feature.transform)
+            if transform.window_size is None and transform.limit is None:
+                return False
+
+        child = node.children[0]
+        while not isinstance(child, ScanNode):
+            if not isinstance(
+                child,
+                (
+                    ProjectNode,
+                    CacheNode,
+                    KeyFilterNode,
+                    ExpressionNode,
+                    OverWindowNode,
+                    JoinNode,
+                ),
+            ):
+                return False
+            if isinstance(child, (ExpressionNode, OverWindowNode, JoinNode)) and any(
+                feature.name == node.timestamp_field for feature in child.features
+            ):
+                return False
+            child = child.children[0]
+
+        source = child.source
+        return (
+            isinstance(source, FileSystemSource)
+            and source.timestamp_field == node.timestamp_field
+            and source.max_out_of_orderness == timedelta(0)
+        )
+
+    def _evaluate_over_window_node_in_batches(
+        self, node: OverWindowNode, batches: Iterator[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Evaluates the over window features of the batches of rows ordered by time.
+        The rows with the latest timestamp of a batch are evaluated with the next
+        batch, so that the windows of the rows evaluated contain all their rows.
+        """
+        # The rows of previous batches that the windows of later rows might contain,
+        # with their features evaluated.
+        state_df: Optional[pd.DataFrame] = None
+        # The rows with the latest timestamp seen so far.
+        pending_df: Optional[pd.DataFrame] = None
+        pending_millis: Optional[int] = None
+
+        for batch in itertools.chain(batches, [None]):
+            if batch is None:
+                if pending_df is None:
+                    return
+                df = pending_df
+            else:
+                times = get_unix_time_millis(
+                    batch[node.timestamp_field], node.timestamp_format, self.timezone
+                )
+                if len(times) == 0:
+                    continue
+                if pending_millis is not None and times.min() < pending_millis:
+                    raise FeathubException(
+                        f"Rows are not ordered by {node.timestamp_field}, which is "
+                        f"required to evaluate over windows in batches."
+                    )
+                if pending_df is not None:
+                    batch = pd.concat([pending_df, batch], ignore_index=True)
+                    times = np.concatenate(
+                        [np.full(pending_df.shape[0], pending_millis), times]
+                    )
+                pending_millis = int(times.max())
+                is_pending = times == pending_millis
+                pending_df = batch[is_pending]
+                df = batch[~is_pending]
+                if df.shape[0] == 0:
+                    continue
+
+            num_state_rows = 0
+            if state_df is not None:
+                num_state_rows = state_df.shape[0]
+                df = pd.concat([state_df, df], ignore_index=True)
+            else:
+                df = df.reset_index(drop=True)
+            is_new = np.arange(df.shape[0]) >= num_state_rows
+            for feature in node.features:
+                values = pd.Series(
+                    self._evaluate_over_window_transform(
+                        df,
+                        cast(OverWindowTransform, feature.transform),
+                        node.timestamp_field,
+                        node.timestamp_format,
+                    ),
+                    index=df.index,
+                    dtype=object,
+                )
+                # The rows of previous batches keep the values evaluated with all the
+                # rows in their windows.
+                if num_state_rows > 0:
+                    values = values.where(is_new, df[feature.name])
+                df[feature.name] = cast_series_dtype(
+                    values, to_numpy_dtype(feature.dtype)
+                )
+            yield df[is_new]
+
+            if batch is not None:
+                state_df = df[
+                    self._get_over_window_state_mask(
+                        node, df, cast(int, pending_millis)
+                    )
+                ].reset_index(drop=True)
+
+    def _get_over_window_state_mask(
+        self, node: OverWindowNode, df: pd.DataFrame, min_future_millis: int
+    ) -> np.ndarray:
+        """
+        Returns whether each row might be in the windows of the rows whose timestamps
+        are no less than the given epoch millis.
+        """
+        times = get_unix_time_millis(
+            df[node.timestamp_field], node.timestamp_format, self.timezone
         )
+        state_mask = np.zeros(df.shape[0], dtype=bool)
+        for feature in node.features:
+            transform = cast(OverWindowTransform, feature.transform)
+            mask = np.ones(df.shape[0], dtype=bool)
+            if transform.filter_expr is not None:
+                mask &= np.asarray(
+                    self.ast_evaluator.eval_filter(
+                        self.parser.parse(transform.filter_expr), df
+                    ),
+                    dtype=bool,
+                )
+            if transform.window_size is not None:
+                mask &= times >= min_future_millis - int(
+                    transform.window_size / timedelta(milliseconds=1)
+                )
+            if transform.limit is not None:
+                limit = transform.limit
+                if len(transform.group_by_keys) > 0:
+                    groups = df.groupby(
+                        list(transform.group_by_keys), dropna=False
+                    ).indices.values()
+                else:
+                    groups = [np.arange(df.shape[0])]
+                is_recent = np.zeros(df.shape[0], dtype=bool)
+                for group in groups:
+                    group = group[mask[group]]
+                    group = group[np.lexsort((group, times[group]))]
+                    is_recent[group[-limit:]] = True
+                mask &= is_recent
+            state_mask |= mask
+        return state_mask
+
+    def _scan(self, node: ScanNode) -> pd.DataFrame:
+        source = node.source
+        if isinstance(source, pd.DataFrame):
+            return source
+
+        df = read_file_system_source(
+            source, self._get_read_fields(node), node.time_range
+        )
+        return self._filter_scanned_rows(df, node)
+
+    @staticmethod
+    def _get_read_fields(node: ScanNode) -> List[str]:
+        source = cast(FileSystemSource, node.source)
+        read_fields = list(
+            source.schema.field_names if node.fields is None else node.fields
+        )
+        if (
+            not node.time_range.is_unbounded()
+            and source.timestamp_field not in read_fields
+        ):
+            read_fields.append(cast(str, source.timestamp_field))
+        return read_fields
+
+    def _filter_scanned_rows(self, df: pd.DataFrame, node: ScanNode) -> pd.DataFrame:
+        """
+        Keeps the rows read by the scan that are in its time range, and the fields
+        of the scan.
+        """
+        source = cast(FileSystemSource, node.source)
+        if not node.time_range.is_unbounded():
+            times = get_unix_time_millis(
+                df[source.timestamp_field], source.timestamp_format, self.timezone
+            )
+            mask = np.ones(len(times), dtype=bool)
+            if node.time_range.start_millis is not None:
+                mask &= times >= node.time_range.start_millis
+            if node.time_range.end_millis is not None:
+                mask &= times < node.time_range.end_millis
+            df = df[mask].reset_index(drop=True)
+
+        return df[source.schema.field_names if node.fields is None else node.fields]
+
+    def _filter_by_time(self, df: pd.DataFrame, node: TimeFilterNode) -> pd.DataFrame:
+        append_and_sort_unix_time_column(
+            df, node.timestamp_field, node.timestamp_format, self.timezone
+        )
+        if node.start_datetime is not None:
+            start_millis = (
+                utils.to_unix_timestamp(node.start_datetime, tz=self.timezone) * 1000
+            )
+            df = df[df[EVENT_TIME_ATTRIBUTE_NAME] >= start_millis]
+        if node.end_datetime is not None:
+            end_millis = (
+                utils.to_unix_timestamp(node.end_datetime, tz=self.timezone) * 1000
+            )
+            df = df[df[EVENT_TIME_ATTRIBUTE_NAME] < end_millis]
+        return df.drop(columns=[EVENT_TIME_ATTRIBUTE_NAME])
+
+    def _write_features_to_online_store(
+        self,
+        features: pd.DataFrame,
+        schema: Schema,
+        sink: MemoryStoreSink,
+        key_fields: List[str],
+        timestamp_field: Optional[str],
+        timestamp_format: Optional[str],
+    ) -> LocalJob:
+        MemoryOnlineStore.get_instance().put(
+            table_name=sink.table_name,
+            features=features,
+            schema=schema,
+            key_fields=key_fields,
+            timestamp_field=timestamp_field,
+            timestamp_format=timestamp_format,
+        )
+
+        return LocalJob()
+
+    def _evaluate_expression_transform(
+        self, df: pd.DataFrame, transform: ExpressionTransform
+    ) -> List:
+        expr_node = self.parser.parse(transform.expr)
+        return self.ast_evaluator.eval_column(expr_node, df).tolist()
+
+    def _resolve_table_descriptor(
+        self, features: Union[str, TableDescriptor]
+    ) -> TableDescriptor:
+        if isinstance(features, str):
+            features = self.registry.get_features(name=features)
+        elif isinstance(features, FeatureView) and features.is_unresolved():
+            features = self.registry.get_features(name=features.name)
+
+        return features
+
+    @staticmethod
+    def _resolve_join_features(
+        features: Sequence[Feature], join_descriptor: TableDescriptor
+    ) -> Tuple[Sequence[str], Sequence[str], List[str]]:
+        """
+        Validates the given features with JoinTransform. All the features should join
+        the given table with the same keys.
+
+        :return: The keys of the features, the keys of the table to join, and the
+                 names of the features to join from the table.
+        """
+        if (
+            join_descriptor.timestamp_field is None
+            or join_descriptor.timestamp_format is None
+        ):
+            raise FeathubException(
+                "Join table must have timestamp field and timestamp format specified."
+            )
+
+        source_keys: Optional[Sequence[str]] = None
+        join_keys: Optional[Sequence[str]] = None
+        join_feature_names = []
+        for feature in features:
+            if feature.keys is None:
+                raise FeathubException(
+                    f"Feature {feature} with JoinTransform must have keys."
+                )
+            source_keys = feature.keys
+            join_transform = feature.transform
+            if not isinstance(join_transform, JoinTransform):
+                raise RuntimeError(
+                    f"Feature '{feature.name}' should use JoinTransform."
+                )
+            if join_transform.table_name != join_descriptor.name:
+                raise RuntimeError(
+                    "Features with JoinTransform evaluated in one pass should join "
+                    "the same table."
+                )
+            join_feature = join_descriptor.get_feature(join_transform.feature_name)
+            if join_feature.keys is None:
+                raise FeathubException(
+                    f"The Feature {join_feature} to join must have keys."
+                )
+            if join_keys is None:
+                join_keys = join_feature.keys
+            elif join_keys != join_feature.keys:
+                raise FeathubException(
+                    f"The Features to join from table {join_transform.table_name} "
+                    f"should have the same keys."
+                )
+            join_feature_names.append(join_transform.feature_name)
+
+        return source_keys or [], join_keys or [], join_feature_names
+
+    def _evaluate_join_transforms(
+        self,
+        source_df: pd.DataFrame,
+        features: Sequence[Feature],
+        source_timestamp_field: str,
+        source_timestamp_format: str,
+        join_df: pd.DataFrame,
+        join_descriptor: TableDescriptor,
+    ) -> Dict[str, List]:
+        """
+        Evaluates the given features with JoinTransform in one pass. All the features
+        should join the given table with the same keys.
+
+        :return: A map from feature name to the list of joined values.
+        """
+        source_keys, join_keys, join_feature_names = self._resolve_join_features(
+            features, join_descriptor
+        )
+        if len(join_feature_names) == 0:
+            return {}
+
+        joined_values = evaluate_point_in_time_join(
+            left_df=source_df,
+            left_keys=source_keys,
+            left_times=get_unix_time_millis(
+                source_df[source_timestamp_field],
+                source_timestamp_format,
+                self.timezone,
+            ),
+            right_df=join_df,
+            right_keys=join_keys,
+            right_times=get_unix_time_millis(
+                join_df[cast(str, join_descriptor.timestamp_field)],
+                join_descriptor.timestamp_format,
+                self.timezone,
+            ),
+            value_fields=list(dict.fromkeys(join_feature_names)),
+            executor=self.parallel_executor,
+        )
+
+        return {
+            feature.name: joined_values[join_feature_name]
+            for feature, join_feature_name in zip(features, join_feature_names)
+        }
+
+    def _evaluate_over_window_transform(
+        self,
+        df: pd.DataFrame,
+        transform: OverWindowTransform,
+        timestamp_field: str,
+        timestamp_format: str,
+    ) -> List:
+        if transform.agg_func not in AGG_FUNCTIONS:
+            raise RuntimeError(f"Unsupported agg function {transform.agg_func}.")
+
+        for key in transform.group_by_keys:
+            if key not in df:
+                raise RuntimeError(
+                    f"Group-by key '{key}' is not found in {df.columns}."
+                )
+
+        expr_node = self.parser.parse(transform.expr)
+        values = self.ast_evaluator.eval_column(expr_node, df).tolist()
+
+        row_mask = None
+        if transform.filter_expr is not None:
+            row_mask = self.ast_evaluator.eval_filter(
+                self.parser.parse(transform.filter_expr), df
+            )
+
+        if len(transform.group_by_keys) > 0:
+            groups = list(
+                df.groupby(list(transform.group_by_keys), dropna=False).indices.values()
+            )
+        else:
+            groups = [np.arange(df.shape[0])]
+
+        return evaluate_over_window(
+            values=values,
+            times=get_unix_time_millis(
+                df[timestamp_field], timestamp_format, self.timezone
+            ),
+            groups=groups,
+            row_mask=row_mask,
+            agg_func=transform.agg_func,
+            window_size_millis=None
+            if transform.window_size is None
+            else int(transform.window_size / timedelta(milliseconds=1)),
+            limit=transform.limit,
+            executor=self.parallel_executor,
+        )
+
+    def _evaluate_python_udf_transform(
+        self, df: pd.DataFrame, transform: PythonUdfTransform
+    ) -> List:
+        if transform.input_fields is not None:
+            df = df[transform.input_fields]
+
+        num_partitions = 1
+        if (
+            self.parallel_executor is not None
+            and transform.pure
+            and is_picklable(transform.udf)
+        ):
+            num_partitions = self.parallel_executor.get_num_partitions(df.shape[0])
+        if num_partitions == 1:
+            return _apply_python_udf(transform.udf, transform.vectorized, df)
+
+        assert self.parallel_executor is not None
+        values = []
+        for partition_values in self.parallel_executor.map(
+            _apply_python_udf,
+            [
+                (transform.udf, transform.vectorized, df.iloc[positions])
+                for positions in np.array_split(np.arange(df.shape[0]), num_partitions)
+            ],
+        ):
+            values.extend(partition_values)
+        return values
 
     def _get_dependent_features(self, feature_view: FeatureView) -> Sequence[Feature]:
         dependent_features = []
@@ -606,3 +1425,31 @@ class LocalProcessor(Processor):
             if feature not in dependent_features:
                 dependent_features.append(feature)
         return dependent_features
+
+
+def _apply_python_udf(udf: Callable, vectorized: bool, df: pd.DataFrame) -> List:
+    if not vectorized:
+        return df.apply(lambda row: udf(row), axis=1).tolist()
+
+    result = udf(df)
+    if len(result) != df.shape[0]:
+        raise FeathubException(
+            f"Vectorized Python UDF returns {len(result)} values for "
+            f"{df.shape[0]} rows."
+        )
+    return list(result)
+
+
+def _get_field_names(table: TableDescriptor) -> List[str]:
+    return [feature.name for feature in table.get_output_features()]
+
+
+def _select_fields(
+    fields: Sequence[str], required_fields: Optional[Collection[str]]
+) -> List[str]:
+    """
+    Returns the given fields that are required in their original order.
+    """
+    if required_fields is None:
+        return list(fields)
+    return [field for field in fields if field in required_fields]
@@ -11,9 +11,93 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Dict, Any, List
 
-from feathub.processors.processor_config import ProcessorConfig
+from feathub.common.config import ConfigDef
+from feathub.processors.processor_config import ProcessorConfig, PROCESSOR_PREFIX
+
+LOCAL_PROCESSOR_PREFIX = PROCESSOR_PREFIX + "local."
+
+RESULT_CACHE_ENABLED_CONFIG = LOCAL_PROCESSOR_PREFIX + "result_cache.enabled"
+RESULT_CACHE_ENABLED_DOC = (
+    "Whether to cache the tables computed by LocalProcessor and reuse them when the "
+    "same tables are computed again from unchanged sources."
+)
+
+RESULT_CACHE_MAX_BYTES_CONFIG = LOCAL_PROCESSOR_PREFIX + "result_cache.max_bytes"
+RESULT_CACHE_MAX_BYTES_DOC = (
+    "The maximum total size in bytes of the cached tables kept in memory."
+)
+
+RESULT_CACHE_DIR_CONFIG = LOCAL_PROCESSOR_PREFIX + "result_cache.dir"
+RESULT_CACHE_DIR_DOC = (
+    "Optional. If it is not None, the cached tables are also written to this "
+    "directory so that they can be reused across processes. Tables that cannot be "
+    "stored as Parquet files are stored as pickles, which can execute arbitrary code "
+    "when loaded, so the directory should only be writable by trusted users."
+)
+
+PARALLELISM_CONFIG = LOCAL_PROCESSOR_PREFIX + "parallelism"
+PARALLELISM_DOC = (
+    "The number of worker processes used to evaluate over windows, sliding windows, "
+    "joins and pure Python UDFs in parallel. They are evaluated in the current "
+    "process if it is 1."
+)
+
+MIN_ROWS_PER_PARTITION_CONFIG = LOCAL_PROCESSOR_PREFIX + "min_rows_per_partition"
+MIN_ROWS_PER_PARTITION_DOC = (
+    "The minimum number of rows in a partition evaluated by a worker process. Tables "
+    "with fewer rows than twice this number are evaluated in the current process."
+)
+
+BATCH_SIZE_CONFIG = LOCAL_PROCESSOR_PREFIX + "batch_size"
+BATCH_SIZE_DOC = (
+    "Optional. If it is not None, features are computed and written to sinks in "
+    "batches of this number of rows read from the sources when they are "
+    "materialized, so that tables larger than memory can be materialized."
+)
+
+local_processor_config_defs: List[ConfigDef] = [
+    ConfigDef(
+        name=RESULT_CACHE_ENABLED_CONFIG,
+        value_type=bool,
+        description=RESULT_CACHE_ENABLED_DOC,
+        default_value=False,
+    ),
+    ConfigDef(
+        name=RESULT_CACHE_MAX_BYTES_CONFIG,
+        value_type=int,
+        description=RESULT_CACHE_MAX_BYTES_DOC,
+        default_value=256 * 1024 * 1024,
+    ),
+    ConfigDef(
+        name=RESULT_CACHE_DIR_CONFIG,
+        value_type=str,
+        description=RESULT_CACHE_DIR_DOC,
+        default_value=None,
+    ),
+    ConfigDef(
+        name=PARALLELISM_CONFIG,
+        value_type=int,
+        description=PARALLELISM_DOC,
+        default_value=1,
+    ),
+    ConfigDef(
+        name=MIN_ROWS_PER_PARTITION_CONFIG,
+        value_type=int,
+        description=MIN_ROWS_PER_PARTITION_DOC,
+        default_value=10000,
+    ),
+    ConfigDef(
+        name=BATCH_SIZE_CONFIG,
+        value_type=int,
+        description=BATCH_SIZE_DOC,
+        default_value=None,
+    ),
+]
 
 
 class LocalProcessorConfig(ProcessorConfig):
-    pass
+    def __init__(self, props: Dict[str, Any]) -> None:
+        super().__init__(props)
+        self.update_config_values(local_processor_config_defs)
@@ -0,0 +1,231 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import glob
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional, NamedTuple, Tuple, Collection, FrozenSet
+
+import pandas as pd
+
+
+class ResultCacheStats(NamedTuple):
+    """
+    Statistics of a LocalResultCache.
+    """
+
+    hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    num_entries: int
+    size_bytes: int
+
+
+class LocalResultCache:
+    """
+    A cache of the tables computed by LocalProcessor. The tables are kept in memory in
+    least-recently-used order with a bound on their total size in bytes, and are also
+    written to the cache directory if it is set so that they can be reused by other
+    processes.
+
+    Each table is stored with the names of the tables it is computed from so that the
+    tables depending on a table can be invalidated together.
+
+    Tables are written to the cache directory as Parquet files if pyarrow is installed
+    and their columns can be stored in Parquet, and as pickles otherwise, e.g. when
+    they have map or vector columns. Since loading a pickle can execute arbitrary
+    code, the cache directory should only be writable by trusted users.
+    """
+
+    _PARQUET_SUFFIX = ".parquet"
+    _PICKLE_SUFFIX = ".pkl"
+    _DEPENDENCIES_SUFFIX = ".deps"
+
+    def __init__(self, max_bytes: int, cache_dir: Optional[str] = None):
+        """
+        :param max_bytes: The maximum total size in bytes of the tables kept in memory.
+        :param cache_dir: Optional. If it is not None, it is the directory where the
+                          tables are written to.
+        """
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[pd.DataFrame, int, FrozenSet[str]]]" = (
+            OrderedDict()
+        )
+        self._size_bytes = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns a copy of the table cached with the given key, or None if the key is
+        not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0].copy()
+
+        if self.cache_dir is not None:
+            df = self._read_entry(key)
+            if df is not None:
+                with open(self._get_dependencies_path(key)) as f:
+                    dependencies = frozenset(f.read().splitlines())
+                with self._lock:
+                    self._disk_hits += 1
+                    self._put_in_memory(key, df, dependencies)
+                return df.copy()
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(
+        self,
+        key: str,
+        df: pd.DataFrame,
+        dependencies: Collection[str],
+        persistent: bool = True,
+    ) -> None:
+        """
+        Caches a copy of the table with the given key.
+
+        :param key: The key of the table.
+        :param df: The rows of the table.
+        :param dependencies: The names of the tables the table is computed from,
+                             including itself.
+        :param persistent: Whether the table can be written to the cache directory.
+                           It should be False if the key is only valid in the current
+                           process.
+        """
+        df = df.copy()
+        dependencies = frozenset(dependencies)
+        with self._lock:
+            self._put_in_memory(key, df, dependencies)
+
+        if self.cache_dir is not None and persistent:
+            with open(self._get_dependencies_path(key), "w") as f:
+                f.write("\n".join(sorted(dependencies)))
+            # Writes to a temporary file first so that other processes never read a
+            # partially written table.
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+            os.close(fd)
+            if _is_parquet_compatible(df):
+                df.to_parquet(temp_path)
+                os.replace(temp_path, self._get_entry_path(key, self._PARQUET_SUFFIX))
+            else:
+                df.to_pickle(temp_path)
+                os.replace(temp_path, self._get_entry_path(key, self._PICKLE_SUFFIX))
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """
+        Removes the cached tables computed from the table with the given name, or all
+        the cached tables if the name is None.
+        """
+        with self._lock:
+            for key, (_, size_bytes, dependencies) in list(self._entries.items()):
+                if table_name is None or table_name in dependencies:
+                    del self._entries[key]
+                    self._size_bytes -= size_bytes
+
+        if self.cache_dir is None:
+            return
+        for dependencies_path in glob.glob(
+            os.path.join(self.cache_dir, "*" + self._DEPENDENCIES_SUFFIX)
+        ):
+            if table_name is not None:
+                with open(dependencies_path) as f:
+                    if table_name not in f.read().splitlines():
+                        continue
+            key = os.path.basename(dependencies_path)[: -len(self._DEPENDENCIES_SUFFIX)]
+            for path in [
+                self._get_entry_path(key, self._PARQUET_SUFFIX),
+                self._get_entry_path(key, self._PICKLE_SUFFIX),
+                dependencies_path,
+            ]:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def get_stats(self) -> ResultCacheStats:
+        with self._lock:
+            return ResultCacheStats(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def _put_in_memory(
+        self, key: str, df: pd.DataFrame, dependencies: FrozenSet[str]
+    ) -> None:
+        size_bytes = int(df.memory_usage(index=True, deep=True).sum())
+        if key in self._entries:
+            self._size_bytes -= self._entries.pop(key)[1]
+        if size_bytes > self.max_bytes:
+            return
+
+        self._entries[key] = (df, size_bytes, dependencies)
+        self._size_bytes += size_bytes
+        while self._size_bytes > self.max_bytes:
+            _, (_, evicted_size_bytes, _) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size_bytes
+            self._evictions += 1
+
+    def _read_entry(self, key: str) -> Optional[pd.DataFrame]:
+        path = self._get_entry_path(key, self._PARQUET_SUFFIX)
+        if os.path.exists(path):
+            return pd.read_parquet(path)
+        path = self._get_entry_path(key, self._PICKLE_SUFFIX)
+        if os.path.exists(path):
+            return pd.read_pickle(path)
+        return None
+
+    def _get_entry_path(self, key: str, suffix: str) -> str:
+        return os.path.join(str(self.cache_dir), key + suffix)
+
+    def _get_dependencies_path(self, key: str) -> str:
+        return os.path.join(str(self.cache_dir), key + self._DEPENDENCIES_SUFFIX)
+
+
+def _is_parquet_compatible(df: pd.DataFrame) -> bool:
+    """
+    Returns whether the table is read back unchanged after it is written as Parquet.
+    Object columns are only compatible if they hold strings, since Parquet stores
+    lists and dicts as arrays and structs.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+
+    for name, column in df.items():
+        if not isinstance(name, str):
+            return False
+        if column.dtype == object and not all(
+            value is None or isinstance(value, str) for value in column
+        ):
+            return False
+    return True
@@ -13,12 +13,14 @@
 # limitations under the License.
 
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, Callable, Iterator, cast
 
 import pandas as pd
 
 from feathub.common import types
+from feathub.common.exceptions import FeathubException
 from feathub.feature_tables.feature_table import FeatureTable
+from feathub.processors.local.local_plan import PlanNode, ScanNode, TimeRange
 from feathub.processors.processor_job import ProcessorJob
 from feathub.table.schema import Schema
 from feathub.table.table import Table
@@ -32,22 +34,54 @@ class LocalTable(Table):
 
     def __init__(
         self,
-        df: pd.DataFrame,
+        df: Optional[pd.DataFrame],
         timestamp_field: Optional[str],
         timestamp_format: str,
+        plan: Optional[PlanNode] = None,
+        execute_plan: Optional[Callable[[PlanNode], pd.DataFrame]] = None,
+        execute_plan_in_batches: Optional[
+            Callable[[PlanNode, int], Iterator[pd.DataFrame]]
+        ] = None,
     ):
         """
-        :param df: A DataFrame containing rows of this table.
+        :param df: Optional. A DataFrame containing rows of this table. If it is None,
+                   the rows are computed by executing the plan the first time they
+                   are accessed.
         :param timestamp_field: Optional. If it is not None, it is the name of the field
                                 whose values show the time when the corresponding row
                                 is generated.
         :timestamp_format: The format of the timestamp field.
+        :param plan: Optional. The plan to compute the rows of this table. It must not
+                     be None if the df is None.
+        :param execute_plan: Optional. The function that executes the plan and returns
+                             the computed rows. It must not be None if the df is None.
         """
         super().__init__(
             timestamp_field=timestamp_field,
             timestamp_format=timestamp_format,
         )
-        self.df = df
+        if df is None and (plan is None or execute_plan is None):
+            raise FeathubException(
+                "LocalTable must have either a DataFrame or a plan to compute it."
+            )
+        self._df = df
+        self._plan = plan
+        self._execute_plan = execute_plan
+        self._execute_plan_in_batches = execute_plan_in_batches
+
+    @property
+    def df(self) -> pd.DataFrame:
+        if self._df is None:
+            self._df = cast(Callable, self._execute_plan)(self._plan)
+        return self._df
+
+    def explain(self) -> str:
+        """
+        Returns the plan to compute the rows of this table.
+        """
+        if self._plan is None:
+            return ScanNode(self.df, None, TimeRange()).explain()
+        return self._plan.explain()
 
     def get_schema(self) -> Schema:
         field_names = []
@@ -60,6 +94,27 @@ class LocalTable(Table):
     def to_pandas(self, force_bounded: bool = False) -> pd.DataFrame:
         return self.df
 
+    def to_pandas_batches(self, batch_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Returns the rows of this table in batches. Unlike `to_pandas`, the rows are
+        computed batch by batch if possible, so that tables larger than memory can be
+        processed. The rows are computed again each time this method is called.
+
+        Sources are read in batches of at most `batch_size` rows. Over windows that
+        are limited by size or number of rows keep the rows of previous batches in
+        their windows, and require the rows of their sources to be ordered by time.
+        Sliding windows, over windows without limits, and the tables to join are
+        computed as a whole.
+
+        :param batch_size: The number of rows to read from the sources in a batch.
+        """
+        if batch_size <= 0:
+            raise FeathubException("Batch size must be positive.")
+        if self._df is not None or self._execute_plan_in_batches is None:
+            yield from split_into_batches(self.df, batch_size)
+        else:
+            yield from self._execute_plan_in_batches(self._plan, batch_size)
+
     def execute_insert(
         self,
         sink: FeatureTable,
@@ -67,3 +122,12 @@ class LocalTable(Table):
         allow_overwrite: bool = False,
     ) -> ProcessorJob:
         pass
+
+
+def split_into_batches(df: pd.DataFrame, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Splits the rows of the DataFrame into batches of at most `batch_size` rows.
+    """
+    for start in range(0, df.shape[0], batch_size):
+        end = start + batch_size
+        yield df.iloc[start:end].reset_index(drop=True)
@@ -0,0 +1,120 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Any, Optional, Sequence, List
+
+import numpy as np
+import pandas as pd
+
+from feathub.feature_views.transforms.agg_func import AggFunc
+from feathub.processors.local.aggregation_utils import aggregate_windows
+from feathub.processors.local.parallel_utils import ParallelExecutor, partition_groups
+
+
+def evaluate_over_window(
+    values: Sequence[Any],
+    times: np.ndarray,
+    groups: Sequence[np.ndarray],
+    row_mask: Optional[np.ndarray],
+    agg_func: AggFunc,
+    window_size_millis: Optional[int],
+    limit: Optional[int],
+    executor: Optional[ParallelExecutor] = None,
+) -> List:
+    """
+    Evaluates the over window aggregation of each row.
+
+    For a row with timestamp t0, its window contains the rows in the same group that
+    match the row mask and whose timestamps fall in range [t0 - window_size, t0]. If
+    limit is not None, only the `limit` most recent of these rows are kept. The result
+    of the rows that do not match the row mask is None.
+
+    Each group is sorted by timestamp once, then the window start and end of every row
+    are found with binary search and the aggregation result is maintained by a
+    WindowAccumulator while the window slides forward, so that each group takes
+    O(n log n) time.
+
+    :param values: The values to aggregate of each row.
+    :param times: The epoch millis of each row.
+    :param groups: The positions of rows in each group.
+    :param row_mask: Optional. If it is not None, it is a boolean array indicating
+                     which rows match the filter expression.
+    :param agg_func: The aggregation function.
+    :param window_size_millis: Optional. The window size in milliseconds. If it is None
+                               the window size is unlimited.
+    :param limit: Optional. The maximum number of rows in a window.
+    :param executor: Optional. If it is not None, the groups are partitioned and
+                     evaluated in parallel by the executor.
+    :return: A list containing the aggregation result of each row.
+    """
+    values = pd.Series(values, dtype=object).to_numpy()
+    times = np.asarray(times, dtype=np.int64)
+    results = np.full(len(values), None, dtype=object)
+
+    num_partitions = 1
+    if executor is not None:
+        num_partitions = executor.get_num_partitions(len(values))
+    if num_partitions > 1:
+        assert executor is not None
+        args_list = []
+        partition_rows = []
+        for group_indices in partition_groups(groups, num_partitions):
+            # Each partition only holds its own rows, and the positions in the groups
+            # are re-numbered accordingly.
+            rows = np.concatenate([groups[i] for i in group_indices]).astype(np.int64)
+            offsets = np.cumsum([len(groups[i]) for i in group_indices])[:-1]
+            args_list.append(
+                (
+                    values[rows],
+                    times[rows],
+                    np.split(np.arange(len(rows)), offsets),
+                    None if row_mask is None else row_mask[rows],
+                    agg_func,
+                    window_size_millis,
+                    limit,
+                )
+            )
+            partition_rows.append(rows)
+        for rows, partition_results in zip(
+            partition_rows, executor.map(evaluate_over_window, args_list)
+        ):
+            results[rows] = pd.Series(partition_results, dtype=object).to_numpy()
+        return results.tolist()
+
+    for group in groups:
+        group = np.asarray(group)
+        if row_mask is not None:
+            group = group[row_mask[group]]
+        if len(group) == 0:
+            continue
+
+        # Sorts rows by timestamp, and by position for rows with the same timestamp.
+        group = group[np.lexsort((group, times[group]))]
+        group_times = times[group]
+        group_values = values[group]
+
+        window_ends = np.searchsorted(group_times, group_times, side="right")
+        if window_size_millis is None:
+            window_starts = np.zeros(len(group), dtype=np.int64)
+        else:
+            window_starts = np.searchsorted(
+                group_times, group_times - window_size_millis, side="left"
+            )
+        if limit is not None:
+            window_starts = np.maximum(window_starts, window_ends - limit)
+
+        results[group] = aggregate_windows(
+            group_values, window_starts, window_ends, agg_func
+        )
+
+    return results.tolist()
@@ -0,0 +1,112 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import heapq
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Callable, Sequence, List, Tuple, Any
+
+import numpy as np
+
+
+class ParallelExecutor:
+    """
+    Runs a function on partitions of rows in a pool of worker processes. The pool is
+    created the first time it is used.
+    """
+
+    def __init__(self, num_workers: int, min_rows_per_partition: int):
+        """
+        :param num_workers: The number of worker processes.
+        :param min_rows_per_partition: The minimum number of rows in a partition. Inputs
+                                       with fewer rows are not partitioned, since the
+                                       cost of transferring them to the workers
+                                       outweighs the parallelism.
+        """
+        self.num_workers = num_workers
+        self.min_rows_per_partition = min_rows_per_partition
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def get_num_partitions(self, num_rows: int) -> int:
+        """
+        Returns the number of partitions to split the given number of rows into.
+        """
+        return max(
+            1,
+            min(self.num_workers, num_rows // max(self.min_rows_per_partition, 1)),
+        )
+
+    def map(self, func: Callable, args_list: Sequence[Tuple]) -> List[Any]:
+        """
+        Calls the function with each of the given arguments and returns the results
+        in order. The calls run in the worker processes if there are more than one.
+        """
+        if len(args_list) <= 1:
+            return [func(*args) for args in args_list]
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.num_workers)
+            pool = self._pool
+        futures = [pool.submit(func, *args) for args in args_list]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes. The pool is created again if the executor is
+        used after being closed.
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def partition_groups(
+    groups: Sequence[np.ndarray], num_partitions: int
+) -> List[List[int]]:
+    """
+    Assigns the groups of rows to partitions so that all rows of a group are in the
+    same partition and the partitions have similar numbers of rows. Groups are
+    assigned from the largest to the partition with the fewest rows.
+
+    :param groups: The positions of the rows in each group.
+    :param num_partitions: The number of partitions.
+    :return: The indices of the groups in each non-empty partition, in ascending
+             order.
+    """
+    partitions: List[List[int]] = [[] for _ in range(num_partitions)]
+    heap = [(0, i) for i in range(num_partitions)]
+    for group_index in sorted(
+        range(len(groups)), key=lambda i: len(groups[i]), reverse=True
+    ):
+        num_rows, partition_index = heapq.heappop(heap)
+        partitions[partition_index].append(group_index)
+        heapq.heappush(heap, (num_rows + len(groups[group_index]), partition_index))
+    return [sorted(partition) for partition in partitions if len(partition) > 0]
+
+
+def is_picklable(obj: Any) -> bool:
+    """
+    Returns whether the object can be sent to worker processes.
+    """
+    try:
+        pickle.dumps(obj)
+        return True
+    except Exception:
+        return False
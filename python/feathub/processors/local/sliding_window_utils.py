@@ -11,14 +11,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from datetime import timedelta, datetime, tzinfo
-from typing import Optional, Sequence, Type, Any, Tuple, Dict, List
+from datetime import timedelta, tzinfo
+from typing import Optional, Sequence, Type, Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from feathub.common.exceptions import FeathubException
 from feathub.common.types import to_numpy_dtype
-from feathub.dsl.ast import ExprAST
 from feathub.dsl.expr_parser import ExprParser
 from feathub.feature_views.feature import Feature
 from feathub.feature_views.sliding_feature_view import SlidingFeatureView
@@ -27,9 +27,17 @@ from feathub.feature_views.transforms.sliding_window_transform import (
     SlidingWindowTransform,
 )
 from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
-from feathub.processors.local.aggregation_utils import AGG_FUNCTIONS
-from feathub.processors.local.ast_evaluator.local_ast_evaluator import LocalAstEvaluator
-from feathub.processors.local.time_utils import append_unix_time_column
+from feathub.processors.local.aggregation_utils import aggregate_windows
+from feathub.processors.local.ast_evaluator.local_vectorized_ast_evaluator import (
+    LocalVectorizedAstEvaluator,
+)
+from feathub.processors.local.parallel_utils import ParallelExecutor, partition_groups
+from feathub.processors.local.time_utils import (
+    append_unix_time_column,
+    get_local_time_millis,
+    get_unix_time_millis_from_local,
+    format_unix_time_millis,
+)
 from feathub.processors.local.type_utils import cast_dataframe_dtype
 
 
@@ -120,10 +128,14 @@ def evaluate_sliding_window(
     agg_descriptors: List[AggregationFieldDescriptor],
     tz: tzinfo,
     parser: ExprParser,
-    ast_evaluator: LocalAstEvaluator,
+    ast_evaluator: LocalVectorizedAstEvaluator,
+    executor: Optional[ParallelExecutor] = None,
 ) -> pd.DataFrame:
     """
     Evaluate the sliding window on the input DataFrame.
+
+    If the executor is not None, the groups are partitioned and evaluated in parallel
+    by the executor.
     """
     df_copy = input_df.copy()
     append_unix_time_column(
@@ -133,195 +145,222 @@ def evaluate_sliding_window(
         tz,
     )
 
-    agg_df = df_copy.sort_values(by=[EVENT_TIME_ATTRIBUTE_NAME])
-    if len(window_descriptor.group_by_keys) > 0:
-        agg_df = agg_df.groupby(by=window_descriptor.group_by_keys).apply(
-            lambda df: _sliding_window_func(
-                df=df,
-                sliding_window_descriptor=window_descriptor,
-                agg_field_descriptors=agg_descriptors,
-                tz=tz,
-                parser=parser,
-                ast_evaluator=ast_evaluator,
+    # We assign row base on the local timestamp millis instead of unix time so that the
+    # windows are aligned with 1970-01-01 00:00:00 at the current time zone.
+    local_times = get_local_time_millis(
+        df_copy[EVENT_TIME_ATTRIBUTE_NAME].to_numpy(), tz
+    )
+
+    # Evaluates the expression and the filter expression of each aggregation field
+    # once for all rows, instead of once per window.
+    agg_values: Dict[str, np.ndarray] = {}
+    row_masks: Dict[str, Optional[np.ndarray]] = {}
+    for descriptor in agg_descriptors:
+        agg_values[descriptor.field_name] = ast_evaluator.eval_column(
+            parser.parse(descriptor.expr), df_copy
+        ).to_numpy(dtype=object)
+        row_masks[descriptor.field_name] = None
+        if descriptor.filter_expr is not None:
+            row_masks[descriptor.field_name] = ast_evaluator.eval_filter(
+                parser.parse(descriptor.filter_expr), df_copy
             )
+
+    if len(window_descriptor.group_by_keys) > 0:
+        groups = list(
+            df_copy.groupby(by=list(window_descriptor.group_by_keys)).indices.values()
         )
     else:
-        agg_df = _sliding_window_func(
-            df=agg_df,
-            sliding_window_descriptor=window_descriptor,
-            agg_field_descriptors=agg_descriptors,
-            tz=tz,
-            parser=parser,
-            ast_evaluator=ast_evaluator,
+        groups = [np.arange(df_copy.shape[0])]
+
+    group_args = []
+    for group in groups:
+        # Sorts rows in the group by time, and by position for rows with the same
+        # time.
+        group = np.asarray(group)
+        group = group[np.lexsort((group, local_times[group]))]
+        if len(group) == 0:
+            continue
+        group_args.append(
+            (
+                {
+                    key: df_copy[key].iloc[group[0]]
+                    for key in window_descriptor.group_by_keys
+                },
+                local_times[group],
+                {name: values[group] for name, values in agg_values.items()},
+                {
+                    name: None if row_mask is None else row_mask[group]
+                    for name, row_mask in row_masks.items()
+                },
+                window_descriptor,
+                agg_descriptors,
+                tz,
+            )
         )
 
-    agg_df = agg_df.reset_index(drop=True)
+    num_partitions = 1
+    if executor is not None:
+        num_partitions = executor.get_num_partitions(df_copy.shape[0])
+    if num_partitions > 1:
+        assert executor is not None
+        partitions = partition_groups([args[1] for args in group_args], num_partitions)
+        partition_dfs = executor.map(
+            _evaluate_sliding_window_groups,
+            [([group_args[i] for i in partition],) for partition in partitions],
+        )
+        dfs_by_group_index: Dict[int, pd.DataFrame] = {}
+        for partition, dfs in zip(partitions, partition_dfs):
+            dfs_by_group_index.update(zip(partition, dfs))
+        group_dfs = [dfs_by_group_index[i] for i in range(len(group_args))]
+    else:
+        group_dfs = _evaluate_sliding_window_groups(group_args)
+
+    if len(group_dfs) > 0:
+        agg_df = pd.concat(group_dfs, ignore_index=True)
+    else:
+        agg_df = pd.DataFrame(
+            columns=[
+                *window_descriptor.group_by_keys,
+                *[d.field_name for d in agg_descriptors],
+                EVENT_TIME_ATTRIBUTE_NAME,
+            ]
+        )
 
     # Compute the timestamp field with the given timestamp format from event
     # time(window time).
     if feature_view.timestamp_field is not None:
-        if feature_view.timestamp_format == "epoch":
-            agg_df[feature_view.timestamp_field] = agg_df[
-                EVENT_TIME_ATTRIBUTE_NAME
-            ].transform(lambda unix_time: int(unix_time))
-        elif feature_view.timestamp_format == "epoch_millis":
-            agg_df[feature_view.timestamp_field] = agg_df[
-                EVENT_TIME_ATTRIBUTE_NAME
-            ].transform(lambda unix_time: int(unix_time * 1000))
-        else:
-            agg_df[feature_view.timestamp_field] = agg_df[
-                EVENT_TIME_ATTRIBUTE_NAME
-            ].transform(
-                lambda unix_time: datetime.fromtimestamp(unix_time).strftime(
-                    feature_view.timestamp_format
-                )[:-3]
-            )
+        timestamps = format_unix_time_millis(
+            agg_df[EVENT_TIME_ATTRIBUTE_NAME].to_numpy(dtype=np.int64),
+            feature_view.timestamp_format,
+            tz,
+        )
+        if feature_view.timestamp_format not in ("epoch", "epoch_millis"):
+            timestamps = [timestamp[:-3] for timestamp in timestamps]
+        agg_df[feature_view.timestamp_field] = timestamps
 
     agg_df = agg_df.drop([EVENT_TIME_ATTRIBUTE_NAME], axis=1)
     return agg_df
 
 
+def _evaluate_sliding_window_groups(group_args: Sequence[Tuple]) -> List[pd.DataFrame]:
+    return [_sliding_window_func(*args) for args in group_args]
+
+
 def _sliding_window_func(
-    df: pd.DataFrame,
+    keys: Dict[str, Any],
+    local_times: np.ndarray,
+    agg_values: Dict[str, np.ndarray],
+    row_masks: Dict[str, Optional[np.ndarray]],
     sliding_window_descriptor: SlidingWindowDescriptor,
     agg_field_descriptors: Sequence[AggregationFieldDescriptor],
     tz: tzinfo,
-    parser: ExprParser,
-    ast_evaluator: LocalAstEvaluator,
-) -> Optional[pd.DataFrame]:
-
-    if df.shape[0] <= 0:
-        return None
-
-    df_copy = df.copy()
-
-    # We assign row base on the local timestamp millis instead of unix time so that the
-    # windows are aligned with 1970-01-01 00:00:00 at the current time zone.
-    df_copy[EVENT_TIME_ATTRIBUTE_NAME] = df_copy[EVENT_TIME_ATTRIBUTE_NAME].transform(
-        lambda t: int((t + _get_utc_offset_seconds(t, tz)) * 1000)
-    )
-
-    first_row = df_copy.iloc[0]
-    keys_dict = {k: first_row[k] for k in sliding_window_descriptor.group_by_keys}
-    agg_field_names = [d.field_name for d in agg_field_descriptors]
-
-    filter_ast_map: Dict[AggregationFieldDescriptor, ExprAST] = {
-        descriptor: parser.parse(descriptor.filter_expr)
-        for descriptor in agg_field_descriptors
-        if descriptor.filter_expr is not None
-    }
-    agg_result_dtypes = {
-        agg_field_descriptor.field_name: agg_field_descriptor.field_data_type
-        for agg_field_descriptor in agg_field_descriptors
-    }
+) -> pd.DataFrame:
+    """
+    Evaluates the sliding windows of the rows in a group, which are sorted by their
+    local timestamp millis.
+
+    Rows are assigned to step buckets once. The content of a window only changes
+    at the end of the bucket where a row enters the window, and at the end of the
+    bucket where the row leaves the window. The windows ending at other steps have
+    the same result as the window before them, so only the windows ending at these
+    bucket ends are evaluated. The aggregation results are then computed by sliding
+    a WindowAccumulator over the rows in each window, so that each row is added and
+    retracted at most once.
+    """
     step_size_millis = int(sliding_window_descriptor.step_size.total_seconds() * 1000)
+    window_size_millis = {
+        d.field_name: int(d.window_size.total_seconds() * 1000)
+        for d in agg_field_descriptors
+    }
 
-    for agg_field_descriptor in agg_field_descriptors:
-        expr_node = parser.parse(agg_field_descriptor.expr)
-        df_copy[agg_field_descriptor.field_name] = df_copy.apply(
-            lambda r: ast_evaluator.eval(expr_node, r), axis=1
+    # Windows end at the end of the bucket containing a row, and at the end of the
+    # bucket where the row leaves the window of each aggregation field.
+    window_ends = np.unique(
+        np.concatenate(
+            [
+                _get_bucket_end_times(local_times, step_size_millis),
+                *[
+                    _get_bucket_end_times(local_times + size, step_size_millis)
+                    for size in window_size_millis.values()
+                ],
+            ]
         )
-
-    res_df = pd.DataFrame()
-    idx_map: Dict[AggregationFieldDescriptor, Tuple[int, int]] = {}
-    cur_window_end = _get_first_window_end_time(
-        first_row[EVENT_TIME_ATTRIBUTE_NAME], sliding_window_descriptor.step_size
     )
 
-    while True:
-        agg_res: Dict[str, Any] = {}
-        all_reach_end = True
-        for agg_field_descriptor in agg_field_descriptors:
-            agg_func = AGG_FUNCTIONS.get(agg_field_descriptor.agg_func, None)
-            if agg_func is None:
-                raise RuntimeError(
-                    f"Unsupported agg function {agg_field_descriptor.agg_func}."
-                )
-
-            left_idx, right_idx = idx_map.get(agg_field_descriptor, (0, 0))
-
-            # Advance left idx
-            while (
-                right_idx < df_copy.shape[0]
-                and df_copy.iloc[right_idx][EVENT_TIME_ATTRIBUTE_NAME] < cur_window_end
-            ):
-                right_idx += 1
-
-            # Advance right idx
-            window_size_millis = int(
-                agg_field_descriptor.window_size.total_seconds() * 1000
-            )
-            while (
-                left_idx < right_idx
-                and df_copy.iloc[left_idx][EVENT_TIME_ATTRIBUTE_NAME]
-                < cur_window_end - window_size_millis
-            ):
-                left_idx += 1
-
-            if left_idx >= df_copy.shape[0] and right_idx >= df_copy.shape[0]:
-                # All rows are processed for this aggregation descriptor
-                rows_in_window = df_copy.iloc[0:0]
-            else:
-                all_reach_end = False
-                rows_in_window = df_copy.iloc[left_idx:right_idx]
-
-            if agg_field_descriptor in filter_ast_map:
-                # Filter the rows in the window
-                rows_in_window = rows_in_window[
-                    rows_in_window.apply(
-                        lambda r: ast_evaluator.eval(
-                            filter_ast_map.get(agg_field_descriptor), r
-                        ),
-                        axis=1,
-                    )
-                ]
-
-            limit = agg_field_descriptor.limit
-            if limit is not None and limit < rows_in_window.shape[0]:
-                # Limit the rows in the window
-                rows_in_window = rows_in_window.iloc[-limit:]
-            agg_res[agg_field_descriptor.field_name] = agg_func(
-                rows_in_window[agg_field_descriptor.field_name].to_list()
-            )
-
-            # Update indexes
-            idx_map[agg_field_descriptor] = (left_idx, right_idx)
-
-        last_row_agg_res = None
-        if res_df.shape[0] > 0:
-            last_row_agg_res = dict(res_df.iloc[-1][agg_field_names])
-
-        if agg_res != last_row_agg_res:
-            row = pd.DataFrame(
-                data={
-                    **keys_dict,
-                    **{agg_field: [agg_val] for agg_field, agg_val in agg_res.items()},
-                    EVENT_TIME_ATTRIBUTE_NAME: [cur_window_end - 1],
-                }
-            )
-            res_df = res_df.append(cast_dataframe_dtype(row, agg_result_dtypes))
+    agg_results: Dict[str, List] = {}
+    for descriptor in agg_field_descriptors:
+        times = local_times
+        values = agg_values[descriptor.field_name]
+        row_mask = row_masks[descriptor.field_name]
+        if row_mask is not None:
+            times = times[row_mask]
+            values = values[row_mask]
+
+        # Each window contains the rows with time in range
+        # [window_end - window_size, window_end).
+        end_indices = np.searchsorted(times, window_ends, side="left")
+        start_indices = np.searchsorted(
+            times, window_ends - window_size_millis[descriptor.field_name], side="left"
+        )
+        if descriptor.limit is not None:
+            start_indices = np.maximum(start_indices, end_indices - descriptor.limit)
 
-        if all_reach_end:
-            break
+        agg_results[descriptor.field_name] = aggregate_windows(
+            values, start_indices, end_indices, descriptor.agg_func
+        )
 
-        cur_window_end += step_size_millis
+    # Only outputs the windows whose results are different from the previous window.
+    output_indices = [
+        i
+        for i in range(len(window_ends))
+        if i == 0
+        or any(
+            not _is_same_result(results[i], results[i - 1])
+            for results in agg_results.values()
+        )
+    ]
+
+    num_rows = len(output_indices)
+    res_df = pd.DataFrame(
+        data={
+            **{key: [value] * num_rows for key, value in keys.items()},
+            # Object columns keep None for empty integer windows instead of
+            # letting pandas infer float64 with NaN.
+            **{
+                field_name: pd.Series(
+                    [results[i] for i in output_indices], dtype=object
+                )
+                for field_name, results in agg_results.items()
+            },
+        }
+    )
+    res_df = cast_dataframe_dtype(
+        res_df,
+        {
+            descriptor.field_name: descriptor.field_data_type
+            for descriptor in agg_field_descriptors
+        },
+    )
 
     # Convert local timestamp mills back to unix time
-    res_df[EVENT_TIME_ATTRIBUTE_NAME] = res_df[EVENT_TIME_ATTRIBUTE_NAME].transform(
-        lambda t: t / 1000.0 - _get_utc_offset_seconds(t / 1000.0, tz)
+    res_df[EVENT_TIME_ATTRIBUTE_NAME] = get_unix_time_millis_from_local(
+        window_ends[output_indices] - 1, tz
     )
-    res_df.index = res_df[EVENT_TIME_ATTRIBUTE_NAME]
     return res_df
 
 
-def _get_utc_offset_seconds(unix_time: float, zone: tzinfo) -> float:
-    return zone.utcoffset(datetime.fromtimestamp(unix_time)).total_seconds()
+def _get_bucket_end_times(times: np.ndarray, step_size_millis: int) -> np.ndarray:
+    return times - times % step_size_millis + step_size_millis
 
 
-def _get_first_window_end_time(
-    row_time: int,
-    step_size: timedelta,
-) -> int:
-    step_size_millis = int(step_size.total_seconds() * 1000)
-    first_window_end = row_time - row_time % step_size_millis + step_size_millis
-    return first_window_end
+def _is_same_result(result: Any, other: Any) -> bool:
+    if result is None or other is None:
+        return result is other
+    if (
+        isinstance(result, float)
+        and isinstance(other, float)
+        and np.isnan(result)
+        and np.isnan(other)
+    ):
+        return True
+    return result == other
@@ -0,0 +1,164 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.orc as orc
+import pyarrow.parquet as pq
+
+from feathub.common import types
+from feathub.common.config import TIMEZONE_CONFIG
+from feathub.common.exceptions import FeathubException
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
+from feathub.processors.local.file_system_utils import (
+    read_file_system_source,
+    get_file_paths,
+)
+from feathub.processors.local.local_plan import TimeRange
+from feathub.processors.local.local_processor import LocalProcessor
+from feathub.registries.local_registry import LocalRegistry
+from feathub.table.schema import Schema
+
+
+class FileSystemUtilsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.table = pa.table(
+            {
+                "name": ["Alex", "Emma", "Alex", "Jack"],
+                "cost": pa.array([100, 400, 300, 500], pa.int32()),
+                "time": [1000, 2000, 3000, 4000],
+            }
+        )
+        self.schema = (
+            Schema.new_builder()
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .column("time", types.Int64)
+            .build()
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _new_source(self, path: str, data_format: str) -> FileSystemSource:
+        return FileSystemSource(
+            name="source",
+            path=path,
+            data_format=data_format,
+            schema=self.schema,
+            keys=["name"],
+            timestamp_field="time",
+            timestamp_format="epoch_millis",
+        )
+
+    def test_read_columnar_formats(self):
+        paths = {
+            "parquet": os.path.join(self.temp_dir, "source.parquet"),
+            "orc": os.path.join(self.temp_dir, "source.orc"),
+            "feather": os.path.join(self.temp_dir, "source.feather"),
+        }
+        pq.write_table(self.table, paths["parquet"])
+        orc.write_table(self.table, paths["orc"])
+        feather.write_feather(self.table, paths["feather"])
+
+        for data_format, path in paths.items():
+            df = read_file_system_source(
+                self._new_source(path, data_format), ["cost", "name"], TimeRange()
+            )
+            self.assertListEqual(["cost", "name"], df.columns.tolist())
+            self.assertEqual("int64", df["cost"].dtype)
+            self.assertListEqual([100, 400, 300, 500], df["cost"].tolist())
+
+    def test_read_columnar_format_without_pyarrow(self):
+        path = os.path.join(self.temp_dir, "source.parquet")
+        pq.write_table(self.table, path)
+        with patch.dict(sys.modules, {"pyarrow.dataset": None}):
+            with self.assertRaises(FeathubException):
+                read_file_system_source(
+                    self._new_source(path, "parquet"), ["cost"], TimeRange()
+                )
+
+    def test_filter_row_groups_by_time_range(self):
+        path = os.path.join(self.temp_dir, "source.parquet")
+        pq.write_table(self.table, path, row_group_size=1)
+        df = read_file_system_source(
+            self._new_source(path, "parquet"), ["cost"], TimeRange(1500, 3001)
+        )
+        self.assertListEqual([400, 300], df["cost"].tolist())
+
+    def test_read_hive_partitions(self):
+        for day, begin in [("2022-01-01", 0), ("2022-01-02", 2)]:
+            os.makedirs(os.path.join(self.temp_dir, f"day={day}"))
+            pq.write_table(
+                self.table.slice(begin, 2),
+                os.path.join(self.temp_dir, f"day={day}", "part-0.parquet"),
+            )
+        self.schema = (
+            Schema.new_builder()
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .column("time", types.Int64)
+            .column("day", types.String)
+            .build()
+        )
+
+        df = read_file_system_source(
+            self._new_source(self.temp_dir, "parquet"), ["cost", "day"], TimeRange()
+        )
+        self.assertListEqual([100, 400, 300, 500], df["cost"].tolist())
+        self.assertListEqual(
+            ["2022-01-01", "2022-01-01", "2022-01-02", "2022-01-02"],
+            df["day"].tolist(),
+        )
+
+        glob_path = os.path.join(self.temp_dir, "day=2022-01-02", "*.parquet")
+        self.assertEqual(1, len(get_file_paths(glob_path)))
+        df = read_file_system_source(
+            self._new_source(glob_path, "parquet"), ["cost", "day"], TimeRange()
+        )
+        self.assertListEqual([300, 500], df["cost"].tolist())
+        self.assertListEqual(["2022-01-02", "2022-01-02"], df["day"].tolist())
+
+    def test_get_table_from_parquet_source(self):
+        path = os.path.join(self.temp_dir, "source.parquet")
+        pq.write_table(self.table, path, row_group_size=1)
+        registry = LocalRegistry(props={})
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=self._new_source(path, "parquet"),
+            features=[Feature(name="double_cost", transform="cost * 2")],
+        )
+        processor = LocalProcessor(props={TIMEZONE_CONFIG: "UTC"}, registry=registry)
+
+        result = processor.get_table(
+            registry.build_features([feature_view])[0],
+            start_datetime=datetime(1970, 1, 1, 0, 0, 2),
+            end_datetime=datetime(1970, 1, 1, 0, 0, 4),
+        ).to_pandas()
+        self.assertTrue(
+            pd.DataFrame({"time": [2000, 3000], "double_cost": [800, 600]}).equals(
+                result
+            )
+        )
@@ -0,0 +1,168 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from feathub.common.exceptions import FeathubException
+from feathub.processors.local.join_utils import (
+    evaluate_point_in_time_join,
+    filter_by_keys,
+)
+from feathub.processors.local.parallel_utils import ParallelExecutor
+
+
+class JoinUtilsTest(unittest.TestCase):
+    def test_point_in_time_join(self):
+        left_df = pd.DataFrame(
+            [
+                ["Alex", 1, 1000],
+                ["Emma", 1, 2000],
+                ["Alex", 2, 3000],
+                ["Alex", 1, 500],
+                ["Jack", 1, 3000],
+                [None, 1, 3000],
+            ],
+            columns=["name", "id", "time"],
+        )
+        right_df = pd.DataFrame(
+            [
+                ["Alex", 1, 100.0, 1000],
+                ["Alex", 1, 200.0, 1000],
+                ["Emma", 1, 300.0, 1500],
+                ["Emma", 1, 400.0, 2500],
+                ["Alex", 2, 500.0, 2000],
+                [None, 1, 600.0, 1000],
+            ],
+            columns=["user", "user_id", "cost", "time"],
+        )
+
+        result = evaluate_point_in_time_join(
+            left_df=left_df,
+            left_keys=["name", "id"],
+            left_times=left_df["time"].to_numpy(),
+            right_df=right_df,
+            right_keys=["user", "user_id"],
+            right_times=right_df["time"].to_numpy(),
+            value_fields=["cost"],
+        )
+
+        self.assertListEqual([100.0, 300.0, 500.0, None, None, None], result["cost"])
+
+    def test_point_in_time_join_with_random_data(self):
+        rng = np.random.default_rng(0)
+        left_df = pd.DataFrame(
+            {
+                "key": rng.integers(0, 10, 200),
+                "time": rng.integers(0, 100, 200),
+            }
+        )
+        right_df = pd.DataFrame(
+            {
+                "key": rng.integers(0, 10, 200),
+                "value": np.arange(200),
+                "time": rng.integers(0, 100, 200),
+            }
+        )
+
+        result = evaluate_point_in_time_join(
+            left_df=left_df,
+            left_keys=["key"],
+            left_times=left_df["time"].to_numpy(),
+            right_df=right_df,
+            right_keys=["key"],
+            right_times=right_df["time"].to_numpy(),
+            value_fields=["value"],
+        )
+
+        expected = []
+        for _, left_row in left_df.iterrows():
+            joined_value = None
+            joined_time = None
+            for _, right_row in right_df.iterrows():
+                if right_row["key"] != left_row["key"]:
+                    continue
+                if right_row["time"] > left_row["time"]:
+                    continue
+                if joined_time is not None and joined_time >= right_row["time"]:
+                    continue
+                joined_value = right_row["value"]
+                joined_time = right_row["time"]
+            expected.append(joined_value)
+
+        self.assertListEqual(expected, result["value"])
+
+    def test_point_in_time_join_in_parallel(self):
+        rng = np.random.default_rng(0)
+        left_df = pd.DataFrame(
+            {"key": rng.integers(0, 10, 200), "time": rng.integers(0, 100, 200)}
+        )
+        left_df.loc[0, "key"] = None
+        right_df = pd.DataFrame(
+            {
+                "key": rng.integers(0, 10, 200),
+                "value": np.arange(200),
+                "time": rng.integers(0, 100, 200),
+            }
+        )
+        kwargs = dict(
+            left_df=left_df,
+            left_keys=["key"],
+            left_times=left_df["time"].to_numpy(),
+            right_df=right_df,
+            right_keys=["key"],
+            right_times=right_df["time"].to_numpy(),
+            value_fields=["value"],
+        )
+
+        executor = ParallelExecutor(num_workers=3, min_rows_per_partition=1)
+        try:
+            self.assertDictEqual(
+                evaluate_point_in_time_join(**kwargs),
+                evaluate_point_in_time_join(**kwargs, executor=executor),
+            )
+        finally:
+            executor.close()
+
+    def test_filter_by_keys(self):
+        df = pd.DataFrame(
+            [
+                ["Jack", 1, 100],
+                ["Alex", 1, 200],
+                ["Alex", 2, 300],
+                [None, 1, 400],
+                ["Emma", None, 500],
+                ["Jack", 1, 600],
+            ],
+            columns=["name", "id", "cost"],
+            index=[5, 4, 3, 2, 1, 0],
+        )
+        key_df = pd.DataFrame(
+            [["Jack", 1.0], ["Alex", 2.0], [None, 1.0], ["Emma", None], ["Jack", 1.0]],
+            columns=["name", "id"],
+        )
+
+        result = filter_by_keys(df, key_df)
+        self.assertListEqual([5, 3, 2, 1, 0], result.index.tolist())
+        self.assertListEqual([100, 300, 400, 500, 600], result["cost"].tolist())
+
+        result = filter_by_keys(df, pd.DataFrame({"name": ["Alex"]}))
+        self.assertListEqual([200, 300], result["cost"].tolist())
+
+        result = filter_by_keys(df, pd.DataFrame({"name": []}))
+        self.assertEqual(0, result.shape[0])
+
+        with self.assertRaises(FeathubException):
+            filter_by_keys(df, pd.DataFrame({"invalid_key": ["Alex"]}))
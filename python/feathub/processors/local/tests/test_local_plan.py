@@ -0,0 +1,256 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.common.exceptions import FeathubException
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.transforms.join_transform import JoinTransform
+from feathub.feature_views.transforms.over_window_transform import (
+    OverWindowTransform,
+)
+from feathub.processors.local.local_plan import (
+    ScanNode,
+    ProjectNode,
+    TimeRange,
+    JoinNode,
+)
+from feathub.processors.local.local_processor import LocalProcessor
+from feathub.registries.local_registry import LocalRegistry
+from feathub.table.schema import Schema
+from feathub.table.table_descriptor import TableDescriptor
+
+
+class LocalPlanTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry = LocalRegistry(props={})
+        self.processor = LocalProcessor(props={}, registry=self.registry)
+
+        df = pd.DataFrame(
+            [
+                ["Alex", 100, 100, "2022-01-01 08:01:00"],
+                ["Emma", 400, 250, "2022-01-01 08:02:00"],
+                ["Alex", 300, 200, "2022-01-02 08:03:00"],
+                ["Emma", 200, 250, "2022-01-02 08:04:00"],
+                ["Jack", 500, 500, "2022-01-03 08:05:00"],
+                ["Alex", 600, 800, "2022-01-03 08:06:00"],
+            ],
+            columns=["name", "cost", "distance", "time"],
+        )
+        path = f"{self.temp_dir}/source.csv"
+        df.to_csv(path, index=False, header=False)
+        self.source = FileSystemSource(
+            name="source",
+            path=path,
+            data_format="csv",
+            schema=Schema.new_builder()
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .column("distance", types.Int64)
+            .column("time", types.String)
+            .build(),
+            keys=["name"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _build_feature_view(self) -> TableDescriptor:
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=self.source,
+            features=[
+                Feature(
+                    name="cost_sum",
+                    transform=OverWindowTransform(
+                        expr="cost",
+                        agg_func="SUM",
+                        group_by_keys=["name"],
+                        window_size=timedelta(days=1),
+                    ),
+                ),
+                Feature(name="double_cost_sum", transform="cost_sum * 2"),
+                Feature(name="unused_distance", transform="distance + 1"),
+            ],
+        )
+        return self.registry.build_features([feature_view])[0]
+
+    def _find_scans(self, table):
+        nodes = [table._plan]
+        scans = []
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, ScanNode):
+                scans.append(node)
+            nodes.extend(node.children)
+        return scans
+
+    def test_prune_fields(self):
+        feature_view = DerivedFeatureView(
+            name="outer_feature_view",
+            source=self._build_feature_view(),
+            features=["double_cost_sum"],
+        )
+        table = self.processor.get_table(
+            self.registry.build_features([feature_view])[0]
+        )
+
+        scans = self._find_scans(table)
+        self.assertEqual(1, len(scans))
+        self.assertListEqual(["name", "cost", "time"], scans[0].fields)
+        self.assertNotIn("unused_distance", table.explain())
+        self.assertListEqual(
+            [200, 800, 600, 400, 1000, 1200],
+            table.to_pandas()["double_cost_sum"].tolist(),
+        )
+
+    def test_push_down_time_range(self):
+        feature_view = self._build_feature_view()
+        table = self.processor.get_table(
+            feature_view,
+            start_datetime=datetime(2022, 1, 2),
+            end_datetime=datetime(2022, 1, 3),
+        )
+
+        # The start is extended by the size of the over window.
+        scans = self._find_scans(table)
+        self.assertEqual(
+            TimeRange(1641081600000 - 86400000, 1641168000001), scans[0].time_range
+        )
+
+        expected = self.processor.get_table(feature_view).to_pandas()
+        expected = expected[expected["time"].str.startswith("2022-01-02")]
+        self.assertTrue(expected.reset_index(drop=True).equals(table.to_pandas()))
+
+    def test_lazy_execution(self):
+        with patch.object(
+            self.processor, "_execute_plan", wraps=self.processor._execute_plan
+        ) as execute_plan:
+            table = self.processor.get_table(self._build_feature_view())
+            table.explain()
+            execute_plan.assert_not_called()
+
+            table.to_pandas()
+            table.to_pandas()
+            execute_plan.assert_called_once()
+
+    def test_share_join_table(self):
+        self.registry.build_features([self.source])
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=self.source,
+            features=[
+                Feature(
+                    name="joined_cost",
+                    dtype=types.Int64,
+                    transform=JoinTransform("source", "cost"),
+                    keys=["name"],
+                ),
+                Feature(
+                    name="joined_distance",
+                    dtype=types.Int64,
+                    transform=JoinTransform("source", "distance"),
+                    keys=["name"],
+                ),
+            ],
+            keep_source_fields=True,
+        )
+        table = self.processor.get_table(
+            self.registry.build_features([feature_view])[0]
+        )
+
+        # The source is scanned once for both sides of the join.
+        plan = table._plan
+        self.assertIsInstance(plan, ProjectNode)
+        join_node = plan.children[0]
+        assert isinstance(join_node, JoinNode)
+        self.assertEqual(2, len(join_node.features))
+        self.assertIs(join_node.children[0], join_node.children[1])
+        self.assertEqual(
+            "Project([name, cost, distance, time, joined_cost, joined_distance])\n"
+            "  Join('source', [joined_cost, joined_distance])\n"
+            f"    #1 Scan(FileSystemSource 'source', path={self.source.path}, "
+            "fields=[name, cost, distance, time])\n"
+            "    #1 (reused)",
+            table.explain(),
+        )
+
+        result = table.to_pandas()
+        self.assertListEqual(
+            [100, 400, 300, 200, 500, 600], result["joined_cost"].tolist()
+        )
+
+    def test_join_features_with_different_join_keys(self):
+        join_view = DerivedFeatureView(
+            name="join_view",
+            source=self.source,
+            features=[
+                Feature(name="alias", transform="name", keys=["name"]),
+                Feature(name="cost_by_name", transform="cost", keys=["name"]),
+                Feature(name="cost_by_alias", transform="cost * 2", keys=["alias"]),
+            ],
+        )
+        self.registry.build_features([join_view])
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=self.source,
+            features=[
+                Feature(
+                    name="joined_cost",
+                    dtype=types.Int64,
+                    transform=JoinTransform("join_view", "cost_by_name"),
+                    keys=["name"],
+                ),
+                Feature(
+                    name="joined_double_cost",
+                    dtype=types.Int64,
+                    transform=JoinTransform("join_view", "cost_by_alias"),
+                    keys=["name"],
+                ),
+            ],
+        )
+        table = self.processor.get_table(
+            self.registry.build_features([feature_view])[0]
+        )
+
+        # Features joined with different keys of the table are joined separately.
+        self.assertEqual(2, table.explain().count("Join('join_view'"))
+        result = table.to_pandas()
+        self.assertListEqual(
+            [100, 400, 300, 200, 500, 600], result["joined_cost"].tolist()
+        )
+        self.assertListEqual(
+            [200, 800, 600, 400, 1000, 1200], result["joined_double_cost"].tolist()
+        )
+
+    def test_validate_when_building_plan(self):
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=self.source,
+            features=["cost"],
+            filter_expr="cost > 100",
+        )
+        with self.assertRaises(FeathubException):
+            self.processor.get_table(self.registry.build_features([feature_view])[0])
@@ -11,8 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from datetime import timedelta
 from typing import Optional, Dict, List
 
+from feathub.common import types
+
 from feathub.feathub_client import FeathubClient
 from feathub.feature_tables.tests.test_file_system_source_sink import (
     FileSystemSourceSinkITTest,
@@ -34,6 +37,15 @@ from feathub.feature_views.transforms.tests.test_sliding_window_transform import
     SlidingWindowTestConfig,
     ENABLE_EMPTY_WINDOW_OUTPUT_SKIP_SAME_WINDOW_OUTPUT,
 )
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.sliding_feature_view import (
+    SlidingFeatureView,
+    ENABLE_EMPTY_WINDOW_OUTPUT_CONFIG,
+    SKIP_SAME_WINDOW_OUTPUT_CONFIG,
+)
+from feathub.feature_views.transforms.sliding_window_transform import (
+    SlidingWindowTransform,
+)
 from feathub.tests.test_get_features import GetFeaturesITTest
 from feathub.tests.test_online_features import OnlineFeaturesITTest
 
@@ -108,3 +120,43 @@ class LocalProcessorITTest(
 
     def test_case_else(self):
         pass
+
+    def test_sliding_window_integer_max_min_with_empty_window(self):
+        source = self.create_file_source(self.input_data.copy())
+
+        features = SlidingFeatureView(
+            name="features",
+            source=source,
+            features=[
+                Feature(
+                    name=f"{agg_func.lower()}_cost",
+                    dtype=types.Int64,
+                    transform=SlidingWindowTransform(
+                        expr="cost",
+                        agg_func=agg_func,
+                        window_size=timedelta(days=1),
+                        step_size=timedelta(days=1),
+                        group_by_keys=["name"],
+                    ),
+                )
+                for agg_func in ["MAX", "MIN"]
+            ],
+            props={
+                ENABLE_EMPTY_WINDOW_OUTPUT_CONFIG: True,
+                SKIP_SAME_WINDOW_OUTPUT_CONFIG: True,
+            },
+        )
+
+        result_df = (
+            self.client.get_features(features=features)
+            .to_pandas()
+            .sort_values(by=["name", "window_time"])
+            .reset_index(drop=True)
+        )
+
+        for column in ["max_cost", "min_cost"]:
+            self.assertEqual(object, result_df[column].dtype)
+        self.assertEqual(
+            [100, 300, 600, None],
+            result_df[result_df["name"] == "Alex"]["max_cost"].tolist(),
+        )
@@ -0,0 +1,221 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.transforms.python_udf_transform import PythonUdfTransform
+from feathub.processors.local.local_processor import LocalProcessor
+from feathub.processors.local.local_result_cache import LocalResultCache
+from feathub.registries.local_registry import LocalRegistry
+from feathub.table.schema import Schema
+
+
+class LocalResultCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+        self.size_bytes = int(self.df.memory_usage(index=True, deep=True).sum())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_lru_eviction(self):
+        cache = LocalResultCache(max_bytes=self.size_bytes * 2)
+        cache.put("k1", self.df, ["t1"])
+        cache.put("k2", self.df, ["t2"])
+        self.assertIsNotNone(cache.get("k1"))
+        cache.put("k3", self.df, ["t3"])
+
+        self.assertIsNone(cache.get("k2"))
+        self.assertIsNotNone(cache.get("k1"))
+        stats = cache.get_stats()
+        self.assertEqual(
+            (2, 1, 1, 2), (stats.hits, stats.misses, stats.evictions, stats.num_entries)
+        )
+        self.assertEqual(self.size_bytes * 2, stats.size_bytes)
+
+    def test_copy(self):
+        cache = LocalResultCache(max_bytes=self.size_bytes)
+        cache.put("k1", self.df, ["t1"])
+        cache.get("k1")["a"] = 0
+        self.df["a"] = 0
+        self.assertListEqual([1, 2, 3], cache.get("k1")["a"].tolist())
+
+    def test_disk_tier(self):
+        cache = LocalResultCache(max_bytes=0, cache_dir=self.temp_dir)
+        cache.put("k1", self.df, ["t1", "t2"])
+        cache.put("k2", self.df, ["t2"], persistent=False)
+        self.assertEqual(0, cache.get_stats().num_entries)
+
+        another_cache = LocalResultCache(max_bytes=0, cache_dir=self.temp_dir)
+        self.assertTrue(self.df.equals(another_cache.get("k1")))
+        self.assertIsNone(another_cache.get("k2"))
+        self.assertEqual(1, another_cache.get_stats().disk_hits)
+
+        another_cache.invalidate("t1")
+        self.assertIsNone(cache.get("k1"))
+
+    def test_disk_tier_formats(self):
+        cache = LocalResultCache(max_bytes=0, cache_dir=self.temp_dir)
+        map_df = pd.DataFrame({"a": [{"k": 1}, None]})
+        cache.put("k1", self.df, ["t1"])
+        cache.put("k2", map_df, ["t1"])
+
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "k1.parquet")))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "k2.pkl")))
+        self.assertTrue(self.df.equals(cache.get("k1")))
+        self.assertTrue(map_df.equals(cache.get("k2")))
+
+        cache.invalidate("t1")
+        self.assertListEqual([], os.listdir(self.temp_dir))
+
+    def test_invalidate(self):
+        cache = LocalResultCache(max_bytes=self.size_bytes * 2)
+        cache.put("k1", self.df, ["t1", "t2"])
+        cache.put("k2", self.df, ["t2"])
+
+        cache.invalidate("t1")
+        self.assertIsNone(cache.get("k1"))
+        self.assertIsNotNone(cache.get("k2"))
+        cache.invalidate()
+        self.assertIsNone(cache.get("k2"))
+        self.assertEqual(0, cache.get_stats().size_bytes)
+
+
+class LocalProcessorResultCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry = LocalRegistry(props={})
+        self.processor = LocalProcessor(
+            props={"processor.local.result_cache.enabled": True},
+            registry=self.registry,
+        )
+
+        self.path = os.path.join(self.temp_dir, "source.csv")
+        self._write_source([["Alex", 100, "2022-01-01 08:01:00"]])
+        source = FileSystemSource(
+            name="source",
+            path=self.path,
+            data_format="csv",
+            schema=Schema.new_builder()
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .column("time", types.String)
+            .build(),
+            keys=["name"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+        self.source = source
+        self.feature_view = self.registry.build_features(
+            [
+                DerivedFeatureView(
+                    name="feature_view",
+                    source=source,
+                    features=[Feature(name="double_cost", transform="cost * 2")],
+                )
+            ]
+        )[0]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_source(self, rows) -> None:
+        pd.DataFrame(rows).to_csv(self.path, index=False, header=False)
+
+    def _get_double_costs(self):
+        return (
+            self.processor.get_table(self.feature_view)
+            .to_pandas()["double_cost"]
+            .tolist()
+        )
+
+    def test_reuse_result(self):
+        self.assertEqual([200], self._get_double_costs())
+        with patch("pandas.read_csv") as read_csv:
+            self.assertEqual([200], self._get_double_costs())
+            read_csv.assert_not_called()
+
+        stats = self.processor.get_result_cache_stats()
+        assert stats is not None
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(2, stats.num_entries)
+
+    def test_source_file_changed(self):
+        self.assertEqual([200], self._get_double_costs())
+        self._write_source(
+            [["Alex", 100, "2022-01-01 08:01:00"], ["Emma", 300, "2022-01-01 08:02:00"]]
+        )
+        self.assertEqual([200, 600], self._get_double_costs())
+
+    def test_redefined_udf(self):
+        for multiplier in [5, 7]:
+            feature_view = self.registry.build_features(
+                [
+                    DerivedFeatureView(
+                        name="udf_feature_view",
+                        source=self.source,
+                        features=[
+                            Feature(
+                                name="cost_udf",
+                                dtype=types.Int64,
+                                transform=PythonUdfTransform(
+                                    lambda row, m=multiplier: row["cost"] * m
+                                ),
+                            )
+                        ],
+                    )
+                ]
+            )[0]
+            self.assertEqual(
+                [100 * multiplier],
+                self.processor.get_table(feature_view).to_pandas()["cost_udf"].tolist(),
+            )
+
+    def test_udf_token_not_reused(self):
+        udf = lambda row: row  # noqa: E731
+        token = self.processor._get_udf_token(udf)
+        self.assertEqual(token, self.processor._get_udf_token(udf))
+        del udf
+
+        # Simulates that the id of the garbage collected UDF is reused by a new UDF.
+        with patch(
+            "feathub.processors.local.local_processor.id", create=True, return_value=0
+        ):
+            first_token = self.processor._get_udf_token(lambda row: row)
+            second_token = self.processor._get_udf_token(lambda row: row)
+        self.assertNotEqual(first_token, second_token)
+        self.assertNotEqual(token, first_token)
+
+    def test_invalidate(self):
+        self._get_double_costs()
+        self.processor.invalidate_result_cache("source")
+        stats = self.processor.get_result_cache_stats()
+        assert stats is not None
+        self.assertEqual(0, stats.num_entries)
+
+    def test_disabled_by_default(self):
+        processor = LocalProcessor(props={}, registry=self.registry)
+        processor.get_table(self.feature_view).to_pandas()
+        self.assertIsNone(processor.get_result_cache_stats())
+        self.assertNotIn("Cache", processor.get_table(self.feature_view).explain())
@@ -0,0 +1,168 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+from typing import List
+from unittest.mock import patch
+
+import pandas as pd
+
+from feathub.common import types
+from feathub.common.exceptions import FeathubException
+from feathub.feature_tables.sources.file_system_source import FileSystemSource
+from feathub.feature_views.derived_feature_view import DerivedFeatureView
+from feathub.feature_views.feature import Feature
+from feathub.feature_views.transforms.over_window_transform import (
+    OverWindowTransform,
+)
+from feathub.processors.local.local_processor import LocalProcessor
+from feathub.processors.local.local_table import LocalTable
+from feathub.registries.local_registry import LocalRegistry
+from feathub.table.schema import Schema
+from feathub.table.table_descriptor import TableDescriptor
+
+
+class LocalTableBatchesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry = LocalRegistry(props={})
+        self.processor = LocalProcessor(props={}, registry=self.registry)
+        self.rows = [
+            ["Alex", 100, "2022-01-01 08:01:00"],
+            ["Emma", 400, "2022-01-01 08:02:00"],
+            ["Alex", 300, "2022-01-01 08:02:00"],
+            ["Emma", 200, "2022-01-01 08:02:00"],
+            ["Jack", 500, "2022-01-01 08:03:00"],
+            ["Alex", 600, "2022-01-01 08:04:00"],
+            ["Alex", 200, "2022-01-01 08:06:00"],
+        ]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _new_source(self, rows: List[List]) -> FileSystemSource:
+        path = f"{self.temp_dir}/source.csv"
+        pd.DataFrame(rows).to_csv(path, index=False, header=False)
+        return FileSystemSource(
+            name="source",
+            path=path,
+            data_format="csv",
+            schema=Schema.new_builder()
+            .column("name", types.String)
+            .column("cost", types.Int64)
+            .column("time", types.String)
+            .build(),
+            keys=["name"],
+            timestamp_field="time",
+            timestamp_format="%Y-%m-%d %H:%M:%S",
+        )
+
+    def _build_feature_view(self, features: List[Feature]) -> TableDescriptor:
+        feature_view = DerivedFeatureView(
+            name="feature_view",
+            source=self._new_source(self.rows),
+            features=features,
+        )
+        return self.registry.build_features([feature_view])[0]
+
+    def _assert_batches_equal(self, table: LocalTable) -> None:
+        expected = table.to_pandas()
+        for batch_size in range(1, len(self.rows) + 1):
+            batches = list(table.to_pandas_batches(batch_size))
+            result = pd.concat(batches, ignore_index=True)
+            self.assertTrue(expected.equals(result), f"batch_size={batch_size}")
+
+    def test_row_local_features(self):
+        table = self.processor.get_table(
+            self._build_feature_view(
+                [Feature(name="double_cost", transform="cost * 2")]
+            )
+        )
+        with patch.object(
+            self.processor, "_execute_plan", wraps=self.processor._execute_plan
+        ) as execute_plan:
+            batches = list(table.to_pandas_batches(3))
+            execute_plan.assert_not_called()
+
+        self.assertListEqual([3, 3, 1], [batch.shape[0] for batch in batches])
+        self._assert_batches_equal(table)
+
+    def test_bounded_over_windows(self):
+        table = self.processor.get_table(
+            self._build_feature_view(
+                [
+                    Feature(
+                        name="cost_sum_2_minutes",
+                        transform=OverWindowTransform(
+                            expr="cost",
+                            agg_func="SUM",
+                            group_by_keys=["name"],
+                            window_size=timedelta(minutes=2),
+                        ),
+                    ),
+                    Feature(
+                        name="last_2_cost_max",
+                        transform=OverWindowTransform(
+                            expr="cost_sum_2_minutes",
+                            agg_func="MAX",
+                            window_size=timedelta(minutes=10),
+                            filter_expr="cost > 150",
+                            limit=2,
+                        ),
+                    ),
+                ]
+            )
+        )
+        self.assertListEqual(
+            [100, 600, 400, 600, 500, 900, 800],
+            table.to_pandas()["cost_sum_2_minutes"].tolist(),
+        )
+        self._assert_batches_equal(table)
+
+    def test_unbounded_over_window(self):
+        table = self.processor.get_table(
+            self._build_feature_view(
+                [
+                    Feature(
+                        name="cost_sum",
+                        transform=OverWindowTransform(
+                            expr="cost", agg_func="SUM", group_by_keys=["name"]
+                        ),
+                    ),
+                ]
+            )
+        )
+        self._assert_batches_equal(table)
+
+    def test_unordered_rows(self):
+        self.rows = self.rows[::-1]
+        table = self.processor.get_table(
+            self._build_feature_view(
+                [
+                    Feature(
+                        name="cost_sum",
+                        transform=OverWindowTransform(
+                            expr="cost",
+                            agg_func="SUM",
+                            group_by_keys=["name"],
+                            window_size=timedelta(minutes=2),
+                        ),
+                    ),
+                ]
+            )
+        )
+        with self.assertRaises(FeathubException):
+            list(table.to_pandas_batches(2))
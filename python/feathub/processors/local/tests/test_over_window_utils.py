@@ -0,0 +1,95 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+from typing import List
+
+import numpy as np
+
+from feathub.feature_views.transforms.agg_func import AggFunc
+from feathub.processors.local.aggregation_utils import AGG_FUNCTIONS
+from feathub.processors.local.over_window_utils import evaluate_over_window
+from feathub.processors.local.parallel_utils import ParallelExecutor
+
+
+class OverWindowUtilsTest(unittest.TestCase):
+    def test_evaluate_over_window(self):
+        rng = np.random.default_rng(0)
+        num_rows = 100
+        keys = rng.integers(0, 3, num_rows)
+        values = rng.integers(0, 5, num_rows).tolist()
+        times = rng.integers(0, 50, num_rows)
+        row_mask = rng.integers(0, 2, num_rows).astype(bool)
+        groups = [np.where(keys == key)[0] for key in range(3)]
+
+        for agg_func in AggFunc:
+            for window_size in [None, 10]:
+                for limit in [None, 3]:
+                    for mask in [None, row_mask]:
+                        result = evaluate_over_window(
+                            values=values,
+                            times=times,
+                            groups=groups,
+                            row_mask=mask,
+                            agg_func=agg_func,
+                            window_size_millis=window_size,
+                            limit=limit,
+                        )
+                        expected = self._evaluate_over_window(
+                            values, times, keys, mask, agg_func, window_size, limit
+                        )
+                        self.assertListEqual(expected, result)
+
+    def test_evaluate_over_window_in_parallel(self):
+        rng = np.random.default_rng(0)
+        num_rows = 100
+        keys = rng.integers(0, 5, num_rows)
+        kwargs = dict(
+            values=rng.integers(0, 5, num_rows).tolist(),
+            times=rng.integers(0, 50, num_rows),
+            groups=[np.where(keys == key)[0] for key in range(5)],
+            row_mask=rng.integers(0, 2, num_rows).astype(bool),
+            agg_func=AggFunc.VALUE_COUNTS,
+            window_size_millis=10,
+            limit=None,
+        )
+
+        executor = ParallelExecutor(num_workers=3, min_rows_per_partition=1)
+        try:
+            self.assertListEqual(
+                evaluate_over_window(**kwargs),
+                evaluate_over_window(**kwargs, executor=executor),
+            )
+        finally:
+            executor.close()
+
+    @staticmethod
+    def _evaluate_over_window(values, times, keys, row_mask, agg_func, size, limit):
+        results: List = []
+        for i in range(len(values)):
+            if row_mask is not None and not row_mask[i]:
+                results.append(None)
+                continue
+            rows = [
+                j
+                for j in range(len(values))
+                if keys[j] == keys[i]
+                and (row_mask is None or row_mask[j])
+                and times[j] <= times[i]
+                and (size is None or times[j] >= times[i] - size)
+            ]
+            rows = sorted(rows, key=lambda j: (times[j], j))
+            if limit is not None:
+                rows = rows[-limit:]
+            results.append(AGG_FUNCTIONS[agg_func]([values[j] for j in rows]))
+        return results
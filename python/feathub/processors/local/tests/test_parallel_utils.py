@@ -0,0 +1,77 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import gc
+import os
+import unittest
+
+import numpy as np
+
+from feathub.processors.local.local_processor import LocalProcessor
+from feathub.processors.local.local_processor_config import PARALLELISM_CONFIG
+from feathub.processors.local.parallel_utils import (
+    ParallelExecutor,
+    partition_groups,
+    is_picklable,
+)
+from feathub.registries.local_registry import LocalRegistry
+
+
+class ParallelUtilsTest(unittest.TestCase):
+    def test_partition_groups(self):
+        groups = [np.arange(n) for n in [5, 1, 4, 2, 3]]
+        self.assertListEqual([[0], [1, 2], [3, 4]], partition_groups(groups, 3))
+        self.assertListEqual([[0, 1]], partition_groups(groups[:2], 1))
+        self.assertListEqual([[0], [1]], partition_groups(groups[:2], 4))
+
+    def test_get_num_partitions(self):
+        executor = ParallelExecutor(num_workers=4, min_rows_per_partition=100)
+        self.assertEqual(1, executor.get_num_partitions(150))
+        self.assertEqual(2, executor.get_num_partitions(250))
+        self.assertEqual(4, executor.get_num_partitions(10000))
+
+    def test_map(self):
+        executor = ParallelExecutor(num_workers=2, min_rows_per_partition=1)
+        try:
+            self.assertListEqual([os.getpid()], executor.map(os.getpid, [()]))
+            results = executor.map(divmod, [(7, 2), (9, 4), (5, 5)])
+            self.assertListEqual([(3, 1), (2, 1), (1, 0)], results)
+        finally:
+            executor.close()
+
+    def test_close(self):
+        executor = ParallelExecutor(num_workers=2, min_rows_per_partition=1)
+        executor.map(divmod, [(7, 2), (9, 4)])
+        processes = list(executor._pool._processes.values())
+        self.assertEqual(2, len(processes))
+
+        executor.close()
+        self.assertIsNone(executor._pool)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+    def test_close_local_processor(self):
+        processor = LocalProcessor(
+            props={PARALLELISM_CONFIG: 2}, registry=LocalRegistry(props={})
+        )
+        executor = processor.parallel_executor
+        executor.map(divmod, [(7, 2), (9, 4)])
+        processes = list(executor._pool._processes.values())
+
+        del processor
+        gc.collect()
+        self.assertIsNone(executor._pool)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+    def test_is_picklable(self):
+        self.assertTrue(is_picklable(divmod))
+        self.assertFalse(is_picklable(lambda x: x))
@@ -0,0 +1,111 @@
+#  Copyright 2022 The FeatHub Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+
+import numpy as np
+import pandas as pd
+from dateutil import tz
+
+from feathub.common.utils import to_unix_timestamp
+from feathub.processors.local.time_utils import (
+    get_unix_time_millis,
+    get_local_time_millis,
+    get_unix_time_millis_from_local,
+    format_unix_time_millis,
+)
+
+
+class TimeUtilsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tz = tz.gettz("America/New_York")
+
+    def _assert_same_as_to_unix_timestamp(self, values, timestamp_format) -> None:
+        expected = [
+            round(to_unix_timestamp(value, timestamp_format, self.tz) * 1000)
+            for value in values
+        ]
+        millis = get_unix_time_millis(pd.Series(values), timestamp_format, self.tz)
+        self.assertEqual(np.int64, millis.dtype)
+        self.assertListEqual(expected, millis.tolist())
+
+    def test_get_unix_time_millis(self):
+        self._assert_same_as_to_unix_timestamp(
+            [
+                "2022-07-01 12:00:00",
+                # Skipped and repeated local times of daylight saving time.
+                "2022-03-13 02:30:00",
+                "2022-11-06 01:30:00",
+            ],
+            "%Y-%m-%d %H:%M:%S",
+        )
+        self._assert_same_as_to_unix_timestamp(
+            ["2022/01/01 08:00:00.123", "2022/01/01 08:00:00.456"],
+            "%Y/%m/%d %H:%M:%S.%f",
+        )
+        self._assert_same_as_to_unix_timestamp(
+            ["2022-01-01 08:00:00 +0800", "2022-01-01 08:00:00 +0000"],
+            "%Y-%m-%d %H:%M:%S %z",
+        )
+        self._assert_same_as_to_unix_timestamp([1640995200, 1640995201], "epoch")
+        self._assert_same_as_to_unix_timestamp(
+            [1640995200123, 1640995201456], "epoch_millis"
+        )
+
+    def test_invalid_timestamp(self):
+        # The last four values are accepted by the ISO 8601 parser of pandas.
+        for value in [
+            "invalid",
+            "2022-01-01",
+            "2022-01-01 08:01",
+            "2022-01-01T08:01:00",
+            "2022-01-01 08:01:00.5",
+        ]:
+            with self.assertRaises(ValueError):
+                get_unix_time_millis(
+                    pd.Series(["2022-01-01 08:00:00", value]),
+                    "%Y-%m-%d %H:%M:%S",
+                    self.tz,
+                )
+
+    def test_timestamp_without_zero_padding(self):
+        self._assert_same_as_to_unix_timestamp(
+            ["2022-1-1 8:0:0", "2022-01-01 08:00:00"], "%Y-%m-%d %H:%M:%S"
+        )
+
+    def test_local_time_millis(self):
+        unix_time_millis = get_unix_time_millis(
+            pd.Series(
+                ["2022-03-13 01:59:59", "2022-03-13 03:00:00", "2022-11-06 01:30:00"]
+            ),
+            "%Y-%m-%d %H:%M:%S",
+            self.tz,
+        )
+        local_time_millis = get_local_time_millis(unix_time_millis, self.tz)
+        self.assertListEqual(
+            [1647136799000, 1647140400000, 1667698200000], local_time_millis.tolist()
+        )
+        self.assertListEqual(
+            unix_time_millis.tolist(),
+            get_unix_time_millis_from_local(local_time_millis, self.tz).tolist(),
+        )
+
+    def test_format_unix_time_millis(self):
+        unix_time_millis = np.array([1656691200123], dtype=np.int64)
+        self.assertListEqual(
+            ["2022-07-01 12:00:00.123000"],
+            format_unix_time_millis(unix_time_millis, "%Y-%m-%d %H:%M:%S.%f", self.tz),
+        )
+        self.assertListEqual(
+            [1656691200], format_unix_time_millis(unix_time_millis, "epoch", self.tz)
+        )
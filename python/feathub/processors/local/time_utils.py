@@ -11,25 +11,32 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import _strptime
 from datetime import tzinfo
+from typing import Optional, Tuple, List
 
+import numpy as np
 import pandas as pd
 
 from feathub.common.utils import to_unix_timestamp
 from feathub.processors.constants import EVENT_TIME_ATTRIBUTE_NAME
 
+_NANOS_PER_MILLI = 1000000
+
 
 def append_unix_time_column(
     df: pd.DataFrame, timestamp_field: str, timestamp_format: str, tz: tzinfo
 ) -> None:
+    """
+    Appends a column with the epoch millis of the timestamp field to the DataFrame.
+    """
     if EVENT_TIME_ATTRIBUTE_NAME in df:
         raise RuntimeError(
             f"The dataframe has column with name {EVENT_TIME_ATTRIBUTE_NAME}."
         )
 
-    df[EVENT_TIME_ATTRIBUTE_NAME] = df.apply(
-        lambda row: to_unix_timestamp(row[timestamp_field], timestamp_format, tz),
-        axis=1,
+    df[EVENT_TIME_ATTRIBUTE_NAME] = get_unix_time_millis(
+        df[timestamp_field], timestamp_format, tz
     )
 
 
@@ -43,4 +50,143 @@ def append_and_sort_unix_time_column(
         ascending=True,
         inplace=True,
         ignore_index=True,
+        kind="stable",
+    )
+
+
+def get_unix_time_millis(
+    series: pd.Series, timestamp_format: str, tz: tzinfo
+) -> np.ndarray:
+    """
+    Returns an int64 array containing the epoch millis of each value in the given
+    timestamp series.
+
+    Epoch values are scaled as a whole. Strings are parsed by `pd.to_datetime`, which
+    has a fast path for ISO 8601 layouts, and are kept only if they match the format
+    exactly as `datetime.strptime` requires. The local times are converted with the
+    transition tables of the timezone. Ambiguous local times are resolved to their
+    first occurrence. The values that can not be converted this way, such as local
+    times skipped by daylight saving time, are converted one by one with
+    `to_unix_timestamp`.
+    """
+    if len(series) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    try:
+        result = _get_unix_time_millis_vectorized(series, timestamp_format, tz)
+    except (ValueError, TypeError, OverflowError):
+        result = None
+    if result is None:
+        millis = np.zeros(len(series), dtype=np.int64)
+        is_converted = np.zeros(len(series), dtype=bool)
+    else:
+        millis, is_converted = result
+
+    if not is_converted.all():
+        values = series.to_numpy(dtype=object)
+        for i in np.flatnonzero(~is_converted):
+            millis[i] = round(to_unix_timestamp(values[i], timestamp_format, tz) * 1000)
+    return millis
+
+
+def _get_unix_time_millis_vectorized(
+    series: pd.Series, timestamp_format: str, tz: tzinfo
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Returns the epoch millis of the values in the series and whether each value is
+    converted, or None if the values can not be converted in a vectorized way.
+    """
+    if timestamp_format == "epoch" or timestamp_format == "epoch_millis":
+        if series.dtype.kind not in "iu":
+            return None
+        millis = series.to_numpy(dtype=np.int64)
+        if timestamp_format == "epoch":
+            millis = millis * 1000
+        return millis, np.ones(len(millis), dtype=bool)
+
+    if series.dtype.kind == "M":
+        datetimes = pd.DatetimeIndex(series)
+    elif series.dtype.kind == "O":
+        datetimes = pd.DatetimeIndex(
+            pd.to_datetime(series, format=timestamp_format, errors="coerce", cache=True)
+        )
+        # pd.to_datetime also accepts ISO 8601 strings that do not match the format,
+        # which `to_unix_timestamp` rejects, so the values that do not match the
+        # format are left to be converted one by one.
+        datetimes = datetimes.where(_match_strptime_format(series, timestamp_format))
+    else:
+        return None
+
+    if datetimes.tz is None:
+        datetimes = datetimes.tz_localize(
+            tz, ambiguous=np.ones(len(datetimes), dtype=bool), nonexistent="NaT"
+        )
+    # Rounds to the nearest millisecond.
+    millis = np.floor_divide(datetimes.asi8 + _NANOS_PER_MILLI // 2, _NANOS_PER_MILLI)
+    return millis, ~np.asarray(datetimes.isna())
+
+
+def _match_strptime_format(series: pd.Series, timestamp_format: str) -> np.ndarray:
+    """
+    Returns whether each value in the series is a string that `datetime.strptime`
+    accepts in the given format, regardless of whether the fields are in range.
+    """
+    # The regular expression strptime matches the whole string against.
+    pattern = _strptime._TimeRE_cache.compile(timestamp_format)  # type: ignore
+    return np.fromiter(
+        (
+            isinstance(value, str) and pattern.fullmatch(value) is not None
+            for value in series.to_numpy(dtype=object)
+        ),
+        dtype=bool,
+        count=len(series),
+    )
+
+
+def get_local_time_millis(unix_time_millis: np.ndarray, tz: tzinfo) -> np.ndarray:
+    """
+    Returns the millis since 1970-01-01 00:00:00 in the timezone of the local time of
+    each epoch millis.
+    """
+    datetimes = pd.DatetimeIndex(
+        pd.to_datetime(np.asarray(unix_time_millis, dtype=np.int64), unit="ms")
+    )
+    local_datetimes = datetimes.tz_localize("UTC").tz_convert(tz).tz_localize(None)
+    return np.floor_divide(local_datetimes.asi8, _NANOS_PER_MILLI)
+
+
+def get_unix_time_millis_from_local(
+    local_time_millis: np.ndarray, tz: tzinfo
+) -> np.ndarray:
+    """
+    Returns the epoch millis of each local time in the timezone, given in millis
+    since 1970-01-01 00:00:00. It is the inverse of `get_local_time_millis`. Ambiguous
+    local times are resolved to their first occurrence, and local times skipped by
+    daylight saving time are shifted forward.
+    """
+    datetimes = pd.DatetimeIndex(
+        pd.to_datetime(np.asarray(local_time_millis, dtype=np.int64), unit="ms")
+    )
+    zoned_datetimes = datetimes.tz_localize(
+        tz, ambiguous=np.ones(len(datetimes), dtype=bool), nonexistent="shift_forward"
+    )
+    return np.floor_divide(zoned_datetimes.asi8, _NANOS_PER_MILLI)
+
+
+def format_unix_time_millis(
+    unix_time_millis: np.ndarray, timestamp_format: str, tz: tzinfo
+) -> List:
+    """
+    Returns the timestamp of each epoch millis in the given format and timezone.
+    """
+    if timestamp_format == "epoch":
+        return np.floor_divide(unix_time_millis, 1000).tolist()
+    if timestamp_format == "epoch_millis":
+        return np.asarray(unix_time_millis, dtype=np.int64).tolist()
+
+    datetimes = pd.DatetimeIndex(
+        pd.to_datetime(np.asarray(unix_time_millis, dtype=np.int64), unit="ms")
+    )
+    return (
+        datetimes.tz_localize("UTC").tz_convert(tz).strftime(timestamp_format).tolist()
     )
@@ -18,7 +18,7 @@ import pandas as pd
 from feathub.feature_views.transforms.join_transform import JoinTransform
 from pyspark.sql import DataFrame as NativeSparkDataFrame, functions
 from pyspark.sql import SparkSession
-from pyspark.sql.functions import udf, struct
+from pyspark.sql.functions import udf, struct, pandas_udf
 
 from feathub.common.exceptions import (
     FeathubException,
@@ -334,10 +334,20 @@ class SparkDataFrameBuilder:
         result_field_name: str,
         result_type: DType,
     ) -> NativeSparkDataFrame:
-        python_udf = udf(transform.udf, returnType=to_spark_type(result_type))
+        input_fields = transform.input_fields
+        if input_fields is None:
+            input_fields = source_dataframe.columns
+        if transform.vectorized:
+            # A pandas UDF with a struct argument is invoked with a pandas DataFrame
+            # of a batch of rows.
+            python_udf = pandas_udf(
+                transform.udf, returnType=to_spark_type(result_type)
+            )
+        else:
+            python_udf = udf(transform.udf, returnType=to_spark_type(result_type))
         return source_dataframe.withColumn(
             result_field_name,
-            python_udf(struct([source_dataframe[x] for x in source_dataframe.columns])),
+            python_udf(struct([source_dataframe[x] for x in input_fields])),
         )
 
     @staticmethod
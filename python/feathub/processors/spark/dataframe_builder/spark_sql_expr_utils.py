@@ -16,7 +16,6 @@ import logging
 from feathub.dsl.expr_parser import ExprParser
 from feathub.processors.spark.ast_evaluator.spark_ast_evaluator import SparkAstEvaluator
 
-_parser = ExprParser()
 _ast_evaluator = SparkAstEvaluator()
 
 logger = logging.getLogger(__file__)
@@ -24,7 +23,7 @@ logger = logging.getLogger(__file__)
 
 def to_spark_sql_expr(feathub_expr: str) -> str:
     logger.debug(f"Parsing FeatHub expr: {feathub_expr}")
-    ast = _parser.parse(feathub_expr)
+    ast = ExprParser.get_instance().parse(feathub_expr)
     spark_sql_expr = _ast_evaluator.eval(ast, {})
     logger.debug(f"Result Spark Sql expr: {spark_sql_expr}")
     return spark_sql_expr
@@ -147,6 +147,9 @@ try:
         "spark": [
             "pyspark==3.3.1",
         ],
+        "pyarrow": [
+            "pyarrow>=5.0.0",
+        ],
     }
 
     setup(